@@ -0,0 +1,70 @@
+"""
+Backtest de reglas sobre las transacciones historicas.
+
+Uso (desde BE-FCORE):
+    python backtest_rules.py --start 2026-09-01 --end 2026-10-01 --expression "amount > 5000 and is_foreign_transaction"
+    python backtest_rules.py --start 2026-09-01 --end 2026-10-01 --workers 8 --output reporte.json
+
+Sin --expression se evalua el conjunto de reglas habilitadas que no estan en modo sombra.
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+# Aseguramos que el path del proyecto esté visible
+sys.path.append(os.getcwd())
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from fcore.application.services.feature_builder import SCORING_FEATURE_SCHEMA
+from fcore.application.use_cases.backtest_use_case import BacktestUseCase
+from fcore.infrastructure.database.process_pool_backtest_runner import ProcessPoolBacktestRunner
+from fcore.infrastructure.database.repositories.sqlalchemy_rule_repository import SqlAlchemyRuleRepository
+
+load_dotenv()
+
+# Configuración DB (Mismas variables que init_db.py)
+DB_USER = os.getenv("POSTGRES_USER", "fcore_user")
+DB_PASSWORD = os.getenv("POSTGRES_PASSWORD", "fcore_password")
+DB_HOST = os.getenv("POSTGRES_HOST", "localhost")
+DB_PORT = os.getenv("POSTGRES_PORT", "5432")
+DB_NAME = os.getenv("POSTGRES_DB", "fcore_db")
+DATABASE_URL = os.getenv("BACKTEST_DATABASE_URL", f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Backtest de reglas sobre la tabla transactions.")
+    parser.add_argument("--start", required=True, type=datetime.fromisoformat, help="Inicio (incluido), ISO 8601")
+    parser.add_argument("--end", required=True, type=datetime.fromisoformat, help="Fin (excluido), ISO 8601")
+    parser.add_argument("--expression", help="Expresion DSL candidata; por defecto, las reglas habilitadas (sin las de modo sombra)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Procesos (un shard de clientes cada uno)")
+    parser.add_argument("--batch-rows", type=int, default=10_000, help="Transacciones por lote evaluado")
+    parser.add_argument("--output", help="Archivo JSON de salida; por defecto, la salida estandar")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    session = sessionmaker(bind=create_engine(DATABASE_URL))()
+    try:
+        use_case = BacktestUseCase(
+            rule_repository=SqlAlchemyRuleRepository(session),
+            runner=ProcessPoolBacktestRunner(DATABASE_URL, workers=args.workers, batch_rows=args.batch_rows),
+            known_names=SCORING_FEATURE_SCHEMA.names
+        )
+        report = use_case.execute(args.start, args.end, args.expression)
+    finally:
+        session.close()
+
+    output = json.dumps(report.to_dict(), indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+        print(f"Reporte escrito en {args.output} ({report.rows} transacciones).")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
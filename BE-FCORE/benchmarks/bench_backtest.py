@@ -0,0 +1,53 @@
+"""
+Per-worker throughput of a rule backtest without the database: point-in-time
+profiles, feature contexts and vectorized rule evaluation over a synthetic,
+time-ordered transaction stream. Multiply by the worker count (one shard of
+customers each) for the replay rate; the database read is not included.
+
+Usage (from BE-FCORE):
+    python benchmarks/bench_backtest.py
+"""
+import random
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+sys.path.append(os.getcwd())
+
+from fcore.application.services.backtest import LOOKBACK
+from fcore.core.entities.transaction import Transaction, TransactionChannel
+from fcore.infrastructure.database.process_pool_backtest_runner import replay
+from benchmarks.bench_rule_index import build_rules, COUNTRIES
+
+def build_stream(count: int, start: datetime, span: timedelta, customers: int, rng: random.Random):
+    customer_ids = [uuid4() for _ in range(customers)]
+    merchant_id = uuid4()
+    step = span / count
+    return [Transaction(
+        customer_id=rng.choice(customer_ids), merchant_id=merchant_id,
+        amount=Decimal(rng.randint(100, 500_000)) / 100, country=rng.choice(COUNTRIES[:3]),
+        channel=rng.choice([TransactionChannel.POS, TransactionChannel.ECOM]),
+        label_fraud=rng.random() < 0.01, occurred_at=start + step * i
+    ) for i in range(count)]
+
+def main():
+    rng = random.Random(42)
+    start = datetime(2026, 9, 1)
+    rules = build_rules(50, rng)
+    warm_up = build_stream(100_000, start - LOOKBACK, LOOKBACK, 20_000, rng)
+    transactions = build_stream(200_000, start, timedelta(days=30), 20_000, rng)
+
+    began = time.perf_counter()
+    report = replay(warm_up, transactions, rules, start, start + timedelta(days=30))
+    elapsed = time.perf_counter() - began
+
+    rate = len(transactions) / elapsed
+    print(f"{len(transactions)} transactions x {len(rules)} rules in {elapsed:.2f} s "
+          f"({rate:,.0f} tx/s per worker, {sum(rule.hits for rule in report.rules)} hits)")
+    print(f"30M transactions on 8 workers: ~{30_000_000 / (rate * 8) / 60:.1f} min (CPU side)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compares per-row rule evaluation (CompiledEvalEvaluator.evaluate for every
+rule and transaction) against VectorizedEvalEvaluator.evaluate_batch over the
+same rows, and checks both produce the same hit matrix.
+
+Usage (from BE-FCORE):
+    python benchmarks/bench_batch_rule_evaluator.py
+"""
+import random
+import sys
+import os
+import time
+
+sys.path.append(os.getcwd())
+
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+from fcore.infrastructure.strategies.vectorized_eval_evaluator import VectorizedEvalEvaluator
+from benchmarks.bench_rule_index import build_rules, build_contexts
+
+# Shapes the array path does not translate; they run row by row inside evaluate_batch
+FALLBACK_TEMPLATES = [
+    "int(amount) % {k} == 0",
+    "country.lower() == 'ec' and amount > {n}",
+]
+
+def main():
+    rng = random.Random(42)
+    rules = build_rules(100, rng)
+    contexts = [features.as_dict() for features in build_contexts(10_000, rng)]
+
+    scalar = CompiledEvalEvaluator()
+    scalar.prepare(rules)
+    start = time.perf_counter()
+    expected = [[scalar.evaluate(rule, context) for rule in rules] for context in contexts]
+    scalar_time = time.perf_counter() - start
+
+    vectorized = VectorizedEvalEvaluator()
+    vectorized.prepare(rules)
+    vectorized.evaluate_batch(rules, contexts[:10])  # Translate the expressions outside the timing
+    start = time.perf_counter()
+    matrix = vectorized.evaluate_batch(rules, contexts)
+    batch_time = time.perf_counter() - start
+    assert matrix.tolist() == expected, "vectorized evaluation changed the hits"
+
+    print(f"{len(contexts)} rows x {len(rules)} rules, {int(matrix.sum())} hits")
+    print(f"per-row:    {scalar_time * 1000:8.1f} ms")
+    print(f"vectorized: {batch_time * 1000:8.1f} ms  ({scalar_time / batch_time:.1f}x)")
+
+    with_fallback = rules[:90] + build_rules(10, rng)
+    for rule, template in zip(with_fallback[90:], FALLBACK_TEMPLATES * 5):
+        rule.dsl_expression = template.format(k=rng.randint(2, 9), n=rng.randint(100, 5000))
+    start = time.perf_counter()
+    vectorized.evaluate_batch(with_fallback, contexts)
+    print(f"vectorized, 10 rules row by row: {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Behavior feature computation: the previous five-query implementation versus
+the single-statement SqlAlchemyBehaviorRepository.calculate_features_from_history.
+
+By default it seeds an in-memory SQLite database. Point BENCH_DATABASE_URL at a
+TimescaleDB instance (with 'transactions' already converted by init_db.py) to
+measure against the hypertable; the seeded rows are removed afterwards.
+
+Usage (from BE-FCORE):
+    python benchmarks/bench_behavior_features.py [customers] [tx_per_customer]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+sys.path.append(os.getcwd())
+
+from sqlalchemy import create_engine, event, func, insert
+from sqlalchemy.orm import sessionmaker
+
+from fcore.infrastructure.database.models.base_db_model import Base
+from fcore.infrastructure.database.models.customer_model import CustomerModel
+from fcore.infrastructure.database.models.merchant_model import MerchantModel
+from fcore.infrastructure.database.models.transaction_model import TransactionModel
+from fcore.infrastructure.database.repositories.sqlalchemy_behavior_repository import SqlAlchemyBehaviorRepository
+from fcore.core.entities.transaction import TransactionChannel
+
+def legacy_features(session, customer_id):
+    """The implementation this benchmark replaces: one query per window."""
+    now = datetime.now(timezone.utc)
+
+    def get_count(minutes_lookback):
+        return (
+            session.query(func.count(TransactionModel.id))
+            .filter(TransactionModel.customer_id == customer_id,
+                    TransactionModel.occurred_at >= now - timedelta(minutes=minutes_lookback))
+            .scalar() or 0
+        )
+
+    avg_24h = (
+        session.query(func.avg(TransactionModel.amount))
+        .filter(TransactionModel.customer_id == customer_id,
+                TransactionModel.occurred_at >= now - timedelta(hours=24))
+        .scalar() or 0.0
+    )
+    usual_country = (
+        session.query(TransactionModel.country)
+        .filter(TransactionModel.customer_id == customer_id,
+                TransactionModel.occurred_at >= now - timedelta(days=30))
+        .group_by(TransactionModel.country)
+        .order_by(func.count(TransactionModel.country).desc())
+        .limit(1)
+        .scalar()
+    )
+    return {
+        "tx_count_10m": get_count(10),
+        "tx_count_30m": get_count(30),
+        "tx_count_24h": get_count(1440),
+        "avg_amount_24h": float(avg_24h),
+        "usual_country": usual_country
+    }
+
+def seed(session, customers: int, tx_per_customer: int):
+    rng = random.Random(7)
+    now = datetime.now(timezone.utc)
+    customer_ids = [uuid4() for _ in range(customers)]
+    merchant_id = uuid4()
+
+    session.add(MerchantModel(id=merchant_id, name=f"Bench merchant {merchant_id}", category="retail"))
+    session.add_all(CustomerModel(id=cid, full_name="Bench customer", document_number=str(10**9 + i))
+                    for i, cid in enumerate(customer_ids))
+    session.flush()
+
+    rows = [{
+        "id": uuid4(),
+        "customer_id": cid,
+        "merchant_id": merchant_id,
+        "amount": Decimal(rng.randint(100, 90000)) / 100,
+        "currency": "USD",
+        "channel": TransactionChannel.POS,
+        "occurred_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 30)),
+        "country": rng.choice(["EC", "EC", "EC", "CO", "PE"]),
+    } for cid in customer_ids for _ in range(tx_per_customer)]
+    session.execute(insert(TransactionModel), rows)
+    session.commit()
+    return customer_ids, merchant_id
+
+def cleanup(session, customer_ids, merchant_id):
+    session.query(TransactionModel).filter(TransactionModel.customer_id.in_(customer_ids)).delete(synchronize_session=False)
+    session.query(CustomerModel).filter(CustomerModel.id.in_(customer_ids)).delete(synchronize_session=False)
+    session.query(MerchantModel).filter_by(id=merchant_id).delete(synchronize_session=False)
+    session.commit()
+
+def measure(engine, label, fn, customer_ids):
+    statements = 0
+
+    def count_statement(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    start = time.perf_counter()
+    for customer_id in customer_ids:
+        fn(customer_id)
+    elapsed = time.perf_counter() - start
+    event.remove(engine, "before_cursor_execute", count_statement)
+
+    per_call_ms = elapsed / len(customer_ids) * 1000
+    print(f"{label:<16} | {statements / len(customer_ids):>14.1f} | {per_call_ms:>12.3f}")
+
+def main():
+    customers = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    tx_per_customer = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    url = os.getenv("BENCH_DATABASE_URL", "sqlite://")
+    engine = create_engine(url)
+    if url.startswith("sqlite"):
+        Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    customer_ids, merchant_id = seed(session, customers, tx_per_customer)
+    try:
+        repo = SqlAlchemyBehaviorRepository(session)
+        sample = customer_ids[:100]
+        assert all(
+            legacy_features(session, cid)["tx_count_24h"] == repo.calculate_features_from_history(cid)["tx_count_24h"]
+            for cid in sample[:10]
+        )
+
+        print(f"{customers} customers x {tx_per_customer} transactions on {engine.dialect.name}")
+        print(f"{'implementation':<16} | {'queries / call':>14} | {'ms / call':>12}")
+        measure(engine, "five queries", lambda cid: legacy_features(session, cid), sample)
+        measure(engine, "single query", repo.calculate_features_from_history, sample)
+    finally:
+        cleanup(session, customer_ids, merchant_id)
+        session.close()
+
+if __name__ == "__main__":
+    main()
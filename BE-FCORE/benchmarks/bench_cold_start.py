@@ -0,0 +1,68 @@
+"""
+Cold start of the API: time from exec'ing a uvicorn process to the first
+request served (/health/live), and to the worker reporting ready (/health/ready,
+which needs the database configured through the usual POSTGRES_* variables).
+Also reports how long 'import fcore.main' takes in a fresh interpreter.
+
+Usage (from BE-FCORE):
+    python benchmarks/bench_cold_start.py [runs]
+"""
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+READY_TIMEOUT_SECONDS = 30.0
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def wait_for(url: str, started: float, expect_ok: bool) -> float:
+    while time.perf_counter() - started < READY_TIMEOUT_SECONDS:
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return time.perf_counter() - started
+        except urllib.error.HTTPError:
+            if not expect_ok:
+                return time.perf_counter() - started
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(0.01)
+    return float("nan")
+
+def measure_import() -> float:
+    code = "import time; t = time.perf_counter(); import fcore.main; print(time.perf_counter() - t)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=os.getcwd())
+    return float(output.stdout.strip().splitlines()[-1])
+
+def measure_server() -> tuple:
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "fcore.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=os.getcwd(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        first_request = wait_for(f"http://127.0.0.1:{port}/health/live", started, expect_ok=False)
+        ready = wait_for(f"http://127.0.0.1:{port}/health/ready", started, expect_ok=True)
+    finally:
+        server.terminate()
+        server.wait()
+    return first_request, ready
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    for run in range(1, runs + 1):
+        import_seconds = measure_import()
+        first_request, ready = measure_server()
+        ready_text = f"{ready * 1000:7.1f} ms" if ready == ready else f"not ready after {READY_TIMEOUT_SECONDS:.0f}s"
+        print(f"run {run}: import fcore.main {import_seconds * 1000:7.1f} ms | "
+              f"exec -> first request {first_request * 1000:7.1f} ms | exec -> ready {ready_text}")
+
+if __name__ == "__main__":
+    main()
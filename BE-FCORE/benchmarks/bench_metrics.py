@@ -0,0 +1,114 @@
+"""
+Cost of recording one observation in the MetricsRegistry, and of a scoring
+request with and without ScoringMetrics.
+
+Usage (from BE-FCORE):
+    python benchmarks/bench_metrics.py
+"""
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+
+sys.path.append(os.getcwd())
+
+from fcore.application.services.decision_service import DecisionService
+from fcore.application.services.metrics import MetricsRegistry
+from fcore.application.services.scoring_metrics import ScoringMetrics
+from fcore.application.use_cases.scoring_use_case import ScoringUseCase
+from fcore.core.entities.behavior_profile import BehaviorProfile
+from fcore.core.entities.transaction import Transaction
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+from benchmarks.bench_rule_index import build_rules
+
+OBSERVATIONS = 1_000_000
+REQUESTS = 20_000
+
+def per_call_ns(fn, count: int) -> float:
+    start = time.perf_counter_ns()
+    fn(count)
+    return (time.perf_counter_ns() - start) / count
+
+def bench_recording():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("bench_seconds", "Bench.", ["stage"])
+    counter = registry.counter("bench_total", "Bench.", ["action"])
+    series = histogram.labels("rule_evaluation")
+    values = [random.random() / 100 for _ in range(1024)]
+
+    def loop_overhead(n):
+        for i in range(n):
+            values[i & 1023]
+
+    def observe_series(n):
+        for i in range(n):
+            series.observe(values[i & 1023])
+
+    def observe_labels(n):
+        for i in range(n):
+            histogram.labels("rule_evaluation").observe(values[i & 1023])
+
+    def inc_labels(n):
+        for i in range(n):
+            counter.labels("APPROVE").inc()
+
+    def timer(n):
+        for i in range(n):
+            with histogram.time("rule_evaluation"):
+                pass
+
+    baseline = per_call_ns(loop_overhead, OBSERVATIONS)
+    print(f"{'operation':<32} | {'ns/observation':>14}")
+    for name, fn in [("series.observe(v)", observe_series), ("labels(...).observe(v)", observe_labels),
+                     ("counter.labels(...).inc()", inc_labels), ("with histogram.time(...)", timer)]:
+        print(f"{name:<32} | {per_call_ns(fn, OBSERVATIONS) - baseline:>14.0f}")
+
+def bench_scoring():
+    rules = build_rules(50, random.Random(7))
+    rule_repo = Mock()
+    rule_repo.get_all.return_value = rules
+    behavior_repo = Mock()
+    behavior_repo.get_by_customer_id.side_effect = lambda customer_id: BehaviorProfile(customer_id=customer_id, usual_country="EC")
+    behavior_repo.calculate_features_from_history.return_value = {
+        "tx_count_10m": 1, "tx_count_30m": 1, "tx_count_24h": 1, "avg_amount_24h": 100.0, "usual_country": "EC"}
+    analyst_repo = Mock()
+    analyst_repo.get_all.return_value = []
+    scorer = Mock()
+    scorer.score.return_value = 0.1
+    transactions = [Transaction(customer_id=uuid4(), merchant_id=uuid4(), amount=Decimal(random.randint(1, 9000)),
+                                country="EC", occurred_at=datetime.utcnow()) for _ in range(REQUESTS)]
+
+    def run(metrics) -> float:
+        evaluator = CompiledEvalEvaluator()
+        evaluator.prepare(rules)
+        use_case = ScoringUseCase(Mock(), behavior_repo, rule_repo, Mock(), Mock(), analyst_repo, scorer,
+                                  DecisionService(), evaluator, metrics=metrics)
+        start = time.perf_counter()
+        for tx in transactions:
+            use_case.execute(tx)
+        return (time.perf_counter() - start) / REQUESTS * 1e6
+
+    # Best of three, alternating, so that both see the same machine state
+    best = {"off": float("inf"), "every": float("inf"), "1 in 10": float("inf")}
+    for _ in range(3):
+        best["off"] = min(best["off"], run(None))
+        best["every"] = min(best["every"], run(ScoringMetrics(MetricsRegistry())))
+        best["1 in 10"] = min(best["1 in 10"], run(ScoringMetrics(MetricsRegistry(), rule_sample_every=10)))
+    print(f"\nScoringUseCase.execute, {len(rules)} rules, in-memory repositories:")
+    print(f"{'metrics':<28} | {'us/request':>10} | {'overhead us':>11}")
+    for name, label in [("off", "off"), ("every", "rule timings on every tx"), ("1 in 10", "rule timings on 1 tx in 10")]:
+        print(f"{label:<28} | {best[name]:>10.1f} | {best[name] - best['off']:>11.1f}")
+
+def main():
+    # Rule hits and alerts without analysts are logged; that cost would hide the one measured here
+    logging.disable(logging.WARNING)
+    bench_recording()
+    bench_scoring()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compares SimpleEvalEvaluator against CompiledEvalEvaluator.
+
+Usage (from BE-FCORE):
+    python benchmarks/bench_rule_evaluators.py
+"""
+import random
+import sys
+import os
+import time
+from datetime import datetime
+
+sys.path.append(os.getcwd())
+
+from fcore.core.entities.rule import Rule
+from fcore.infrastructure.strategies.simple_eval_evaluator import SimpleEvalEvaluator
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+
+TEMPLATES = [
+    "amount > {n}",
+    "country == '{c}' and amount > {n}",
+    "channel == 'ECOM' and tx_count_10m > {k}",
+    "amount_ratio_vs_avg > {r} and not is_whitelisted_merchant",
+    "tx_count_24h > {k} or amount > avg_amount_24h * {r}",
+]
+COUNTRIES = ["EC", "CO", "PE", "US", "BR", "AR"]
+
+def build_rules(count: int, rng: random.Random):
+    rules = []
+    for i in range(count):
+        expression = rng.choice(TEMPLATES).format(
+            n=rng.randint(100, 5000), c=rng.choice(COUNTRIES), k=rng.randint(1, 30), r=rng.randint(2, 8)
+        )
+        rules.append(Rule(name=f"Bench rule {i}", dsl_expression=expression,
+                          created_at=datetime.utcnow(), created_by="C1000001"))
+    return rules
+
+def build_contexts(count: int, rng: random.Random):
+    return [{
+        "amount": rng.uniform(1, 6000),
+        "currency": "USD",
+        "country": rng.choice(COUNTRIES),
+        "channel": rng.choice(["POS", "ECOM"]),
+        "tx_count_10m": rng.randint(0, 10),
+        "tx_count_30m": rng.randint(0, 20),
+        "tx_count_24h": rng.randint(0, 60),
+        "avg_amount_24h": rng.uniform(1, 800),
+        "amount_ratio_vs_avg": rng.uniform(0, 10),
+        "is_whitelisted_merchant": rng.random() < 0.1,
+    } for _ in range(count)]
+
+def run(evaluator, rules, contexts) -> float:
+    start = time.perf_counter()
+    for context in contexts:
+        for rule in rules:
+            evaluator.evaluate(rule, context)
+    return time.perf_counter() - start
+
+def main():
+    rng = random.Random(42)
+    contexts = build_contexts(200, rng)
+
+    print(f"{'rules':>6} | {'simpleeval us/tx':>17} | {'compiled us/tx':>15} | {'speedup':>7}")
+    for rule_count in (10, 100, 1000):
+        rules = build_rules(rule_count, rng)
+        sample = contexts if rule_count < 1000 else contexts[:50]
+
+        compiled = CompiledEvalEvaluator()
+        compiled.prepare(rules)
+
+        simple_time = run(SimpleEvalEvaluator(), rules, sample)
+        compiled_time = run(compiled, rules, sample)
+
+        simple_us = simple_time / len(sample) * 1e6
+        compiled_us = compiled_time / len(sample) * 1e6
+        print(f"{rule_count:>6} | {simple_us:>17.1f} | {compiled_us:>15.1f} | {simple_us / compiled_us:>6.1f}x")
+
+if __name__ == "__main__":
+    main()
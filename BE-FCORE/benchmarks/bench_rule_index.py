@@ -0,0 +1,87 @@
+"""
+Compares the linear rule scan against indexed dispatch (RuleIndex) as the rule set grows.
+Both engines run in audit mode, so every candidate is evaluated and hits are compared.
+
+Usage (from BE-FCORE):
+    python benchmarks/bench_rule_index.py
+"""
+import random
+import sys
+import os
+import time
+from datetime import datetime
+
+sys.path.append(os.getcwd())
+
+from fcore.application.services.feature_builder import SCORING_FEATURE_SCHEMA
+from fcore.application.services.rule_engine import RuleEngine
+from fcore.application.services.rule_index import RuleIndex
+from fcore.core.entities.feature_vector import FeatureVector
+from fcore.core.entities.rule import Rule, RuleSeverity
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+
+# Mostly the shapes analysts write (country/channel/currency plus a threshold), some unindexable
+TEMPLATES = [
+    "country == '{c}' and amount > {n}",
+    "country == '{c}' and channel == 'ECOM' and tx_count_10m > {k}",
+    "channel == '{ch}' and amount > {n}",
+    "currency == '{cur}' and amount_ratio_vs_avg > {r}",
+    "amount > {big}",
+    "tx_count_30m >= {k}",
+    "amount_ratio_vs_avg > {r} and not is_whitelisted_merchant",
+]
+COUNTRIES = ["EC", "CO", "PE", "US", "BR", "AR", "MX", "CL", "UY", "PY"]
+
+def build_rules(count: int, rng: random.Random):
+    return [Rule(
+        name=f"Bench rule {i}",
+        dsl_expression=rng.choice(TEMPLATES).format(
+            c=rng.choice(COUNTRIES), ch=rng.choice(["POS", "ECOM"]), cur=rng.choice(["EUR", "PEN", "BRL"]),
+            n=rng.randint(100, 5000), big=rng.randint(4000, 20000), k=rng.randint(3, 30), r=rng.randint(3, 8)
+        ),
+        severity=rng.choice([RuleSeverity.LOW, RuleSeverity.MEDIUM, RuleSeverity.HIGH]),
+        created_at=datetime.utcnow(), created_by="C1000001"
+    ) for i in range(count)]
+
+def build_contexts(count: int, rng: random.Random):
+    return [FeatureVector(SCORING_FEATURE_SCHEMA, {
+        "amount": rng.uniform(1, 3000),
+        "currency": rng.choice(["USD", "USD", "EUR"]),
+        "country": rng.choice(COUNTRIES),
+        "channel": rng.choice(["POS", "ECOM"]),
+        "tx_count_10m": rng.randint(0, 6),
+        "tx_count_30m": rng.randint(0, 12),
+        "tx_count_24h": rng.randint(0, 40),
+        "avg_amount_24h": rng.uniform(1, 800),
+        "amount_ratio_vs_avg": rng.uniform(0, 6),
+        "is_whitelisted_merchant": rng.random() < 0.1,
+    }) for _ in range(count)]
+
+def run(engine, contexts):
+    start = time.perf_counter()
+    hits = [engine.evaluate(features) for features in contexts]
+    return time.perf_counter() - start, hits
+
+def main():
+    rng = random.Random(42)
+    contexts = build_contexts(500, rng)
+    evaluator = CompiledEvalEvaluator()
+
+    print(f"{'rules':>6} | {'indexed':>7} | {'candidates/tx':>13} | {'linear us/tx':>12} | {'indexed us/tx':>13} | {'speedup':>7}")
+    for rule_count in (10, 50, 200, 800, 2000):
+        rules = build_rules(rule_count, rng)
+        evaluator.prepare(rules)
+        index = RuleIndex(rules)
+
+        linear_time, linear_hits = run(RuleEngine(rules, evaluator, audit=True), contexts)
+        indexed_time, indexed_hits = run(RuleEngine(rules, evaluator, audit=True, index=index), contexts)
+        assert linear_hits == indexed_hits, "indexed dispatch changed the hits"
+
+        candidates = sum(len(index.candidates(features.as_dict())) for features in contexts) / len(contexts)
+        linear_us = linear_time / len(contexts) * 1e6
+        indexed_us = indexed_time / len(contexts) * 1e6
+        print(f"{rule_count:>6} | {index.indexed_count:>7} | {candidates:>13.1f} | {linear_us:>12.1f} | "
+              f"{indexed_us:>13.1f} | {linear_us / indexed_us:>6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+SQL statements and latency per scored transaction: the former two-step path
+(TransactionUseCases.record_transaction + ScoringUseCase.execute on the request
+session) versus ScoringIngestionUseCase with its single-commit unit of work.
+
+Runs on an in-memory SQLite database; set BENCH_DATABASE_URL to measure against
+PostgreSQL/TimescaleDB (tables must exist; the seeded rows are left in place).
+
+Usage (from BE-FCORE):
+    python benchmarks/bench_scoring_round_trips.py [transactions]
+"""
+import os
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+
+sys.path.append(os.getcwd())
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from fcore.infrastructure.database.models.base_db_model import Base
+from fcore.infrastructure.database.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_merchant_repository import SqlAlchemyMerchantRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_transaction_repository import SqlAlchemyTransactionRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_behavior_repository import SqlAlchemyBehaviorRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_rule_repository import SqlAlchemyRuleRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_alert_repository import SqlAlchemyAlertRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_case_repository import SqlAlchemyCaseRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_analyst_repository import SqlAlchemyAnalystRepository
+from fcore.infrastructure.database.scoring_unit_of_work import SqlAlchemyScoringUnitOfWork
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+from fcore.infrastructure.ml.xgb_scorer import XgbScorerStub
+from fcore.application.services.decision_service import DecisionService
+from fcore.application.services.rule_set_cache import RuleSetCache
+from fcore.application.use_cases.transaction_use_case import TransactionUseCases
+from fcore.application.use_cases.scoring_use_case import ScoringUseCase
+from fcore.application.use_cases.scoring_ingestion_use_case import ScoringIngestionUseCase
+from fcore.core.entities.customer import Customer
+from fcore.core.entities.merchant import Merchant
+from fcore.core.entities.rule import Rule
+from fcore.core.entities.transaction import TransactionChannel
+
+def legacy_score(session_factory, rule_set_cache, data):
+    """The previous request flow: record (commit), score, then get_db's commit."""
+    session = session_factory()
+    try:
+        transaction = TransactionUseCases(
+            SqlAlchemyTransactionRepository(session),
+            SqlAlchemyCustomerRepository(session),
+            SqlAlchemyMerchantRepository(session)
+        ).record_transaction(data)
+        ScoringUseCase(
+            SqlAlchemyTransactionRepository(session), SqlAlchemyBehaviorRepository(session),
+            SqlAlchemyRuleRepository(session), SqlAlchemyAlertRepository(session),
+            SqlAlchemyCaseRepository(session), SqlAlchemyAnalystRepository(session),
+            XgbScorerStub(), DecisionService(), CompiledEvalEvaluator(), rule_set_cache
+        ).execute(transaction)
+        session.commit()
+    finally:
+        session.close()
+
+def measure(engine, label, fn, items):
+    statements = commits = 0
+
+    def count_statement(*_):
+        nonlocal statements
+        statements += 1
+
+    def count_commit(*_):
+        nonlocal commits
+        commits += 1
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    event.listen(engine, "commit", count_commit)
+    start = time.perf_counter()
+    for data in items:
+        fn(data)
+    elapsed = time.perf_counter() - start
+    event.remove(engine, "before_cursor_execute", count_statement)
+    event.remove(engine, "commit", count_commit)
+
+    n = len(items)
+    print(f"{label:<20} | {statements / n:>12.1f} | {commits / n:>9.1f} | {elapsed / n * 1000:>9.3f}")
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    url = os.getenv("BENCH_DATABASE_URL", "sqlite://")
+    engine = create_engine(url)
+    if url.startswith("sqlite"):
+        Base.metadata.create_all(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    session = session_factory()
+    customer = SqlAlchemyCustomerRepository(session).create(
+        Customer(full_name="Bench customer", document_number=str(uuid4().int)[:10]))
+    merchant = SqlAlchemyMerchantRepository(session).create(
+        Merchant(name=f"Bench merchant {uuid4()}", category="retail"))
+    SqlAlchemyRuleRepository(session).create(Rule(
+        name=f"Bench rule {uuid4()}", dsl_expression="amount > 100000",
+        created_at=datetime.utcnow(), created_by="C1000001"))
+    session.close()
+
+    items = [{"customer_id": customer.id, "merchant_id": merchant.id, "amount": Decimal("12.50"),
+              "channel": TransactionChannel.POS, "country": "EC"} for _ in range(count)]
+    rule_set_cache = RuleSetCache(max_age_seconds=3600)
+    ingestion = ScoringIngestionUseCase(
+        uow=SqlAlchemyScoringUnitOfWork(session_factory), scorer=XgbScorerStub(),
+        decision_service=DecisionService(), rule_evaluator=CompiledEvalEvaluator(),
+        rule_set_cache=rule_set_cache
+    )
+
+    # Warm up: rule set snapshot and behavior profile
+    legacy_score(session_factory, rule_set_cache, items[0])
+
+    print(f"{count} approved transactions on {engine.dialect.name}")
+    print(f"{'path':<20} | {'statements/tx':>12} | {'commits/tx':>9} | {'ms/tx':>9}")
+    measure(engine, "record + score", lambda data: legacy_score(session_factory, rule_set_cache, data), items)
+    measure(engine, "scoring unit of work", ingestion.execute, items)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Latency of the NumPy tree-ensemble scorer at 1, 64 and 4,096 rows: one score()
+call per row versus a single score_batch() call, against a per-row pure-Python
+walk of the same trees as the baseline.
+
+Uses a synthetic 300-tree, depth-6 ensemble over the scoring features; pass the
+path of an XGBoost JSON model to measure a real one instead.
+
+Usage (from BE-FCORE):
+    python benchmarks/bench_tree_scorer.py [model.json]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from fcore.infrastructure.ml.tree_ensemble import load_xgboost_json
+from fcore.infrastructure.ml.xgb_tree_scorer import XgbTreeScorer
+
+FEATURES = ["amount", "tx_count_10m", "tx_count_30m", "tx_count_24h", "avg_amount_24h", "is_new_country"]
+RANGES = {"amount": 5000, "tx_count_10m": 10, "tx_count_30m": 20, "tx_count_24h": 60, "avg_amount_24h": 2000, "is_new_country": 1}
+
+def synthetic_model(rng: random.Random, trees: int = 300, depth: int = 6) -> dict:
+    def build_tree():
+        left, right, splits, conditions, defaults = [], [], [], [], []
+
+        def grow(level):
+            node = len(left)
+            for values in (left, right, splits, conditions, defaults):
+                values.append(0)
+            if level == depth:
+                left[node], right[node], conditions[node] = -1, -1, rng.uniform(-0.2, 0.2)
+                return node
+            feature = rng.randrange(len(FEATURES))
+            splits[node], conditions[node] = feature, rng.uniform(0, RANGES[FEATURES[feature]])
+            defaults[node] = rng.randrange(2)
+            left[node] = grow(level + 1)
+            right[node] = grow(level + 1)
+            return node
+
+        grow(0)
+        return {"left_children": left, "right_children": right, "split_indices": splits,
+                "split_conditions": conditions, "default_left": defaults}
+
+    return {"learner": {
+        "feature_names": FEATURES,
+        "learner_model_param": {"base_score": "5E-1", "num_class": "0"},
+        "objective": {"name": "binary:logistic"},
+        "gradient_booster": {"name": "gbtree", "model": {"trees": [build_tree() for _ in range(trees)]}}
+    }}
+
+def python_walk(model: dict, features: dict) -> float:
+    margin = 0.0
+    for tree in model["learner"]["gradient_booster"]["model"]["trees"]:
+        node = 0
+        while tree["left_children"][node] >= 0:
+            value = features.get(FEATURES[tree["split_indices"][node]])
+            go_left = bool(tree["default_left"][node]) if value is None else value < tree["split_conditions"][node]
+            node = tree["left_children"][node] if go_left else tree["right_children"][node]
+        margin += tree["split_conditions"][node]
+    return margin
+
+def timed(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+def main():
+    rng = random.Random(42)
+    if len(sys.argv) > 1:
+        scorer, model = XgbTreeScorer.from_file(sys.argv[1]), None
+        names = scorer._feature_names
+    else:
+        model = synthetic_model(rng)
+        scorer, names = XgbTreeScorer(load_xgboost_json(model)), FEATURES
+
+    print(f"{scorer._ensemble.num_trees} trees, max depth {scorer._ensemble.max_depth}")
+    print(f"{'rows':>6} | {'python walk ms':>14} | {'score() ms':>10} | {'score_batch ms':>14} | {'us/row batch':>12}")
+    for rows in (1, 64, 4096):
+        batch = [{name: rng.uniform(0, RANGES.get(name, 1)) for name in names} for _ in range(rows)]
+        repeat = max(1, 2000 // rows)
+
+        walk_ms = timed(lambda: [python_walk(model, f) for f in batch], max(1, repeat // 10)) * 1000 if model else float("nan")
+        single_ms = timed(lambda: [scorer.score(f) for f in batch], max(1, repeat // 10)) * 1000
+        batch_ms = timed(lambda: scorer.score_batch(batch), repeat) * 1000
+        print(f"{rows:>6} | {walk_ms:>14.2f} | {single_ms:>10.2f} | {batch_ms:>14.2f} | {batch_ms * 1000 / rows:>12.2f}")
+
+if __name__ == "__main__":
+    main()
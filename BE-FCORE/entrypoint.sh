@@ -21,6 +21,22 @@ if [ -f "seed_data.py" ]; then
 fi
 
 # Iniciar Uvicorn
-echo "🔥 [Backend] Arrancando servidor..."
 # Importante: Como tu main.py está en fcore/presentation/api/main.py
+if [ "${APP_ENV}" = "production" ]; then
+    # Modo producción: un worker por núcleo (WEB_CONCURRENCY) y reciclaje de cada
+    # worker tras MAX_REQUESTS peticiones. Cada worker hace su warm-up antes de
+    # aceptar conexiones; /health/ready indica cuándo terminó.
+    WORKERS="${WEB_CONCURRENCY:-$(nproc)}"
+    # Cada scrape de /metrics lo atiende un worker cualquiera: los workers comparten
+    # sus métricas en este directorio, que se vacía en cada arranque.
+    export METRICS_MULTIPROC_DIR="${METRICS_MULTIPROC_DIR:-/tmp/fcore-metrics}"
+    rm -rf "${METRICS_MULTIPROC_DIR}" && mkdir -p "${METRICS_MULTIPROC_DIR}"
+    echo "🔥 [Backend] Arrancando servidor en modo producción con ${WORKERS} workers..."
+    exec uvicorn fcore.main:app --host 0.0.0.0 --port 8000 \
+        --workers "${WORKERS}" \
+        --limit-max-requests "${MAX_REQUESTS:-10000}" \
+        --timeout-graceful-shutdown "${GRACEFUL_SHUTDOWN_SECONDS:-30}"
+fi
+
+echo "🔥 [Backend] Arrancando servidor..."
 exec uvicorn fcore.main:app --host 0.0.0.0 --port 8000
\ No newline at end of file
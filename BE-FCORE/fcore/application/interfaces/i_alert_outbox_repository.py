@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from ...core.entities.alert_outbox_event import AlertOutboxEvent
+
+class IAlertOutboxRepository(ABC):
+    """Interface for the alert outbox (pending alert/case creation)."""
+
+    @abstractmethod
+    def add(self, event: AlertOutboxEvent) -> None:
+        """Stages the event in the current transaction, without extra reads."""
+        pass
+
+    @abstractmethod
+    def claim_batch(self, limit: int, lease_seconds: float) -> List[AlertOutboxEvent]:
+        """
+        Returns up to 'limit' due events and leases them for 'lease_seconds'
+        (counting one attempt), so concurrent workers skip them.
+        """
+        pass
+
+    @abstractmethod
+    def mark_done(self, id: UUID) -> None:
+        pass
+
+    @abstractmethod
+    def mark_failed(self, id: UUID, error: str, retry_at: Optional[datetime]) -> None:
+        """Schedules a retry at 'retry_at', or gives up on the event when it is None."""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Pending and dead counts plus the creation time of the oldest pending event."""
+        pass
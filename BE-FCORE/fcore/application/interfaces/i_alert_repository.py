@@ -14,6 +14,11 @@ class IAlertRepository(ABC):
     def find_by_id(self, id: UUID) -> Optional[Alert]:
         pass
 
+    @abstractmethod
+    def exists(self, id: UUID) -> bool:
+        """Cheap existence check, without loading relationships."""
+        pass
+
     @abstractmethod
     def get_all(self, limit: int = 100, offset: int = 0) -> List[Alert]:
         pass
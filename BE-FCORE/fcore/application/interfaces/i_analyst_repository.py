@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from uuid import UUID
 from ...core.entities.analyst import Analyst
 
 class IAnalystRepository(ABC):
@@ -14,6 +15,11 @@ class IAnalystRepository(ABC):
     @abstractmethod
     def get_all(self) -> List[Analyst]:
         pass
+
+    @abstractmethod
+    def get_active_workload(self) -> List[Tuple[UUID, str, int]]:
+        """(id, name, open PENDING cases) of every active analyst, from one grouped query."""
+        pass
     
     @abstractmethod
     def find_by_id(self, id: int) -> Optional[Analyst]:
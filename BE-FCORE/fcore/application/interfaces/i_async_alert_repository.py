@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from uuid import UUID
+from ...core.entities.alert import Alert
+
+class IAsyncAlertRepository(ABC):
+    """Awaitable counterpart of IAlertRepository for the async endpoints."""
+
+    @abstractmethod
+    async def find_by_id(self, id: UUID) -> Optional[Alert]:
+        pass
+
+    @abstractmethod
+    async def exists(self, id: UUID) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[Alert]:
+        pass
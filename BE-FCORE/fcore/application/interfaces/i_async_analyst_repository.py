@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from ...core.entities.analyst import Analyst
+
+class IAsyncAnalystRepository(ABC):
+    """Awaitable analyst lookup for the authentication dependency."""
+
+    @abstractmethod
+    async def find_by_code(self, code: str) -> Optional[Analyst]:
+        pass
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+from ...core.entities.behavior_profile import BehaviorProfile
+
+class IAsyncBehaviorRepository(ABC):
+    """Awaitable counterpart of the IBehaviorRepository reads used by the API."""
+
+    @abstractmethod
+    async def get_by_customer_id(self, customer_id: UUID) -> Optional[BehaviorProfile]:
+        pass
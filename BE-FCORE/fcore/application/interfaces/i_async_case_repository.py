@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from uuid import UUID
+from ...core.entities.case import Case
+
+class IAsyncCaseRepository(ABC):
+    """Awaitable counterpart of ICaseRepository for the async endpoints."""
+
+    @abstractmethod
+    async def create(self, case: Case) -> Case:
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, id: UUID) -> Optional[Case]:
+        pass
+
+    @abstractmethod
+    async def find_by_alert_id(self, alert_id: UUID) -> Optional[Case]:
+        pass
+
+    @abstractmethod
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[Case]:
+        pass
+
+    @abstractmethod
+    async def update(self, case: Case) -> Case:
+        pass
@@ -0,0 +1,26 @@
+from abc import abstractmethod
+from concurrent.futures import Future
+from typing import Any, Callable, TypeVar
+
+from .i_scoring_unit_of_work import IScoringUnitOfWork
+
+T = TypeVar("T")
+
+class IAsyncScoringUnitOfWork(IScoringUnitOfWork):
+    """
+    A scoring unit of work whose database I/O is awaited on the event loop.
+    The scoring pipeline itself stays synchronous: run() executes it against
+    the repositories of this unit of work without tying up a thread.
+    """
+
+    @abstractmethod
+    async def run(self, work: Callable[..., T], *args: Any) -> T:
+        pass
+
+    @abstractmethod
+    def wait_for(self, future: Future, timeout_seconds: float) -> Any:
+        """
+        Called from the pipeline inside run(): the result of 'future', waited for
+        without blocking the event loop. Raises concurrent.futures.TimeoutError.
+        """
+        pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Sequence
+
+from ...core.entities.rule import Rule
+from ..services.backtest import BacktestReport
+
+class IBacktestRunner(ABC):
+    """Interface for replaying rules over the stored transactions."""
+
+    @abstractmethod
+    def run(self, rules: Sequence[Rule], start: datetime, end: datetime) -> BacktestReport:
+        """
+        Evaluates the rules against every transaction in [start, end) with the
+        behavior features as they stood just before it.
+        """
+        pass
@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from typing import Any, Mapping, Sequence
+
+from .i_rule_evaluator import IRuleEvaluator
+from ...core.entities.rule import Rule
+
+class IBatchRuleEvaluator(IRuleEvaluator):
+    """
+    A rule evaluation Strategy that can also evaluate a whole rule set against
+    many contexts at once (batch scoring, replays).
+    """
+
+    @abstractmethod
+    def evaluate_batch(self, rules: Sequence[Rule], contexts: Sequence[Mapping[str, Any]]) -> Any:
+        """
+        Returns a boolean hit matrix of len(contexts) rows by len(rules) columns,
+        indexable as matrix[row][column] (a NumPy array in practice). Every cell
+        equals evaluate(rules[column], contexts[row]).
+        """
+        pass
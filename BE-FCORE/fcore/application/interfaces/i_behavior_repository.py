@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 from ...core.entities.behavior_profile import BehaviorProfile
 
@@ -9,10 +9,27 @@ class IBehaviorRepository(ABC):
     def get_by_customer_id(self, customer_id: UUID) -> Optional[BehaviorProfile]:
         pass
 
+    @abstractmethod
+    def get_by_customer_ids(self, customer_ids: Iterable[UUID]) -> Dict[UUID, BehaviorProfile]:
+        pass
+
     @abstractmethod
     def save(self, profile: BehaviorProfile) -> BehaviorProfile:
         pass
 
     @abstractmethod
     def calculate_features_from_history(self, customer_id: UUID) -> Dict[str, any]:
+        pass
+
+    @abstractmethod
+    def save_many(self, profiles: List[BehaviorProfile]) -> None:
+        pass
+
+    @abstractmethod
+    def calculate_features_for_customers(self, customer_ids: Iterable[UUID]) -> Dict[UUID, Dict[str, any]]:
+        """
+        Same aggregations as calculate_features_from_history for several customers
+        in one grouped query. Each entry also carries 'amount_sum_24h' and
+        'country_counts_30d' so callers can fold new transactions in.
+        """
         pass
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 from uuid import UUID
 from ...core.entities.customer import Customer
 
@@ -13,6 +13,11 @@ class ICustomerRepository(ABC):
     def find_by_id(self, id: UUID) -> Optional[Customer]:
         pass
 
+    @abstractmethod
+    def find_existing_ids(self, ids: Iterable[UUID]) -> Set[UUID]:
+        """Returns the subset of the given IDs that exist, using a single query."""
+        pass
+
     @abstractmethod
     def find_by_document_number(self, document_number: str) -> Optional[Customer]:
         pass
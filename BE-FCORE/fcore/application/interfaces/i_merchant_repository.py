@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 from ...core.entities.merchant import Merchant
 
@@ -14,6 +14,11 @@ class IMerchantRepository(ABC):
     def find_by_id(self, id: UUID) -> Optional[Merchant]:
         pass
 
+    @abstractmethod
+    def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, Merchant]:
+        """Loads several merchants at once, keyed by ID. Unknown IDs are omitted."""
+        pass
+
     @abstractmethod
     def find_by_name(self, name: str) -> Optional[Merchant]:
         pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Mapping, Any, List
 
 class IModelScorer(ABC):
     """
@@ -7,9 +7,18 @@ class IModelScorer(ABC):
     """
 
     @abstractmethod
-    def score(self, features: Dict[str, Any]) -> float:
+    def score(self, features: Mapping[str, Any]) -> float:
         """
-        Calculates a risk score based on a feature vector.
+        Calculates a risk score based on a feature vector (a FeatureVector on the
+        scoring path; any name -> value mapping is accepted).
         Returns a score between 0.0 (no risk) and 1.0 (high risk).
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def score_batch(self, features_list: List[Mapping[str, Any]]) -> List[float]:
+        """
+        Scores several feature vectors in one call, in input order.
+        Same results as calling score() on each of them.
+        """
+        pass
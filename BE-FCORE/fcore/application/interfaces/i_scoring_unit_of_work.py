@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Optional, Type
+
+from .i_customer_repository import ICustomerRepository
+from .i_merchant_repository import IMerchantRepository
+from .i_transaction_repository import ITransactionRepository
+from .i_behavior_repository import IBehaviorRepository
+from .i_rule_repository import IRuleRepository
+from .i_alert_repository import IAlertRepository
+from .i_case_repository import ICaseRepository
+from .i_analyst_repository import IAnalystRepository
+from .i_alert_outbox_repository import IAlertOutboxRepository
+
+class IScoringUnitOfWork(ABC):
+    """
+    Everything the real-time scoring path touches, bound to one database
+    transaction that is committed once.
+    """
+
+    customer_repository: ICustomerRepository
+    merchant_repository: IMerchantRepository
+    transaction_repository: ITransactionRepository
+    behavior_repository: IBehaviorRepository
+    rule_repository: IRuleRepository
+    alert_repository: IAlertRepository
+    case_repository: ICaseRepository
+    analyst_repository: IAnalystRepository
+    alert_outbox_repository: IAlertOutboxRepository
+
+    @abstractmethod
+    def __enter__(self) -> "IScoringUnitOfWork":
+        pass
+
+    @abstractmethod
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        pass
+
+    @property
+    @abstractmethod
+    def statement_count(self) -> int:
+        """SQL statements sent to the database since the unit of work was entered."""
+        pass
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import List
+from ...core.entities.shadow_rule_hit import ShadowRuleHit
+
+class IShadowRuleHitRepository(ABC):
+    """Interface for the shadow rule hit log."""
+
+    @abstractmethod
+    def add_many(self, hits: List[ShadowRuleHit]) -> None:
+        """Writes and commits the hits with a single bulk statement."""
+        pass
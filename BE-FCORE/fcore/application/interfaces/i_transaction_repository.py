@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Iterator, List, Optional, Tuple
 from uuid import UUID
 from ...core.entities.transaction import Transaction
 
@@ -10,6 +12,19 @@ class ITransactionRepository(ABC):
     def create(self, transaction: Transaction) -> Transaction:
         pass
 
+    @abstractmethod
+    def add(self, transaction: Transaction) -> Transaction:
+        """
+        Inserts within the caller's transaction (no commit, no re-read). The given
+        entity, with whatever customer/merchant it already carries, is returned.
+        """
+        pass
+
+    @abstractmethod
+    def create_many(self, transactions: List[Transaction]) -> List[Transaction]:
+        """Inserts several transactions with a single bulk statement."""
+        pass
+
     @abstractmethod
     def find_by_id(self, id: UUID) -> Optional[Transaction]:
         pass
@@ -20,4 +35,20 @@ class ITransactionRepository(ABC):
 
     @abstractmethod
     def get_all(self, limit: int = 100, offset: int = 0) -> List[Transaction]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_activity_since(self, since: datetime) -> Iterator[Tuple[UUID, datetime, Decimal]]:
+        """Streams (customer_id, occurred_at, amount) of every transaction since 'since', oldest first."""
+        pass
+
+    @abstractmethod
+    def stream_range(self, since: datetime, until: datetime, shard: int = 0, shard_count: int = 1,
+                     chunk: timedelta = timedelta(days=1)) -> Iterator[Transaction]:
+        """
+        Streams the transactions in [since, until), oldest first, without keeping
+        them in the session. With shard_count > 1 only the customers of the given
+        shard are returned (the same customer always lands in the same shard).
+        Merchants are attached only when flagged (blacklisted / whitelisted).
+        """
+        pass
@@ -4,11 +4,17 @@ from typing import Optional, Type
 
 from .i_analyst_repository import IAnalystRepository
 from .i_role_repository import IRoleRepository
+from .i_alert_repository import IAlertRepository
+from .i_case_repository import ICaseRepository
+from .i_alert_outbox_repository import IAlertOutboxRepository
 
 class IUnitOfWork(ABC):
     
     analyst_repository: IAnalystRepository
     role_repository: IRoleRepository
+    alert_repository: IAlertRepository
+    case_repository: ICaseRepository
+    alert_outbox_repository: IAlertOutboxRepository
 
     @abstractmethod
     def __enter__(self) -> "IUnitOfWork":
@@ -0,0 +1,73 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from ..use_cases.alert_outbox_use_case import ProcessAlertOutboxUseCase
+
+logger = logging.getLogger(__name__)
+
+class AlertOutboxWorker:
+    """
+    Background thread that drains the alert outbox. It keeps polling while
+    batches come back full and sleeps poll_interval_seconds otherwise.
+    """
+
+    def __init__(
+        self,
+        use_case_factory: Callable[[], ProcessAlertOutboxUseCase],
+        batch_size: int = 100,
+        poll_interval_seconds: float = 1.0
+    ):
+        self._use_case_factory = use_case_factory
+        self._batch_size = batch_size
+        self._poll_interval_seconds = poll_interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.processed_total = 0
+        self.failed_total = 0
+        self.last_batch_at: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="alert-outbox-worker", daemon=True)
+        self._thread.start()
+        logger.info("Alert outbox worker started.")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        logger.info("Alert outbox worker stopped.")
+
+    def run_once(self) -> int:
+        """Processes a single batch. Returns how many events were handled."""
+        processed, failed = self._use_case_factory().process_batch(self._batch_size)
+        self.processed_total += processed
+        self.failed_total += failed
+        self.last_batch_at = time.time()
+        return processed + failed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.is_running,
+            "processed_total": self.processed_total,
+            "failed_total": self.failed_total,
+            "last_batch_at": self.last_batch_at
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                handled = self.run_once()
+            except Exception as e:
+                logger.error(f"Alert outbox batch failed: {e}")
+                handled = 0
+            if handled < self._batch_size:
+                self._stop.wait(self._poll_interval_seconds)
@@ -0,0 +1,116 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from ..interfaces.i_analyst_repository import IAnalystRepository
+
+logger = logging.getLogger(__name__)
+
+class AnalystAssignmentService:
+    """
+    Least-loaded case assignment over an in-memory roster of active analysts.
+
+    The roster (analyst id, name and open-case count) is loaded with one grouped
+    query and reloaded when it is older than ttl_seconds or after invalidate()
+    (analyst CRUD). A reload also corrects counters that drifted because other
+    workers assigned or closed cases.
+
+    Picking an analyst is O(log n): the heap holds (open_cases, sequence, id)
+    entries, and entries made stale by a newer count are skipped when popped.
+    The sequence number sends ties to the analyst assigned least recently.
+
+    The roster query runs outside the lock, which only guards the in-memory
+    state: on the async path run_sync drives this code in greenlets on the
+    event loop thread, where waiting on a lock held across a query would block
+    the loop that query needs. A roster older than one already swapped in (or
+    than an invalidate()) is dropped.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._names: Dict[UUID, str] = {}
+        self._open_cases: Dict[UUID, int] = {}
+        self._heap: List[Tuple[int, int, UUID]] = []
+        self._loaded_at: Optional[float] = None
+        self._loads_started = 0
+        self._oldest_installable_load = 0
+
+    def assign(self, analyst_repo: IAnalystRepository) -> Optional[Tuple[UUID, str]]:
+        """Returns (analyst_id, name) of the least-loaded active analyst, or None if there are none."""
+        return self.assign_many(analyst_repo, 1)[0]
+
+    def assign_many(self, analyst_repo: IAnalystRepository, count: int) -> List[Optional[Tuple[UUID, str]]]:
+        """Assigns 'count' new cases at once, spreading them over the least-loaded analysts."""
+        self._ensure_fresh(analyst_repo)
+        with self._lock:
+            return [self._pop_least_loaded() for _ in range(count)]
+
+    def acquire(self, analyst_id: UUID) -> None:
+        """Counts a case opened for the analyst outside assign(), e.g. by hand from an alert."""
+        with self._lock:
+            if analyst_id in self._open_cases:
+                self._open_cases[analyst_id] += 1
+                self._push(analyst_id)
+
+    def release(self, analyst_id: UUID) -> None:
+        """Frees one slot of the analyst: the case was resolved, or the assignment was not used."""
+        with self._lock:
+            if analyst_id in self._open_cases and self._open_cases[analyst_id] > 0:
+                self._open_cases[analyst_id] -= 1
+                self._push(analyst_id)
+
+    def invalidate(self) -> None:
+        """Forces the roster to be reloaded on the next assignment."""
+        with self._lock:
+            self._loaded_at = None
+            self._oldest_installable_load = self._loads_started + 1
+
+    def workload(self) -> Dict[UUID, int]:
+        with self._lock:
+            return dict(self._open_cases)
+
+    def _ensure_fresh(self, analyst_repo: IAnalystRepository) -> None:
+        with self._lock:
+            now = self._clock()
+            if self._loaded_at is not None and now - self._loaded_at < self._ttl_seconds:
+                return
+            self._loads_started += 1
+            load = self._loads_started
+
+        roster = analyst_repo.get_active_workload()
+
+        with self._lock:
+            if load < self._oldest_installable_load:
+                return
+            self._oldest_installable_load = load
+            self._names = {analyst_id: name for analyst_id, name, _ in roster}
+            self._open_cases = {analyst_id: open_cases for analyst_id, _, open_cases in roster}
+            self._heap = []
+            for analyst_id in self._open_cases:
+                self._push(analyst_id)
+            self._loaded_at = now
+        logger.info(f"Analyst roster loaded: {len(self._names)} active analysts.")
+
+    def _push(self, analyst_id: UUID) -> None:
+        heapq.heappush(self._heap, (self._open_cases[analyst_id], next(self._sequence), analyst_id))
+        # Stale entries are dropped lazily; rebuild if they start to dominate the heap.
+        if len(self._heap) > 4 * len(self._open_cases) + 64:
+            self._heap = [entry for entry in self._heap if entry[0] == self._open_cases.get(entry[2])]
+            heapq.heapify(self._heap)
+
+    def _pop_least_loaded(self) -> Optional[Tuple[UUID, str]]:
+        while self._heap:
+            open_cases, _, analyst_id = heapq.heappop(self._heap)
+            if self._open_cases.get(analyst_id) != open_cases:
+                continue  # Stale entry
+            self._open_cases[analyst_id] = open_cases + 1
+            self._push(analyst_id)
+            return analyst_id, self._names[analyst_id]
+        return None
@@ -0,0 +1,165 @@
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from ...core.entities.behavior_profile import BehaviorProfile
+from ...core.entities.rule import Rule
+from ...core.entities.transaction import Transaction
+
+# Longest window a behavior feature looks back over (usual_country)
+LOOKBACK = timedelta(days=30)
+
+_WINDOW_10M = timedelta(minutes=10)
+_WINDOW_30M = timedelta(minutes=30)
+_WINDOW_24H = timedelta(hours=24)
+
+class _CustomerHistory:
+    __slots__ = ("amounts", "amount_sum", "countries", "country_counts")
+
+    def __init__(self):
+        self.amounts: Deque[Tuple[datetime, float]] = deque()     # last 24h
+        self.amount_sum = 0.0
+        self.countries: Deque[Tuple[datetime, str]] = deque()     # last 30 days
+        self.country_counts: Counter = Counter()
+
+class PointInTimeProfiles:
+    """
+    Behavior profiles rebuilt from the transaction stream itself, for replays.
+    Feed every transaction with add() in occurred_at order, starting LOOKBACK
+    before the first one scored; profile_before() then returns what the
+    history query (calculate_features_from_history) would have returned just
+    before that transaction: counts over the trailing 10m/30m/24h, the 24h
+    average amount and the 30-day country mode.
+    """
+
+    def __init__(self):
+        self._customers: Dict[UUID, _CustomerHistory] = {}
+
+    def profile_before(self, tx: Transaction) -> BehaviorProfile:
+        history = self._customers.get(tx.customer_id)
+        if history is None:
+            return BehaviorProfile(customer_id=tx.customer_id, updated_at=tx.occurred_at)
+        now = tx.occurred_at
+        self._expire(history, now)
+
+        count_10m = count_30m = 0
+        since_10m, since_30m = now - _WINDOW_10M, now - _WINDOW_30M
+        for occurred_at, _ in reversed(history.amounts):
+            if occurred_at < since_30m:
+                break
+            count_30m += 1
+            if occurred_at >= since_10m:
+                count_10m += 1
+
+        count_24h = len(history.amounts)
+        most_common = history.country_counts.most_common(1)
+        return BehaviorProfile(
+            customer_id=tx.customer_id,
+            avg_amount_24h=history.amount_sum / count_24h if count_24h else 0.0,
+            tx_count_10m=count_10m,
+            tx_count_30m=count_30m,
+            tx_count_24h=count_24h,
+            usual_country=most_common[0][0] if most_common else None,
+            updated_at=now
+        )
+
+    def add(self, tx: Transaction) -> None:
+        history = self._customers.get(tx.customer_id)
+        if history is None:
+            history = self._customers[tx.customer_id] = _CustomerHistory()
+        self._expire(history, tx.occurred_at)
+        amount = float(tx.amount)
+        history.amounts.append((tx.occurred_at, amount))
+        history.amount_sum += amount
+        if tx.country is not None:
+            # count(country) in the history query skips NULLs
+            history.countries.append((tx.occurred_at, tx.country))
+            history.country_counts[tx.country] += 1
+
+    @staticmethod
+    def _expire(history: _CustomerHistory, now: datetime) -> None:
+        since_24h = now - _WINDOW_24H
+        while history.amounts and history.amounts[0][0] < since_24h:
+            history.amount_sum -= history.amounts.popleft()[1]
+        if not history.amounts:
+            history.amount_sum = 0.0  # Drop accumulated rounding error
+
+        since_30d = now - LOOKBACK
+        while history.countries and history.countries[0][0] < since_30d:
+            country = history.countries.popleft()[1]
+            history.country_counts[country] -= 1
+            if not history.country_counts[country]:
+                del history.country_counts[country]
+
+@dataclass
+class RuleBacktest:
+    rule_id: str
+    rule_name: str
+    dsl_expression: str
+    hits: int = 0
+    fraud_hits: int = 0
+    hits_by_day: Dict[str, int] = field(default_factory=dict)
+
+@dataclass
+class BacktestReport:
+    """
+    Counters of a replay: transactions and labeled frauds per day, and per rule
+    its hits, the hits on transactions labeled as fraud and the hits per day.
+    Partial reports (one per shard of customers) are combined with merge().
+    """
+    start: datetime
+    end: datetime
+    rules: List[RuleBacktest]
+    rows: int = 0
+    fraud_rows: int = 0
+    rows_by_day: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def for_rules(cls, start: datetime, end: datetime, rules: Sequence[Rule]) -> "BacktestReport":
+        return cls(start=start, end=end, rules=[
+            RuleBacktest(rule_id=str(rule.id), rule_name=rule.name, dsl_expression=rule.dsl_expression)
+            for rule in rules
+        ])
+
+    def merge(self, other: "BacktestReport") -> "BacktestReport":
+        self.rows += other.rows
+        self.fraud_rows += other.fraud_rows
+        _add_counts(self.rows_by_day, other.rows_by_day)
+        for mine, theirs in zip(self.rules, other.rules):
+            mine.hits += theirs.hits
+            mine.fraud_hits += theirs.fraud_hits
+            _add_counts(mine.hits_by_day, theirs.hits_by_day)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "rows": self.rows,
+            "fraud_rows": self.fraud_rows,
+            "rules": [{
+                "rule_id": rule.rule_id,
+                "rule_name": rule.rule_name,
+                "dsl_expression": rule.dsl_expression,
+                "hits": rule.hits,
+                "hit_rate": _ratio(rule.hits, self.rows),
+                "fraud_hits": rule.fraud_hits,
+                # Share of the hits labeled as fraud, and of the labeled frauds that were hit
+                "precision": _ratio(rule.fraud_hits, rule.hits),
+                "recall": _ratio(rule.fraud_hits, self.fraud_rows),
+                "by_day": [
+                    {"day": day, "rows": rows, "hits": rule.hits_by_day.get(day, 0),
+                     "hit_rate": _ratio(rule.hits_by_day.get(day, 0), rows)}
+                    for day, rows in sorted(self.rows_by_day.items())
+                ],
+            } for rule in self.rules],
+        }
+
+def _add_counts(target: Dict[str, int], counts: Dict[str, int]) -> None:
+    for key, count in counts.items():
+        target[key] = target.get(key, 0) + count
+
+def _ratio(part: int, total: int) -> Optional[float]:
+    return round(part / total, 6) if total else None
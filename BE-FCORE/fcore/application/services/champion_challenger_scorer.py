@@ -0,0 +1,153 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping
+
+from ...core.entities.feature_vector import FeatureVector
+from ..interfaces.i_model_scorer import IModelScorer
+from .decision_service import DecisionService
+
+logger = logging.getLogger(__name__)
+
+class ChallengerComparison:
+    """Running comparison of one challenger's scores against the champion's."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.scored = 0
+        self.dropped = 0
+        self.timed_out = 0
+        self.failed = 0
+        self.same_action = 0
+        self.abs_diff_sum = 0.0
+        self.abs_diff_max = 0.0
+        self.latency_seconds_sum = 0.0
+        self.latency_seconds_max = 0.0
+
+    def record(self, champion_scores: List[float], challenger_scores: List[float], elapsed: float) -> None:
+        for champion, challenger in zip(champion_scores, challenger_scores):
+            diff = abs(challenger - champion)
+            self.abs_diff_sum += diff
+            self.abs_diff_max = max(self.abs_diff_max, diff)
+            if DecisionService.action_for_score(challenger) == DecisionService.action_for_score(champion):
+                self.same_action += 1
+        self.scored += len(challenger_scores)
+        self.latency_seconds_sum += elapsed
+        self.latency_seconds_max = max(self.latency_seconds_max, elapsed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        calls = self.scored or 1
+        return {
+            "name": self.name,
+            "scored": self.scored,
+            "dropped": self.dropped,
+            "timed_out": self.timed_out,
+            "failed": self.failed,
+            "same_action_rate": round(self.same_action / calls, 6) if self.scored else 0.0,
+            "mean_abs_diff": round(self.abs_diff_sum / calls, 6) if self.scored else 0.0,
+            "max_abs_diff": round(self.abs_diff_max, 6),
+            "mean_latency_ms": round(self.latency_seconds_sum * 1000 / calls, 3) if self.scored else 0.0,
+            "max_latency_ms": round(self.latency_seconds_max * 1000, 3),
+        }
+
+class ChampionChallengerScorer(IModelScorer):
+    """
+    Returns the champion model's score and, without waiting for them, has each
+    challenger model score the same features on a bounded thread pool. The
+    challenger scores are only compared with the champion's (score difference,
+    agreement of the score-only action, latency); they never reach the decision.
+
+    A challenger has budget_seconds per scored transaction, counted from the
+    moment the champion returned. A job still queued when its budget runs out is
+    dropped without scoring, and a result that arrives late is discarded and
+    counted as timed out. At most max_pending jobs wait in the pool: beyond that
+    new jobs are dropped, so a slow challenger cannot build up a backlog.
+    """
+
+    def __init__(self, champion: IModelScorer, challengers: Dict[str, IModelScorer],
+                 budget_seconds: float = 0.05, workers: int = 2, max_pending: int = 1_000):
+        self._champion = champion
+        self._challengers = dict(challengers)
+        self._budget_seconds = budget_seconds
+        self._max_pending = max_pending
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="challenger")
+        self._comparisons = {name: ChallengerComparison(name) for name in self._challengers}
+
+    @property
+    def champion(self) -> IModelScorer:
+        return self._champion
+
+    def score(self, features: Mapping[str, Any]) -> float:
+        score = self._champion.score(features)
+        self._submit([features], [score])
+        return score
+
+    def score_batch(self, features_list: List[Mapping[str, Any]]) -> List[float]:
+        scores = self._champion.score_batch(features_list)
+        self._submit(features_list, scores)
+        return scores
+
+    def close(self, wait: bool = True) -> None:
+        """Stops accepting jobs; with wait, returns once the queued ones are done."""
+        self._closed = True
+        self._pool.shutdown(wait=wait)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "champion": type(self._champion).__name__,
+            "budget_ms": self._budget_seconds * 1000,
+            "pending": self._pending,
+            "max_pending": self._max_pending,
+            "challengers": [comparison.to_dict() for comparison in self._comparisons.values()],
+        }
+
+    def _submit(self, features_list: List[Mapping[str, Any]], champion_scores: List[float]) -> None:
+        if not self._challengers or not features_list or self._closed:
+            return
+        # Lazy vectors are not thread-safe: each job reads its own copy
+        detached = [features.detached() if isinstance(features, FeatureVector) else dict(features)
+                    for features in features_list]
+        deadline = time.monotonic() + self._budget_seconds * len(features_list)
+        for name, scorer in self._challengers.items():
+            with self._lock:
+                if self._pending >= self._max_pending:
+                    self._comparisons[name].dropped += len(features_list)
+                    continue
+                self._pending += 1
+            try:
+                self._pool.submit(self._run, name, scorer, detached, champion_scores, deadline)
+            except RuntimeError:
+                # Closed while submitting
+                with self._lock:
+                    self._pending -= 1
+                return
+
+    def _run(self, name: str, scorer: IModelScorer, features_list: List[Mapping[str, Any]],
+             champion_scores: List[float], deadline: float) -> None:
+        comparison = self._comparisons[name]
+        try:
+            started = time.monotonic()
+            if started >= deadline:
+                with self._lock:
+                    comparison.dropped += len(features_list)
+                return
+            try:
+                scores = scorer.score_batch(features_list)
+            except Exception as e:
+                with self._lock:
+                    comparison.failed += len(features_list)
+                logger.error(f"Challenger model '{name}' failed: {e}")
+                return
+            finished = time.monotonic()
+            with self._lock:
+                if finished > deadline:
+                    comparison.timed_out += len(features_list)
+                else:
+                    comparison.record(champion_scores, scores, finished - started)
+        finally:
+            with self._lock:
+                self._pending -= 1
@@ -1,13 +1,20 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from ...core.entities.alert import AlertAction
 from .rule_engine import RuleHit
 
 class DecisionService:
 
+    DECLINE_THRESHOLD = 0.90
+    REVIEW_THRESHOLD = 0.75
 
-    def decide(self, ml_score: float, rule_hits: List[RuleHit]) -> Tuple[AlertAction, float]:
+    def decide(self, ml_score: Optional[float], rule_hits: List[RuleHit]) -> Tuple[AlertAction, float]:
+        """
+        ml_score is None when the model missed its deadline: the score is then the
+        rule boosts alone, and a high-severity hit is reviewed at least, since no
+        model score can confirm or clear it.
+        """
 
-        final_score = ml_score
+        final_score = ml_score if ml_score is not None else 0.0
 
         for hit in rule_hits:
             if hit.get("severity") == "critical":
@@ -22,9 +29,16 @@ class DecisionService:
         
         final_score = min(final_score + score_boost, 1.0)
 
-        if final_score >= 0.90:
-            return AlertAction.DECLINE, final_score
-        elif final_score >= 0.75:
-            return AlertAction.REVIEW, final_score
+        action = self.action_for_score(final_score)
+        if ml_score is None and action == AlertAction.APPROVE and any(hit.get("severity") == "high" for hit in rule_hits):
+            action = AlertAction.REVIEW
+        return action, final_score
+
+    @classmethod
+    def action_for_score(cls, score: float) -> AlertAction:
+        if score >= cls.DECLINE_THRESHOLD:
+            return AlertAction.DECLINE
+        elif score >= cls.REVIEW_THRESHOLD:
+            return AlertAction.REVIEW
         else:
-            return AlertAction.APPROVE, final_score
\ No newline at end of file
+            return AlertAction.APPROVE
\ No newline at end of file
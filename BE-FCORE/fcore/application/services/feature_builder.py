@@ -0,0 +1,60 @@
+from copy import copy
+from typing import Any, Callable, Dict
+
+from ...core.entities.transaction import Transaction
+from ...core.entities.behavior_profile import BehaviorProfile
+from ...core.entities.feature_vector import FeatureField, FeatureSchema, FeatureType, FeatureVector, LazyFeatureContext
+
+FeatureGetter = Callable[[Dict[str, Any], Transaction, BehaviorProfile], Any]
+
+def _merchant_flag(tx: Transaction, flag: str) -> bool:
+    merchant = getattr(tx, "merchant", None)
+    return getattr(merchant, flag) if merchant else False
+
+# name -> (type, getter(context, tx, beh)), in schema order. Derived features read
+# their inputs through the context so a Decimal is only converted once.
+_FEATURES: Dict[str, tuple] = {
+    # --- Transaction Attributes ---
+    "amount": (FeatureType.FLOAT, lambda ctx, tx, beh: float(tx.amount)),
+    "currency": (FeatureType.STR, lambda ctx, tx, beh: tx.currency),
+    "country": (FeatureType.STR, lambda ctx, tx, beh: tx.country),
+    "ip_address": (FeatureType.STR, lambda ctx, tx, beh: tx.ip_address),
+    "device_id": (FeatureType.STR, lambda ctx, tx, beh: tx.device_id),
+    "channel": (FeatureType.STR, lambda ctx, tx, beh: tx.channel.value if tx.channel else None),
+
+    # --- Behavior Attributes ---
+    "tx_count_10m": (FeatureType.INT, lambda ctx, tx, beh: beh.tx_count_10m),
+    "tx_count_30m": (FeatureType.INT, lambda ctx, tx, beh: beh.tx_count_30m),
+    "tx_count_24h": (FeatureType.INT, lambda ctx, tx, beh: beh.tx_count_24h),
+    "avg_amount_24h": (FeatureType.FLOAT, lambda ctx, tx, beh: float(beh.avg_amount_24h)),
+    "usual_country": (FeatureType.STR, lambda ctx, tx, beh: beh.usual_country),
+    "usual_ip": (FeatureType.STR, lambda ctx, tx, beh: beh.usual_ip),
+
+    # --- Helper / Derived Logic ---
+    "is_new_country": (FeatureType.BOOL,
+                       lambda ctx, tx, beh: beh.usual_country is not None and tx.country != beh.usual_country),
+    "is_foreign_transaction": (FeatureType.BOOL,
+                               lambda ctx, tx, beh: tx.country != beh.usual_country if (tx.country and beh.usual_country) else False),
+    "amount_ratio_vs_avg": (FeatureType.FLOAT,
+                            lambda ctx, tx, beh: ctx["amount"] / ctx["avg_amount_24h"] if ctx["avg_amount_24h"] > 0 else 1.0),
+    "is_blacklisted_merchant": (FeatureType.BOOL, lambda ctx, tx, beh: _merchant_flag(tx, "is_blacklisted")),
+    "is_whitelisted_merchant": (FeatureType.BOOL, lambda ctx, tx, beh: _merchant_flag(tx, "is_whitelisted")),
+}
+
+# Bump the version on any change to the fields or their order; models pin it through ML_MODEL_SCHEMA_VERSION.
+SCORING_FEATURE_SCHEMA = FeatureSchema(
+    version="1",
+    fields=tuple(FeatureField(name, kind) for name, (kind, _) in _FEATURES.items())
+)
+
+_GETTERS: Dict[str, FeatureGetter] = {name: getter for name, (_, getter) in _FEATURES.items()}
+
+def build_scoring_features(tx: Transaction, beh: BehaviorProfile) -> FeatureVector:
+    """
+    The feature vector of a transaction given the profile as it stands before it.
+    Nothing is computed up front: each feature is computed the first time the
+    rules, the model or the alert read it, then memoized. The profile is copied
+    because the caller updates it in place after scoring (and batch scoring
+    folds each item in before the model runs).
+    """
+    return FeatureVector(SCORING_FEATURE_SCHEMA, LazyFeatureContext(_GETTERS, tx, copy(beh)))
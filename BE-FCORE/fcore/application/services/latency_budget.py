@@ -0,0 +1,187 @@
+import asyncio
+import enum
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+def _on_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+def _wait_on_thread(future: Future, timeout_seconds: float) -> float:
+    return future.result(timeout=timeout_seconds)
+
+class ScoringStage(str, enum.Enum):
+    FEATURES = "features"
+    RULES = "rules"
+    MODEL = "model"
+    ALERT = "alert"
+
+class DegradedMode(str, enum.Enum):
+    CACHED_PROFILE = "cached_profile"  # behavior profile from the in-memory copy, stored one not read
+    RULES_ONLY = "rules_only"          # no ML score: decided on the rule hits alone
+
+@dataclass(frozen=True)
+class LatencyBudgetConfig:
+    """Milliseconds for the whole request and for each stage of it."""
+    total_ms: float = 150.0
+    features_ms: float = 40.0
+    rules_ms: float = 20.0
+    model_ms: float = 30.0
+    alert_ms: float = 40.0
+    # How long the stored profile is skipped after a feature fetch missed its deadline
+    features_cooldown_seconds: float = 5.0
+
+    def stage_ms(self, stage: ScoringStage) -> float:
+        return getattr(self, f"{stage.value}_ms")
+
+class LatencyBudget:
+    """
+    Time spent by one scoring request, per stage, and the degraded modes it fell
+    back to. Created by LatencyGuard.start().
+    """
+
+    def __init__(self, config: LatencyBudgetConfig, clock: Callable[[], float] = time.perf_counter):
+        self.config = config
+        self._clock = clock
+        self._started = clock()
+        self.stages: Dict[ScoringStage, float] = {}
+        self.degraded: List[DegradedMode] = []
+
+    def elapsed_ms(self) -> float:
+        return (self._clock() - self._started) * 1000
+
+    def remaining_ms(self) -> float:
+        return self.config.total_ms - self.elapsed_ms()
+
+    def stage_timeout_ms(self, stage: ScoringStage) -> float:
+        """The stage's own deadline, cut short by what is left of the whole budget."""
+        return min(self.config.stage_ms(stage), self.remaining_ms())
+
+    @contextmanager
+    def stage(self, stage: ScoringStage) -> Iterator[None]:
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.stages[stage] = self.stages.get(stage, 0.0) + (self._clock() - started) * 1000
+
+    def overran(self, stage: ScoringStage) -> bool:
+        return self.stages.get(stage, 0.0) > self.config.stage_ms(stage)
+
+    def degrade(self, mode: DegradedMode) -> None:
+        if mode not in self.degraded:
+            self.degraded.append(mode)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "budget_ms": self.config.total_ms,
+            "elapsed_ms": round(self.elapsed_ms(), 3),
+            "stages_ms": {stage.value: round(ms, 3) for stage, ms in self.stages.items()},
+            "degraded": [mode.value for mode in self.degraded],
+        }
+
+class LatencyGuard:
+    """
+    Enforces the scoring latency budget of a worker process and keeps its counters.
+
+    Database stages cannot be interrupted without breaking the request's single
+    transaction, so a feature fetch that misses its deadline opens a cooldown:
+    for features_cooldown_seconds the following requests use the last profile
+    this worker saw for the customer instead of reading it, then the database is
+    tried again. The model runs on a small thread pool and is abandoned when it
+    misses its deadline (or the request has no budget left), and the request is
+    decided on rules alone. Rules and alert persistence are timed and counted but
+    never skipped: the rules are the fallback decision, and alerts must not be lost.
+
+    Waiting for the pool must not block an event loop: on the async scoring path
+    the pipeline runs in greenlets on the loop's thread, so the caller passes a
+    'wait' that hands the loop back meanwhile (IAsyncScoringUnitOfWork.wait_for).
+    On a loop thread without one the model is scored inline, and a score that
+    arrives after the deadline is used but counted as an overrun.
+    """
+
+    def __init__(self, config: LatencyBudgetConfig, model_workers: int = 4,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.config = config
+        self._clock = clock
+        self._model_pool = ThreadPoolExecutor(max_workers=model_workers, thread_name_prefix="scoring-model")
+        self._lock = threading.Lock()
+        self._features_skip_until = 0.0
+        self.requests = 0
+        self.over_budget = 0
+        self.stage_overruns: Dict[ScoringStage, int] = {stage: 0 for stage in ScoringStage}
+        self.degraded: Dict[DegradedMode, int] = {mode: 0 for mode in DegradedMode}
+
+    def start(self) -> LatencyBudget:
+        return LatencyBudget(self.config, clock=self._clock)
+
+    def skip_feature_fetch(self) -> bool:
+        """True while the cooldown after a slow feature fetch lasts."""
+        return self._clock() < self._features_skip_until
+
+    def run_model(self, budget: LatencyBudget, score: Callable[[], float],
+                  wait: Optional[Callable[[Future, float], float]] = None) -> Optional[float]:
+        """
+        score() within the model deadline; None (and RULES_ONLY) when it does not make it.
+        wait(future, timeout_seconds) returns the result or raises TimeoutError; it
+        defaults to future.result, or to scoring inline on an event loop thread.
+        """
+        timeout_ms = budget.stage_timeout_ms(ScoringStage.MODEL)
+        with budget.stage(ScoringStage.MODEL):
+            if timeout_ms <= 0:
+                ml_score = None
+            elif wait is None and _on_event_loop_thread():
+                ml_score = score()
+            else:
+                future = self._model_pool.submit(score)
+                try:
+                    ml_score = (wait or _wait_on_thread)(future, timeout_ms / 1000)
+                except FutureTimeoutError:
+                    future.cancel()
+                    ml_score = None
+        if ml_score is None:
+            budget.degrade(DegradedMode.RULES_ONLY)
+        return ml_score
+
+    def finish(self, budget: LatencyBudget) -> None:
+        """Folds a finished request into the counters."""
+        overruns = [stage for stage in budget.stages if budget.overran(stage)]
+        with self._lock:
+            self.requests += 1
+            if budget.remaining_ms() < 0:
+                self.over_budget += 1
+            for stage in overruns:
+                self.stage_overruns[stage] += 1
+            for mode in budget.degraded:
+                self.degraded[mode] += 1
+            if ScoringStage.FEATURES in overruns:
+                self._features_skip_until = self._clock() + self.config.features_cooldown_seconds
+        if budget.degraded or overruns:
+            logger.warning(
+                f"Scoring took {budget.elapsed_ms():.1f}ms of {self.config.total_ms}ms; "
+                f"overran {[stage.value for stage in overruns]}, degraded {[mode.value for mode in budget.degraded]}."
+            )
+
+    def close(self) -> None:
+        self._model_pool.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "budget_ms": self.config.total_ms,
+            "stage_deadlines_ms": {stage.value: self.config.stage_ms(stage) for stage in ScoringStage},
+            "requests": self.requests,
+            "over_budget": self.over_budget,
+            "stage_overruns": {stage.value: count for stage, count in self.stage_overruns.items()},
+            "degraded": {mode.value: count for mode, count in self.degraded.items()},
+            "skipping_feature_fetch": self.skip_feature_fetch(),
+        }
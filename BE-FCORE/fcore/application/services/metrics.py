@@ -0,0 +1,204 @@
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+# Upper bounds (seconds) of the latency histograms; the last bucket is +Inf.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0
+)
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class _Timer:
+    __slots__ = ("_series", "_started")
+
+    def __init__(self, series: "_HistogramSeries"):
+        self._series = series
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._series.observe(time.perf_counter() - self._started)
+
+class _HistogramSeries:
+    __slots__ = ("_bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+
+    def time(self) -> _Timer:
+        return _Timer(self)
+
+    def dump(self) -> Dict[str, Any]:
+        return {"counts": list(self.counts), "sum": self.sum}
+
+    def add(self, dumped: Dict[str, Any]) -> None:
+        for i, count in enumerate(dumped["counts"]):
+            self.counts[i] += count
+        self.sum += dumped["sum"]
+
+class _CounterSeries:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dump(self) -> float:
+        return self.value
+
+    def add(self, dumped: float) -> None:
+        self.value += dumped
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values: str):
+        """The series of these label values, created on first use."""
+        series = self._series.get(values)
+        if series is None:
+            series = self._series.setdefault(values, self._new_series())
+        return series
+
+    def _new_series(self):
+        raise NotImplementedError
+
+    def dump(self) -> Dict[str, Any]:
+        """This process's series in a JSON-serializable form (see MetricsRegistry.dump)."""
+        return {"kind": self.kind, "series": [[list(values), series.dump()]
+                                              for values, series in list(self._series.items())]}
+
+    def render(self, others: Iterable[Dict[str, Any]] = ()) -> List[str]:
+        """HELP, TYPE and series lines, each series summed with the same series in the 'others' dumps."""
+        totals: Dict[Tuple[str, ...], object] = {}
+        for dumped in [self.dump(), *others]:
+            if dumped.get("kind") != self.kind:
+                continue
+            for values, state in dumped["series"]:
+                values = tuple(values)
+                series = totals.get(values)
+                if series is None:
+                    series = totals[values] = self._new_series()
+                series.add(state)
+
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for values, series in sorted(totals.items(), key=lambda item: item[0]):
+            lines.extend(self._render_series(values, series))
+        return lines
+
+    def _render_series(self, values, series) -> List[str]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _new_series(self) -> _CounterSeries:
+        return _CounterSeries()
+
+    def _render_series(self, values, series: _CounterSeries) -> List[str]:
+        return [f"{self.name}{_label_text(self.labelnames, values)} {series.value:g}"]
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self, *values: str) -> _Timer:
+        return _Timer(self.labels(*values))
+
+    def dump(self) -> Dict[str, Any]:
+        return {**super().dump(), "buckets": list(self.buckets)}
+
+    def render(self, others: Iterable[Dict[str, Any]] = ()) -> List[str]:
+        # Series recorded with other bounds cannot be added bucket by bucket
+        return super().render(d for d in others if tuple(d.get("buckets", ())) == self.buckets)
+
+    def _new_series(self) -> _HistogramSeries:
+        return _HistogramSeries(self.buckets)
+
+    def _render_series(self, values, series: _HistogramSeries) -> List[str]:
+        lines, total = [], 0
+        counts = list(series.counts)
+        for bound, count in zip([f"{b:g}" for b in self.buckets] + ["+Inf"], counts):
+            total += count
+            le = f'le="{bound}"'
+            lines.append(f"{self.name}_bucket{_label_text(self.labelnames, values, le)} {total}")
+        labels = _label_text(self.labelnames, values)
+        lines.append(f"{self.name}_sum{labels} {series.sum:.9g}")
+        lines.append(f"{self.name}_count{labels} {total}")
+        return lines
+
+class MetricsRegistry:
+    """
+    In-process counters and histograms rendered in the Prometheus text format
+    (version 0.0.4), for scraping /metrics without a client library.
+
+    Recording is a dict lookup for the label values, a bisect over the bucket
+    bounds and two increments, without a lock: under heavy thread contention an
+    increment can be lost, which a latency histogram tolerates.
+
+    Values are per process. With several server workers on one port a scrape
+    reaches whichever worker accepts it, so each worker publishes dump() (see
+    FileMetricsStore) and the one answering adds the others' dumps to its own
+    series in render(others).
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def dump(self) -> Dict[str, Dict[str, Any]]:
+        """Every metric's series, by metric name, in a JSON-serializable form."""
+        return {name: metric.dump() for name, metric in self._metrics.items()}
+
+    def render(self, others: Iterable[Dict[str, Dict[str, Any]]] = ()) -> str:
+        """The text exposition, each series summed with the same series in the 'others' dumps."""
+        others = list(others)
+        lines: List[str] = []
+        for name, metric in self._metrics.items():
+            lines.extend(metric.render([dump[name] for dump in others if name in dump]))
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: _Metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
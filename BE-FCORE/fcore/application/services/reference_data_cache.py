@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+class ReferenceDataCache:
+    """
+    Bounded LRU cache with a TTL for rarely-changing reference data (customers,
+    merchants). Unknown keys can be remembered for negative_ttl_seconds so that
+    repeated lookups of bad IDs do not reach the database either; 0 disables it.
+
+    Invalidation is per process: CRUD use cases invalidate the entries they
+    change, and the TTL bounds how stale other workers can be.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 100_000,
+        ttl_seconds: float = 300.0,
+        negative_ttl_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Optional[Any]]:
+        """(found, value). found with a None value means the key is known not to exist."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            if entry[1] is _MISSING:
+                self.negative_hits += 1
+                return True, None
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, key: Hashable, value: Optional[Any]) -> None:
+        """Caches a value; None records the key as unknown (if negative caching is on)."""
+        if value is None:
+            if self._negative_ttl_seconds <= 0:
+                return
+            expires_at, value = self._clock() + self._negative_ttl_seconds, _MISSING
+        else:
+            expires_at = self._clock() + self._ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.negative_hits) / lookups if lookups else 0.0
+        }
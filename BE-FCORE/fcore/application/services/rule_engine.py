@@ -1,67 +1,121 @@
-from typing import List, Dict, Any
+from itertools import groupby
+from typing import List, Dict, Any, Optional, Sequence
 import logging
+import time
 
-from ...core.entities.rule import Rule
-from ...core.entities.transaction import Transaction
-from ...core.entities.behavior_profile import BehaviorProfile
+from ...core.entities.rule import Rule, RuleSeverity
+from ...core.entities.feature_vector import FeatureVector
 from ..interfaces.i_rule_evaluator import IRuleEvaluator
+from ..interfaces.i_batch_rule_evaluator import IBatchRuleEvaluator
+from .rule_index import RuleIndex
+from .rule_set_cache import SEVERITY_ORDER
+from .rule_evaluation_stats import RuleEvaluationStats
+from .scoring_metrics import ScoringMetrics
 
 logger = logging.getLogger(__name__)
 
 RuleHit = Dict[str, Any]
 
 class RuleEngine:
+    """
+    Evaluates the enabled rules severity tier by severity tier, critical first.
 
+    A critical hit makes DecisionService decline with score 1.0 whatever else
+    matched, so evaluation stops at the first one unless audit is set, in which
+    case every rule runs and the full hit list is returned. With stats, each
+    tier runs in the order RuleEvaluationStats derives from observed cost and hit rate.
+    With metrics, each rule's evaluation time goes to its histogram on the
+    transactions ScoringMetrics samples.
 
-    def __init__(self, rules: List[Rule], evaluator: IRuleEvaluator):
+    With an index (built over the enabled rules, see RuleSetSnapshot) only the
+    candidate rules of each transaction are evaluated; rules is then ignored in
+    favor of index.rules, which the candidate positions refer to.
 
-        self._rules = [rule for rule in rules if rule.enabled]
+    evaluate_batch() hands a whole batch to an IBatchRuleEvaluator, which runs
+    every rule over every transaction at once; tiers, early exit and audit then
+    only shape each transaction's hit list (stats and index are not used there).
+    """
+
+    # Below this many transactions the per-transaction path is as fast
+    BATCH_MIN_ROWS = 32
+
+    def __init__(self, rules: List[Rule], evaluator: IRuleEvaluator,
+                 stats: Optional[RuleEvaluationStats] = None, audit: bool = False,
+                 index: Optional[RuleIndex] = None, metrics: Optional[ScoringMetrics] = None):
+
+        # Shadow rules never take part in the decision (see ShadowRuleRunner)
+        self._rules = list(index.rules) if index is not None else [rule for rule in rules if rule.enabled and not rule.shadow]
         self._evaluator = evaluator
+        self._stats = stats
+        self._audit = audit
+        self._index = index
+        self._metrics = metrics
+        self._tier_of = [SEVERITY_ORDER.get(rule.severity, len(SEVERITY_ORDER)) for rule in self._rules]
+        self._all_positions = sorted(range(len(self._rules)), key=self._tier_of.__getitem__)
 
-    def evaluate(self, transaction: Transaction, behavior: BehaviorProfile) -> List[RuleHit]:
+    def evaluate(self, features: FeatureVector) -> List[RuleHit]:
 
         hits: List[RuleHit] = []
 
-        context = self._build_context(transaction, behavior)
+        # Built once per transaction (see feature_builder); the evaluators look names up in a plain dict.
+        context = features.as_dict()
+        stats = self._stats
+        metrics = self._metrics if self._metrics and self._metrics.sample_rules() else None
+        rules = self._rules
+
+        if self._index is not None:
+            # sorted() is stable: candidates come in rule order, now grouped by tier
+            positions = sorted(self._index.candidates(context), key=self._tier_of.__getitem__)
+        else:
+            positions = self._all_positions
 
-        for rule in self._rules:
-            is_triggered = self._evaluator.evaluate(rule, context)
-            
-            if is_triggered:
-                logger.info(f"Rule triggered: {rule.name}")
-                hits.append({
-                    "rule_id": str(rule.id),
-                    "rule_name": rule.name,
-                    "dsl_expression": rule.dsl_expression,
-                    "severity": rule.severity.value
-                })
+        for _, tier_positions in groupby(positions, key=self._tier_of.__getitem__):
+            tier = [rules[position] for position in tier_positions]
+            for rule in (stats.order(tier) if stats else tier):
+                if stats or metrics:
+                    start = time.perf_counter_ns()
+                    is_triggered = self._evaluator.evaluate(rule, context)
+                    elapsed_ns = time.perf_counter_ns() - start
+                    if stats:
+                        stats.record(rule.id, elapsed_ns, is_triggered)
+                    if metrics:
+                        metrics.observe_rule(rule.name, elapsed_ns)
+                else:
+                    is_triggered = self._evaluator.evaluate(rule, context)
+
+                if is_triggered:
+                    hits.append(self._hit(rule))
+                    # The decision is already DECLINE; nothing evaluated after this can change it.
+                    if rule.severity == RuleSeverity.CRITICAL and not self._audit:
+                        return hits
 
         return hits
 
-    def _build_context(self, tx: Transaction, beh: BehaviorProfile) -> Dict[str, Any]:
+    def evaluate_batch(self, features_list: Sequence[FeatureVector]) -> List[List[RuleHit]]:
+        """The hit list of each transaction, as evaluate() would return it without stats."""
+        if not isinstance(self._evaluator, IBatchRuleEvaluator) or len(features_list) < self.BATCH_MIN_ROWS:
+            return [self.evaluate(features) for features in features_list]
+
+        ordered = [self._rules[position] for position in self._all_positions]
+        matrix = self._evaluator.evaluate_batch(ordered, [features.as_dict() for features in features_list])
+
+        results: List[List[RuleHit]] = []
+        for row in matrix:
+            hits: List[RuleHit] = []
+            for rule, is_triggered in zip(ordered, row):
+                if is_triggered:
+                    hits.append(self._hit(rule))
+                    if rule.severity == RuleSeverity.CRITICAL and not self._audit:
+                        break
+            results.append(hits)
+        return results
 
+    @staticmethod
+    def _hit(rule: Rule) -> RuleHit:
+        logger.info(f"Rule triggered: {rule.name}")
         return {
-            # --- Transaction Attributes ---
-            "amount": float(tx.amount),
-            "currency": tx.currency,
-            "country": tx.country,
-            "ip_address": tx.ip_address,
-            "device_id": tx.device_id,
-            "channel": tx.channel.value if tx.channel else None,
-            
-            # --- Behavior Attributes ---
-            "tx_count_10m": beh.tx_count_10m,
-            "tx_count_30m": beh.tx_count_30m,
-            "tx_count_24h": beh.tx_count_24h,
-            "avg_amount_24h": float(beh.avg_amount_24h),
-            "usual_country": beh.usual_country,
-            "usual_ip": beh.usual_ip,
-            
-            # --- Helper / Derived Logic ---
-            "is_foreign_transaction": tx.country != beh.usual_country if (tx.country and beh.usual_country) else False,
-            "amount_ratio_vs_avg": (float(tx.amount) / float(beh.avg_amount_24h)) if beh.avg_amount_24h > 0 else 1.0,
-            
-            # If Merchant entity is populated
-            "is_blacklisted_merchant": tx.merchant.is_blacklisted if getattr(tx, 'merchant', None) else False,
-            "is_whitelisted_merchant": tx.merchant.is_whitelisted if getattr(tx, 'merchant', None) else False
-        }
\ No newline at end of file
+            "rule_id": str(rule.id),
+            "rule_name": rule.name,
+            "dsl_expression": rule.dsl_expression,
+            "severity": rule.severity.value
+        }
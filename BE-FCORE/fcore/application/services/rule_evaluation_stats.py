@@ -0,0 +1,69 @@
+import threading
+from typing import Any, Dict, List, Sequence
+from uuid import UUID
+
+from ...core.entities.rule import Rule
+
+class RuleEvaluationStats:
+    """
+    Per-rule evaluation counters (evaluations, hits, time spent) shared by every
+    RuleEngine of the worker process, and the ranks derived from them.
+
+    Within a tier, rules run cheapest-per-expected-hit first (mean cost divided by
+    hit rate), the order that reaches a short-circuiting hit with the least work.
+    Ranks are recomputed every reorder_every evaluations; a request only sorts
+    the candidates of each tier by them. Counter updates are not locked: a lost
+    increment under contention only nudges an ordering heuristic.
+    """
+
+    def __init__(self, reorder_every: int = 10_000):
+        self._reorder_every = reorder_every
+        self._counters: Dict[UUID, List[int]] = {}  # rule id -> [evaluations, hits, total_ns]
+        self._ranks: Dict[UUID, float] = {}
+        self._since_reorder = 0
+        self._lock = threading.Lock()
+
+    def record(self, rule_id: UUID, elapsed_ns: int, hit: bool) -> None:
+        counters = self._counters.get(rule_id)
+        if counters is None:
+            counters = self._counters.setdefault(rule_id, [0, 0, 0])
+        counters[0] += 1
+        if hit:
+            counters[1] += 1
+        counters[2] += elapsed_ns
+        self._since_reorder += 1
+
+    def order(self, rules: Sequence[Rule]) -> Sequence[Rule]:
+        """The given rules of one severity tier in evaluation order."""
+        if self._since_reorder >= self._reorder_every:
+            with self._lock:
+                if self._since_reorder >= self._reorder_every:
+                    self._ranks = {rule_id: self._rank(counters) for rule_id, counters in list(self._counters.items())}
+                    self._since_reorder = 0
+
+        ranks = self._ranks
+        if not ranks or len(rules) < 2:
+            return rules
+        # sorted() is stable, so rules without samples keep the snapshot's name order
+        return sorted(rules, key=lambda rule: ranks.get(rule.id, 0.0))
+
+    def describe(self) -> List[Dict[str, Any]]:
+        stats = []
+        for rule_id, (evaluations, hits, total_ns) in list(self._counters.items()):
+            stats.append({
+                "rule_id": str(rule_id),
+                "evaluations": evaluations,
+                "hits": hits,
+                "hit_rate": round(hits / evaluations, 6) if evaluations else 0.0,
+                "mean_cost_us": round(total_ns / evaluations / 1000, 3) if evaluations else 0.0,
+            })
+        return sorted(stats, key=lambda entry: entry["evaluations"], reverse=True)
+
+    @staticmethod
+    def _rank(counters: List[int]) -> float:
+        evaluations, hits, total_ns = counters
+        if not evaluations:
+            return 0.0
+        # Laplace smoothing: a rule that never hit still has a finite rank
+        hit_rate = (hits + 1) / (evaluations + 2)
+        return (total_ns / evaluations) / hit_rate
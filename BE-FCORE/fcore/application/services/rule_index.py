@@ -0,0 +1,128 @@
+import ast
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ...core.entities.rule import Rule
+
+# Context names that get a hash map (== constant) or sorted threshold arrays
+EQUALITY_FIELDS = ("country", "channel", "currency")
+THRESHOLD_FIELDS = ("amount", "tx_count_10m", "tx_count_30m", "tx_count_24h")
+
+_FLIPPED = {ast.Gt: ast.Lt, ast.GtE: ast.LtE, ast.Lt: ast.Gt, ast.LtE: ast.GtE, ast.Eq: ast.Eq}
+
+# A necessary condition of a rule: ("eq", field, value) or (">"/">="/"<"/"<=", field, threshold)
+Predicate = Tuple[str, str, Any]
+
+def _constant(node: ast.AST) -> Any:
+    if isinstance(node, ast.Constant):
+        return node.value
+    raise ValueError
+
+def _conjunct_predicate(node: ast.AST) -> Optional[Predicate]:
+    if not isinstance(node, ast.Compare) or len(node.ops) != 1:
+        return None
+    left, op, right = node.left, type(node.ops[0]), node.comparators[0]
+    if not isinstance(left, ast.Name) and isinstance(right, ast.Name) and op in _FLIPPED:
+        left, op, right = right, _FLIPPED[op], left
+    if not isinstance(left, ast.Name):
+        return None
+    try:
+        if left.id in EQUALITY_FIELDS and op is ast.Eq:
+            value = _constant(right)
+            if isinstance(value, str):
+                return "eq", left.id, value
+        elif left.id in THRESHOLD_FIELDS and op in (ast.Gt, ast.GtE, ast.Lt, ast.LtE):
+            value = _constant(right)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                symbol = {ast.Gt: ">", ast.GtE: ">=", ast.Lt: "<", ast.LtE: "<="}[op]
+                return symbol, left.id, value
+    except ValueError:
+        pass
+    return None
+
+def extract_predicate(expression: str) -> Optional[Predicate]:
+    """
+    A top-level conjunct of the expression the index can check without running
+    the rule: the rule cannot trigger when it is false. Equality beats thresholds
+    (a hash lookup discriminates more). None when there is nothing to index.
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode="eval").body
+    except SyntaxError:
+        return None
+    conjuncts = tree.values if isinstance(tree, ast.BoolOp) and isinstance(tree.op, ast.And) else [tree]
+    predicates = [p for p in (_conjunct_predicate(c) for c in conjuncts) if p is not None]
+    equalities = [p for p in predicates if p[0] == "eq"]
+    return (equalities or predicates or [None])[0]
+
+class RuleIndex:
+    """
+    Candidate lookup for a rule set. Each rule is filed under one necessary
+    condition pulled out of its expression: a hash map per equality field and,
+    per threshold field and operator, thresholds sorted with the rule positions
+    in the same order. candidates() returns, in ascending position order, the
+    rules whose condition holds plus every rule that could not be indexed.
+    Only candidates need to be evaluated; the others are known not to trigger.
+    """
+
+    def __init__(self, rules: Sequence[Rule]):
+        self.rules: Tuple[Rule, ...] = tuple(rules)
+        self._always: List[int] = []
+        self._equality: Dict[str, Dict[str, List[int]]] = {}
+        thresholds: Dict[Tuple[str, str], List[Tuple[Any, int]]] = {}
+
+        for position, rule in enumerate(self.rules):
+            predicate = extract_predicate(rule.dsl_expression)
+            if predicate is None:
+                self._always.append(position)
+            elif predicate[0] == "eq":
+                self._equality.setdefault(predicate[1], {}).setdefault(predicate[2], []).append(position)
+            else:
+                thresholds.setdefault((predicate[1], predicate[0]), []).append((predicate[2], position))
+
+        self._thresholds: Dict[Tuple[str, str], Tuple[List[Any], List[int]]] = {}
+        for key, entries in thresholds.items():
+            entries.sort()
+            self._thresholds[key] = ([value for value, _ in entries], [position for _, position in entries])
+
+    @property
+    def indexed_count(self) -> int:
+        return len(self.rules) - len(self._always)
+
+    def candidates(self, context: Mapping[str, Any]) -> List[int]:
+        found = list(self._always)
+        for field, table in self._equality.items():
+            try:
+                positions = table.get(context[field])
+            except KeyError:
+                # The rules reading a missing name fail (and do not trigger) when evaluated
+                continue
+            except TypeError:
+                # Unhashable value: keep every rule of the field, evaluation decides
+                positions = [p for rule_positions in table.values() for p in rule_positions]
+            if positions:
+                found.extend(positions)
+
+        for (field, op), (values, positions) in self._thresholds.items():
+            # Not context.get(): a LazyFeatureContext computes features in __missing__, which get() bypasses
+            try:
+                value = context[field]
+            except KeyError:
+                continue
+            if value is None:
+                # Comparing None raises inside the rule, which then does not trigger
+                continue
+            try:
+                if op == ">":
+                    found.extend(positions[:bisect_left(values, value)])
+                elif op == ">=":
+                    found.extend(positions[:bisect_right(values, value)])
+                elif op == "<":
+                    found.extend(positions[bisect_right(values, value):])
+                else:
+                    found.extend(positions[bisect_left(values, value):])
+            except TypeError:
+                found.extend(positions)
+
+        found.sort()
+        return found
@@ -0,0 +1,20 @@
+import ast
+from typing import Collection, FrozenSet, List
+
+def referenced_names(expression: str) -> FrozenSet[str]:
+    """
+    The context names a DSL expression reads, found statically. Called function
+    names (e.g. int(...)) and comprehension variables are not context names.
+    Raises SyntaxError when the expression does not parse.
+    """
+    tree = ast.parse(expression.strip(), mode="eval")
+    functions = {id(node.func) for node in ast.walk(tree) if isinstance(node, ast.Call)}
+    loaded, bound = set(), set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and id(node) not in functions:
+            (bound if isinstance(node.ctx, ast.Store) else loaded).add(node.id)
+    return frozenset(loaded - bound)
+
+def unknown_names(expression: str, known: Collection[str]) -> List[str]:
+    """Referenced names that are not in known, sorted. Raises SyntaxError like referenced_names."""
+    return sorted(name for name in referenced_names(expression) if name not in known)
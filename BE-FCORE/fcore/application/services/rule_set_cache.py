@@ -0,0 +1,180 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Collection, Dict, FrozenSet, Optional, Tuple
+
+from ...core.entities.rule import Rule, RuleSeverity
+from ..interfaces.i_rule_repository import IRuleRepository
+from .rule_references import referenced_names
+from .rule_index import RuleIndex
+
+logger = logging.getLogger(__name__)
+
+SEVERITY_ORDER = {
+    RuleSeverity.CRITICAL: 0,
+    RuleSeverity.HIGH: 1,
+    RuleSeverity.MEDIUM: 2,
+    RuleSeverity.LOW: 3,
+}
+
+@dataclass(frozen=True)
+class RuleSetSnapshot:
+    """
+    Immutable view of the enabled rules at a given version.
+    Rules are sorted by severity (critical first) and then by name.
+    referenced_names holds every context name the rules read, and index the
+    candidate lookup built over rules (see RuleEngine). Enabled shadow rules
+    are kept apart in shadow_rules and never reach the scoring decision.
+    """
+    version: int
+    rules: Tuple[Rule, ...]
+    loaded_at: datetime
+    loaded_at_monotonic: float
+    referenced_names: FrozenSet[str] = frozenset()
+    index: Optional[RuleIndex] = None
+    shadow_rules: Tuple[Rule, ...] = ()
+
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.loaded_at_monotonic
+
+class RuleSetCache:
+    """
+    Process-wide holder of the rule set used by the scoring path.
+
+    Readers get the current snapshot without taking a lock. A new snapshot is
+    built (and swapped in as a single reference assignment) when the CRUD use
+    case refreshes it or when it is older than max_age_seconds, which bounds
+    how long a change made from another worker process can go unnoticed.
+
+    The lock only guards the bookkeeping and the swap, never the query: on the
+    async path run_sync drives this code in greenlets on the event loop thread,
+    and a greenlet waiting on a lock held across a query would block the very
+    loop the query needs. While one reader reloads a stale snapshot the others
+    keep serving it; a load that started before a newer one was swapped in (or
+    before invalidate()) is not installed.
+    """
+
+    def __init__(self, max_age_seconds: float = 30.0, known_names: Optional[Collection[str]] = None):
+        self._max_age_seconds = max_age_seconds
+        self._known_names = known_names
+        self._lock = threading.Lock()
+        self._snapshot: Optional[RuleSetSnapshot] = None
+        self._version = 0
+        self._loads_started = 0
+        self._oldest_installable_load = 0
+        self._loads_in_flight = 0
+
+    @property
+    def max_age_seconds(self) -> float:
+        return self._max_age_seconds
+
+    @property
+    def active_version(self) -> int:
+        snapshot = self._snapshot
+        return snapshot.version if snapshot else 0
+
+    def get(self, rule_repo: IRuleRepository) -> RuleSetSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and not self._is_stale(snapshot):
+            return snapshot
+
+        with self._lock:
+            # Another thread may have reloaded meanwhile, or be reloading now.
+            snapshot = self._snapshot
+            if snapshot is not None and (self._loads_in_flight or not self._is_stale(snapshot)):
+                return snapshot
+        return self._load(rule_repo)
+
+    def refresh(self, rule_repo: IRuleRepository) -> RuleSetSnapshot:
+        """Reloads the rule set unconditionally. Called after any rule change."""
+        return self._load(rule_repo)
+
+    def invalidate(self) -> None:
+        """Drops the current snapshot so the next reader reloads it."""
+        with self._lock:
+            self._snapshot = None
+            self._oldest_installable_load = self._loads_started + 1
+
+    def describe(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version if snapshot else 0,
+            "rule_count": len(snapshot.rules) if snapshot else 0,
+            "loaded_at": snapshot.loaded_at if snapshot else None,
+            "age_seconds": round(snapshot.age_seconds(), 3) if snapshot else None,
+            "max_age_seconds": self._max_age_seconds,
+            "referenced_features": sorted(snapshot.referenced_names) if snapshot else [],
+            "indexed_rules": snapshot.index.indexed_count if snapshot and snapshot.index else 0,
+            "shadow_rule_count": len(snapshot.shadow_rules) if snapshot else 0,
+        }
+
+    def _is_stale(self, snapshot: RuleSetSnapshot) -> bool:
+        return snapshot.age_seconds() >= self._max_age_seconds
+
+    def _load(self, rule_repo: IRuleRepository) -> RuleSetSnapshot:
+        with self._lock:
+            self._loads_started += 1
+            self._loads_in_flight += 1
+            load = self._loads_started
+        try:
+            enabled = rule_repo.get_all(only_enabled=True)
+        finally:
+            with self._lock:
+                self._loads_in_flight -= 1
+
+        rules, shadow_rules, referenced = [], [], set()
+        for rule in enabled:
+            names = self._referenced_names(rule)
+            if names is None:
+                continue
+            if rule.shadow:
+                shadow_rules.append(rule)
+            else:
+                rules.append(rule)
+                referenced |= names
+        rules.sort(key=lambda rule: (SEVERITY_ORDER.get(rule.severity, len(SEVERITY_ORDER)), rule.name))
+        shadow_rules.sort(key=lambda rule: rule.name)
+        index = RuleIndex(rules)
+
+        with self._lock:
+            superseded = load < self._oldest_installable_load
+            if superseded and self._snapshot is not None:
+                return self._snapshot
+            if not superseded:
+                self._version += 1
+                self._oldest_installable_load = load
+            snapshot = RuleSetSnapshot(
+                version=self._version,
+                rules=tuple(rules),
+                loaded_at=datetime.utcnow(),
+                loaded_at_monotonic=time.monotonic(),
+                referenced_names=frozenset(referenced),
+                index=index,
+                shadow_rules=tuple(shadow_rules)
+            )
+            if superseded:
+                # Invalidated while loading: serve this reader, let the next one reload.
+                return snapshot
+            self._snapshot = snapshot
+        logger.info(f"Rule set v{snapshot.version} loaded with {len(snapshot.rules)} enabled rules "
+                    f"and {len(snapshot.shadow_rules)} shadow rules.")
+        return snapshot
+
+    def _referenced_names(self, rule: Rule) -> Optional[FrozenSet[str]]:
+        # A rule that does not parse, or reads a name the context never has, can
+        # never trigger; drop it once here instead of logging the same error on
+        # every scored transaction. Saving such a rule is refused, but rules saved
+        # before a feature was removed can still be in the table.
+        try:
+            names = referenced_names(rule.dsl_expression)
+        except SyntaxError as e:
+            logger.error(f"Rule '{rule.name}' (ID: {rule.id}) excluded from the rule set: {e}")
+            return None
+        if self._known_names is not None:
+            unknown = sorted(names.difference(self._known_names))
+            if unknown:
+                logger.error(f"Rule '{rule.name}' (ID: {rule.id}) excluded from the rule set: unknown names {unknown}")
+                return None
+        return names
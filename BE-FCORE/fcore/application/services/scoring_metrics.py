@@ -0,0 +1,71 @@
+from typing import Iterable, List
+
+from ...core.entities.alert import AlertAction
+from .metrics import MetricsRegistry
+
+# Stages of ScoringUseCase.execute, as labelled in fcore_scoring_stage_seconds
+PROFILE_LOAD = "profile_load"
+RULE_FETCH = "rule_fetch"
+FEATURE_COMPUTATION = "feature_computation"
+RULE_EVALUATION = "rule_evaluation"
+MODEL_SCORING = "model_scoring"
+DECISION = "decision"
+ALERT_CASE_CREATION = "alert_case_creation"
+BEHAVIOR_SAVE = "behavior_save"
+
+# Upper bounds of the statements-per-request histogram
+STATEMENT_BUCKETS = (1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 30, 50)
+
+class ScoringMetrics:
+    """
+    The scoring path's metrics, registered once per worker in a MetricsRegistry.
+
+    Per-rule timings are the only observations made once per rule rather than
+    once per request, so they are taken on one transaction in
+    rule_sample_every: the histograms keep their shape, their counts are a sample.
+    """
+
+    def __init__(self, registry: MetricsRegistry, rule_sample_every: int = 1):
+        self._rule_sample_every = max(rule_sample_every, 1)
+        self._rule_calls = 0
+        self._stage_seconds = registry.histogram(
+            "fcore_scoring_stage_seconds", "Time spent in each stage of a scoring request.", ["stage"])
+        self._rule_seconds = registry.histogram(
+            "fcore_rule_evaluation_seconds", "Time spent evaluating each rule on one transaction.", ["rule"])
+        self._rule_series = {}
+        self._rule_hits = registry.counter(
+            "fcore_rule_hits_total", "Rule hits in scored transactions.", ["rule", "severity"])
+        self._decisions = registry.counter(
+            "fcore_scoring_decisions_total", "Scoring decisions by action.", ["action"])
+        self._degraded = registry.counter(
+            "fcore_scoring_degraded_total", "Scoring requests that fell back to a degraded mode.", ["mode"])
+        self._statements = registry.histogram(
+            "fcore_scoring_sql_statements", "SQL statements per scoring request.", buckets=STATEMENT_BUCKETS)
+
+    def stage(self, stage: str):
+        """Context manager timing one stage."""
+        return self._stage_seconds.time(stage)
+
+    def sample_rules(self) -> bool:
+        """Whether the transaction being evaluated has its rule timings recorded."""
+        self._rule_calls += 1
+        return self._rule_calls % self._rule_sample_every == 0
+
+    def observe_rule(self, rule_name: str, elapsed_ns: int) -> None:
+        # Called for every rule of every transaction: skips the label tuple of labels()
+        series = self._rule_series.get(rule_name)
+        if series is None:
+            series = self._rule_series[rule_name] = self._rule_seconds.labels(rule_name)
+        series.observe(elapsed_ns * 1e-9)
+
+    def record_decision(self, action: AlertAction, rule_hits: List[dict]) -> None:
+        self._decisions.labels(action.value).inc()
+        for hit in rule_hits:
+            self._rule_hits.labels(hit["rule_name"], hit["severity"]).inc()
+
+    def record_degraded(self, modes: Iterable[str]) -> None:
+        for mode in modes:
+            self._degraded.labels(mode).inc()
+
+    def observe_statements(self, count: int) -> None:
+        self._statements.observe(count)
@@ -0,0 +1,179 @@
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from ...core.entities.feature_vector import FeatureVector
+from ...core.entities.rule import Rule
+from ...core.entities.shadow_rule_hit import ShadowRuleHit
+from ...core.entities.transaction import Transaction
+from ..interfaces.i_rule_evaluator import IRuleEvaluator
+
+logger = logging.getLogger(__name__)
+
+# (shadow rules, detached features, transaction id, transaction occurred_at)
+_Job = Tuple[Sequence[Rule], FeatureVector, UUID, Any]
+
+class ShadowRuleRunner:
+    """
+    Evaluates shadow rules on live traffic without touching the decision.
+
+    submit() only puts the work on a bounded queue, dropping it (and counting
+    the drop) when the queue is full, so an authorization never waits for a
+    shadow rule. A fixed pool of worker threads evaluates the rules against a
+    detached copy of the transaction's features, keeps per-rule counters and
+    appends hits to a log written in batches through write_hits (every
+    flush_size hits, and every flush_interval_seconds).
+    Without write_hits only the counters are kept.
+    """
+
+    def __init__(
+        self,
+        evaluator: IRuleEvaluator,
+        write_hits: Optional[Callable[[List[ShadowRuleHit]], None]] = None,
+        workers: int = 1,
+        queue_size: int = 10_000,
+        flush_size: int = 500,
+        flush_interval_seconds: float = 5.0
+    ):
+        self._evaluator = evaluator
+        self._write_hits = write_hits
+        self._workers = workers
+        self._queue: "queue.Queue[Optional[_Job]]" = queue.Queue(maxsize=queue_size)
+        self._flush_size = flush_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._pending_hits: List[ShadowRuleHit] = []
+        self._counters: Dict[UUID, List] = {}  # rule id -> [rule name, evaluations, hits]
+        self.submitted_total = 0
+        self.dropped_total = 0
+        self.failed_flushes = 0
+        self.written_hits = 0
+
+    @property
+    def is_running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._threads = [
+            threading.Thread(target=self._run, name=f"shadow-rules-{number}", daemon=True)
+            for number in range(self._workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Shadow rule runner started with {self._workers} workers.")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Lets the workers finish the queued jobs, then writes the remaining hits."""
+        for _ in self._threads:
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                break
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self.flush()
+        logger.info("Shadow rule runner stopped.")
+
+    def submit(self, rules: Sequence[Rule], features: FeatureVector, transaction: Transaction) -> bool:
+        """Queues the evaluation; False when it was dropped because the queue is full."""
+        if not rules:
+            return True
+        try:
+            self._queue.put_nowait((rules, features.detached(), transaction.id, transaction.occurred_at))
+        except queue.Full:
+            self.dropped_total += 1
+            return False
+        self.submitted_total += 1
+        return True
+
+    def drain(self) -> int:
+        """Evaluates the queued jobs in the calling thread. Returns how many were handled."""
+        handled = 0
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return handled
+            if job is not None:
+                self._evaluate(job)
+                handled += 1
+
+    def flush(self) -> None:
+        with self._lock:
+            hits, self._pending_hits = self._pending_hits, []
+        if not hits or self._write_hits is None:
+            return
+        try:
+            self._write_hits(hits)
+            self.written_hits += len(hits)
+        except Exception as e:
+            # The counters already have them; the log is best effort.
+            self.failed_flushes += 1
+            logger.error(f"Writing {len(hits)} shadow rule hits failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        rules = []
+        for rule_id, (name, evaluations, hits) in list(self._counters.items()):
+            rules.append({
+                "rule_id": str(rule_id),
+                "rule_name": name,
+                "evaluations": evaluations,
+                "hits": hits,
+                "hit_rate": round(hits / evaluations, 6) if evaluations else 0.0,
+            })
+        return {
+            "running": self.is_running,
+            "workers": self._workers,
+            "queue_depth": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+            "submitted_total": self.submitted_total,
+            "dropped_total": self.dropped_total,
+            "written_hits": self.written_hits,
+            "failed_flushes": self.failed_flushes,
+            "rules": sorted(rules, key=lambda entry: entry["rule_name"]),
+        }
+
+    def _evaluate(self, job: _Job) -> None:
+        rules, features, transaction_id, occurred_at = job
+        context = features.as_dict()
+        hits = []
+        results = [(rule, self._evaluator.evaluate(rule, context)) for rule in rules]
+        with self._lock:
+            for rule, is_triggered in results:
+                counters = self._counters.get(rule.id)
+                if counters is None:
+                    counters = self._counters[rule.id] = [rule.name, 0, 0]
+                counters[1] += 1
+                if is_triggered:
+                    counters[2] += 1
+                    hits.append(ShadowRuleHit(rule_id=rule.id, transaction_id=transaction_id,
+                                              transaction_occurred_at=occurred_at))
+            self._pending_hits.extend(hits)
+            full = len(self._pending_hits) >= self._flush_size
+        if full:
+            self.flush()
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        while True:
+            try:
+                job = self._queue.get(timeout=self._flush_interval_seconds)
+            except queue.Empty:
+                job = ()
+            if job is None:
+                return
+            if job:
+                try:
+                    self._evaluate(job)
+                except Exception as e:
+                    logger.error(f"Shadow rule evaluation failed: {e}")
+            if time.monotonic() - last_flush >= self._flush_interval_seconds:
+                self.flush()
+                last_flush = time.monotonic()
@@ -0,0 +1,210 @@
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+BUCKET_SECONDS = 60
+
+# Feature name -> window length in buckets. The last window is the longest one.
+WINDOWS: Tuple[Tuple[str, int], ...] = (
+    ("tx_count_10m", 10),
+    ("tx_count_30m", 30),
+    ("tx_count_24h", 24 * 60),
+)
+_LONGEST_WINDOW = WINDOWS[-1][1]
+
+Activity = Tuple[UUID, datetime, Decimal]
+
+def _to_epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+class _CustomerVelocity:
+    """
+    Time-bucketed activity of one customer. Each window keeps its own queue of
+    (shared) one-minute buckets and running totals, so recording and answering
+    are O(1) and expiring a bucket is amortized O(1).
+    """
+    __slots__ = ("windows", "counts", "sums", "last_bucket")
+
+    def __init__(self):
+        self.windows = [deque() for _ in WINDOWS]
+        self.counts = [0] * len(WINDOWS)
+        self.sums = [0.0] * len(WINDOWS)
+        self.last_bucket: Optional[list] = None
+
+    def add(self, bucket_id: int, amount: float) -> bool:
+        """Returns True when a new bucket had to be allocated."""
+        bucket = self.last_bucket
+        created = bucket is None or bucket_id > bucket[0]
+        if created:
+            bucket = [bucket_id, 0, 0.0]
+            self.last_bucket = bucket
+            for window in self.windows:
+                window.append(bucket)
+        # Late events are folded into the newest bucket: at minute granularity
+        # the error is bounded by the caller's clock skew. Windows the bucket has
+        # already left do not count the event.
+        bucket[1] += 1
+        bucket[2] += amount
+        for i, window in enumerate(self.windows):
+            if window and window[-1] is bucket:
+                self.counts[i] += 1
+                self.sums[i] += amount
+        return created
+
+    def expire(self, current_bucket: int) -> int:
+        """Drops buckets that left each window. Returns buckets no longer referenced."""
+        released = 0
+        for i, (_, length) in enumerate(WINDOWS):
+            window = self.windows[i]
+            while window and window[0][0] <= current_bucket - length:
+                bucket = window.popleft()
+                self.counts[i] -= bucket[1]
+                self.sums[i] -= bucket[2]
+                if i == len(WINDOWS) - 1:
+                    released += 1
+        if not self.windows[-1]:
+            self.last_bucket = None
+        return released
+
+    @property
+    def is_idle(self) -> bool:
+        return not self.windows[-1]
+
+class VelocityEngine:
+    """
+    Process-local velocity state: per-customer sliding windows of transaction
+    counts and amount sums, answering tx_count_10m/30m/24h and avg_amount_24h
+    without touching the database.
+
+    The state only reflects transactions recorded through this process, so it
+    is meant for deployments where one process owns a customer's traffic; any
+    customer the engine cannot vouch for (before bootstrap, or evicted while
+    still active) yields None and callers fall back to the database.
+    """
+
+    def __init__(self, max_memory_bytes: int = 64 * 1024 * 1024, clock: Callable[[], float] = time.time):
+        self._max_memory_bytes = max_memory_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._customers: "OrderedDict[UUID, _CustomerVelocity]" = OrderedDict()
+        self._evicted: Dict[UUID, int] = {}
+        self._bucket_count = 0
+        self._ready = False
+        self._evictions = 0
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    def bootstrap(self, activity: Iterable[Activity]) -> int:
+        """Rebuilds the state from the last 24h of history (ordered by occurred_at)."""
+        with self._lock:
+            self._customers.clear()
+            self._evicted.clear()
+            self._bucket_count = 0
+            loaded = 0
+            for customer_id, occurred_at, amount in activity:
+                self._add(customer_id, _to_epoch(occurred_at), float(amount))
+                loaded += 1
+            self._expire_all(self._current_bucket())
+            self._ready = True
+        logger.info(f"Velocity engine bootstrapped with {loaded} transactions for {len(self._customers)} customers.")
+        return loaded
+
+    def record(self, customer_id: UUID, occurred_at: datetime, amount: Decimal) -> None:
+        if not self._ready:
+            # Anything recorded before bootstrap is committed and will be read by it.
+            return
+        with self._lock:
+            self._add(customer_id, _to_epoch(occurred_at), float(amount))
+            self._enforce_memory_cap()
+
+    def snapshot(self, customer_id: UUID) -> Optional[Dict[str, float]]:
+        """Current windows for a customer, or None when the engine cannot vouch for them."""
+        if not self._ready:
+            return None
+        with self._lock:
+            if customer_id in self._evicted:
+                return None
+            state = self._customers.get(customer_id)
+            if state is None:
+                return {name: 0 for name, _ in WINDOWS} | {"avg_amount_24h": 0.0}
+
+            self._bucket_count -= state.expire(self._current_bucket())
+            self._customers.move_to_end(customer_id)
+            features = {name: state.counts[i] for i, (name, _) in enumerate(WINDOWS)}
+            count_24h = state.counts[-1]
+            features["avg_amount_24h"] = state.sums[-1] / count_24h if count_24h else 0.0
+            return features
+
+    def memory_bytes(self) -> int:
+        """Estimated footprint of the tracked state."""
+        return len(self._customers) * _CUSTOMER_BYTES + self._bucket_count * _BUCKET_BYTES
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ready": self._ready,
+            "customers": len(self._customers),
+            "buckets": self._bucket_count,
+            "memory_bytes": self.memory_bytes(),
+            "max_memory_bytes": self._max_memory_bytes,
+            "evictions": self._evictions,
+        }
+
+    def _current_bucket(self) -> int:
+        return int(self._clock() // BUCKET_SECONDS)
+
+    def _add(self, customer_id: UUID, epoch_seconds: float, amount: float) -> None:
+        state = self._customers.get(customer_id)
+        if state is None:
+            state = _CustomerVelocity()
+            self._customers[customer_id] = state
+            self._evicted.pop(customer_id, None)
+        else:
+            self._customers.move_to_end(customer_id)
+        if state.add(int(epoch_seconds // BUCKET_SECONDS), amount):
+            self._bucket_count += 1
+
+    def _expire_all(self, current_bucket: int) -> None:
+        for customer_id in list(self._customers):
+            state = self._customers[customer_id]
+            self._bucket_count -= state.expire(current_bucket)
+            if state.is_idle:
+                del self._customers[customer_id]
+
+    def _enforce_memory_cap(self) -> None:
+        if self.memory_bytes() <= self._max_memory_bytes:
+            return
+
+        current_bucket = self._current_bucket()
+        # Idle customers carry no information: dropping them is lossless.
+        self._expire_all(current_bucket)
+        self._evicted = {cid: b for cid, b in self._evicted.items() if b > current_bucket - _LONGEST_WINDOW}
+
+        while self._customers and self.memory_bytes() > self._max_memory_bytes:
+            customer_id, state = self._customers.popitem(last=False)
+            self._bucket_count -= len(state.windows[-1])
+            self._evicted[customer_id] = current_bucket
+            self._evictions += 1
+
+def _estimate_sizes() -> Tuple[int, int]:
+    state = _CustomerVelocity()
+    customer = (
+        sys.getsizeof(state) + sum(sys.getsizeof(w) for w in state.windows)
+        + sys.getsizeof(state.counts) + sys.getsizeof(state.sums)
+        + 100  # UUID key and OrderedDict entry
+    )
+    bucket = sys.getsizeof([0, 0, 0.0]) + sys.getsizeof(10**6) + sys.getsizeof(0.0) + len(WINDOWS) * 8
+    return customer, bucket
+
+_CUSTOMER_BYTES, _BUCKET_BYTES = _estimate_sizes()
@@ -0,0 +1,58 @@
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+WarmUpStep = Callable[[], Union[Any, Awaitable[Any]]]
+
+class WorkerWarmUp:
+    """
+    Ordered warm-up steps a worker process runs before it takes traffic
+    (rule set, compiled rules, model, pooled connections...). The worker is
+    ready once every step has succeeded; a failed step keeps it not ready and
+    is retried by the next run().
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._steps: List[Tuple[str, WarmUpStep]] = []
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._ready = False
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    def add_step(self, name: str, step: WarmUpStep) -> None:
+        self._steps.append((name, step))
+
+    async def run(self) -> bool:
+        for name, step in self._steps:
+            if self._results.get(name, {}).get("ok"):
+                continue
+            started = self._clock()
+            try:
+                result = step()
+                if inspect.isawaitable(result):
+                    result = await result
+                self._results[name] = {"ok": True, "seconds": round(self._clock() - started, 4),
+                                       "detail": None if result is None else str(result)}
+            except Exception as e:
+                logger.error(f"Warm-up step '{name}' failed: {e}")
+                self._results[name] = {"ok": False, "seconds": round(self._clock() - started, 4), "detail": str(e)}
+                break
+        self._ready = all(self._results.get(name, {}).get("ok") for name, _ in self._steps)
+        if self._ready:
+            total = sum(result["seconds"] for result in self._results.values())
+            logger.info(f"Worker warm-up finished in {total:.3f}s.")
+        return self._ready
+
+    async def run_until_ready(self, retry_seconds: float = 5.0) -> None:
+        while not await self.run():
+            await asyncio.sleep(retry_seconds)
+
+    def status(self) -> Dict[str, Any]:
+        return {"ready": self._ready, "steps": dict(self._results)}
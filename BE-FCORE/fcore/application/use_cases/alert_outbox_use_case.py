@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+import logging
+import random
+
+from ...core.entities.alert import Alert
+from ...core.entities.alert_outbox_event import AlertOutboxEvent
+from ...core.entities.case import Case
+from ..interfaces.i_unit_of_work import IUnitOfWork
+from ..services.analyst_assignment import AnalystAssignmentService
+
+logger = logging.getLogger(__name__)
+
+class ProcessAlertOutboxUseCase:
+    """
+    Turns outbox events written by the scoring path into Alerts and Cases.
+    Each event is committed on its own; a failed event is retried with
+    exponential backoff and given up (DEAD) after max_attempts.
+    """
+
+    def __init__(
+        self,
+        uow: IUnitOfWork,
+        max_attempts: int = 10,
+        lease_seconds: float = 60.0,
+        base_backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 300.0,
+        analyst_assignment: Optional[AnalystAssignmentService] = None
+    ):
+        self._uow = uow
+        self._max_attempts = max_attempts
+        self._lease_seconds = lease_seconds
+        self._base_backoff_seconds = base_backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._analyst_assignment = analyst_assignment
+
+    def process_batch(self, batch_size: int = 100) -> Tuple[int, int]:
+        """Processes one batch of due events. Returns (processed, failed)."""
+        with self._uow:
+            events = self._uow.alert_outbox_repository.claim_batch(batch_size, self._lease_seconds)
+            self._uow.commit()
+            if not events:
+                return 0, 0
+
+            assignments = self._assign_batch(len(events))
+            processed = failed = 0
+            for event, assigned in zip(events, assignments):
+                try:
+                    self._materialize(event, assigned)
+                    self._uow.alert_outbox_repository.mark_done(event.id)
+                    self._uow.commit()
+                    processed += 1
+                except Exception as e:
+                    self._uow.rollback()
+                    if assigned and self._analyst_assignment:
+                        self._analyst_assignment.release(assigned[0])
+                    self._record_failure(event, e)
+                    failed += 1
+            return processed, failed
+
+    def _assign_batch(self, count: int) -> List[Optional[Tuple]]:
+        """One (analyst_id, name) per event, chosen for the whole batch at once."""
+        if self._analyst_assignment:
+            return self._analyst_assignment.assign_many(self._uow.analyst_repository, count)
+        # Loaded once per batch instead of once per alert
+        analysts = self._uow.analyst_repository.get_all()
+        if not analysts:
+            return [None] * count
+        return [(analyst.id, analyst.name) for analyst in (random.choice(analysts) for _ in range(count))]
+
+    def _materialize(self, event: AlertOutboxEvent, assigned: Optional[Tuple]) -> None:
+        # Idempotent: a retried event (or one leased twice) finds its alert and case already there.
+        if not self._uow.alert_repository.exists(event.id):
+            self._uow.alert_repository.create(Alert(
+                id=event.id,
+                transaction_id=event.transaction_id,
+                transaction_occurred_at=event.transaction_occurred_at,
+                action=event.action,
+                ml_score=event.ml_score,
+                final_score=event.final_score,
+                rule_hits=event.rule_hits,
+                created_at=event.created_at
+            ))
+
+        if not assigned:
+            logger.warning(f"Alert {event.id} created but NO ANALYSTS available.")
+            return
+        analyst_id, analyst_name = assigned
+        if self._uow.case_repository.find_by_alert_id(event.id):
+            # Retried event whose case already exists: give the slot back.
+            if self._analyst_assignment:
+                self._analyst_assignment.release(analyst_id)
+            return
+        self._uow.case_repository.create(Case(alert_id=event.id, analyst_id=analyst_id))
+        logger.info(f"Case created for Alert {event.id}. Assigned to {analyst_name}")
+
+    def _record_failure(self, event: AlertOutboxEvent, error: Exception) -> None:
+        retry_at: Optional[datetime] = None
+        if event.attempts < self._max_attempts:
+            backoff = min(self._base_backoff_seconds * 2 ** (event.attempts - 1), self._max_backoff_seconds)
+            retry_at = datetime.utcnow() + timedelta(seconds=backoff)
+            logger.warning(f"Outbox event {event.id} failed (attempt {event.attempts}), retrying at {retry_at}: {error}")
+        else:
+            logger.error(f"Outbox event {event.id} failed {event.attempts} times, giving up: {error}")
+        self._uow.alert_outbox_repository.mark_failed(event.id, repr(error), retry_at)
+        self._uow.commit()
@@ -2,6 +2,7 @@ from typing import List
 from uuid import UUID
 from ...core.entities.alert import Alert
 from ..interfaces.i_alert_repository import IAlertRepository
+from ..interfaces.i_async_alert_repository import IAsyncAlertRepository
 from ...core.errors.alert_errors import AlertNotFoundError
 
 class AlertUseCases:
@@ -21,4 +22,19 @@ class AlertUseCases:
 
     # Note: The 'create_alert' use case will be part of the main 'DecisionUseCase'
     # It will take a transaction, run it through rules/ML, and then call
-    # alert_repository.create() if needed. We don't expose its creation directly.
\ No newline at end of file
+    # alert_repository.create() if needed. We don't expose its creation directly.
+
+class AsyncAlertUseCases:
+    """AlertUseCases for the async endpoints."""
+
+    def __init__(self, alert_repository: IAsyncAlertRepository):
+        self._alert_repository = alert_repository
+
+    async def get_alert_by_id(self, id: UUID) -> Alert:
+        alert = await self._alert_repository.find_by_id(id)
+        if not alert:
+            raise AlertNotFoundError(f"Alert with ID {id} not found.")
+        return alert
+
+    async def get_all_alerts(self, limit: int, offset: int) -> List[Alert]:
+        return await self._alert_repository.get_all(limit, offset)
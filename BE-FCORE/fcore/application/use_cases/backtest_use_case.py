@@ -0,0 +1,67 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Collection, Optional
+
+from ...core.entities.rule import Rule
+from ...core.errors.backtest_errors import BacktestAlreadyRunningError, BacktestValidationError
+from ...core.errors.rule_errors import RuleValidationError
+from ..interfaces.i_backtest_runner import IBacktestRunner
+from ..interfaces.i_rule_repository import IRuleRepository
+from ..services.backtest import BacktestReport
+from ..services.rule_references import unknown_names
+
+class BacktestUseCase:
+    """
+    Use case for replaying a candidate expression, or the live rule set, over past transactions.
+
+    The live rule set is what decides transactions: enabled rules that are not in shadow mode.
+
+    max_range rejects longer [start, end) ranges. A backtest holds 'slot' while it
+    runs and is refused if another one already holds it, so that callers sharing a
+    slot (the requests of one API worker) never run two process pools at once.
+    """
+
+    def __init__(self, rule_repository: IRuleRepository, runner: IBacktestRunner,
+                 known_names: Optional[Collection[str]] = None, max_range: Optional[timedelta] = None,
+                 slot: Optional[threading.Lock] = None):
+        self._rule_repository = rule_repository
+        self._runner = runner
+        # Names a DSL expression may read (the feature catalog); None skips the check
+        self._known_names = known_names
+        self._max_range = max_range
+        self._slot = slot
+
+    def execute(self, start: datetime, end: datetime, dsl_expression: Optional[str] = None,
+                requested_by: str = "backtest") -> BacktestReport:
+        if end <= start:
+            raise BacktestValidationError("Backtest end must be after its start.")
+        if self._max_range is not None and end - start > self._max_range:
+            raise BacktestValidationError(
+                f"Backtest range is longer than {self._max_range.days} days; run backtest_rules.py for longer ranges.")
+
+        if dsl_expression is not None:
+            self._validate_expression(dsl_expression)
+            rules = [Rule(name="Backtest candidate", dsl_expression=dsl_expression,
+                          created_at=datetime.utcnow(), created_by=requested_by)]
+        else:
+            # Shadow rules never decide a transaction, so they would skew the replayed decisions
+            rules = [rule for rule in self._rule_repository.get_all() if rule.enabled and not rule.shadow]
+            if not rules:
+                raise BacktestValidationError("There are no enabled live rules to backtest.")
+
+        if self._slot is None:
+            return self._runner.run(rules, start, end)
+        if not self._slot.acquire(blocking=False):
+            raise BacktestAlreadyRunningError("Another backtest is already running; retry when it has finished.")
+        try:
+            return self._runner.run(rules, start, end)
+        finally:
+            self._slot.release()
+
+    def _validate_expression(self, dsl_expression: str) -> None:
+        try:
+            unknown = unknown_names(dsl_expression, self._known_names or ())
+        except SyntaxError as e:
+            raise RuleValidationError(f"Rule DSL expression is not valid: {e.msg}.")
+        if self._known_names is not None and unknown:
+            raise RuleValidationError(f"Rule DSL expression references unknown features: {', '.join(unknown)}.")
@@ -1,5 +1,6 @@
 from uuid import UUID
 from ..interfaces.i_behavior_repository import IBehaviorRepository
+from ..interfaces.i_async_behavior_repository import IAsyncBehaviorRepository
 from ...core.errors.behavior_errors import BehaviorProfileNotFoundError
 from ...core.entities.behavior_profile import BehaviorProfile
 
@@ -17,4 +18,16 @@ class BehaviorUseCases:
         profile = self._behavior_repository.get_by_customer_id(customer_id)
         if not profile:
             raise BehaviorProfileNotFoundError(f"No behavior profile found for customer {customer_id}.")
-        return profile
\ No newline at end of file
+        return profile
+
+class AsyncBehaviorUseCases:
+    """BehaviorUseCases for the async endpoints."""
+
+    def __init__(self, behavior_repository: IAsyncBehaviorRepository):
+        self._behavior_repository = behavior_repository
+
+    async def get_behavior_for_customer(self, customer_id: UUID) -> BehaviorProfile:
+        profile = await self._behavior_repository.get_by_customer_id(customer_id)
+        if not profile:
+            raise BehaviorProfileNotFoundError(f"No behavior profile found for customer {customer_id}.")
+        return profile
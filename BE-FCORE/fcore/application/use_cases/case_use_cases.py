@@ -1,17 +1,26 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from ...core.entities.case import Case, CaseDecision
 from ..interfaces.i_case_repository import ICaseRepository
 from ..interfaces.i_alert_repository import IAlertRepository
+from ..interfaces.i_async_case_repository import IAsyncCaseRepository
+from ..interfaces.i_async_alert_repository import IAsyncAlertRepository
+from ..services.analyst_assignment import AnalystAssignmentService
 from ...core.errors.case_errors import CaseNotFoundError, CaseAlreadyExistsError
 from ...core.errors.alert_errors import AlertNotFoundError
 
 class CaseUseCases:
     """Use cases for managing investigation cases."""
 
-    def __init__(self, case_repository: ICaseRepository, alert_repository: IAlertRepository):
+    def __init__(
+        self,
+        case_repository: ICaseRepository,
+        alert_repository: IAlertRepository,
+        analyst_assignment: Optional[AnalystAssignmentService] = None
+    ):
         self._case_repository = case_repository
         self._alert_repository = alert_repository
+        self._analyst_assignment = analyst_assignment
 
     def open_case_from_alert(self, alert_id: UUID, analyst_id: UUID) -> Case:
         if not self._alert_repository.find_by_id(alert_id):
@@ -21,7 +30,11 @@ class CaseUseCases:
             raise CaseAlreadyExistsError(f"A case for alert ID {alert_id} already exists.")
 
         new_case = Case(alert_id=alert_id, analyst_id=analyst_id)
-        return self._case_repository.create(new_case)
+        created = self._case_repository.create(new_case)
+        if self._analyst_assignment:
+            # resolve_case releases it, so it must be counted here too
+            self._analyst_assignment.acquire(created.analyst_id)
+        return created
 
     def get_case_by_id(self, id: UUID) -> Case:
         case = self._case_repository.find_by_id(id)
@@ -40,4 +53,55 @@ class CaseUseCases:
     def resolve_case(self, case_id: UUID, decision: CaseDecision) -> Case:
         case_to_update = self.get_case_by_id(case_id)
         case_to_update.resolve(decision)
-        return self._case_repository.update(case_to_update)
\ No newline at end of file
+        updated = self._case_repository.update(case_to_update)
+        if self._analyst_assignment:
+            self._analyst_assignment.release(updated.analyst_id)
+        return updated
+
+class AsyncCaseUseCases:
+    """CaseUseCases for the async endpoints."""
+
+    def __init__(
+        self,
+        case_repository: IAsyncCaseRepository,
+        alert_repository: IAsyncAlertRepository,
+        analyst_assignment: Optional[AnalystAssignmentService] = None
+    ):
+        self._case_repository = case_repository
+        self._alert_repository = alert_repository
+        self._analyst_assignment = analyst_assignment
+
+    async def open_case_from_alert(self, alert_id: UUID, analyst_id: UUID) -> Case:
+        if not await self._alert_repository.exists(alert_id):
+            raise AlertNotFoundError(f"Alert with ID {alert_id} not found.")
+
+        if await self._case_repository.find_by_alert_id(alert_id):
+            raise CaseAlreadyExistsError(f"A case for alert ID {alert_id} already exists.")
+
+        new_case = Case(alert_id=alert_id, analyst_id=analyst_id)
+        created = await self._case_repository.create(new_case)
+        if self._analyst_assignment:
+            self._analyst_assignment.acquire(created.analyst_id)
+        return created
+
+    async def get_case_by_id(self, id: UUID) -> Case:
+        case = await self._case_repository.find_by_id(id)
+        if not case:
+            raise CaseNotFoundError(f"Case with ID {id} not found.")
+        return case
+
+    async def get_all_cases(self, limit: int, offset: int) -> List[Case]:
+        return await self._case_repository.get_all(limit, offset)
+
+    async def add_note_to_case(self, case_id: UUID, note: str, analyst_name: str) -> Case:
+        case_to_update = await self.get_case_by_id(case_id)
+        case_to_update.add_note(note, analyst_name)
+        return await self._case_repository.update(case_to_update)
+
+    async def resolve_case(self, case_id: UUID, decision: CaseDecision) -> Case:
+        case_to_update = await self.get_case_by_id(case_id)
+        case_to_update.resolve(decision)
+        updated = await self._case_repository.update(case_to_update)
+        if self._analyst_assignment:
+            self._analyst_assignment.release(updated.analyst_id)
+        return updated
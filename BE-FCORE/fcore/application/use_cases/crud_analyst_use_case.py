@@ -5,6 +5,7 @@ from uuid import UUID
 from ...core.entities.analyst import Analyst
 from ..interfaces.i_unit_of_work import IUnitOfWork # Dependency on UoW
 from ..interfaces.i_password_hasher import IPasswordHasher
+from ..services.analyst_assignment import AnalystAssignmentService
 from ...core.errors.analyst_errors import AnalystAlreadyExistsError, AnalystNotFoundError
 from ...core.errors.roles_errors import RoleNotFoundError
 from ...presentation.api.schemas.analyst_schemas import AnalystCreate, AnalystUpdate
@@ -14,10 +15,12 @@ class CrudAnalystUseCase:
     def __init__(
         self, 
         uow: IUnitOfWork, 
-        password_service: IPasswordHasher
+        password_service: IPasswordHasher,
+        analyst_assignment: Optional[AnalystAssignmentService] = None
     ):
         self._uow = uow
         self._password_hasher = password_service
+        self._analyst_assignment = analyst_assignment
 
     def create(self, analyst_schema: AnalystCreate, created_by_code: str) -> Analyst:
 
@@ -42,6 +45,7 @@ class CrudAnalystUseCase:
             
             created_analyst = self._uow.analyst_repository.create(new_analyst)
             self._uow.commit()
+            self._refresh_roster()
             
             return created_analyst
 
@@ -86,6 +90,7 @@ class CrudAnalystUseCase:
 
             updated_analyst = self._uow.analyst_repository.update(analyst_to_update)
             self._uow.commit()
+            self._refresh_roster()
             return updated_analyst
     
     def deactivate(self, code: str, modified_by_code: str) -> Analyst:
@@ -100,4 +105,10 @@ class CrudAnalystUseCase:
             
             result = self._uow.analyst_repository.update(analyst)
             self._uow.commit()
-            return result
\ No newline at end of file
+            self._refresh_roster()
+            return result
+
+    def _refresh_roster(self) -> None:
+        """Analyst changes invalidate the assignment roster."""
+        if self._analyst_assignment:
+            self._analyst_assignment.invalidate()
\ No newline at end of file
@@ -1,14 +1,16 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from ...core.entities.customer import Customer
 from ..interfaces.i_customer_repository import ICustomerRepository
+from ..services.reference_data_cache import ReferenceDataCache
 from ...core.errors.customer_errors import CustomerNotFoundError, CustomerAlreadyExistsError
 
 class CrudCustomerUseCase:
     """Use case for CRUD operations on a Customer."""
     
-    def __init__(self, customer_repository: ICustomerRepository):
+    def __init__(self, customer_repository: ICustomerRepository, cache: Optional[ReferenceDataCache] = None):
         self._customer_repository = customer_repository
+        self._cache = cache
 
     def create(self, full_name: str, document_number: str, segment: str = None, age: int = None) -> Customer:
         if self._customer_repository.find_by_document_number(document_number):
@@ -20,7 +22,9 @@ class CrudCustomerUseCase:
             segment=segment,
             age=age
         )
-        return self._customer_repository.create(customer_entity)
+        created = self._customer_repository.create(customer_entity)
+        self._invalidate(created.id)
+        return created
 
     def get_by_id(self, id: UUID) -> Customer:
         customer = self._customer_repository.find_by_id(id)
@@ -46,9 +50,18 @@ class CrudCustomerUseCase:
                 setattr(customer_to_update, key, value)
         
         customer_to_update.__post_init__() # Re-validate
-        return self._customer_repository.update(customer_to_update)
+        updated = self._customer_repository.update(customer_to_update)
+        self._invalidate(id)
+        return updated
 
     def delete(self, id: UUID) -> bool:
         if not self._customer_repository.find_by_id(id):
             raise CustomerNotFoundError(f"Customer with ID {id} not found.")
-        return self._customer_repository.delete(id)
\ No newline at end of file
+        deleted = self._customer_repository.delete(id)
+        self._invalidate(id)
+        return deleted
+
+    def _invalidate(self, id: UUID) -> None:
+        """Drops the entry the scoring path may have cached for this customer."""
+        if self._cache:
+            self._cache.invalidate(id)
\ No newline at end of file
@@ -1,21 +1,25 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from ...core.entities.merchant import Merchant
 from ..interfaces.i_merchant_repository import IMerchantRepository
+from ..services.reference_data_cache import ReferenceDataCache
 from ...core.errors.merchant_errors import MerchantNotFoundError, MerchantAlreadyExistsError
 
 class CrudMerchantUseCase:
     """Use case for CRUD operations on a Merchant."""
     
-    def __init__(self, merchant_repository: IMerchantRepository):
+    def __init__(self, merchant_repository: IMerchantRepository, cache: Optional[ReferenceDataCache] = None):
         self._merchant_repository = merchant_repository
+        self._cache = cache
 
     def create(self, name: str, category: str) -> Merchant:
         if self._merchant_repository.find_by_name(name):
             raise MerchantAlreadyExistsError(f"Merchant with name '{name}' already exists.")
         
         merchant_entity = Merchant(name=name, category=category)
-        return self._merchant_repository.create(merchant_entity)
+        created = self._merchant_repository.create(merchant_entity)
+        self._invalidate(created.id)
+        return created
 
     def get_by_id(self, id: UUID) -> Merchant:
         merchant = self._merchant_repository.find_by_id(id)
@@ -39,9 +43,18 @@ class CrudMerchantUseCase:
                 setattr(merchant_to_update, key, value)
         
         merchant_to_update.__post_init__() # Re-validate
-        return self._merchant_repository.update(merchant_to_update)
+        updated = self._merchant_repository.update(merchant_to_update)
+        self._invalidate(id)
+        return updated
 
     def delete(self, id: UUID) -> bool:
         if not self._merchant_repository.find_by_id(id):
             raise MerchantNotFoundError(f"Merchant with ID {id} not found.")
-        return self._merchant_repository.delete(id)
\ No newline at end of file
+        deleted = self._merchant_repository.delete(id)
+        self._invalidate(id)
+        return deleted
+
+    def _invalidate(self, id: UUID) -> None:
+        """Drops the entry the scoring path may have cached for this merchant."""
+        if self._cache:
+            self._cache.invalidate(id)
\ No newline at end of file
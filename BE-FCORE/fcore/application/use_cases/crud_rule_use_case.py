@@ -1,27 +1,42 @@
-from typing import List
+from typing import Collection, List, Optional
 from uuid import UUID
 from datetime import datetime
 from ...core.entities.rule import Rule, RuleSeverity
 from ..interfaces.i_rule_repository import IRuleRepository
-from ...core.errors.rule_errors import RuleNotFoundError, RuleAlreadyExistsError
+from ..services.rule_set_cache import RuleSetCache
+from ..services.rule_references import unknown_names
+from ...core.errors.rule_errors import RuleNotFoundError, RuleAlreadyExistsError, RuleValidationError
 
 class CrudRuleUseCase:
     """Use case for CRUD operations on a Rule."""
     
-    def __init__(self, rule_repository: IRuleRepository):
+    def __init__(
+        self,
+        rule_repository: IRuleRepository,
+        rule_set_cache: Optional[RuleSetCache] = None,
+        known_names: Optional[Collection[str]] = None
+    ):
         self._rule_repository = rule_repository
+        self._rule_set_cache = rule_set_cache
+        # Names a DSL expression may read (the feature catalog); None skips the check
+        self._known_names = known_names
 
-    def create(self, name: str, dsl_expression: str, severity: RuleSeverity, created_by_code: str) -> Rule:
+    def create(self, name: str, dsl_expression: str, severity: RuleSeverity, created_by_code: str,
+               shadow: bool = False) -> Rule:
         if self._rule_repository.find_by_name(name):
             raise RuleAlreadyExistsError(f"Rule with name '{name}' already exists.")
+        self._validate_expression(dsl_expression)
         
         rule_entity = Rule(
             name=name, 
             dsl_expression=dsl_expression, 
             severity=severity, 
+            shadow=shadow,
             created_at=datetime.utcnow(),
             created_by=created_by_code)
-        return self._rule_repository.create(rule_entity)
+        created_rule = self._rule_repository.create(rule_entity)
+        self._refresh_rule_set()
+        return created_rule
 
     def get_by_id(self, id: UUID) -> Rule:
         rule = self._rule_repository.find_by_id(id)
@@ -32,6 +47,13 @@ class CrudRuleUseCase:
     def get_all(self) -> List[Rule]:
         return self._rule_repository.get_all()
 
+    def get_active_rule_set(self) -> dict:
+        """Describes the rule set snapshot currently used by the scoring path."""
+        if not self._rule_set_cache:
+            raise RuleNotFoundError("Rule set cache is not configured.")
+        self._rule_set_cache.get(self._rule_repository)
+        return self._rule_set_cache.describe()
+
     def update(self, id: UUID, update_data: dict, modified_by_code: str) -> Rule:
         rule_to_update = self.get_by_id(id)
 
@@ -39,6 +61,8 @@ class CrudRuleUseCase:
             existing = self._rule_repository.find_by_name(update_data['name'])
             if existing:
                 raise RuleAlreadyExistsError(f"Rule with name '{update_data['name']}' already exists.")
+        if 'dsl_expression' in update_data:
+            self._validate_expression(update_data['dsl_expression'])
 
         for key, value in update_data.items():
             if hasattr(rule_to_update, key):
@@ -47,9 +71,27 @@ class CrudRuleUseCase:
         rule_to_update.updated_at = datetime.utcnow()
         rule_to_update.updated_by = modified_by_code
         rule_to_update.__post_init__()
-        return self._rule_repository.update(rule_to_update)
+        updated_rule = self._rule_repository.update(rule_to_update)
+        self._refresh_rule_set()
+        return updated_rule
 
     def delete(self, id: UUID) -> bool:
         if not self._rule_repository.find_by_id(id):
             raise RuleNotFoundError(f"Rule with ID {id} not found.")
-        return self._rule_repository.delete(id)
\ No newline at end of file
+        deleted = self._rule_repository.delete(id)
+        self._refresh_rule_set()
+        return deleted
+
+    def _validate_expression(self, dsl_expression: str) -> None:
+        """Rejects expressions that do not parse or read names the scoring context does not provide."""
+        try:
+            unknown = unknown_names(dsl_expression, self._known_names or ())
+        except SyntaxError as e:
+            raise RuleValidationError(f"Rule DSL expression is not valid: {e.msg}.")
+        if self._known_names is not None and unknown:
+            raise RuleValidationError(f"Rule DSL expression references unknown features: {', '.join(unknown)}.")
+
+    def _refresh_rule_set(self) -> None:
+        """Swaps in a new rule set snapshot so scoring sees the change immediately."""
+        if self._rule_set_cache:
+            self._rule_set_cache.refresh(self._rule_repository)
\ No newline at end of file
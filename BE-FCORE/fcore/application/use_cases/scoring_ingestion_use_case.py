@@ -0,0 +1,129 @@
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+from ...core.entities.transaction import Transaction
+from ...core.entities.alert import AlertAction
+from ...core.errors.customer_errors import CustomerNotFoundError
+from ...core.errors.merchant_errors import MerchantNotFoundError
+from ..interfaces.i_scoring_unit_of_work import IScoringUnitOfWork
+from ..interfaces.i_async_scoring_unit_of_work import IAsyncScoringUnitOfWork
+from ..interfaces.i_model_scorer import IModelScorer
+from ..interfaces.i_rule_evaluator import IRuleEvaluator
+from ..services.decision_service import DecisionService
+from ..services.rule_set_cache import RuleSetCache
+from ..services.velocity_engine import VelocityEngine
+from ..services.analyst_assignment import AnalystAssignmentService
+from ..services.rule_evaluation_stats import RuleEvaluationStats
+from ..services.shadow_rule_runner import ShadowRuleRunner
+from ..services.reference_data_cache import ReferenceDataCache
+from ..services.latency_budget import LatencyGuard
+from ..services.scoring_metrics import ScoringMetrics
+from .scoring_use_case import ScoringUseCase
+
+logger = logging.getLogger(__name__)
+
+class ScoringIngestionUseCase:
+    """
+    Records and scores an incoming transaction in a single database transaction:
+    customer and merchant are read once and attached to the transaction, the row
+    is inserted with RETURNING instead of being flushed and refreshed, and the
+    only COMMIT happens after the behavior profile (and alert) are written.
+    """
+
+    def __init__(
+        self,
+        uow: IScoringUnitOfWork,
+        scorer: IModelScorer,
+        decision_service: DecisionService,
+        rule_evaluator: IRuleEvaluator,
+        rule_set_cache: Optional[RuleSetCache] = None,
+        velocity_engine: Optional[VelocityEngine] = None,
+        analyst_assignment: Optional[AnalystAssignmentService] = None,
+        use_alert_outbox: bool = False,
+        rule_stats: Optional[RuleEvaluationStats] = None,
+        rule_audit: bool = False,
+        shadow_runner: Optional[ShadowRuleRunner] = None,
+        latency_guard: Optional[LatencyGuard] = None,
+        behavior_cache: Optional[ReferenceDataCache] = None,
+        metrics: Optional[ScoringMetrics] = None
+    ):
+        self._uow = uow
+        self._scorer = scorer
+        self._decision_service = decision_service
+        self._rule_evaluator = rule_evaluator
+        self._rule_set_cache = rule_set_cache
+        self._velocity_engine = velocity_engine
+        self._analyst_assignment = analyst_assignment
+        self._use_alert_outbox = use_alert_outbox
+        self._rule_stats = rule_stats
+        self._rule_audit = rule_audit
+        self._shadow_runner = shadow_runner
+        self._latency_guard = latency_guard
+        self._behavior_cache = behavior_cache
+        self._metrics = metrics
+        self.last_statement_count: Optional[int] = None
+
+    def execute(self, data: dict) -> Tuple[Transaction, AlertAction, Dict[str, Any]]:
+        with self._uow:
+            customer = self._uow.customer_repository.find_by_id(data.get('customer_id'))
+            if not customer:
+                raise CustomerNotFoundError(f"Customer with ID {data.get('customer_id')} not found.")
+            merchant = self._uow.merchant_repository.find_by_id(data.get('merchant_id'))
+            if not merchant:
+                raise MerchantNotFoundError(f"Merchant with ID {data.get('merchant_id')} not found.")
+
+            transaction = self._uow.transaction_repository.add(Transaction(
+                customer_id=customer.id,
+                merchant_id=merchant.id,
+                amount=Decimal(data.get('amount')),
+                channel=data.get('channel'),
+                device_id=data.get('device_id'),
+                ip_address=data.get('ip_address'),
+                country=data.get('country'),
+                customer=customer,
+                merchant=merchant
+            ))
+            action, details = self._build_scoring().execute(transaction, recorded_in_velocity=False)
+            self._uow.commit()
+
+            # Only committed transactions reach the velocity counters, as in TransactionUseCase.
+            if self._velocity_engine:
+                self._velocity_engine.record(transaction.customer_id, transaction.occurred_at, transaction.amount)
+
+            self.last_statement_count = self._uow.statement_count
+            if self._metrics:
+                self._metrics.observe_statements(self.last_statement_count)
+            logger.debug(f"Scored transaction {transaction.id} with {self.last_statement_count} SQL statements.")
+            return transaction, action, details
+
+    async def execute_async(self, data: dict) -> Tuple[Transaction, AlertAction, Dict[str, Any]]:
+        """execute() on an IAsyncScoringUnitOfWork, without holding a thread while the database answers."""
+        if not isinstance(self._uow, IAsyncScoringUnitOfWork):
+            return self.execute(data)
+        return await self._uow.run(self.execute, data)
+
+    def _build_scoring(self) -> ScoringUseCase:
+        return ScoringUseCase(
+            transaction_repo=self._uow.transaction_repository,
+            behavior_repo=self._uow.behavior_repository,
+            rule_repo=self._uow.rule_repository,
+            alert_repo=self._uow.alert_repository,
+            case_repo=self._uow.case_repository,
+            analyst_repo=self._uow.analyst_repository,
+            scorer=self._scorer,
+            decision_service=self._decision_service,
+            rule_evaluator=self._rule_evaluator,
+            rule_set_cache=self._rule_set_cache,
+            velocity_engine=self._velocity_engine,
+            alert_outbox_repo=self._uow.alert_outbox_repository if self._use_alert_outbox else None,
+            analyst_assignment=self._analyst_assignment,
+            rule_stats=self._rule_stats,
+            rule_audit=self._rule_audit,
+            shadow_runner=self._shadow_runner,
+            latency_guard=self._latency_guard,
+            behavior_cache=self._behavior_cache,
+            metrics=self._metrics,
+            # Inside run() the pipeline is on the event loop thread: wait for the model without blocking it
+            model_wait=self._uow.wait_for if isinstance(self._uow, IAsyncScoringUnitOfWork) else None
+        )
@@ -1,12 +1,17 @@
+from concurrent.futures import Future
+from contextlib import nullcontext
+from copy import copy
 from datetime import datetime
-from typing import Dict, Any, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import logging
 import random
 
 from ...core.entities.transaction import Transaction
 from ...core.entities.behavior_profile import BehaviorProfile
 from ...core.entities.alert import Alert, AlertAction
+from ...core.entities.alert_outbox_event import AlertOutboxEvent
 from ...core.entities.case import Case
+from ...core.entities.feature_vector import FeatureVector
 
 from ..interfaces.i_transaction_repository import ITransactionRepository
 from ..interfaces.i_behavior_repository import IBehaviorRepository
@@ -14,11 +19,22 @@ from ..interfaces.i_rule_repository import IRuleRepository
 from ..interfaces.i_alert_repository import IAlertRepository
 from ..interfaces.i_case_repository import ICaseRepository
 from ..interfaces.i_analyst_repository import IAnalystRepository
+from ..interfaces.i_alert_outbox_repository import IAlertOutboxRepository
 from ..interfaces.i_model_scorer import IModelScorer
 from ..interfaces.i_rule_evaluator import IRuleEvaluator  # <--- New Import
 
 from ..services.rule_engine import RuleEngine
+from ..services.rule_evaluation_stats import RuleEvaluationStats
 from ..services.decision_service import DecisionService
+from ..services.rule_set_cache import RuleSetCache
+from ..services.velocity_engine import VelocityEngine
+from ..services.analyst_assignment import AnalystAssignmentService
+from ..services.feature_builder import build_scoring_features
+from ..services.shadow_rule_runner import ShadowRuleRunner
+from ..services.reference_data_cache import ReferenceDataCache
+from ..services.latency_budget import DegradedMode, LatencyBudget, LatencyGuard, ScoringStage
+from ..services.scoring_metrics import (ScoringMetrics, PROFILE_LOAD, RULE_FETCH, FEATURE_COMPUTATION, RULE_EVALUATION,
+                                        MODEL_SCORING, DECISION, ALERT_CASE_CREATION, BEHAVIOR_SAVE)
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +53,18 @@ class ScoringUseCase:
         analyst_repo: IAnalystRepository,
         scorer: IModelScorer,
         decision_service: DecisionService,
-        rule_evaluator: IRuleEvaluator # <--- Injected Strategy
+        rule_evaluator: IRuleEvaluator, # <--- Injected Strategy
+        rule_set_cache: Optional[RuleSetCache] = None,
+        velocity_engine: Optional[VelocityEngine] = None,
+        alert_outbox_repo: Optional[IAlertOutboxRepository] = None,
+        analyst_assignment: Optional[AnalystAssignmentService] = None,
+        rule_stats: Optional[RuleEvaluationStats] = None,
+        rule_audit: bool = False,
+        shadow_runner: Optional[ShadowRuleRunner] = None,
+        latency_guard: Optional[LatencyGuard] = None,
+        behavior_cache: Optional[ReferenceDataCache] = None,
+        metrics: Optional[ScoringMetrics] = None,
+        model_wait: Optional[Callable[[Future, float], float]] = None
     ):
         self._transaction_repo = transaction_repo
         self._behavior_repo = behavior_repo
@@ -48,37 +75,187 @@ class ScoringUseCase:
         self._scorer = scorer
         self._decision_service = decision_service
         self._rule_evaluator = rule_evaluator # <--- Saved Strategy
+        self._rule_set_cache = rule_set_cache
+        self._velocity_engine = velocity_engine
+        self._alert_outbox_repo = alert_outbox_repo
+        self._analyst_assignment = analyst_assignment
+        self._rule_stats = rule_stats
+        self._rule_audit = rule_audit
+        self._shadow_runner = shadow_runner
+        self._latency_guard = latency_guard
+        self._behavior_cache = behavior_cache
+        self._metrics = metrics
+        # How the latency guard waits for the model (see LatencyGuard.run_model)
+        self._model_wait = model_wait
+
+    def execute(self, transaction: Transaction,
+                recorded_in_velocity: bool = True) -> Tuple[AlertAction, Dict[str, Any]]:
+        """
+        Scores a recorded transaction. recorded_in_velocity=False is for callers
+        that feed the velocity counters only once the transaction is committed:
+        it is then added to the live counters read here, not to the engine.
+        """
+        # With a latency guard each stage is timed against its deadline and may degrade (see LatencyGuard)
+        budget = self._latency_guard.start() if self._latency_guard else None
 
-    def execute(self, transaction: Transaction) -> Tuple[AlertAction, Dict[str, Any]]:
         # 1. Get or create customer's behavior profile
-        behavior = self._behavior_repo.get_by_customer_id(transaction.customer_id)
-        if not behavior:
-            behavior = BehaviorProfile(customer_id=transaction.customer_id)
+        with self._timed(PROFILE_LOAD):
+            behavior = self._load_behavior(transaction.customer_id, budget)
 
-        # 2. Compute features
-        features = self._compute_features(transaction, behavior)
-        
-        # 3. Get all enabled rules and initialize the engine with the Strategy
-        all_rules = self._rule_repo.get_all(only_enabled=True)
-        
-        # INJECTION: We pass the strategy (evaluator) to the engine
-        rule_engine = RuleEngine(rules=all_rules, evaluator=self._rule_evaluator)
-        
-        rule_hits = rule_engine.evaluate(transaction, behavior)
+            # Live velocity counters replace the stored (last-update) values when available
+            velocity = self._velocity_snapshot(transaction.customer_id)
+            if velocity:
+                if not recorded_in_velocity:
+                    velocity = self._add_to_velocity(velocity, transaction)
+                self._overlay_velocity(behavior, velocity, [transaction])
 
-        # 4. Score the transaction with the ML model
-        ml_score = self._scorer.score(features)
+        # 2. Get all enabled rules (from the shared snapshot when available) and initialize the engine with the Strategy
+        with self._timed(RULE_FETCH):
+            rule_engine = self._build_rule_engine()
 
-        # 5. Make the final decision
-        action, final_score = self._decision_service.decide(ml_score, rule_hits)
+        # 3. Features, rules, model, decision and alert
+        action, details = self._score(transaction, behavior, rule_engine, budget=budget)
 
-        # 6. Alert Logic (Refactored slightly for brevity, logic remains same)
-        if action in [AlertAction.REVIEW, AlertAction.DECLINE]:
-            self._handle_alert_creation(transaction, action, ml_score, final_score, rule_hits)
+        # 4. Update and save behavior
+        with self._timed(BEHAVIOR_SAVE):
+            if velocity:
+                updated_behavior = self._update_behavior_from_velocity(transaction, behavior, velocity)
+            elif budget and DegradedMode.CACHED_PROFILE in budget.degraded:
+                # The database is slow: fold the transaction in instead of recomputing from history
+                self._fold_into_profile(transaction, behavior)
+                behavior.updated_at = datetime.utcnow()
+                updated_behavior = behavior
+            else:
+                updated_behavior = self._update_behavior_from_db(transaction, behavior)
+            self._behavior_repo.save(updated_behavior)
+            if self._behavior_cache:
+                self._behavior_cache.put(transaction.customer_id, copy(updated_behavior))
+
+        if budget:
+            self._latency_guard.finish(budget)
+            details["degraded"] = [mode.value for mode in budget.degraded]
+            details["latency"] = budget.to_dict()
+        if self._metrics:
+            self._metrics.record_decision(action, details["rule_hits"])
+            self._metrics.record_degraded(details.get("degraded", ()))
+        return action, details
 
-        # 7. Update and save behavior
-        updated_behavior = self._update_behavior_from_db(transaction, behavior)
-        self._behavior_repo.save(updated_behavior)
+    def execute_batch(self, transactions: List[Transaction]) -> List[Tuple[AlertAction, Dict[str, Any]]]:
+        """
+        Scores several recorded transactions with set-based reads: one query for
+        the stored profiles, one grouped history query for the refreshed profiles
+        and one batched write. Each item sees its customer's profile plus the
+        earlier items of the same batch, as sequential calls to execute() would.
+        Results are returned in input order.
+        """
+        customer_ids = {tx.customer_id for tx in transactions}
+        profiles = self._behavior_repo.get_by_customer_ids(customer_ids)
+        for customer_id in customer_ids:
+            profiles.setdefault(customer_id, BehaviorProfile(customer_id=customer_id))
+
+        batch_by_customer: Dict[Any, List[Transaction]] = {}
+        for tx in transactions:
+            batch_by_customer.setdefault(tx.customer_id, []).append(tx)
+
+        velocity_by_customer = {}
+        for customer_id in customer_ids:
+            velocity = self._velocity_snapshot(customer_id)
+            if velocity:
+                # The whole batch is already recorded; each item is folded back in as it is scored.
+                self._overlay_velocity(profiles[customer_id], velocity, batch_by_customer[customer_id])
+                velocity_by_customer[customer_id] = velocity
+
+        rule_engine = self._build_rule_engine()
+        analysts_cache: Dict[str, List] = {}
+
+        features_list = []
+        for tx in transactions:
+            behavior = profiles[tx.customer_id]
+            features_list.append(build_scoring_features(tx, behavior))
+            self._fold_into_profile(tx, behavior)
+
+        # One rule pass and one model call for the whole batch
+        hits_list = rule_engine.evaluate_batch(features_list)
+        ml_scores = self._scorer.score_batch(features_list)
+        results = [
+            self._decide(tx, features, ml_score, rule_hits, analysts_cache)
+            for tx, features, ml_score, rule_hits in zip(transactions, features_list, ml_scores, hits_list)
+        ]
+        if self._metrics:
+            for action, details in results:
+                self._metrics.record_decision(action, details["rule_hits"])
+        shadow_rules = self._shadow_rules()
+        for tx, features in zip(transactions, features_list):
+            self._submit_shadow(shadow_rules, tx, features)
+
+        # History is only needed for customers without live counters or whose usual country may change.
+        needs_history = {
+            customer_id for customer_id in customer_ids
+            if customer_id not in velocity_by_customer
+            or any(tx.country != profiles[customer_id].usual_country for tx in batch_by_customer[customer_id])
+        }
+        stats_by_customer = self._behavior_repo.calculate_features_for_customers(needs_history) if needs_history else {}
+        for customer_id, behavior in profiles.items():
+            stats = stats_by_customer.get(customer_id)
+            if customer_id in velocity_by_customer:
+                usual_country = stats["usual_country"] if stats else behavior.usual_country
+                stats = {**velocity_by_customer[customer_id], "usual_country": usual_country}
+            self._apply_stats(batch_by_customer[customer_id][-1], behavior, stats)
+        self._behavior_repo.save_many(list(profiles.values()))
+
+        return results
+
+    def _score(self, transaction: Transaction, behavior: BehaviorProfile, rule_engine: RuleEngine,
+               analysts_cache: Optional[Dict[str, List]] = None,
+               budget: Optional[LatencyBudget] = None) -> Tuple[AlertAction, Dict[str, Any]]:
+        features, rule_hits = self._prepare(transaction, behavior, rule_engine, budget)
+
+        # Score the transaction with the ML model
+        with self._timed(MODEL_SCORING):
+            if budget:
+                # The model may still be running when the deadline passes: it gets its own copy of the features
+                detached = features.detached()
+                ml_score = self._latency_guard.run_model(budget, lambda: self._scorer.score(detached),
+                                                         wait=self._model_wait)
+            else:
+                ml_score = self._scorer.score(features)
+
+        result = self._decide(transaction, features, ml_score, rule_hits, analysts_cache, budget)
+        self._submit_shadow(self._shadow_rules(), transaction, features)
+        return result
+
+    def _load_behavior(self, customer_id, budget: Optional[LatencyBudget]) -> BehaviorProfile:
+        with budget.stage(ScoringStage.FEATURES) if budget else nullcontext():
+            behavior = None
+            if budget and self._behavior_cache and self._latency_guard.skip_feature_fetch():
+                _, cached = self._behavior_cache.get(customer_id)
+                if cached is not None:
+                    behavior = copy(cached)
+                    budget.degrade(DegradedMode.CACHED_PROFILE)
+            if behavior is None:
+                behavior = self._behavior_repo.get_by_customer_id(customer_id)
+        return behavior or BehaviorProfile(customer_id=customer_id)
+
+    def _prepare(self, transaction: Transaction, behavior: BehaviorProfile, rule_engine: RuleEngine,
+                 budget: Optional[LatencyBudget] = None) -> Tuple[FeatureVector, List]:
+        """Features (shared by the rules, the model and the alert) and rule hits, given the profile as it stands before the transaction."""
+        with budget.stage(ScoringStage.FEATURES) if budget else nullcontext(), self._timed(FEATURE_COMPUTATION):
+            features = build_scoring_features(transaction, behavior)
+        with budget.stage(ScoringStage.RULES) if budget else nullcontext(), self._timed(RULE_EVALUATION):
+            rule_hits = rule_engine.evaluate(features)
+        return features, rule_hits
+
+    def _decide(self, transaction: Transaction, features: FeatureVector, ml_score: Optional[float], rule_hits: List,
+                analysts_cache: Optional[Dict[str, List]] = None,
+                budget: Optional[LatencyBudget] = None) -> Tuple[AlertAction, Dict[str, Any]]:
+        # Make the final decision (on rules alone when ml_score is None)
+        with self._timed(DECISION):
+            action, final_score = self._decision_service.decide(ml_score, rule_hits)
+
+        # Alert Logic (Refactored slightly for brevity, logic remains same)
+        if action in [AlertAction.REVIEW, AlertAction.DECLINE]:
+            with budget.stage(ScoringStage.ALERT) if budget else nullcontext(), self._timed(ALERT_CASE_CREATION):
+                self._handle_alert_creation(transaction, features, action, ml_score, final_score, rule_hits, analysts_cache)
 
         return action, {
             "ml_score": ml_score,
@@ -86,40 +263,143 @@ class ScoringUseCase:
             "rule_hits": rule_hits
         }
 
-    def _handle_alert_creation(self, tx, action, ml_score, final_score, rule_hits):
-        """Helper to keep execute clean"""
+    def _build_rule_engine(self) -> RuleEngine:
+        # The snapshot carries its candidate index; rules read from the repository are scanned linearly.
+        if self._rule_set_cache:
+            snapshot = self._rule_set_cache.get(self._rule_repo)
+            rules, index = list(snapshot.rules), snapshot.index
+        else:
+            rules, index = self._rule_repo.get_all(only_enabled=True), None
+        return RuleEngine(rules=rules, evaluator=self._rule_evaluator, stats=self._rule_stats,
+                          audit=self._rule_audit, index=index, metrics=self._metrics)
+
+    def _timed(self, stage: str):
+        # Times a stage into fcore_scoring_stage_seconds when metrics are on
+        return self._metrics.stage(stage) if self._metrics else nullcontext()
+
+    def _shadow_rules(self):
+        # Shadow rules come with the snapshot; without the cache they are not evaluated.
+        if self._shadow_runner is None or self._rule_set_cache is None:
+            return ()
+        return self._rule_set_cache.get(self._rule_repo).shadow_rules
+
+    def _submit_shadow(self, shadow_rules, transaction: Transaction, features: FeatureVector) -> None:
+        """Hands the shadow rules to the background runner once the decision is made; never blocks."""
+        if shadow_rules:
+            self._shadow_runner.submit(shadow_rules, features, transaction)
+
+    def _handle_alert_creation(self, tx, features, action, ml_score, final_score, rule_hits, analysts_cache=None):
+        """Helper to keep execute clean. analysts_cache lets a batch load the analysts only once."""
+        # The alert keeps the exact inputs the rules and the model saw, tagged with their schema version.
+        evidence = {
+            "hits": rule_hits,
+            "features": features.to_dict(),
+            "feature_schema_version": features.schema.version
+        }
+        if self._alert_outbox_repo:
+            # Deferred: the outbox worker creates the alert and the case off the authorization path.
+            self._alert_outbox_repo.add(AlertOutboxEvent(
+                transaction_id=tx.id,
+                transaction_occurred_at=tx.occurred_at,
+                action=action,
+                ml_score=ml_score,
+                final_score=final_score,
+                rule_hits=evidence
+            ))
+            return
+
         alert = Alert(
             transaction_id=tx.id,
             transaction_occurred_at=tx.occurred_at,
             action=action,
             ml_score=ml_score,
             final_score=final_score,
-            rule_hits={"hits": rule_hits}
+            rule_hits=evidence
         )
         alert_created = self._alert_repo.create(alert)
-        
-        analysts = self._analyst_repo.get_all()
-        if analysts:
-            analyst = random.choice(analysts)
-            case = Case(alert_id=alert_created.id, analyst_id=analyst.id)
+
+        assigned = self._pick_analyst(analysts_cache)
+        if assigned:
+            analyst_id, analyst_name = assigned
+            case = Case(alert_id=alert_created.id, analyst_id=analyst_id)
             self._case_repo.create(case)
-            logger.info(f"Case created for Alert {alert_created.id}. Assigned to {analyst.name}")
+            logger.info(f"Case created for Alert {alert_created.id}. Assigned to {analyst_name}")
         else:
             logger.warning(f"Alert {alert_created.id} created but NO ANALYSTS available.")
 
-    def _compute_features(self, tx: Transaction, beh: BehaviorProfile) -> Dict[str, Any]:
-        """Creates a feature vector for the model."""
-        return {
-            "amount": float(tx.amount),
-            "tx_count_10m": beh.tx_count_10m,
-            "tx_count_30m": beh.tx_count_30m,
-            "tx_count_24h": beh.tx_count_24h,
-            "avg_amount_24h": float(beh.avg_amount_24h),
-            "is_new_country": beh.usual_country is not None and tx.country != beh.usual_country
-        }
-    
+    def _pick_analyst(self, analysts_cache=None):
+        """(analyst_id, name) for a new case, or None when no analyst is available."""
+        if self._analyst_assignment:
+            return self._analyst_assignment.assign(self._analyst_repo)
+
+        if analysts_cache is None:
+            analysts = self._analyst_repo.get_all()
+        else:
+            if "analysts" not in analysts_cache:
+                analysts_cache["analysts"] = self._analyst_repo.get_all()
+            analysts = analysts_cache["analysts"]
+        if not analysts:
+            return None
+        analyst = random.choice(analysts)
+        return analyst.id, analyst.name
+
     def _update_behavior_from_db(self, tx: Transaction, beh: BehaviorProfile) -> BehaviorProfile:
         stats = self._behavior_repo.calculate_features_from_history(tx.customer_id)
+        return self._apply_stats(tx, beh, stats)
+
+    def _update_behavior_from_velocity(self, tx: Transaction, beh: BehaviorProfile,
+                                       velocity: Dict[str, Any]) -> BehaviorProfile:
+        # A transaction in the usual country cannot change the 30-day mode, so the
+        # history is only read when the country differs.
+        if beh.usual_country and tx.country == beh.usual_country:
+            usual_country = beh.usual_country
+        else:
+            usual_country = self._behavior_repo.calculate_features_from_history(tx.customer_id)["usual_country"]
+        return self._apply_stats(tx, beh, {**velocity, "usual_country": usual_country})
+
+    def _velocity_snapshot(self, customer_id) -> Optional[Dict[str, Any]]:
+        if not self._velocity_engine:
+            return None
+        return self._velocity_engine.snapshot(customer_id)
+
+    @staticmethod
+    def _add_to_velocity(velocity: Dict[str, Any], tx: Transaction) -> Dict[str, Any]:
+        """Live counters as they will be once 'tx' is recorded."""
+        count_24h = velocity["tx_count_24h"] + 1
+        return {
+            "tx_count_10m": velocity["tx_count_10m"] + 1,
+            "tx_count_30m": velocity["tx_count_30m"] + 1,
+            "tx_count_24h": count_24h,
+            "avg_amount_24h": (velocity["avg_amount_24h"] * velocity["tx_count_24h"] + float(tx.amount)) / count_24h,
+        }
+
+    @staticmethod
+    def _overlay_velocity(beh: BehaviorProfile, velocity: Dict[str, Any], pending: List[Transaction]) -> None:
+        """
+        Loads live counters into the profile. 'pending' transactions are already
+        recorded in the counters but not yet scored, so they are left out.
+        """
+        pending_count = len(pending)
+        amount_sum = velocity["avg_amount_24h"] * velocity["tx_count_24h"] - sum(float(tx.amount) for tx in pending)
+        beh.tx_count_10m = max(velocity["tx_count_10m"] - pending_count, 0)
+        beh.tx_count_30m = max(velocity["tx_count_30m"] - pending_count, 0)
+        beh.tx_count_24h = max(velocity["tx_count_24h"] - pending_count, 0)
+        beh.avg_amount_24h = amount_sum / beh.tx_count_24h if beh.tx_count_24h else 0.0
+
+    def _fold_into_profile(self, tx: Transaction, beh: BehaviorProfile) -> None:
+        """
+        Adds a just-scored transaction to an in-memory profile: between the items of
+        a batch, and in execute() when the latency guard fell back to the cached profile.
+        """
+        amount_sum = float(beh.avg_amount_24h) * beh.tx_count_24h + float(tx.amount)
+        beh.tx_count_10m += 1
+        beh.tx_count_30m += 1
+        beh.tx_count_24h += 1
+        beh.avg_amount_24h = amount_sum / beh.tx_count_24h
+        if not beh.usual_country:
+            beh.usual_country = tx.country
+
+    def _apply_stats(self, tx: Transaction, beh: BehaviorProfile, stats: Dict[str, Any]) -> BehaviorProfile:
         beh.tx_count_10m = stats["tx_count_10m"]
         beh.tx_count_30m = stats["tx_count_30m"]
         beh.tx_count_24h = stats["tx_count_24h"]
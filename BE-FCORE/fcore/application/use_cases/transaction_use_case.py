@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Union
 from uuid import UUID
 from decimal import Decimal
 
@@ -6,9 +6,10 @@ from ...core.entities.transaction import Transaction, TransactionChannel
 from ..interfaces.i_transaction_repository import ITransactionRepository
 from ..interfaces.i_customer_repository import ICustomerRepository
 from ..interfaces.i_merchant_repository import IMerchantRepository
+from ..services.velocity_engine import VelocityEngine
 from ...core.errors.customer_errors import CustomerNotFoundError
 from ...core.errors.merchant_errors import MerchantNotFoundError
-from ...core.errors.transaction_errors import TransactionNotFoundError
+from ...core.errors.transaction_errors import TransactionNotFoundError, TransactionError
 
 class TransactionUseCases:
     """Use cases for handling transactions."""
@@ -17,11 +18,13 @@ class TransactionUseCases:
         self,
         transaction_repository: ITransactionRepository,
         customer_repository: ICustomerRepository,
-        merchant_repository: IMerchantRepository
+        merchant_repository: IMerchantRepository,
+        velocity_engine: Optional[VelocityEngine] = None
     ):
         self._transaction_repository = transaction_repository
         self._customer_repository = customer_repository
         self._merchant_repository = merchant_repository
+        self._velocity_engine = velocity_engine
 
     def record_transaction(self, data: dict) -> Transaction:
         """
@@ -47,7 +50,58 @@ class TransactionUseCases:
             country=data.get('country')
         )
 
-        return self._transaction_repository.create(transaction_entity)
+        created = self._transaction_repository.create(transaction_entity)
+        self._record_velocity([created])
+        return created
+
+    def record_transactions(self, items: List[dict]) -> List[Union[Transaction, Exception]]:
+        """
+        Batch variant of record_transaction. Customers and merchants are checked
+        with one query each and every valid item is inserted in a single bulk
+        statement. The result keeps the input order; an item that failed
+        validation is returned as the corresponding domain error.
+        """
+        existing_customers = self._customer_repository.find_existing_ids(
+            item.get('customer_id') for item in items
+        )
+        merchants = self._merchant_repository.find_by_ids(item.get('merchant_id') for item in items)
+
+        results: List[Union[Transaction, Exception]] = []
+        for item in items:
+            customer_id = item.get('customer_id')
+            merchant_id = item.get('merchant_id')
+
+            if customer_id not in existing_customers:
+                results.append(CustomerNotFoundError(f"Customer with ID {customer_id} not found."))
+                continue
+            if merchant_id not in merchants:
+                results.append(MerchantNotFoundError(f"Merchant with ID {merchant_id} not found."))
+                continue
+
+            try:
+                results.append(Transaction(
+                    customer_id=customer_id,
+                    merchant_id=merchant_id,
+                    amount=Decimal(item.get('amount')),
+                    channel=item.get('channel'),
+                    device_id=item.get('device_id'),
+                    ip_address=item.get('ip_address'),
+                    country=item.get('country'),
+                    merchant=merchants[merchant_id]
+                ))
+            except TransactionError as e:
+                results.append(e)
+
+        created = self._transaction_repository.create_many([r for r in results if isinstance(r, Transaction)])
+        self._record_velocity(created)
+        return results
+
+    def _record_velocity(self, transactions: List[Transaction]) -> None:
+        """Feeds committed transactions to the in-memory velocity counters, if enabled."""
+        if not self._velocity_engine:
+            return
+        for tx in transactions:
+            self._velocity_engine.record(tx.customer_id, tx.occurred_at, tx.amount)
 
     def get_transaction_by_id(self, id: UUID) -> Transaction:
         transaction = self._transaction_repository.find_by_id(id)
@@ -0,0 +1,33 @@
+import enum
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict, Any
+from uuid import UUID, uuid4
+
+from .alert import AlertAction
+
+class OutboxStatus(str, enum.Enum):
+    """Lifecycle of an outbox event."""
+    PENDING = "PENDING"
+    DONE = "DONE"
+    DEAD = "DEAD"  # Gave up after too many failed attempts
+
+@dataclass
+class AlertOutboxEvent:
+    """
+    A scoring decision that still needs its Alert (and Case) to be created.
+    The event id is reused as the alert id, which makes processing idempotent.
+    """
+    transaction_id: UUID
+    transaction_occurred_at: datetime
+    action: AlertAction
+    ml_score: Optional[float] = None
+    final_score: Optional[float] = None
+    rule_hits: Optional[Dict[str, Any]] = None
+    status: OutboxStatus = OutboxStatus.PENDING
+    attempts: int = 0
+    last_error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    available_at: datetime = field(default_factory=datetime.utcnow)
+    processed_at: Optional[datetime] = None
+    id: UUID = field(default_factory=uuid4)
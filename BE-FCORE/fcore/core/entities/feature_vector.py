@@ -0,0 +1,145 @@
+import enum
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+class FeatureType(str, enum.Enum):
+    """Value type of a feature. Numeric types can be fed to a model."""
+    FLOAT = "float"
+    INT = "int"
+    BOOL = "bool"
+    STR = "str"
+
+    @property
+    def is_numeric(self) -> bool:
+        return self is not FeatureType.STR
+
+@dataclass(frozen=True)
+class FeatureField:
+    name: str
+    type: FeatureType
+
+@dataclass(frozen=True)
+class FeatureSchema:
+    """
+    The declared features of a transaction, in a fixed order. A FeatureVector
+    stores its values in this order, and models bind to positions once, so the
+    version must change whenever a field is added, removed, renamed or moved.
+    """
+    version: str
+    fields: Tuple[FeatureField, ...]
+    names: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _positions: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        positions = {f.name: i for i, f in enumerate(self.fields)}
+        if len(positions) != len(self.fields):
+            raise ValueError(f"Feature schema {self.version} declares a feature twice.")
+        object.__setattr__(self, "names", tuple(f.name for f in self.fields))
+        object.__setattr__(self, "_positions", positions)
+
+    def position(self, name: str) -> int:
+        try:
+            return self._positions[name]
+        except KeyError:
+            raise KeyError(f"Feature '{name}' is not in schema {self.version}.") from None
+
+    def numeric_positions(self, names: Sequence[str]) -> List[int]:
+        """Positions of the given features, which must all exist and be numeric (model inputs)."""
+        missing = [name for name in names if name not in self._positions]
+        if missing:
+            raise ValueError(f"Features {missing} are not in schema {self.version}.")
+        textual = [name for name in names if not self.fields[self._positions[name]].type.is_numeric]
+        if textual:
+            raise ValueError(f"Features {textual} of schema {self.version} are not numeric.")
+        return [self._positions[name] for name in names]
+
+    def require_version(self, version: Optional[str]) -> None:
+        """Raises when a model trained against another schema version is bound to this one."""
+        if version is not None and version != self.version:
+            raise ValueError(f"Model expects feature schema {version}, but features are built with schema {self.version}.")
+
+    def vector(self, values: Iterable[Any]) -> "FeatureVector":
+        values = tuple(values)
+        if len(values) != len(self.fields):
+            raise ValueError(f"Schema {self.version} has {len(self.fields)} features, got {len(values)} values.")
+        return FeatureVector(self, dict(zip(self.names, values)))
+
+class LazyFeatureContext(dict):
+    """
+    A dict whose features are computed on first access and memoized for the
+    rest of the transaction. getters maps a feature name to getter(context, *source);
+    derived features read their inputs through the context, so shared inputs
+    are converted once. Hits are plain dict lookups, which is what eval() and
+    simpleeval do with their names.
+    """
+    __slots__ = ("_getters", "_source")
+
+    def __init__(self, getters: Dict[str, Callable[..., Any]], *source: Any):
+        super().__init__()
+        self._getters = getters
+        self._source = source
+
+    def __missing__(self, name: str) -> Any:
+        getter = self._getters.get(name)
+        if getter is None:
+            raise KeyError(name)
+        value = self[name] = getter(self, *self._source)
+        return value
+
+    def copy(self) -> "LazyFeatureContext":
+        """Computed values are carried over; features computed later go to one side only."""
+        clone = LazyFeatureContext(self._getters, *self._source)
+        clone.update(self)
+        return clone
+
+class FeatureVector(Mapping):
+    """
+    The features of one transaction in a FeatureSchema, shared by the rules,
+    the model and the alert. Values live in a name -> value context that may be
+    lazy (LazyFeatureContext), so each consumer only pays for the features it reads.
+    """
+    __slots__ = ("schema", "_context")
+
+    def __init__(self, schema: FeatureSchema, context: Dict[str, Any]):
+        self.schema = schema
+        self._context = context
+
+    def __getitem__(self, name: str) -> Any:
+        self.schema.position(name)
+        return self._context[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.schema.names)
+
+    def __len__(self) -> int:
+        return len(self.schema.fields)
+
+    @property
+    def values(self) -> Tuple[Any, ...]:
+        """All values in schema order (computes any feature not read yet)."""
+        context = self._context
+        return tuple(context[name] for name in self.schema.names)
+
+    def pick(self, names: Sequence[str]) -> List[Any]:
+        context = self._context
+        return [context[name] for name in names]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The underlying context, for consumers that look names up repeatedly (the rule evaluator)."""
+        return self._context
+
+    def detached(self) -> "FeatureVector":
+        """
+        The same features over a copy of the context, for another thread: it
+        reuses what is already computed and computes the rest without touching
+        this vector's context.
+        """
+        return FeatureVector(self.schema, self._context.copy())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """A plain dict with every feature, e.g. to persist with an alert."""
+        return dict(zip(self.schema.names, self.values))
+
+    def __repr__(self) -> str:
+        return f"FeatureVector(schema={self.schema.version!r}, {self.to_dict()!r})"
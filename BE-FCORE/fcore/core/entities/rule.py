@@ -22,6 +22,8 @@ class Rule(AuditMixin):
     dsl_expression: str
     severity: RuleSeverity = RuleSeverity.MEDIUM
     enabled: bool = True
+    # Evaluated off the scoring path for its hit rate only; never affects the decision
+    shadow: bool = False
 
     id: UUID = field(default_factory=uuid4)
 
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+@dataclass
+class ShadowRuleHit:
+    """
+    A shadow rule that would have triggered on a live transaction. Kept compact:
+    the rule and the transaction are referenced, not copied.
+    """
+    rule_id: UUID
+    transaction_id: UUID
+    transaction_occurred_at: datetime
+    hit_at: datetime = field(default_factory=datetime.utcnow)
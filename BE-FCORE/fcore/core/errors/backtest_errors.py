@@ -0,0 +1,11 @@
+class BacktestError(Exception):
+    """Base exception for backtest errors."""
+    pass
+
+class BacktestValidationError(BacktestError):
+    """Raised when a backtest request is not valid (e.g. an empty time range)."""
+    pass
+
+class BacktestAlreadyRunningError(BacktestError):
+    """Raised when a backtest is requested while another one is still running."""
+    pass
@@ -0,0 +1,59 @@
+from typing import Iterable, List, Optional, Set
+from uuid import UUID
+
+from ...core.entities.customer import Customer
+from ...application.interfaces.i_customer_repository import ICustomerRepository
+from ...application.services.reference_data_cache import ReferenceDataCache
+
+class CachedCustomerRepository(ICustomerRepository):
+    """
+    Read-through cache in front of a customer repository. Lookups by ID are
+    served from the cache; writes go to the wrapped repository and drop the entry.
+    Cached entities are shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, inner: ICustomerRepository, cache: ReferenceDataCache):
+        self._inner = inner
+        self._cache = cache
+
+    def find_by_id(self, id: UUID) -> Optional[Customer]:
+        found, customer = self._cache.get(id)
+        if found:
+            return customer
+        customer = self._inner.find_by_id(id)
+        self._cache.put(id, customer)
+        return customer
+
+    def find_existing_ids(self, ids: Iterable[UUID]) -> Set[UUID]:
+        existing, unknown = set(), set()
+        for id in set(ids):
+            found, customer = self._cache.get(id)
+            if not found:
+                unknown.add(id)
+            elif customer is not None:
+                existing.add(id)
+        if unknown:
+            # Only existence is known here; entities are cached by find_by_id.
+            existing |= self._inner.find_existing_ids(unknown)
+        return existing
+
+    def create(self, customer: Customer) -> Customer:
+        created = self._inner.create(customer)
+        self._cache.invalidate(created.id)
+        return created
+
+    def find_by_document_number(self, document_number: str) -> Optional[Customer]:
+        return self._inner.find_by_document_number(document_number)
+
+    def get_all(self) -> List[Customer]:
+        return self._inner.get_all()
+
+    def update(self, customer: Customer) -> Customer:
+        updated = self._inner.update(customer)
+        self._cache.invalidate(customer.id)
+        return updated
+
+    def delete(self, id: UUID) -> bool:
+        deleted = self._inner.delete(id)
+        self._cache.invalidate(id)
+        return deleted
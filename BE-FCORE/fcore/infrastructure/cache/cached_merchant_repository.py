@@ -0,0 +1,61 @@
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from ...core.entities.merchant import Merchant
+from ...application.interfaces.i_merchant_repository import IMerchantRepository
+from ...application.services.reference_data_cache import ReferenceDataCache
+
+class CachedMerchantRepository(IMerchantRepository):
+    """
+    Read-through cache in front of a merchant repository, including the
+    blacklist/whitelist flags the rules read. Writes drop the cached entry.
+    Cached entities are shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, inner: IMerchantRepository, cache: ReferenceDataCache):
+        self._inner = inner
+        self._cache = cache
+
+    def find_by_id(self, id: UUID) -> Optional[Merchant]:
+        found, merchant = self._cache.get(id)
+        if found:
+            return merchant
+        merchant = self._inner.find_by_id(id)
+        self._cache.put(id, merchant)
+        return merchant
+
+    def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, Merchant]:
+        merchants, unknown = {}, set()
+        for id in set(ids):
+            found, merchant = self._cache.get(id)
+            if not found:
+                unknown.add(id)
+            elif merchant is not None:
+                merchants[id] = merchant
+        if unknown:
+            loaded = self._inner.find_by_ids(unknown)
+            for id in unknown:
+                self._cache.put(id, loaded.get(id))
+            merchants.update(loaded)
+        return merchants
+
+    def create(self, merchant: Merchant) -> Merchant:
+        created = self._inner.create(merchant)
+        self._cache.invalidate(created.id)
+        return created
+
+    def find_by_name(self, name: str) -> Optional[Merchant]:
+        return self._inner.find_by_name(name)
+
+    def get_all(self) -> List[Merchant]:
+        return self._inner.get_all()
+
+    def update(self, merchant: Merchant) -> Merchant:
+        updated = self._inner.update(merchant)
+        self._cache.invalidate(merchant.id)
+        return updated
+
+    def delete(self, id: UUID) -> bool:
+        deleted = self._inner.delete(id)
+        self._cache.invalidate(id)
+        return deleted
@@ -0,0 +1,59 @@
+import asyncio
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional, TypeVar
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+from ...application.interfaces.i_async_scoring_unit_of_work import IAsyncScoringUnitOfWork
+from ...application.services.reference_data_cache import ReferenceDataCache
+from .scoring_unit_of_work import SqlAlchemyScoringUnitOfWork
+
+T = TypeVar("T")
+
+class AsyncSqlAlchemyScoringUnitOfWork(SqlAlchemyScoringUnitOfWork, IAsyncScoringUnitOfWork):
+    """
+    Scoring unit of work on an async engine. run() opens an AsyncSession and
+    hands its synchronous facade to the regular repositories through
+    AsyncSession.run_sync: the pipeline code is unchanged, but each statement
+    is awaited on the event loop (asyncpg) instead of blocking a worker thread.
+    """
+
+    def __init__(
+        self,
+        async_session_factory: async_sessionmaker,
+        use_rollups: bool = False,
+        customer_cache: Optional[ReferenceDataCache] = None,
+        merchant_cache: Optional[ReferenceDataCache] = None
+    ):
+        super().__init__(
+            session_factory=self._current_sync_session,
+            use_rollups=use_rollups,
+            customer_cache=customer_cache,
+            merchant_cache=merchant_cache
+        )
+        self._async_session_factory = async_session_factory
+        self._sync_session: Optional[Session] = None
+
+    async def run(self, work: Callable[..., T], *args: Any) -> T:
+        async with self._async_session_factory() as session:
+            return await session.run_sync(self._run_with_session, work, args)
+
+    def wait_for(self, future: Future, timeout_seconds: float) -> Any:
+        # run_sync drives the pipeline in a greenlet: await_only suspends it and
+        # lets the event loop serve other requests until the future is done.
+        try:
+            return await_only(asyncio.wait_for(asyncio.wrap_future(future), timeout_seconds))
+        except asyncio.TimeoutError:
+            raise FutureTimeoutError() from None
+
+    def _run_with_session(self, sync_session: Session, work: Callable[..., T], args) -> T:
+        self._sync_session = sync_session
+        try:
+            return work(*args)
+        finally:
+            self._sync_session = None
+
+    def _current_sync_session(self) -> Session:
+        if self._sync_session is None:
+            raise RuntimeError("The async scoring unit of work can only be entered inside run().")
+        return self._sync_session
@@ -0,0 +1,69 @@
+from sqlalchemy import Column, Float, DateTime, Enum, Integer, Text, Index
+from uuid import uuid4
+import datetime
+
+from ....core.entities.alert import AlertAction
+from ....core.entities.alert_outbox_event import AlertOutboxEvent, OutboxStatus
+from .base_db_model import Base, UUID_CHAR
+from .alert_model import JSONBType
+
+class AlertOutboxModel(Base):
+    __tablename__ = 'alert_outbox'
+
+    id = Column(UUID_CHAR, primary_key=True, default=uuid4)
+
+    # No FK: the row must stay cheap to write on the scoring path.
+    transaction_id = Column(UUID_CHAR, nullable=False)
+    transaction_occurred_at = Column(DateTime(timezone=True), nullable=False)
+
+    action = Column(Enum(AlertAction), nullable=False)
+    ml_score = Column(Float, nullable=True)
+    final_score = Column(Float, nullable=True)
+    rule_hits = Column(JSONBType, nullable=True)
+
+    status = Column(Enum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.datetime.utcnow)
+    available_at = Column(DateTime(timezone=True), nullable=False, default=datetime.datetime.utcnow)
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index('ix_alert_outbox_status_available_at', 'status', 'available_at'),
+    )
+
+    def to_entity(self) -> AlertOutboxEvent:
+        return AlertOutboxEvent(
+            id=self.id,
+            transaction_id=self.transaction_id,
+            transaction_occurred_at=self.transaction_occurred_at,
+            action=self.action,
+            ml_score=self.ml_score,
+            final_score=self.final_score,
+            rule_hits=self.rule_hits,
+            status=self.status,
+            attempts=self.attempts,
+            last_error=self.last_error,
+            created_at=self.created_at,
+            available_at=self.available_at,
+            processed_at=self.processed_at
+        )
+
+    @staticmethod
+    def from_entity(event: AlertOutboxEvent) -> "AlertOutboxModel":
+        return AlertOutboxModel(
+            id=event.id,
+            transaction_id=event.transaction_id,
+            transaction_occurred_at=event.transaction_occurred_at,
+            action=event.action,
+            ml_score=event.ml_score,
+            final_score=event.final_score,
+            rule_hits=event.rule_hits,
+            status=event.status,
+            attempts=event.attempts,
+            last_error=event.last_error,
+            created_at=event.created_at,
+            available_at=event.available_at,
+            processed_at=event.processed_at
+        )
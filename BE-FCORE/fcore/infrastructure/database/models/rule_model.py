@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Enum
+from sqlalchemy import Column, String, Boolean, DateTime, Enum, false
 from uuid import uuid4
 import datetime
 
@@ -13,6 +13,7 @@ class RuleModel(Base):
     dsl_expression = Column(String(1024), nullable=False)
     severity = Column(Enum(RuleSeverity), nullable=False, default=RuleSeverity.MEDIUM)
     enabled = Column(Boolean, nullable=False, default=True)
+    shadow = Column(Boolean, nullable=False, default=False, server_default=false())
     created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.datetime.utcnow)
     created_by = Column(String(12), nullable=False)
     updated_at = Column(DateTime(timezone=True), nullable=True, onupdate=datetime.datetime.utcnow)
@@ -25,6 +26,7 @@ class RuleModel(Base):
             dsl_expression=self.dsl_expression,
             severity=self.severity,
             enabled=self.enabled,
+            shadow=self.shadow,
             created_at=self.created_at,
             created_by= self.created_by
         )
@@ -40,6 +42,7 @@ class RuleModel(Base):
             dsl_expression=rule.dsl_expression,
             severity=rule.severity,
             enabled=rule.enabled,
+            shadow=rule.shadow,
             created_at=rule.created_at,
             created_by = rule.created_by,
             updated_at=rule.updated_at,
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, BigInteger, DateTime, Index, Integer
+import datetime
+
+from .base_db_model import Base, UUID_CHAR
+
+class ShadowRuleHitModel(Base):
+    __tablename__ = 'shadow_rule_hits'
+
+    # BigInteger on Postgres, INTEGER (rowid alias) on SQLite
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+
+    # No FKs: written in bulk by a background worker, rules may be deleted afterwards.
+    rule_id = Column(UUID_CHAR, nullable=False)
+    transaction_id = Column(UUID_CHAR, nullable=False)
+    transaction_occurred_at = Column(DateTime(timezone=True), nullable=False)
+    hit_at = Column(DateTime(timezone=True), nullable=False, default=datetime.datetime.utcnow)
+
+    __table_args__ = (
+        Index('ix_shadow_rule_hits_rule_id_hit_at', 'rule_id', 'hit_at'),
+    )
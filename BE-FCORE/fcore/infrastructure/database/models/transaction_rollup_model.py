@@ -0,0 +1,18 @@
+from sqlalchemy import Column, DateTime, BigInteger, MetaData, Numeric, String, Table
+
+from .base_db_model import UUID_CHAR
+
+# Continuous aggregates are created by init_db.py, not by Base.metadata.create_all,
+# so the rollup lives in its own MetaData.
+rollup_metadata = MetaData()
+
+# Hourly per-customer, per-country buckets of 'transactions' (TimescaleDB continuous aggregate).
+transactions_hourly = Table(
+    "transactions_hourly",
+    rollup_metadata,
+    Column("customer_id", UUID_CHAR, nullable=False),
+    Column("country", String(2), nullable=True),
+    Column("bucket", DateTime(timezone=True), nullable=False),
+    Column("tx_count", BigInteger, nullable=False),
+    Column("amount_sum", Numeric, nullable=False),
+)
@@ -0,0 +1,133 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds (seconds) of the checkout wait histogram; the last bucket is +Inf.
+WAIT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class PoolCheckoutTelemetry:
+    """Counts checkouts and timeouts and keeps a histogram of how long each checkout waited."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = [0] * (len(WAIT_BUCKETS) + 1)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_sum = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, waited: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self._buckets[bisect_left(WAIT_BUCKETS, waited)] += 1
+            self.wait_seconds_sum += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+
+    def histogram(self) -> list:
+        """Cumulative counts per upper bound, Prometheus style."""
+        with self._lock:
+            counts = list(self._buckets)
+        result, total = [], 0
+        for bound, count in zip([f"{b:g}" for b in WAIT_BUCKETS] + ["+Inf"], counts):
+            total += count
+            result.append({"le": bound, "count": total})
+        return result
+
+class _TimedCheckoutMixin:
+    """
+    Times the whole checkout (waiting for a free connection, opening an overflow
+    connection, pre-ping). recreate() builds a new instance, so telemetry
+    restarts when the engine is disposed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.telemetry = PoolCheckoutTelemetry()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.telemetry.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.telemetry.record(time.perf_counter() - started)
+        return connection
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+def engine_options(
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_timeout: float = 30.0,
+    pool_recycle: int = -1,
+    pre_ping: bool = False,
+    statement_timeout_ms: Optional[int] = None,
+    pgbouncer: bool = False,
+    is_async: bool = False
+) -> Dict[str, Any]:
+    """
+    Keyword arguments for create_engine/create_async_engine.
+
+    With pgbouncer=True (transaction pooling) each transaction may run on a
+    different backend, so asyncpg's prepared statement caches are disabled and
+    statement names made unique. The statement timeout is not sent as a startup
+    parameter either, since PgBouncer rejects it; set it on the database role.
+    """
+    options: Dict[str, Any] = {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": pool_timeout,
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": pre_ping,
+    }
+    connect_args: Dict[str, Any] = {}
+    if pgbouncer:
+        if is_async:
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+            connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    elif statement_timeout_ms:
+        if is_async:
+            connect_args["server_settings"] = {"statement_timeout": str(statement_timeout_ms)}
+        else:
+            connect_args["options"] = f"-c statement_timeout={statement_timeout_ms}"
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+def pool_stats(name: str, pool) -> Dict[str, Any]:
+    """Live state of an engine's pool plus the checkout telemetry, when it is instrumented."""
+    stats: Dict[str, Any] = {
+        "name": name,
+        "pool_class": type(pool).__name__,
+        "size": pool.size() if hasattr(pool, "size") else 0,
+        "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else 0,
+        "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else 0,
+        "overflow": max(pool.overflow(), 0) if hasattr(pool, "overflow") else 0,
+        "max_overflow": getattr(pool, "_max_overflow", 0),
+        "timeout_seconds": pool.timeout() if hasattr(pool, "timeout") else 0.0,
+    }
+    telemetry: Optional[PoolCheckoutTelemetry] = getattr(pool, "telemetry", None)
+    if telemetry:
+        stats.update(
+            checkouts=telemetry.checkouts,
+            timeouts=telemetry.timeouts,
+            wait_seconds_sum=telemetry.wait_seconds_sum,
+            wait_seconds_max=telemetry.wait_seconds_max,
+            wait_histogram=telemetry.histogram()
+        )
+    return stats
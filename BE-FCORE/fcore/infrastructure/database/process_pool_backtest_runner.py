@@ -0,0 +1,122 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Iterable, List, Sequence
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from ...application.interfaces.i_backtest_runner import IBacktestRunner
+from ...application.services.backtest import LOOKBACK, BacktestReport, PointInTimeProfiles
+from ...application.services.feature_builder import build_scoring_features
+from ...core.entities.rule import Rule
+from ...core.entities.transaction import Transaction
+from ..strategies.vectorized_eval_evaluator import VectorizedEvalEvaluator
+from .repositories.sqlalchemy_transaction_repository import SqlAlchemyTransactionRepository
+# A spawned worker only imports this module: register the models TransactionModel's relationships name
+from .models.customer_model import CustomerModel  # noqa: F401
+from .models.merchant_model import MerchantModel  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+class ProcessPoolBacktestRunner(IBacktestRunner):
+    """
+    Replays rules over the transactions table with one worker process per shard
+    of customers. A customer's features only depend on its own history, so each
+    worker streams its customers' rows once, oldest first in time chunks
+    (starting LOOKBACK before the range to warm the profiles up), rebuilds the
+    point-in-time profiles as it goes and evaluates the rules over batches of
+    batch_rows transactions with VectorizedEvalEvaluator. The partial reports
+    are merged in the calling process.
+
+    Each worker opens its own connection from database_url; with workers=1 the
+    shard runs in the calling process.
+    """
+
+    def __init__(self, database_url: str, workers: int = 4, batch_rows: int = 10_000,
+                 chunk: timedelta = timedelta(days=1)):
+        self._database_url = database_url
+        self._workers = max(workers, 1)
+        self._batch_rows = batch_rows
+        self._chunk = chunk
+
+    def run(self, rules: Sequence[Rule], start: datetime, end: datetime) -> BacktestReport:
+        rules = list(rules)
+        jobs = [
+            (self._database_url, rules, start, end, shard, self._workers, self._batch_rows, self._chunk)
+            for shard in range(self._workers)
+        ]
+        if self._workers == 1:
+            partials = [_run_shard(*jobs[0])]
+        else:
+            # spawn: the API process has threads and open connections that must not be forked
+            with ProcessPoolExecutor(max_workers=self._workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                partials = list(pool.map(_run_shard, *zip(*jobs)))
+
+        report = BacktestReport.for_rules(start, end, rules)
+        for partial in partials:
+            report.merge(partial)
+        logger.info(f"Backtest of {len(rules)} rules over {report.rows} transactions ({start} - {end}) done.")
+        return report
+
+def _run_shard(database_url: str, rules: List[Rule], start: datetime, end: datetime, shard: int,
+               shard_count: int, batch_rows: int, chunk: timedelta) -> BacktestReport:
+    engine = create_engine(database_url, poolclass=NullPool)
+    try:
+        with Session(engine) as session:
+            repo = SqlAlchemyTransactionRepository(session)
+            return replay(
+                repo.stream_range(start - LOOKBACK, start, shard, shard_count, chunk),
+                repo.stream_range(start, end, shard, shard_count, chunk),
+                rules, start, end, batch_rows
+            )
+    finally:
+        engine.dispose()
+
+def replay(warm_up: Iterable[Transaction], transactions: Iterable[Transaction], rules: List[Rule],
+           start: datetime, end: datetime, batch_rows: int = 10_000) -> BacktestReport:
+    """
+    Scores 'transactions' (oldest first) after feeding the 'warm_up' history into
+    the profiles; both must hold the complete history of the customers they cover.
+    """
+    report = BacktestReport.for_rules(start, end, rules)
+    evaluator = VectorizedEvalEvaluator()
+    evaluator.prepare(rules)
+    profiles = PointInTimeProfiles()
+    for tx in warm_up:
+        profiles.add(tx)
+
+    batch: List[Transaction] = []
+    contexts = []
+    for tx in transactions:
+        contexts.append(build_scoring_features(tx, profiles.profile_before(tx)).as_dict())
+        batch.append(tx)
+        profiles.add(tx)
+        if len(batch) >= batch_rows:
+            _record(report, batch, evaluator.evaluate_batch(rules, contexts))
+            batch, contexts = [], []
+    if batch:
+        _record(report, batch, evaluator.evaluate_batch(rules, contexts))
+    return report
+
+def _record(report: BacktestReport, batch: List[Transaction], hits: np.ndarray) -> None:
+    fraud = np.fromiter((tx.label_fraud is True for tx in batch), dtype=bool, count=len(batch))
+    days, day_of_row = np.unique([tx.occurred_at.date().isoformat() for tx in batch], return_inverse=True)
+
+    report.rows += len(batch)
+    report.fraud_rows += int(fraud.sum())
+    rule_hits = hits.sum(axis=0)
+    fraud_hits = hits[fraud].sum(axis=0)
+    hits_by_day = [(str(day), hits[day_of_row == position].sum(axis=0)) for position, day in enumerate(days)]
+    for position, day in enumerate(days):
+        report.rows_by_day[str(day)] = report.rows_by_day.get(str(day), 0) + int((day_of_row == position).sum())
+
+    for column, rule in enumerate(report.rules):
+        rule.hits += int(rule_hits[column])
+        rule.fraud_hits += int(fraud_hits[column])
+        for day, day_hits in hits_by_day:
+            if day_hits[column]:
+                rule.hits_by_day[day] = rule.hits_by_day.get(day, 0) + int(day_hits[column])
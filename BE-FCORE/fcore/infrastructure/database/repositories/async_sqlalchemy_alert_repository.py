@@ -0,0 +1,45 @@
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from ....core.entities.alert import Alert
+from ....application.interfaces.i_async_alert_repository import IAsyncAlertRepository
+from ..models.alert_model import AlertModel
+from ..models.analyst_model import AnalystModel
+from ..models.transaction_model import TransactionModel
+
+def alert_loading_options(path=None):
+    """Everything Alert.to_entity() touches: async sessions cannot lazy load."""
+    transaction = (path.joinedload(AlertModel.transaction) if path else joinedload(AlertModel.transaction))
+    creator = (path.joinedload(AlertModel.creator) if path else joinedload(AlertModel.creator))
+    return [
+        transaction.joinedload(TransactionModel.customer),
+        transaction.joinedload(TransactionModel.merchant),
+        creator.joinedload(AnalystModel.role)
+    ]
+
+class AsyncSqlAlchemyAlertRepository(IAsyncAlertRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def find_by_id(self, id: UUID) -> Optional[Alert]:
+        result = await self._session.execute(
+            select(AlertModel).options(*alert_loading_options()).filter_by(id=id)
+        )
+        model = result.scalars().first()
+        return model.to_entity() if model else None
+
+    async def exists(self, id: UUID) -> bool:
+        result = await self._session.execute(select(AlertModel.id).filter_by(id=id))
+        return result.first() is not None
+
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[Alert]:
+        result = await self._session.execute(
+            select(AlertModel)
+            .options(*alert_loading_options())
+            .order_by(AlertModel.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        return [model.to_entity() for model in result.scalars()]
@@ -0,0 +1,18 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from ....core.entities.analyst import Analyst
+from ....application.interfaces.i_async_analyst_repository import IAsyncAnalystRepository
+from ..models.analyst_model import AnalystModel
+
+class AsyncSqlAlchemyAnalystRepository(IAsyncAnalystRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def find_by_code(self, code: str) -> Optional[Analyst]:
+        result = await self._session.execute(
+            select(AnalystModel).options(joinedload(AnalystModel.role)).filter_by(code=code)
+        )
+        model = result.scalars().first()
+        return model.to_entity() if model else None
@@ -0,0 +1,22 @@
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from ....core.entities.behavior_profile import BehaviorProfile
+from ....application.interfaces.i_async_behavior_repository import IAsyncBehaviorRepository
+from ..models.behavior_profile_model import BehaviorProfileModel
+
+class AsyncSqlAlchemyBehaviorRepository(IAsyncBehaviorRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_by_customer_id(self, customer_id: UUID) -> Optional[BehaviorProfile]:
+        result = await self._session.execute(
+            select(BehaviorProfileModel)
+            .options(joinedload(BehaviorProfileModel.customer))
+            .filter_by(customer_id=customer_id)
+        )
+        model = result.scalars().first()
+        return model.to_entity() if model else None
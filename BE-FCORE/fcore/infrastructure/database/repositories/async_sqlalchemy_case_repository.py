@@ -0,0 +1,76 @@
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from ....core.entities.case import Case
+from ....application.interfaces.i_async_case_repository import IAsyncCaseRepository
+from ..models.case_model import CaseModel
+from ..models.analyst_model import AnalystModel
+from ....core.errors.case_errors import CaseAlreadyExistsError
+from .async_sqlalchemy_alert_repository import alert_loading_options
+
+class AsyncSqlAlchemyCaseRepository(IAsyncCaseRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def create(self, case: Case) -> Case:
+        model = CaseModel(
+            id=case.id,
+            alert_id=case.alert_id,
+            analyst_id=case.analyst_id,
+            decision=case.decision,
+            notes=case.notes,
+            created_at=case.created_at,
+            updated_at=case.updated_at
+        )
+        try:
+            self._session.add(model)
+            await self._session.flush()
+        except IntegrityError:
+            await self._session.rollback()
+            raise CaseAlreadyExistsError(f"A case for alert ID {case.alert_id} already exists.")
+        return await self.find_by_id(model.id)
+
+    def _get_eager_loading_options(self):
+        return [
+            joinedload(CaseModel.analyst).joinedload(AnalystModel.role),
+            *alert_loading_options(joinedload(CaseModel.alert))
+        ]
+
+    async def _find_one(self, **criteria) -> Optional[Case]:
+        result = await self._session.execute(
+            select(CaseModel)
+            .options(*self._get_eager_loading_options())
+            .filter_by(**criteria)
+            .execution_options(populate_existing=True)
+        )
+        model = result.scalars().first()
+        return model.to_entity() if model else None
+
+    async def find_by_id(self, id: UUID) -> Optional[Case]:
+        return await self._find_one(id=id)
+
+    async def find_by_alert_id(self, alert_id: UUID) -> Optional[Case]:
+        return await self._find_one(alert_id=alert_id)
+
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[Case]:
+        result = await self._session.execute(
+            select(CaseModel)
+            .options(*self._get_eager_loading_options())
+            .order_by(CaseModel.updated_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        return [model.to_entity() for model in result.scalars()]
+
+    async def update(self, case: Case) -> Case:
+        model = await self._session.get(CaseModel, case.id)
+        if model:
+            model.decision = case.decision
+            model.notes = case.notes
+            model.updated_at = case.updated_at
+            await self._session.flush()
+            return await self.find_by_id(model.id)
+        return None
@@ -0,0 +1,68 @@
+import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from ....core.entities.alert_outbox_event import AlertOutboxEvent, OutboxStatus
+from ....application.interfaces.i_alert_outbox_repository import IAlertOutboxRepository
+from ..models.alert_outbox_model import AlertOutboxModel
+
+class SqlAlchemyAlertOutboxRepository(IAlertOutboxRepository):
+    def __init__(self, session: Session):
+        self._session = session
+
+    def add(self, event: AlertOutboxEvent) -> None:
+        self._session.add(AlertOutboxModel.from_entity(event))
+        self._session.flush()
+
+    def claim_batch(self, limit: int, lease_seconds: float) -> List[AlertOutboxEvent]:
+        now = datetime.datetime.utcnow()
+        models = (
+            self._session.query(AlertOutboxModel)
+            .filter(AlertOutboxModel.status == OutboxStatus.PENDING, AlertOutboxModel.available_at <= now)
+            .order_by(AlertOutboxModel.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        lease_until = now + datetime.timedelta(seconds=lease_seconds)
+        for model in models:
+            model.available_at = lease_until
+            model.attempts += 1
+        self._session.flush()
+        return [model.to_entity() for model in models]
+
+    def mark_done(self, id: UUID) -> None:
+        self._session.execute(
+            update(AlertOutboxModel)
+            .where(AlertOutboxModel.id == id)
+            .values(status=OutboxStatus.DONE, processed_at=datetime.datetime.utcnow(), last_error=None)
+        )
+
+    def mark_failed(self, id: UUID, error: str, retry_at: Optional[datetime.datetime]) -> None:
+        values = {"last_error": error}
+        if retry_at is None:
+            values["status"] = OutboxStatus.DEAD
+        else:
+            values["available_at"] = retry_at
+        self._session.execute(update(AlertOutboxModel).where(AlertOutboxModel.id == id).values(**values))
+
+    def get_stats(self) -> Dict[str, Any]:
+        rows = (
+            self._session.query(
+                AlertOutboxModel.status,
+                func.count(AlertOutboxModel.id),
+                func.min(AlertOutboxModel.created_at)
+            )
+            .filter(AlertOutboxModel.status != OutboxStatus.DONE)
+            .group_by(AlertOutboxModel.status)
+            .all()
+        )
+        by_status = {status: (count, oldest) for status, count, oldest in rows}
+        pending, oldest_pending = by_status.get(OutboxStatus.PENDING, (0, None))
+        return {
+            "pending": pending,
+            "dead": by_status.get(OutboxStatus.DEAD, (0, None))[0],
+            "oldest_pending_created_at": oldest_pending
+        }
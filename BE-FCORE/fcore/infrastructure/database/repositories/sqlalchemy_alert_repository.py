@@ -39,6 +39,9 @@ class SqlAlchemyAlertRepository(IAlertRepository):
         )
         return model.to_entity() if model else None
 
+    def exists(self, id: UUID) -> bool:
+        return self._session.query(AlertModel.id).filter_by(id=id).first() is not None
+
     def get_all(self, limit: int = 100, offset: int = 0) -> List[Alert]:
         models = (
             self._session.query(AlertModel)
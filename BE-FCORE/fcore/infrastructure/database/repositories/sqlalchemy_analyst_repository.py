@@ -1,10 +1,13 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session, joinedload
 # No more explicit IntegrityError catch/rollback here; let UoW or UseCase handle logic
 from ....core.entities.analyst import Analyst
 from ....application.interfaces.i_analyst_repository import IAnalystRepository
+from ....core.entities.case import CaseDecision
 from ..models.analyst_model import AnalystModel
+from ..models.case_model import CaseModel
 
 class SqlAlchemyAnalystRepository(IAnalystRepository):
     """
@@ -46,6 +49,17 @@ class SqlAlchemyAnalystRepository(IAnalystRepository):
         )
         return [model.to_entity() for model in all_analyst_models]
 
+    def get_active_workload(self) -> List[Tuple[UUID, str, int]]:
+        rows = (
+            self._session.query(AnalystModel.id, AnalystModel.name, func.count(CaseModel.id))
+            .outerjoin(CaseModel, and_(CaseModel.analyst_id == AnalystModel.id,
+                                       CaseModel.decision == CaseDecision.PENDING))
+            .filter(AnalystModel.is_active.is_(True))
+            .group_by(AnalystModel.id, AnalystModel.name)
+            .all()
+        )
+        return [(analyst_id, name, int(open_cases)) for analyst_id, name, open_cases in rows]
+
     def update(self, analyst: Analyst) -> Analyst:
         analyst_model = self._session.query(AnalystModel).filter_by(id=analyst.id).first()
         if analyst_model:
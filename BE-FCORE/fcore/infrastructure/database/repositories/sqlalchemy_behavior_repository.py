@@ -1,17 +1,27 @@
-from typing import Optional, Dict
+from collections import Counter
+from typing import Optional, Dict, Iterable, List
 from uuid import UUID
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, cast, Numeric
+from sqlalchemy import func, cast, Numeric, case, literal, select, union_all
 
 from ....core.entities.behavior_profile import BehaviorProfile
 from ....application.interfaces.i_behavior_repository import IBehaviorRepository
 from ..models.behavior_profile_model import BehaviorProfileModel
 from ..models.transaction_model import TransactionModel
+from ..models.transaction_rollup_model import transactions_hourly
+
+def _floor_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
 
 class SqlAlchemyBehaviorRepository(IBehaviorRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, use_rollups: bool = False):
         self._session = session
+        # Serve the 24h/30d windows from the 'transactions_hourly' continuous aggregate
+        self._use_rollups = use_rollups
+        # The session's identity map only holds weak references: keeping the loaded
+        # models alive lets save()/save_many() merge into them without a second SELECT.
+        self._loaded: Dict[UUID, BehaviorProfileModel] = {}
 
     def get_by_customer_id(self, customer_id: UUID) -> Optional[BehaviorProfile]:
         model = (
@@ -20,7 +30,22 @@ class SqlAlchemyBehaviorRepository(IBehaviorRepository):
             .filter_by(customer_id=customer_id)
             .first()
         )
-        return model.to_entity() if model else None
+        if not model:
+            return None
+        self._loaded[model.customer_id] = model
+        return model.to_entity()
+
+    def get_by_customer_ids(self, customer_ids: Iterable[UUID]) -> Dict[UUID, BehaviorProfile]:
+        customer_ids = set(customer_ids)
+        if not customer_ids:
+            return {}
+        models = (
+            self._session.query(BehaviorProfileModel)
+            .filter(BehaviorProfileModel.customer_id.in_(customer_ids))
+            .all()
+        )
+        self._loaded.update((model.customer_id, model) for model in models)
+        return {model.customer_id: model.to_entity() for model in models}
 
     def save(self, profile: BehaviorProfile) -> BehaviorProfile:
         model = BehaviorProfileModel.from_entity(profile)
@@ -28,39 +53,31 @@ class SqlAlchemyBehaviorRepository(IBehaviorRepository):
         self._session.flush()
         return merged_model.to_entity()
 
+    def save_many(self, profiles: List[BehaviorProfile]) -> None:
+        # Profiles loaded through get_by_customer_ids are still in the identity
+        # map, so merge() does not SELECT them again; the flush batches the writes.
+        for profile in profiles:
+            self._session.merge(BehaviorProfileModel.from_entity(profile))
+        self._session.flush()
+
     def calculate_features_from_history(self, customer_id: UUID) -> Dict[str, any]:
         """
         Calculates aggregations directly from the Hypertable.
         This is much safer and more accurate than incremental updates in Python.
+        All windows come from a single statement: conditional aggregates over the
+        last 24h plus a scalar subquery for the 30-day country mode.
         """
-        now = datetime.now(timezone.utc)
+        if self._use_rollups:
+            features = self._calculate_features_from_rollups({customer_id})[customer_id]
+            return {key: features[key] for key in
+                    ("tx_count_10m", "tx_count_30m", "tx_count_24h", "avg_amount_24h", "usual_country")}
 
-        def get_count(minutes_lookback: int):
-            return (
-                self._session.query(func.count(TransactionModel.id))
-                .filter(
-                    TransactionModel.customer_id == customer_id,
-                    TransactionModel.occurred_at >= now - timedelta(minutes=minutes_lookback)
-                )
-                .scalar() or 0
-            )
+        now = datetime.now(timezone.utc)
+        since_24h = now - timedelta(hours=24)
 
-        # 1. Calculate Counts (Velocity)
-        count_10m = get_count(10)
-        count_30m = get_count(30)
-        count_24h = get_count(1440)
+        def count_since(since: datetime):
+            return func.sum(case((TransactionModel.occurred_at >= since, 1), else_=0))
 
-        # 2. Calculate Average Amount (Last 24h)
-        avg_24h = (
-            self._session.query(func.avg(TransactionModel.amount))
-            .filter(
-                TransactionModel.customer_id == customer_id,
-                TransactionModel.occurred_at >= now - timedelta(hours=24)
-            )
-            .scalar() or 0.0
-        )
-
-        # 3. Get Usual Country (Mode of countries in the last 30 days)
         usual_country = (
             self._session.query(TransactionModel.country)
             .filter(
@@ -70,13 +87,157 @@ class SqlAlchemyBehaviorRepository(IBehaviorRepository):
             .group_by(TransactionModel.country)
             .order_by(func.count(TransactionModel.country).desc())
             .limit(1)
-            .scalar()
+            .scalar_subquery()
+        )
+
+        row = (
+            self._session.query(
+                count_since(now - timedelta(minutes=10)).label("count_10m"),
+                count_since(now - timedelta(minutes=30)).label("count_30m"),
+                func.count(TransactionModel.id).label("count_24h"),
+                func.avg(TransactionModel.amount).label("avg_24h"),
+                usual_country.label("usual_country")
+            )
+            .filter(
+                TransactionModel.customer_id == customer_id,
+                TransactionModel.occurred_at >= since_24h
+            )
+            .one()
         )
 
         return {
-            "tx_count_10m": count_10m,
-            "tx_count_30m": count_30m,
-            "tx_count_24h": count_24h,
-            "avg_amount_24h": float(avg_24h),
-            "usual_country": usual_country
-        }
\ No newline at end of file
+            "tx_count_10m": int(row.count_10m or 0),
+            "tx_count_30m": int(row.count_30m or 0),
+            "tx_count_24h": int(row.count_24h or 0),
+            "avg_amount_24h": float(row.avg_24h or 0.0),
+            "usual_country": row.usual_country
+        }
+
+    def calculate_features_for_customers(self, customer_ids: Iterable[UUID]) -> Dict[UUID, Dict[str, any]]:
+        """
+        One grouped pass over the last 30 days for every requested customer.
+        Rows are grouped by (customer, country) so the country mode comes out of
+        the same statement as the velocity windows.
+        """
+        customer_ids = set(customer_ids)
+        if not customer_ids:
+            return {}
+        if self._use_rollups:
+            return self._calculate_features_from_rollups(customer_ids)
+
+        now = datetime.now(timezone.utc)
+        since_10m = now - timedelta(minutes=10)
+        since_30m = now - timedelta(minutes=30)
+        since_24h = now - timedelta(hours=24)
+
+        def count_since(since: datetime):
+            return func.sum(case((TransactionModel.occurred_at >= since, 1), else_=0))
+
+        rows = (
+            self._session.query(
+                TransactionModel.customer_id,
+                TransactionModel.country,
+                count_since(since_10m).label("count_10m"),
+                count_since(since_30m).label("count_30m"),
+                count_since(since_24h).label("count_24h"),
+                func.sum(case((TransactionModel.occurred_at >= since_24h, TransactionModel.amount), else_=0)).label("sum_24h"),
+                func.count(TransactionModel.id).label("count_30d")
+            )
+            .filter(
+                TransactionModel.customer_id.in_(customer_ids),
+                TransactionModel.occurred_at >= now - timedelta(days=30)
+            )
+            .group_by(TransactionModel.customer_id, TransactionModel.country)
+            .all()
+        )
+        return self._fold_feature_rows(customer_ids, rows)
+
+    def _calculate_features_from_rollups(self, customer_ids: Iterable[UUID]) -> Dict[UUID, Dict[str, any]]:
+        """
+        Same result as the raw grouped query, but the long windows are read from
+        hourly buckets so the cost no longer grows with the customer's history:
+          - raw rows since the start of the hour before the 30m window (10m/30m and the open buckets),
+          - raw rows of the partial hour at the start of the 24h window,
+          - 'transactions_hourly' buckets for everything in between (30d mode, full 24h hours).
+        The 30-day mode starts at the hour boundary, at most one hour earlier than the raw query.
+        """
+        customer_ids = set(customer_ids)
+        now = datetime.now(timezone.utc)
+        since_10m = now - timedelta(minutes=10)
+        since_30m = now - timedelta(minutes=30)
+        since_24h = now - timedelta(hours=24)
+        raw_from = _floor_hour(since_30m)
+        head_end = _floor_hour(since_24h) + timedelta(hours=1)
+
+        tx = TransactionModel
+        hourly = transactions_hourly.c
+        zero = literal(0)
+
+        raw_tail = select(
+            tx.customer_id, tx.country,
+            case((tx.occurred_at >= since_10m, 1), else_=0).label("n_10m"),
+            case((tx.occurred_at >= since_30m, 1), else_=0).label("n_30m"),
+            literal(1).label("n_24h"),
+            tx.amount.label("amount_24h"),
+            literal(1).label("n_30d")
+        ).where(tx.customer_id.in_(customer_ids), tx.occurred_at >= raw_from)
+
+        # Its bucket is also in the rollup, where it only counts towards the 30-day mode.
+        raw_head = select(
+            tx.customer_id, tx.country, zero, zero, literal(1), tx.amount, zero
+        ).where(tx.customer_id.in_(customer_ids), tx.occurred_at >= since_24h, tx.occurred_at < head_end)
+
+        rollup = select(
+            hourly.customer_id, hourly.country, zero, zero,
+            case((hourly.bucket >= head_end, hourly.tx_count), else_=0),
+            case((hourly.bucket >= head_end, hourly.amount_sum), else_=0),
+            hourly.tx_count
+        ).where(
+            hourly.customer_id.in_(customer_ids),
+            hourly.bucket >= _floor_hour(now - timedelta(days=30)),
+            hourly.bucket < raw_from
+        )
+
+        parts = union_all(raw_tail, raw_head, rollup).subquery()
+        rows = self._session.execute(
+            select(
+                parts.c.customer_id,
+                parts.c.country,
+                func.sum(parts.c.n_10m).label("count_10m"),
+                func.sum(parts.c.n_30m).label("count_30m"),
+                func.sum(parts.c.n_24h).label("count_24h"),
+                func.sum(parts.c.amount_24h).label("sum_24h"),
+                func.sum(parts.c.n_30d).label("count_30d")
+            ).group_by(parts.c.customer_id, parts.c.country)
+        ).all()
+        return self._fold_feature_rows(customer_ids, rows)
+
+    @staticmethod
+    def _fold_feature_rows(customer_ids, rows) -> Dict[UUID, Dict[str, any]]:
+        """Merges per-(customer, country) aggregate rows into one feature dict per customer."""
+        features = {
+            customer_id: {
+                "tx_count_10m": 0,
+                "tx_count_30m": 0,
+                "tx_count_24h": 0,
+                "amount_sum_24h": 0.0,
+                "country_counts_30d": Counter()
+            }
+            for customer_id in customer_ids
+        }
+        for row in rows:
+            entry = features[row.customer_id]
+            entry["tx_count_10m"] += int(row.count_10m or 0)
+            entry["tx_count_30m"] += int(row.count_30m or 0)
+            entry["tx_count_24h"] += int(row.count_24h or 0)
+            entry["amount_sum_24h"] += float(row.sum_24h or 0)
+            if row.country is not None:
+                entry["country_counts_30d"][row.country] += int(row.count_30d)
+
+        for entry in features.values():
+            count_24h = entry["tx_count_24h"]
+            entry["avg_amount_24h"] = entry["amount_sum_24h"] / count_24h if count_24h else 0.0
+            most_common = entry["country_counts_30d"].most_common(1)
+            entry["usual_country"] = most_common[0][0] if most_common else None
+
+        return features
\ No newline at end of file
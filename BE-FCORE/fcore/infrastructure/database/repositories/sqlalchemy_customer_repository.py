@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
@@ -26,6 +26,13 @@ class SqlAlchemyCustomerRepository(ICustomerRepository):
         model = self._session.query(CustomerModel).filter_by(id=id).first()
         return model.to_entity() if model else None
 
+    def find_existing_ids(self, ids: Iterable[UUID]) -> Set[UUID]:
+        ids = set(ids)
+        if not ids:
+            return set()
+        rows = self._session.query(CustomerModel.id).filter(CustomerModel.id.in_(ids)).all()
+        return {row.id for row in rows}
+
     def find_by_document_number(self, document_number: str) -> Optional[Customer]:
         model = self._session.query(CustomerModel).filter_by(document_number=document_number).first()
         return model.to_entity() if model else None
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
@@ -26,6 +26,13 @@ class SqlAlchemyMerchantRepository(IMerchantRepository):
         model = self._session.query(MerchantModel).filter_by(id=id).first()
         return model.to_entity() if model else None
 
+    def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, Merchant]:
+        ids = set(ids)
+        if not ids:
+            return {}
+        models = self._session.query(MerchantModel).filter(MerchantModel.id.in_(ids)).all()
+        return {model.id: model.to_entity() for model in models}
+
     def find_by_name(self, name: str) -> Optional[Merchant]:
         model = self._session.query(MerchantModel).filter_by(name=name).first()
         return model.to_entity() if model else None
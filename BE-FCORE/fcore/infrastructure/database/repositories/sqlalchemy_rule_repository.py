@@ -44,6 +44,7 @@ class SqlAlchemyRuleRepository(IRuleRepository):
             model.dsl_expression = rule.dsl_expression
             model.severity = rule.severity
             model.enabled = rule.enabled
+            model.shadow = rule.shadow
             model.updated_at = rule.updated_at
             model.updated_by = rule.updated_by
             self._session.flush()
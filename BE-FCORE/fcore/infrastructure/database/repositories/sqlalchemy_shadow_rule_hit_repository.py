@@ -0,0 +1,26 @@
+from typing import List
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from ....core.entities.shadow_rule_hit import ShadowRuleHit
+from ....application.interfaces.i_shadow_rule_hit_repository import IShadowRuleHitRepository
+from ..models.shadow_rule_hit_model import ShadowRuleHitModel
+
+class SqlAlchemyShadowRuleHitRepository(IShadowRuleHitRepository):
+    def __init__(self, session: Session):
+        self._session = session
+
+    def add_many(self, hits: List[ShadowRuleHit]) -> None:
+        if not hits:
+            return
+        # Core executemany: no ORM objects for rows nobody reads back
+        self._session.execute(insert(ShadowRuleHitModel), [
+            {
+                "rule_id": hit.rule_id,
+                "transaction_id": hit.transaction_id,
+                "transaction_occurred_at": hit.transaction_occurred_at,
+                "hit_at": hit.hit_at
+            }
+            for hit in hits
+        ])
+        self._session.commit()
@@ -1,9 +1,13 @@
-from typing import List, Optional
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Iterator, List, Optional, Tuple
 from uuid import UUID
+from sqlalchemy import String, cast, func, insert, or_, select
 from sqlalchemy.orm import Session, joinedload
 from ....core.entities.transaction import Transaction
 from ....application.interfaces.i_transaction_repository import ITransactionRepository
 from ..models.transaction_model import TransactionModel
+from ..models.merchant_model import MerchantModel
 
 class SqlAlchemyTransactionRepository(ITransactionRepository):
     def __init__(self, session: Session):
@@ -17,6 +21,41 @@ class SqlAlchemyTransactionRepository(ITransactionRepository):
         self._session.commit()
         return model.to_entity()
 
+    def add(self, transaction: Transaction) -> Transaction:
+        # Core INSERT ... RETURNING: one round trip, nothing added to the identity map to flush or refresh.
+        stored = self._session.execute(
+            insert(TransactionModel)
+            .values(**self._to_row(transaction))
+            .returning(TransactionModel.occurred_at)
+        ).one()
+        transaction.occurred_at = stored.occurred_at
+        return transaction
+
+    def create_many(self, transactions: List[Transaction]) -> List[Transaction]:
+        if not transactions:
+            return []
+        rows = [self._to_row(tx) for tx in transactions]
+        # ORM bulk INSERT: one executemany instead of one flush per object.
+        self._session.execute(insert(TransactionModel), rows)
+        self._session.commit()
+        return transactions
+
+    @staticmethod
+    def _to_row(tx: Transaction) -> dict:
+        return {
+            "id": tx.id,
+            "customer_id": tx.customer_id,
+            "merchant_id": tx.merchant_id,
+            "amount": tx.amount,
+            "currency": tx.currency,
+            "channel": tx.channel,
+            "occurred_at": tx.occurred_at,
+            "device_id": tx.device_id,
+            "ip_address": tx.ip_address,
+            "country": tx.country,
+            "label_fraud": tx.label_fraud
+        }
+
     def find_by_id(self, id: UUID) -> Optional[Transaction]:
         model = (
             self._session.query(TransactionModel)
@@ -43,4 +82,62 @@ class SqlAlchemyTransactionRepository(ITransactionRepository):
             .limit(limit)
             .all()
         )
-        return [model.to_entity() for model in models]
\ No newline at end of file
+        return [model.to_entity() for model in models]
+
+    def get_activity_since(self, since: datetime) -> Iterator[Tuple[UUID, datetime, Decimal]]:
+        stmt = (
+            select(TransactionModel.customer_id, TransactionModel.occurred_at, TransactionModel.amount)
+            .where(TransactionModel.occurred_at >= since)
+            .order_by(TransactionModel.occurred_at)
+            .execution_options(yield_per=5000)
+        )
+        for row in self._session.execute(stmt):
+            yield row.customer_id, row.occurred_at, row.amount
+
+    def stream_range(self, since: datetime, until: datetime, shard: int = 0, shard_count: int = 1,
+                     chunk: timedelta = timedelta(days=1)) -> Iterator[Transaction]:
+        flagged = {
+            model.id: model.to_entity()
+            for model in self._session.query(MerchantModel).filter(
+                or_(MerchantModel.is_blacklisted.is_(True), MerchantModel.is_whitelisted.is_(True))
+            )
+        }
+        columns = [
+            TransactionModel.id, TransactionModel.customer_id, TransactionModel.merchant_id,
+            TransactionModel.amount, TransactionModel.currency, TransactionModel.channel,
+            TransactionModel.occurred_at, TransactionModel.device_id, TransactionModel.ip_address,
+            TransactionModel.country, TransactionModel.label_fraud
+        ]
+        shard_filter = []
+        if shard_count > 1:
+            # Last two hex digits of the customer id, spread over the shards
+            suffixes = [f"{value:02x}" for value in range(256) if value % shard_count == shard]
+            shard_filter.append(func.substr(cast(TransactionModel.customer_id, String), 35, 2).in_(suffixes))
+
+        # One query per time chunk, each read through a server-side cursor: chunks are
+        # pruned on the hypertable and no result set is held in memory.
+        chunk_start = since
+        while chunk_start < until:
+            chunk_end = min(chunk_start + chunk, until)
+            stmt = (
+                select(*columns)
+                .where(TransactionModel.occurred_at >= chunk_start, TransactionModel.occurred_at < chunk_end, *shard_filter)
+                .order_by(TransactionModel.occurred_at)
+                .execution_options(yield_per=5000)
+            )
+            for row in self._session.execute(stmt):
+                yield Transaction(
+                    id=row.id,
+                    customer_id=row.customer_id,
+                    merchant_id=row.merchant_id,
+                    amount=row.amount,
+                    currency=row.currency,
+                    channel=row.channel,
+                    occurred_at=row.occurred_at,
+                    device_id=row.device_id,
+                    ip_address=row.ip_address,
+                    country=row.country,
+                    label_fraud=row.label_fraud,
+                    merchant=flagged.get(row.merchant_id)
+                )
+            chunk_start = chunk_end
@@ -0,0 +1,81 @@
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from ...application.interfaces.i_scoring_unit_of_work import IScoringUnitOfWork
+from ...application.services.reference_data_cache import ReferenceDataCache
+from ...infrastructure.cache.cached_customer_repository import CachedCustomerRepository
+from ...infrastructure.cache.cached_merchant_repository import CachedMerchantRepository
+from ...infrastructure.database.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from ...infrastructure.database.repositories.sqlalchemy_merchant_repository import SqlAlchemyMerchantRepository
+from ...infrastructure.database.repositories.sqlalchemy_transaction_repository import SqlAlchemyTransactionRepository
+from ...infrastructure.database.repositories.sqlalchemy_behavior_repository import SqlAlchemyBehaviorRepository
+from ...infrastructure.database.repositories.sqlalchemy_rule_repository import SqlAlchemyRuleRepository
+from ...infrastructure.database.repositories.sqlalchemy_alert_repository import SqlAlchemyAlertRepository
+from ...infrastructure.database.repositories.sqlalchemy_case_repository import SqlAlchemyCaseRepository
+from ...infrastructure.database.repositories.sqlalchemy_analyst_repository import SqlAlchemyAnalystRepository
+from ...infrastructure.database.repositories.sqlalchemy_alert_outbox_repository import SqlAlchemyAlertOutboxRepository
+
+class SqlAlchemyScoringUnitOfWork(IScoringUnitOfWork):
+    """
+    One session, one transaction and one COMMIT per scored transaction.
+    Statements are counted on the connection the session checks out, so the
+    count only covers this unit of work even when other requests share the engine.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        use_rollups: bool = False,
+        customer_cache: Optional[ReferenceDataCache] = None,
+        merchant_cache: Optional[ReferenceDataCache] = None
+    ):
+        self._session_factory = session_factory
+        self._use_rollups = use_rollups
+        self._customer_cache = customer_cache
+        self._merchant_cache = merchant_cache
+        self._session: Session = None
+        self._statements = 0
+
+    def __enter__(self):
+        self._statements = 0
+        self._session = self._session_factory()
+        event.listen(self._session, "after_begin", self._count_statements_on)
+
+        self.customer_repository = SqlAlchemyCustomerRepository(self._session)
+        self.merchant_repository = SqlAlchemyMerchantRepository(self._session)
+        if self._customer_cache:
+            self.customer_repository = CachedCustomerRepository(self.customer_repository, self._customer_cache)
+        if self._merchant_cache:
+            self.merchant_repository = CachedMerchantRepository(self.merchant_repository, self._merchant_cache)
+        self.transaction_repository = SqlAlchemyTransactionRepository(self._session)
+        self.behavior_repository = SqlAlchemyBehaviorRepository(self._session, use_rollups=self._use_rollups)
+        self.rule_repository = SqlAlchemyRuleRepository(self._session)
+        self.alert_repository = SqlAlchemyAlertRepository(self._session)
+        self.case_repository = SqlAlchemyCaseRepository(self._session)
+        self.analyst_repository = SqlAlchemyAnalystRepository(self._session)
+        self.alert_outbox_repository = SqlAlchemyAlertOutboxRepository(self._session)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type:
+                self.rollback()
+        finally:
+            self._session.close()
+
+    def commit(self):
+        self._session.commit()
+
+    def rollback(self):
+        self._session.rollback()
+
+    @property
+    def statement_count(self) -> int:
+        return self._statements
+
+    def _count_statements_on(self, session, transaction, connection):
+        if not event.contains(connection, "before_cursor_execute", self._count_statement):
+            event.listen(connection, "before_cursor_execute", self._count_statement)
+
+    def _count_statement(self, *args):
+        self._statements += 1
@@ -2,6 +2,9 @@ from sqlalchemy.orm import Session
 from ...application.interfaces.i_unit_of_work import IUnitOfWork
 from ...infrastructure.database.repositories.sqlalchemy_analyst_repository import SqlAlchemyAnalystRepository
 from ...infrastructure.database.repositories.sqlalchemy_role_repository import SqlAlchemyRoleRepository
+from ...infrastructure.database.repositories.sqlalchemy_alert_repository import SqlAlchemyAlertRepository
+from ...infrastructure.database.repositories.sqlalchemy_case_repository import SqlAlchemyCaseRepository
+from ...infrastructure.database.repositories.sqlalchemy_alert_outbox_repository import SqlAlchemyAlertOutboxRepository
 
 class SqlAlchemyUnitOfWork(IUnitOfWork):
 
@@ -15,6 +18,9 @@ class SqlAlchemyUnitOfWork(IUnitOfWork):
         self._session = self._session_factory()
         self.analyst_repository = SqlAlchemyAnalystRepository(self._session)
         self.role_repository = SqlAlchemyRoleRepository(self._session)
+        self.alert_repository = SqlAlchemyAlertRepository(self._session)
+        self.case_repository = SqlAlchemyCaseRepository(self._session)
+        self.alert_outbox_repository = SqlAlchemyAlertOutboxRepository(self._session)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,83 @@
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from ...application.services.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+class FileMetricsStore:
+    """
+    Shares the metrics of several worker processes through a directory, so that
+    a scrape answered by any one worker reports the whole server.
+
+    Every worker writes its registry's dump to <directory>/<pid>.json every
+    interval_seconds (and on stop); render() writes the answering worker's
+    own file first, then sums it with the files of the others. Other workers'
+    values are therefore up to interval_seconds old. Files of exited workers
+    (e.g. recycled after --limit-max-requests) are kept so that counters never
+    go backwards; the directory must be emptied before the server starts.
+    """
+
+    def __init__(self, directory: str, registry: MetricsRegistry, interval_seconds: float = 5.0):
+        self._directory = directory
+        self._registry = registry
+        self._interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-file-writer", daemon=True)
+        self._thread.start()
+        logger.info(f"Metrics shared through {self._directory} every {self._interval_seconds}s.")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self.write()
+
+    def write(self) -> None:
+        """Replaces this process's file atomically, so readers never see half of it."""
+        os.makedirs(self._directory, exist_ok=True)
+        path = self._path(os.getpid())
+        temporary = f"{path}.{threading.get_ident()}.tmp"
+        with open(temporary, "w") as f:
+            json.dump(self._registry.dump(), f)
+        os.replace(temporary, path)
+
+    def render(self) -> str:
+        self.write()
+        return self._registry.render(self._read_others())
+
+    def _read_others(self) -> List[Dict[str, Any]]:
+        own = f"{os.getpid()}.json"
+        dumps = []
+        for name in os.listdir(self._directory):
+            if not name.endswith(".json") or name == own:
+                continue
+            try:
+                with open(os.path.join(self._directory, name)) as f:
+                    dumps.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping metrics file {name}: {e}")
+        return dumps
+
+    def _path(self, pid: int) -> str:
+        return os.path.join(self._directory, f"{pid}.json")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_seconds):
+            try:
+                self.write()
+            except OSError as e:
+                logger.error(f"Writing the metrics file failed: {e}")
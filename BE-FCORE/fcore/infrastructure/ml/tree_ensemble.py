@@ -0,0 +1,207 @@
+import json
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Objectives whose prediction is sigmoid(margin), i.e. a probability.
+_LOGISTIC_OBJECTIVES = ("binary:logistic", "reg:logistic")
+
+@dataclass(frozen=True)
+class TreeEnsemble:
+    """
+    A gradient-boosted tree ensemble flattened into contiguous arrays: every
+    node of every tree lives at one index of feature/threshold/left/right/
+    default_left/value, and roots holds the index of each tree's first node.
+
+    Leaves point to themselves (left == right == own index), so traversal is
+    max_depth rounds of the same vectorized step for every (row, tree) pair,
+    with no per-node branching in Python. Thresholds and inputs are float32,
+    as in XGBoost, so the split decisions match it exactly.
+    """
+    feature: np.ndarray
+    threshold: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    default_left: np.ndarray
+    value: np.ndarray
+    roots: np.ndarray
+    max_depth: int
+    base_margin: float
+    feature_names: List[str]
+
+    @property
+    def num_trees(self) -> int:
+        return len(self.roots)
+
+    def predict_margin(self, rows: np.ndarray) -> np.ndarray:
+        """Raw scores (sum of leaf values plus the base margin) for an (n_rows, n_features) matrix."""
+        rows = np.asarray(rows, dtype=np.float32)
+        if rows.ndim == 1:
+            rows = rows[np.newaxis, :]
+        n_rows, n_features = rows.shape
+        # children[2 * node + go_right] replaces a where() over left/right
+        children = np.stack([self.left, self.right], axis=1).ravel()
+        flat = np.ascontiguousarray(rows).ravel()
+        row_offsets = (np.arange(n_rows, dtype=np.int32) * n_features)[:, np.newaxis]
+        nodes = np.broadcast_to(self.roots, (n_rows, self.num_trees)).copy()
+        for _ in range(self.max_depth):
+            values = flat[row_offsets + self.feature[nodes]]
+            # NaN compares False, so flipping on default_left routes missing values
+            go_right = ~(values < self.threshold[nodes])
+            go_right ^= np.isnan(values) & self.default_left[nodes]
+            nodes = children[(nodes << 1) | go_right]
+        return self.value[nodes].sum(axis=1, dtype=np.float64) + self.base_margin
+
+    def predict_proba(self, rows: np.ndarray) -> np.ndarray:
+        return 1.0 / (1.0 + np.exp(-self.predict_margin(rows)))
+
+def _parse_float(value: Union[str, float, list]) -> float:
+    # base_score is "5E-1" in XGBoost 1.x/2.x and "[5E-1]" in 3.x
+    if isinstance(value, list):
+        value = value[0]
+    return float(str(value).strip("[]"))
+
+def _logit(probability: float) -> float:
+    return math.log(probability / (1.0 - probability))
+
+class _Builder:
+    def __init__(self):
+        self.feature, self.threshold, self.left, self.right = [], [], [], []
+        self.default_left, self.value, self.roots = [], [], []
+        self.max_depth = 0
+
+    def add_node(self, feature: int, threshold: float, left: int, right: int, default_left: bool, value: float) -> int:
+        index = len(self.feature)
+        self.feature.append(feature)
+        self.threshold.append(threshold)
+        self.left.append(left if left >= 0 else index)
+        self.right.append(right if right >= 0 else index)
+        self.default_left.append(default_left)
+        self.value.append(value)
+        return index
+
+    def build(self, base_margin: float, feature_names: List[str]) -> TreeEnsemble:
+        return TreeEnsemble(
+            feature=np.asarray(self.feature, dtype=np.int32),
+            threshold=np.asarray(self.threshold, dtype=np.float32),
+            left=np.asarray(self.left, dtype=np.int32),
+            right=np.asarray(self.right, dtype=np.int32),
+            default_left=np.asarray(self.default_left, dtype=bool),
+            value=np.asarray(self.value, dtype=np.float32),
+            roots=np.asarray(self.roots, dtype=np.int32),
+            max_depth=self.max_depth,
+            base_margin=base_margin,
+            feature_names=feature_names
+        )
+
+def _tree_depth(left: Sequence[int], right: Sequence[int]) -> int:
+    depth, frontier = 0, [0]
+    while True:
+        frontier = [child for node in frontier for child in (left[node], right[node]) if child >= 0]
+        if not frontier:
+            return depth
+        depth += 1
+
+def _from_saved_model(model: Dict[str, Any], feature_names: Optional[List[str]]) -> TreeEnsemble:
+    """Booster.save_model('model.json') format."""
+    learner = model["learner"]
+    objective = learner.get("objective", {}).get("name", "binary:logistic")
+    if objective not in _LOGISTIC_OBJECTIVES:
+        raise ValueError(f"Unsupported objective '{objective}': only {', '.join(_LOGISTIC_OBJECTIVES)} models can be served.")
+    if int(learner["learner_model_param"].get("num_class", "0")) > 1:
+        raise ValueError("Multi-class models are not supported.")
+
+    booster = learner["gradient_booster"]
+    if booster.get("name") != "gbtree":
+        raise ValueError(f"Unsupported booster '{booster.get('name')}': only gbtree models can be served.")
+
+    names = feature_names or learner.get("feature_names") or []
+    if not names:
+        raise ValueError("The model has no feature names; pass feature_names explicitly.")
+
+    builder = _Builder()
+    for tree in booster["model"]["trees"]:
+        if any(int(kind) != 0 for kind in tree.get("split_type", [])):
+            raise ValueError("Categorical splits are not supported.")
+        left, right = tree["left_children"], tree["right_children"]
+        offset = len(builder.feature)
+        builder.roots.append(offset)
+        for node, (split, condition) in enumerate(zip(tree["split_indices"], tree["split_conditions"])):
+            is_leaf = left[node] < 0
+            builder.add_node(
+                feature=0 if is_leaf else int(split),
+                threshold=float(condition),
+                left=-1 if is_leaf else offset + left[node],
+                right=-1 if is_leaf else offset + right[node],
+                default_left=bool(tree["default_left"][node]),
+                # Leaves keep their weight in split_conditions
+                value=float(condition) if is_leaf else 0.0
+            )
+        builder.max_depth = max(builder.max_depth, _tree_depth(left, right))
+
+    base_score = _parse_float(learner["learner_model_param"].get("base_score", "0.5"))
+    return builder.build(_logit(base_score), list(names))
+
+def _from_dump(trees: List[Dict[str, Any]], feature_names: Optional[List[str]], base_score: float) -> TreeEnsemble:
+    """Booster.get_dump(dump_format='json') / dump_model(..., dump_format='json') format."""
+    if not feature_names:
+        raise ValueError("A tree dump carries no feature list; pass feature_names explicitly.")
+    positions = {name: index for index, name in enumerate(feature_names)}
+
+    def feature_index(split: str) -> int:
+        if split in positions:
+            return positions[split]
+        if split.startswith("f") and split[1:].isdigit():
+            return int(split[1:])
+        raise ValueError(f"Split on unknown feature '{split}'.")
+
+    builder = _Builder()
+    for tree in trees:
+        nodes: Dict[int, Dict[str, Any]] = {}
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            nodes[node["nodeid"]] = node
+            stack.extend(node.get("children", []))
+
+        # Node ids are dense per tree, so they map directly onto the flat arrays.
+        offset = len(builder.feature)
+        builder.roots.append(offset + tree["nodeid"])
+        depth = 0
+        for node_id in range(len(nodes)):
+            node = nodes[node_id]
+            if "leaf" in node:
+                builder.add_node(0, 0.0, -1, -1, False, float(node["leaf"]))
+            else:
+                # Only split nodes carry their depth in a dump
+                depth = max(depth, node["depth"] + 1)
+                builder.add_node(
+                    feature=feature_index(node["split"]),
+                    threshold=float(node["split_condition"]),
+                    left=offset + node["yes"],
+                    right=offset + node["no"],
+                    default_left=node.get("missing", node["yes"]) == node["yes"],
+                    value=0.0
+                )
+        builder.max_depth = max(builder.max_depth, depth)
+
+    return builder.build(_logit(base_score), list(feature_names))
+
+def load_xgboost_json(
+    source: Union[str, Dict[str, Any], List[Dict[str, Any]]],
+    feature_names: Optional[List[str]] = None,
+    base_score: float = 0.5
+) -> TreeEnsemble:
+    """
+    Builds a TreeEnsemble from an XGBoost JSON model (save_model) or JSON tree
+    dump (get_dump), given as a file path or as the already-parsed document.
+    base_score only applies to dumps; saved models carry their own.
+    """
+    if isinstance(source, str):
+        with open(source, "r", encoding="utf-8") as f:
+            source = json.load(f)
+    if isinstance(source, list):
+        return _from_dump(source, feature_names, base_score)
+    return _from_saved_model(source, feature_names)
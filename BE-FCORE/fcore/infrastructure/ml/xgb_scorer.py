@@ -1,5 +1,5 @@
 import random
-from typing import Dict, Any
+from typing import Mapping, Any, List
 from ...application.interfaces.i_model_scorer import IModelScorer
 
 class XgbScorerStub(IModelScorer):
@@ -8,7 +8,7 @@ class XgbScorerStub(IModelScorer):
     This simulates the behavior of a real ML model for wiring purposes.
     """
 
-    def score(self, features: Dict[str, Any]) -> float:
+    def score(self, features: Mapping[str, Any]) -> float:
         """
         Calculates a simulated risk score.
         In a real implementation, this would load a model file (e.g., booster.json)
@@ -28,4 +28,7 @@ class XgbScorerStub(IModelScorer):
         # Ensure the score is within the [0, 1] range
         final_score = min(base_score + (random.random() * 0.1), 1.0)
         
-        return round(final_score, 4)
\ No newline at end of file
+        return round(final_score, 4)
+
+    def score_batch(self, features_list: List[Mapping[str, Any]]) -> List[float]:
+        return [self.score(features) for features in features_list]
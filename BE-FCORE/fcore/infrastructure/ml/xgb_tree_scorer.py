@@ -0,0 +1,62 @@
+import logging
+from typing import Any, List, Mapping, Optional
+
+import numpy as np
+
+from ...application.interfaces.i_model_scorer import IModelScorer
+from ...core.entities.feature_vector import FeatureSchema, FeatureVector
+from .tree_ensemble import TreeEnsemble, load_xgboost_json
+
+logger = logging.getLogger(__name__)
+
+class XgbTreeScorer(IModelScorer):
+    """
+    Serves an XGBoost binary classifier with NumPy only (no xgboost runtime in
+    the image). Missing or None values are NaN and follow each split's default
+    direction, as in XGBoost.
+
+    When bound to a FeatureSchema the model's features are checked against it
+    once at load time, and FeatureVectors of another schema version are refused.
+    """
+
+    def __init__(self, ensemble: TreeEnsemble, schema: Optional[FeatureSchema] = None,
+                 schema_version: Optional[str] = None):
+        self._ensemble = ensemble
+        self._feature_names = ensemble.feature_names
+        self._schema = schema
+        if schema is not None:
+            schema.require_version(schema_version)
+            # Fails at load time, not per request, when a model feature is missing from the schema
+            schema.numeric_positions(self._feature_names)
+
+    @classmethod
+    def from_file(cls, path: str, feature_names: Optional[List[str]] = None,
+                  schema: Optional[FeatureSchema] = None, schema_version: Optional[str] = None) -> "XgbTreeScorer":
+        ensemble = load_xgboost_json(path, feature_names=feature_names)
+        logger.info(f"Loaded {ensemble.num_trees} trees (max depth {ensemble.max_depth}) from {path}.")
+        return cls(ensemble, schema=schema, schema_version=schema_version)
+
+    def score(self, features: Mapping[str, Any]) -> float:
+        return self.score_batch([features])[0]
+
+    def score_batch(self, features_list: List[Mapping[str, Any]]) -> List[float]:
+        if not features_list:
+            return []
+        rows = np.array([self._row(features) for features in features_list], dtype=np.float32)
+        return self._ensemble.predict_proba(rows).tolist()
+
+    def _row(self, features: Mapping[str, Any]) -> List[float]:
+        if isinstance(features, FeatureVector) and self._schema is not None:
+            if features.schema.version != self._schema.version:
+                raise ValueError(
+                    f"Model is bound to feature schema {self._schema.version}, got a vector of schema {features.schema.version}."
+                )
+            # Only the model's own features are computed
+            return [np.nan if value is None else value for value in features.pick(self._feature_names)]
+        return [self._to_float(features.get(name)) for name in self._feature_names]
+
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        if value is None:
+            return np.nan
+        return float(value)
@@ -0,0 +1,137 @@
+import ast
+import logging
+import threading
+from dataclasses import dataclass
+from types import CodeType
+from typing import Any, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+import simpleeval
+from simpleeval import SimpleEval
+
+from ...application.interfaces.i_rule_evaluator import IRuleEvaluator
+from ...core.entities.rule import Rule
+
+logger = logging.getLogger(__name__)
+
+# Operators simpleeval guards with a size-limited implementation. The compiled
+# code calls the very same functions so the limits are identical.
+_GUARDED_OPERATORS = {
+    ast.Add: ("__safe_add", simpleeval.safe_add),
+    ast.Mult: ("__safe_mult", simpleeval.safe_mult),
+    ast.Pow: ("__safe_power", simpleeval.safe_power),
+    ast.LShift: ("__safe_lshift", simpleeval.safe_lshift),
+    ast.RShift: ("__safe_rshift", simpleeval.safe_rshift),
+}
+
+# Node types that only carry context (load/and/or); they are implied by the parent node.
+_STRUCTURAL_NODES = (ast.Expression, ast.Load, ast.And, ast.Or)
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """A DSL expression validated and compiled once. code is None when it must be interpreted."""
+    expression_hash: int
+    code: Optional[CodeType]
+    error: Optional[str] = None
+
+class _GuardedOperatorRewriter(ast.NodeTransformer):
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        guarded = _GUARDED_OPERATORS.get(type(node.op))
+        if guarded is None:
+            return node
+        call = ast.Call(func=ast.Name(id=guarded[0], ctx=ast.Load()), args=[node.left, node.right], keywords=[])
+        return ast.copy_location(call, node)
+
+class CompiledEvalEvaluator(IRuleEvaluator):
+    """
+    Concrete Strategy: validates each DSL expression once against the simpleeval
+    whitelist and compiles it to a Python code object, so evaluating a rule is a
+    single eval() call with the context as its only namespace.
+
+    Expressions using constructs whose semantics differ when compiled (attribute
+    access) are delegated to simpleeval, so results never differ from SimpleEvalEvaluator.
+    """
+
+    def __init__(self):
+        whitelist = SimpleEval()
+        self._allowed_nodes = tuple(whitelist.nodes.keys())
+        self._allowed_operators = tuple(whitelist.operators.keys())
+        self._functions = dict(whitelist.functions)
+        self._globals: Dict[str, Any] = {"__builtins__": {}, **self._functions}
+        self._globals.update({name: func for name, func in _GUARDED_OPERATORS.values()})
+        self._compiled: Dict[UUID, CompiledRule] = {}
+        self._lock = threading.Lock()
+
+    def evaluate(self, rule: Rule, context: Dict[str, Any]) -> bool:
+        compiled = self._get_compiled(rule)
+
+        if compiled.error is not None:
+            return False
+
+        try:
+            if compiled.code is None:
+                return bool(SimpleEval(names=context).eval(rule.dsl_expression))
+            return bool(eval(compiled.code, self._globals, context))
+        except Exception as e:
+            # Same contract as SimpleEvalEvaluator: log and assume the rule did not trigger.
+            logger.error(f"Strategy Error evaluating rule '{rule.name}' (ID: {rule.id}): {str(e)}")
+            return False
+
+    def prepare(self, rules: Iterable[Rule]) -> int:
+        """Compiles the given rules ahead of time. Returns how many were compiled."""
+        return sum(1 for rule in rules if self._get_compiled(rule).code is not None)
+
+    def _get_compiled(self, rule: Rule) -> CompiledRule:
+        expression_hash = hash(rule.dsl_expression)
+        compiled = self._compiled.get(rule.id)
+        if compiled is not None and compiled.expression_hash == expression_hash:
+            return compiled
+
+        with self._lock:
+            compiled = self._compile(rule, expression_hash)
+            # One entry per rule id: an edited expression replaces the old code object.
+            self._compiled[rule.id] = compiled
+        return compiled
+
+    def _compile(self, rule: Rule, expression_hash: int) -> CompiledRule:
+        try:
+            tree = ast.parse(rule.dsl_expression.strip(), mode="eval")
+        except SyntaxError as e:
+            logger.error(f"Strategy Error compiling rule '{rule.name}' (ID: {rule.id}): {str(e)}")
+            return CompiledRule(expression_hash, None, error=str(e))
+
+        violation, interpret = self._check_whitelist(tree)
+        if violation:
+            logger.error(f"Strategy Error compiling rule '{rule.name}' (ID: {rule.id}): {violation}")
+            return CompiledRule(expression_hash, None, error=violation)
+        if interpret:
+            return CompiledRule(expression_hash, None)
+
+        tree = ast.fix_missing_locations(_GuardedOperatorRewriter().visit(tree))
+        code = compile(tree, f"<rule {rule.id}>", "eval")
+        return CompiledRule(expression_hash, code)
+
+    def _check_whitelist(self, tree: ast.Expression) -> Tuple[Optional[str], bool]:
+        """
+        Returns (violation, interpret). A violation means simpleeval would refuse the
+        expression; interpret means it is allowed but must run through simpleeval.
+        """
+        interpret = False
+        for node in ast.walk(tree):
+            if isinstance(node, _STRUCTURAL_NODES):
+                continue
+            if isinstance(node, (ast.operator, ast.unaryop, ast.cmpop)):
+                if not isinstance(node, self._allowed_operators):
+                    return f"Operator {type(node).__name__} is not allowed.", False
+                continue
+            if not isinstance(node, self._allowed_nodes) or isinstance(node, (ast.Assign, ast.AugAssign, ast.Import)):
+                return f"Sorry, {type(node).__name__} is not available in this evaluator", False
+            if isinstance(node, ast.Name) and node.id.startswith("__"):
+                return f"Name '{node.id}' is not allowed.", False
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in self._functions:
+                    interpret = True
+            if isinstance(node, ast.Attribute):
+                interpret = True
+        return None, interpret
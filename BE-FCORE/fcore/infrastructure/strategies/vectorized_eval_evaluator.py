@@ -0,0 +1,342 @@
+import ast
+import logging
+import operator
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from ...application.interfaces.i_batch_rule_evaluator import IBatchRuleEvaluator
+from ...core.entities.rule import Rule
+from .compiled_eval_evaluator import CompiledEvalEvaluator
+
+logger = logging.getLogger(__name__)
+
+# A translated (sub)expression: columns -> (values, errors). values is an array with
+# one entry per row or a Python scalar; errors marks the rows where the scalar
+# evaluation would have raised (and the rule therefore would not trigger).
+Plan = Callable[["_Columns"], Tuple[Any, Any]]
+
+_ARITHMETIC = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.true_divide,
+    ast.FloorDiv: np.floor_divide,
+    ast.Mod: np.mod,
+}
+_SCALAR_ARITHMETIC = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+# Operators that raise ZeroDivisionError on a zero right operand
+_DIVISIONS = (ast.Div, ast.FloorDiv, ast.Mod)
+
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+class _Fallback(Exception):
+    """The expression, or this batch's operand types, cannot be reproduced exactly with arrays."""
+
+class _Columns:
+    """Context fields as arrays, built on first use: bool, float64 (ints and floats) or object."""
+
+    def __init__(self, contexts: Sequence[Mapping[str, Any]]):
+        self._contexts = contexts
+        self._arrays: Dict[str, Optional[np.ndarray]] = {}
+        self.rows = len(contexts)
+
+    def get(self, name: str) -> Optional[np.ndarray]:
+        """The column, or None when no context has the name."""
+        if name not in self._arrays:
+            self._arrays[name] = self._build(name)
+        return self._arrays[name]
+
+    def _build(self, name: str) -> Optional[np.ndarray]:
+        values = []
+        missing = 0
+        for context in self._contexts:
+            try:
+                values.append(context[name])
+            except KeyError:
+                missing += 1
+                values.append(None)
+        if missing == self.rows:
+            return None
+        if missing:
+            raise _Fallback(f"'{name}' is missing from some contexts")
+
+        types = {type(value) for value in values}
+        if types == {bool}:
+            return np.array(values, dtype=bool)
+        if types and types <= {int, float}:
+            # Exact for counts below 2**53
+            return np.array(values, dtype=np.float64)
+        column = np.empty(self.rows, dtype=object)
+        column[:] = values
+        return column
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, np.ndarray)
+
+def _numeric(value: Any) -> Any:
+    """Operand of arithmetic; bools become ints as in Python (numpy would treat + as logical or)."""
+    if _is_array(value):
+        if value.dtype == bool:
+            return value.astype(np.int64)
+        if value.dtype.kind not in "if":
+            raise _Fallback("arithmetic on a non-numeric column")
+        return value
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return value
+    raise _Fallback("arithmetic on a non-numeric constant")
+
+def _truth(value: Any, rows: int) -> np.ndarray:
+    if _is_array(value):
+        if value.dtype == bool:
+            return value
+        if value.dtype.kind in "if":
+            return value != 0
+        return np.fromiter((bool(item) for item in value), dtype=bool, count=rows)
+    return np.full(rows, bool(value))
+
+def _mask(errors: Any, rows: int) -> np.ndarray:
+    if _is_array(errors):
+        return errors
+    return np.full(rows, bool(errors))
+
+class _Translator:
+    """Turns a whitelisted DSL expression into a Plan, or raises _Fallback."""
+
+    def __init__(self, functions: Mapping[str, Any]):
+        self._functions = functions
+
+    def truth(self, node: ast.AST) -> Plan:
+        """A plan whose values are the truthiness of node, per row."""
+        if isinstance(node, ast.BoolOp):
+            parts = [self.truth(value) for value in node.values]
+            is_and = isinstance(node.op, ast.And)
+
+            def bool_op(columns):
+                result, errors = parts[0](columns)
+                for part in parts[1:]:
+                    # Python short-circuits: the next operand only runs (and can only fail)
+                    # where the result so far is truthy for 'and' / falsy for 'or'.
+                    runs = (result if is_and else ~result) & ~errors
+                    value, part_errors = part(columns)
+                    errors = errors | (runs & part_errors)
+                    result = np.where(runs, value, result)
+                return result, errors
+            return bool_op
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self.truth(node.operand)
+
+            def negate(columns):
+                value, errors = operand(columns)
+                return ~value, errors
+            return negate
+
+        if isinstance(node, ast.IfExp):
+            test, body, orelse = self.truth(node.test), self.truth(node.body), self.truth(node.orelse)
+
+            def if_exp(columns):
+                condition, errors = test(columns)
+                body_value, body_errors = body(columns)
+                else_value, else_errors = orelse(columns)
+                return (np.where(condition, body_value, else_value),
+                        errors | np.where(condition, body_errors, else_errors))
+            return if_exp
+
+        plan = self.value(node)
+
+        def truth(columns):
+            value, errors = plan(columns)
+            return _truth(value, columns.rows), _mask(errors, columns.rows)
+        return truth
+
+    def value(self, node: ast.AST) -> Plan:
+        if isinstance(node, ast.Constant):
+            constant = node.value
+            return lambda columns: (constant, False)
+
+        if isinstance(node, ast.Name):
+            if node.id in self._functions:
+                raise _Fallback(f"function '{node.id}' used as a value")
+            name = node.id
+
+            def lookup(columns):
+                column = columns.get(name)
+                if column is None:
+                    # NameNotDefined on every row
+                    return None, True
+                return column, False
+            return lookup
+
+        if isinstance(node, ast.Compare):
+            return self._compare(node)
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC:
+            return self._arithmetic(node)
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = self.value(node.operand)
+            negative = isinstance(node.op, ast.USub)
+
+            def sign(columns):
+                value, errors = operand(columns)
+                value = _numeric(value)
+                return (-value if negative else +value), errors
+            return sign
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return self.truth(node)
+
+        # and/or/if-else as values (not just truth), calls, attributes, subscripts, ** ...
+        raise _Fallback(f"{type(node).__name__} is evaluated row by row")
+
+    def _arithmetic(self, node: ast.BinOp) -> Plan:
+        left, right = self.value(node.left), self.value(node.right)
+        op_type = type(node.op)
+        array_op, scalar_op = _ARITHMETIC[op_type], _SCALAR_ARITHMETIC[op_type]
+
+        def arithmetic(columns):
+            left_value, left_errors = left(columns)
+            right_value, right_errors = right(columns)
+            errors = left_errors | right_errors if _is_array(left_errors) or _is_array(right_errors) else (left_errors or right_errors)
+            a, b = _numeric(left_value), _numeric(right_value)
+
+            if not _is_array(a) and not _is_array(b):
+                try:
+                    return scalar_op(a, b), errors
+                except ZeroDivisionError:
+                    return 0, True
+            if op_type in _DIVISIONS:
+                errors = errors | (np.asarray(b) == 0)
+            try:
+                with np.errstate(all="ignore"):
+                    return array_op(a, b), errors
+            except (OverflowError, TypeError) as e:
+                raise _Fallback(str(e))
+        return arithmetic
+
+    def _compare(self, node: ast.Compare) -> Plan:
+        operands = [self.value(node.left)] + [self.value(comparator) for comparator in node.comparators]
+        comparisons = []
+        for op in node.ops:
+            if type(op) not in _COMPARISONS:
+                raise _Fallback(f"{type(op).__name__} is evaluated row by row")
+            comparisons.append((type(op), _COMPARISONS[type(op)]))
+
+        def compare(columns):
+            rows = columns.rows
+            left_value, errors = operands[0](columns)
+            errors = _mask(errors, rows)
+            result = np.ones(rows, dtype=bool)
+            for (op_type, op), operand in zip(comparisons, operands[1:]):
+                # a < b < c only evaluates c where a < b held
+                right_value, right_errors = operand(columns)
+                errors = errors | (result & _mask(right_errors, rows))
+                result = result & _compare_values(op_type, op, left_value, right_value, rows)
+                left_value = right_value
+            return result, errors
+        return compare
+
+def _compare_values(op_type, op, left: Any, right: Any, rows: int) -> np.ndarray:
+    if left is None and right is None and op_type not in (ast.Eq, ast.NotEq):
+        raise _Fallback("ordering None")
+    left_kind = left.dtype.kind if _is_array(left) else None
+    right_kind = right.dtype.kind if _is_array(right) else None
+    if op_type in (ast.Eq, ast.NotEq):
+        # A string never equals a number; numpy may try to compare them differently.
+        if (isinstance(left, str) and right_kind in ("b", "f")) or (isinstance(right, str) and left_kind in ("b", "f")):
+            return np.full(rows, op_type is ast.NotEq)
+    elif "O" in (left_kind, right_kind) or isinstance(left, str) or isinstance(right, str) \
+            or left is None or right is None:
+        # Python orders strings and raises on mixed types; keep that row by row.
+        raise _Fallback("ordering non-numeric values")
+    try:
+        result = op(left, right)
+    except TypeError as e:
+        raise _Fallback(str(e))
+    if _is_array(result):
+        return result.astype(bool, copy=False)
+    return np.full(rows, bool(result))
+
+@dataclass(frozen=True)
+class _VectorPlan:
+    expression_hash: int
+    plan: Optional[Plan]
+    reason: Optional[str] = None
+
+class VectorizedEvalEvaluator(CompiledEvalEvaluator, IBatchRuleEvaluator):
+    """
+    CompiledEvalEvaluator plus a batch path over columnar NumPy arrays (one
+    column per context field). Each DSL expression is translated once into
+    array operations; rows where the scalar evaluation would raise (division
+    by zero, unknown name, ...) are tracked as an error mask and do not trigger,
+    and and/or/if-else respect Python's short-circuiting, so the hit matrix is
+    the one evaluate() would produce cell by cell.
+
+    Constructs without an exact array equivalent (calls, attribute access, **,
+    and/or used as values) and batches whose column types do not fit (ordering
+    strings, None in a numeric field) fall back to evaluate() row by row.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._translator = _Translator(self._functions)
+        self._plans: Dict[UUID, _VectorPlan] = {}
+
+    def evaluate_batch(self, rules: Sequence[Rule], contexts: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        hits = np.zeros((len(contexts), len(rules)), dtype=bool)
+        if not contexts:
+            return hits
+        columns = _Columns(contexts)
+
+        for column, rule in enumerate(rules):
+            if self._get_compiled(rule).error is not None:
+                continue  # Never triggers, as in evaluate()
+
+            vector_plan = self._get_plan(rule)
+            if vector_plan.plan is not None:
+                try:
+                    value, errors = vector_plan.plan(columns)
+                    errors = _mask(errors, columns.rows)
+                    hits[:, column] = _truth(value, columns.rows) & ~errors
+                    failed = int(errors.sum())
+                    if failed:
+                        logger.error(f"Strategy Error evaluating rule '{rule.name}' (ID: {rule.id}) on {failed} of {columns.rows} rows.")
+                    continue
+                except Exception:
+                    # _Fallback, or a lazy feature raising while its column was built:
+                    # evaluate() reproduces the per-row outcome either way.
+                    pass
+            hits[:, column] = [self.evaluate(rule, context) for context in contexts]
+        return hits
+
+    def _get_plan(self, rule: Rule) -> _VectorPlan:
+        expression_hash = hash(rule.dsl_expression)
+        vector_plan = self._plans.get(rule.id)
+        if vector_plan is not None and vector_plan.expression_hash == expression_hash:
+            return vector_plan
+        try:
+            tree = ast.parse(rule.dsl_expression.strip(), mode="eval")
+            vector_plan = _VectorPlan(expression_hash, self._translator.truth(tree.body))
+        except (SyntaxError, _Fallback) as e:
+            vector_plan = _VectorPlan(expression_hash, None, reason=str(e))
+        self._plans[rule.id] = vector_plan
+        return vector_plan
@@ -1,3 +1,8 @@
+import time
+_IMPORT_STARTED = time.perf_counter()
+
+import asyncio
+import logging
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.openapi.models import SecurityScheme
@@ -6,7 +11,11 @@ from fastapi.openapi.utils import get_openapi
 from fcore.presentation.api.controllers import (analyst_controller, auth_controller, 
                                                 role_controller, customer_controller, merchant_controller,
                                                 transaction_controller, behavior_controller, rule_controller,
-                                                alert_controller, case_controller, scoring_controller)
+                                                alert_controller, case_controller, scoring_controller,
+                                                admin_controller, health_controller, metrics_controller)
+from fcore.presentation.api.dependencies import (get_worker_warm_up, get_alert_outbox_worker, get_shadow_rule_runner,
+                                                 get_latency_guard, get_metrics_store, get_model_scorer)
+from fcore.application.services.champion_challenger_scorer import ChampionChallengerScorer
 from fcore.core.errors.analyst_errors import AnalystNotFoundError, AnalystAlreadyExistsError
 from fcore.core.errors.customer_errors import CustomerNotFoundError, CustomerAlreadyExistsError
 from fcore.core.errors.merchant_errors import MerchantNotFoundError, MerchantAlreadyExistsError
@@ -18,6 +27,8 @@ from fcore.core.errors.alert_errors import AlertNotFoundError
 from fcore.core.errors.case_errors import CaseNotFoundError, CaseAlreadyExistsError
 from fastapi.middleware.cors import CORSMiddleware
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(title="Fraud Detection System API")
 
 origins = [
@@ -35,6 +46,71 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def warm_up_worker():
+    # Uvicorn only starts accepting connections once startup returns, so a worker
+    # (including one recycled after --limit-max-requests) never serves cold.
+    # If a step fails, keep retrying in the background and report not ready.
+    warm_up_started = time.perf_counter()
+    worker_warm_up = get_worker_warm_up()
+    if not await worker_warm_up.run():
+        app.state.warm_up_task = asyncio.create_task(worker_warm_up.run_until_ready())
+    logger.info(
+        f"Worker startup: import {warm_up_started - _IMPORT_STARTED:.3f}s, "
+        f"warm-up {time.perf_counter() - warm_up_started:.3f}s (ready={worker_warm_up.is_ready})."
+    )
+
+@app.on_event("startup")
+def start_alert_outbox_worker():
+    # Only when ALERT_OUTBOX_ENABLED is set.
+    worker = get_alert_outbox_worker()
+    if worker:
+        worker.start()
+
+@app.on_event("shutdown")
+def stop_alert_outbox_worker():
+    worker = get_alert_outbox_worker()
+    if worker:
+        worker.stop()
+
+@app.on_event("startup")
+def start_shadow_rule_runner():
+    # Disabled with SHADOW_RULE_WORKERS=0.
+    runner = get_shadow_rule_runner()
+    if runner:
+        runner.start()
+
+@app.on_event("shutdown")
+def stop_shadow_rule_runner():
+    runner = get_shadow_rule_runner()
+    if runner:
+        runner.stop()
+
+@app.on_event("shutdown")
+def stop_challenger_models():
+    scorer = get_model_scorer()
+    if isinstance(scorer, ChampionChallengerScorer):
+        scorer.close(wait=False)
+
+@app.on_event("shutdown")
+def stop_latency_guard():
+    guard = get_latency_guard()
+    if guard:
+        guard.close()
+
+@app.on_event("startup")
+def start_metrics_store():
+    # Only when METRICS_MULTIPROC_DIR is set.
+    store = get_metrics_store()
+    if store:
+        store.start()
+
+@app.on_event("shutdown")
+def stop_metrics_store():
+    store = get_metrics_store()
+    if store:
+        store.stop()
+
 # --- Custom Exception Handlers ---
 @app.exception_handler(AnalystNotFoundError)
 async def analyst_not_found_exception_handler(request: Request, exc: AnalystNotFoundError):
@@ -104,6 +180,9 @@ app.include_router(rule_controller.router)
 app.include_router(alert_controller.router)
 app.include_router(case_controller.router)
 app.include_router(scoring_controller.router)
+app.include_router(admin_controller.router)
+app.include_router(health_controller.router)
+app.include_router(metrics_controller.router)
 
 @app.get("/")
 def read_root():
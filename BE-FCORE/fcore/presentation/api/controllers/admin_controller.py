@@ -0,0 +1,149 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import Engine
+
+from ..dependencies import (get_velocity_engine, get_alert_outbox_stats_repo, get_alert_outbox_worker,
+                            get_customer_cache, get_merchant_cache, get_db_engines, get_rule_evaluation_stats,
+                            get_backtest_use_case, get_shadow_rule_runner, get_model_scorer, get_latency_guard,
+                            get_current_active_analyst_entity, is_admin)
+from ..schemas.admin_schemas import (VelocityEngineStatsResponse, AlertOutboxStatsResponse, ReferenceCacheStatsResponse,
+                                     DbPoolStatsResponse, RuleEvaluationStatsResponse, ShadowRuleStatsResponse,
+                                     ModelChallengersResponse, LatencyBudgetStatsResponse, BacktestRequest, BacktestResponse)
+from ....application.services.velocity_engine import VelocityEngine
+from ....application.services.alert_outbox_worker import AlertOutboxWorker
+from ....application.services.reference_data_cache import ReferenceDataCache
+from ....application.services.rule_evaluation_stats import RuleEvaluationStats
+from ....application.services.shadow_rule_runner import ShadowRuleRunner
+from ....application.services.champion_challenger_scorer import ChampionChallengerScorer
+from ....application.services.latency_budget import LatencyGuard
+from ....application.interfaces.i_model_scorer import IModelScorer
+from ....application.interfaces.i_alert_outbox_repository import IAlertOutboxRepository
+from ....application.use_cases.backtest_use_case import BacktestUseCase
+from ....core.entities.analyst import Analyst
+from ....core.errors.backtest_errors import BacktestAlreadyRunningError, BacktestValidationError
+from ....core.errors.rule_errors import RuleValidationError
+from ....infrastructure.database.pooling import pool_stats
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Administration"],
+    dependencies=[Depends(is_admin)]
+)
+
+@router.get("/velocity-engine", response_model=VelocityEngineStatsResponse)
+def get_velocity_engine_stats(velocity_engine: Optional[VelocityEngine] = Depends(get_velocity_engine)):
+    """
+    Reports the state and estimated memory footprint of this worker's in-memory velocity counters.
+    """
+    if velocity_engine is None:
+        return VelocityEngineStatsResponse(enabled=False)
+    return VelocityEngineStatsResponse(enabled=True, **velocity_engine.stats())
+
+@router.get("/alert-outbox", response_model=AlertOutboxStatsResponse)
+def get_alert_outbox_stats(
+    repo: IAlertOutboxRepository = Depends(get_alert_outbox_stats_repo),
+    worker: Optional[AlertOutboxWorker] = Depends(get_alert_outbox_worker)
+):
+    """
+    Backlog of the alert outbox. lag_seconds is the age of the oldest event still waiting
+    for its alert, i.e. how far alert creation is behind scoring.
+    """
+    stats = repo.get_stats()
+    oldest = stats["oldest_pending_created_at"]
+    lag_seconds = 0.0
+    if oldest is not None:
+        if oldest.tzinfo is None:
+            oldest = oldest.replace(tzinfo=timezone.utc)
+        lag_seconds = max((datetime.now(timezone.utc) - oldest).total_seconds(), 0.0)
+    worker_stats = worker.stats() if worker else {}
+    return AlertOutboxStatsResponse(
+        enabled=worker is not None,
+        worker_running=worker_stats.get("running", False),
+        pending=stats["pending"],
+        dead=stats["dead"],
+        oldest_pending_created_at=stats["oldest_pending_created_at"],
+        lag_seconds=lag_seconds,
+        processed_total=worker_stats.get("processed_total", 0),
+        failed_total=worker_stats.get("failed_total", 0)
+    )
+
+@router.get("/reference-cache", response_model=List[ReferenceCacheStatsResponse])
+def get_reference_cache_stats(
+    customer_cache: ReferenceDataCache = Depends(get_customer_cache),
+    merchant_cache: ReferenceDataCache = Depends(get_merchant_cache)
+):
+    """
+    Hit/miss counters of this worker's customer and merchant caches.
+    """
+    return [customer_cache.stats(), merchant_cache.stats()]
+
+@router.get("/db-pool", response_model=List[DbPoolStatsResponse])
+def get_db_pool_stats(engines: Dict[str, Engine] = Depends(get_db_engines)):
+    """
+    Connections checked out/in and overflow of this worker's sync and async engines,
+    with a histogram of how long requests waited to check a connection out.
+    """
+    return [pool_stats(name, engine.pool) for name, engine in engines.items()]
+
+@router.get("/rule-stats", response_model=List[RuleEvaluationStatsResponse])
+def get_rule_evaluation_stats_view(stats: RuleEvaluationStats = Depends(get_rule_evaluation_stats)):
+    """
+    Evaluations, hits and mean cost per rule in this worker, the inputs of the
+    within-tier evaluation order. Rules skipped by an early exit are not counted.
+    """
+    return stats.describe()
+
+@router.get("/shadow-rules", response_model=ShadowRuleStatsResponse)
+def get_shadow_rule_stats(runner: Optional[ShadowRuleRunner] = Depends(get_shadow_rule_runner)):
+    """
+    Evaluations and hits per shadow rule in this worker since it started, and the
+    state of the queue they are evaluated from. dropped_total counts transactions
+    whose shadow evaluation was skipped because the queue was full.
+    """
+    if runner is None:
+        return ShadowRuleStatsResponse(enabled=False)
+    return ShadowRuleStatsResponse(enabled=True, **runner.stats())
+
+@router.get("/model-challengers", response_model=ModelChallengersResponse)
+def get_model_challenger_stats(scorer: IModelScorer = Depends(get_model_scorer)):
+    """
+    How this worker's challenger models compare with the champion: mean and max
+    score difference, share of transactions where the score alone would give
+    the same action, latency, and the jobs dropped or timed out on the budget.
+    """
+    if not isinstance(scorer, ChampionChallengerScorer):
+        return ModelChallengersResponse(enabled=False)
+    return ModelChallengersResponse(enabled=True, **scorer.stats())
+
+@router.get("/latency-budget", response_model=LatencyBudgetStatsResponse)
+def get_latency_budget_stats(guard: Optional[LatencyGuard] = Depends(get_latency_guard)):
+    """
+    Scoring requests of this worker that went over the latency budget, missed a
+    stage deadline or were degraded (cached behavior profile, rules-only decision).
+    """
+    if guard is None:
+        return LatencyBudgetStatsResponse(enabled=False)
+    return LatencyBudgetStatsResponse(enabled=True, **guard.stats())
+
+@router.post("/backtest", response_model=BacktestResponse)
+def run_backtest(
+    request: BacktestRequest,
+    use_case: BacktestUseCase = Depends(get_backtest_use_case),
+    current_user: Analyst = Depends(get_current_active_analyst_entity)
+):
+    """
+    Replays a candidate expression (or the live rule set, shadow rules
+    excluded) over the stored transactions in [start, end) with point-in-time
+    behavior features: hits, hit rate per day and overlap with label_fraud per
+    rule. Runs synchronously, one backtest at a time per worker (409 while one
+    is running), over at most BACKTEST_MAX_DAYS days; longer ranges belong in
+    backtest_rules.py.
+    """
+    try:
+        report = use_case.execute(request.start, request.end, request.dsl_expression, requested_by=current_user.code)
+    except (BacktestValidationError, RuleValidationError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except BacktestAlreadyRunningError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return report.to_dict()
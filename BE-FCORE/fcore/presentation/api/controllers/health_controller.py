@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Response, status
+
+from ..dependencies import get_worker_warm_up
+from ..schemas.health_schemas import ReadinessResponse
+from ....application.services.warm_up import WorkerWarmUp
+
+router = APIRouter(
+    prefix="/health",
+    tags=["Health"]
+)
+
+@router.get("/live")
+async def liveness():
+    return {"status": "ok"}
+
+@router.get("/ready", response_model=ReadinessResponse)
+async def readiness(response: Response, warm_up: WorkerWarmUp = Depends(get_worker_warm_up)):
+    """
+    200 once this worker has finished its warm-up (rule set, compiled rules, model,
+    pooled connections), 503 until then. Use it as the load balancer's readiness probe.
+    """
+    if not warm_up.is_ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return warm_up.status()
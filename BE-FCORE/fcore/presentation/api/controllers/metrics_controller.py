@@ -0,0 +1,28 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from ..dependencies import get_metrics_registry, get_metrics_store
+from ....application.services.metrics import MetricsRegistry
+from ....infrastructure.metrics.file_metrics_store import FileMetricsStore
+
+router = APIRouter(
+    tags=["Metrics"]
+)
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics(
+    registry: MetricsRegistry = Depends(get_metrics_registry),
+    store: Optional[FileMetricsStore] = Depends(get_metrics_store)
+):
+    """
+    Scoring metrics in the Prometheus text format: latency histograms per stage
+    and per rule, decisions by action, rule hits, degraded requests and SQL
+    statements per request. With METRICS_MULTIPROC_DIR set the values are summed
+    over every server worker (the others' up to a few seconds old); without it
+    they are those of the worker that answered, so run a single worker or set it.
+    Unauthenticated, like /health: scrape it from the internal network only.
+    """
+    text = store.render() if store else registry.render()
+    return PlainTextResponse(text, media_type="text/plain; version=0.0.4")
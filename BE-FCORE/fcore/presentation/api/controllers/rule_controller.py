@@ -3,10 +3,10 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from ..dependencies import get_rule_crud_use_case, get_current_active_analyst_entity
-from ..schemas.rule_schemas import RuleCreate, RuleUpdate, RuleResponse
+from ..schemas.rule_schemas import RuleCreate, RuleUpdate, RuleResponse, RuleSetVersionResponse
 from ....application.use_cases.crud_rule_use_case import CrudRuleUseCase
 from ....core.entities.analyst import Analyst
-from ....core.errors.rule_errors import RuleNotFoundError, RuleAlreadyExistsError
+from ....core.errors.rule_errors import RuleNotFoundError, RuleAlreadyExistsError, RuleValidationError
 
 router = APIRouter(
     prefix="/rules",
@@ -25,15 +25,25 @@ def create_rule(
             name=rule_in.name,
             dsl_expression=rule_in.dsl_expression,
             severity=rule_in.severity,
-            created_by_code=current_user.code
+            created_by_code=current_user.code,
+            shadow=rule_in.shadow
         )
     except RuleAlreadyExistsError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except RuleValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/", response_model=List[RuleResponse])
 def get_all_rules(use_case: CrudRuleUseCase = Depends(get_rule_crud_use_case)):
     return use_case.get_all()
 
+@router.get("/active-set", response_model=RuleSetVersionResponse)
+def get_active_rule_set(use_case: CrudRuleUseCase = Depends(get_rule_crud_use_case)):
+    """
+    Returns the version of the rule set snapshot the scoring engine is using in this worker.
+    """
+    return use_case.get_active_rule_set()
+
 @router.get("/{rule_id}", response_model=RuleResponse)
 def get_rule(
     rule_id: UUID,
@@ -61,6 +71,8 @@ def update_rule(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except RuleAlreadyExistsError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except RuleValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_rule(
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from ....application.use_cases.transaction_use_case import TransactionUseCases # Re-use to create tx
 from ....application.use_cases.scoring_use_case import ScoringUseCase
+from ....application.use_cases.scoring_ingestion_use_case import ScoringIngestionUseCase
 from ..schemas.transaction_schemas import TransactionCreate
-from ..schemas.scoring_schemas import ScoringResponse # Create this new schema
+from ..schemas.scoring_schemas import ScoringResponse, ScoringBatchRequest, ScoringBatchResponse, ScoringBatchItem
+from ....core.entities.transaction import Transaction
 from ....core.errors.customer_errors import CustomerNotFoundError
 from ....core.errors.merchant_errors import MerchantNotFoundError
 
-from ..dependencies import get_transaction_use_cases, get_scoring_use_case
+from ..dependencies import get_transaction_use_cases, get_scoring_use_case, get_scoring_ingestion_use_case
 
 router = APIRouter(
     prefix="/scoring",
@@ -15,28 +17,61 @@ router = APIRouter(
 )
 
 @router.post("/score-transaction", response_model=ScoringResponse, status_code=status.HTTP_200_OK)
-def score_transaction(
+async def score_transaction(
     tx_in: TransactionCreate,
-    tx_use_cases: TransactionUseCases = Depends(get_transaction_use_cases),
-    scoring_use_case: ScoringUseCase = Depends(get_scoring_use_case)
+    response: Response,
+    ingestion: ScoringIngestionUseCase = Depends(get_scoring_ingestion_use_case)
 ):
     """
     This endpoint simulates a real-time transaction authorization request.
-    It records the transaction AND returns the fraud decision.
+    It records the transaction AND returns the fraud decision, in a single database transaction.
+    The X-SQL-Statements header reports how many statements the request needed.
+    With a latency budget (SCORING_BUDGET_MS), 'degraded' lists the fallbacks taken to stay
+    within it and X-Scoring-Latency-Ms reports the time spent scoring.
     """
     try:
-        # 1. First, record the transaction to get a persistent entity
-        transaction_entity = tx_use_cases.record_transaction(tx_in.dict())
+        transaction_entity, action, details = await ingestion.execute_async(tx_in.dict())
+        response.headers["X-SQL-Statements"] = str(ingestion.last_statement_count)
+        if "latency" in details:
+            response.headers["X-Scoring-Latency-Ms"] = str(details["latency"]["elapsed_ms"])
 
-        # 2. Execute the scoring pipeline with the created transaction
-        action, details = scoring_use_case.execute(transaction_entity)
-        
         return ScoringResponse(
             transaction_id=transaction_entity.id,
             action=action,
             ml_score=details['ml_score'],
             final_score=details['final_score'],
-            rule_hits=details['rule_hits']
+            rule_hits=details['rule_hits'],
+            degraded=details.get('degraded', [])
         )
     except (CustomerNotFoundError, MerchantNotFoundError) as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.post("/score-batch", response_model=ScoringBatchResponse, status_code=status.HTTP_200_OK)
+def score_batch(
+    batch_in: ScoringBatchRequest,
+    tx_use_cases: TransactionUseCases = Depends(get_transaction_use_cases),
+    scoring_use_case: ScoringUseCase = Depends(get_scoring_use_case)
+):
+    """
+    Batch variant of /score-transaction for gateways that group authorizations.
+    Items that fail validation are reported individually; results keep the input order.
+    """
+    recorded = tx_use_cases.record_transactions([tx_in.dict() for tx_in in batch_in.transactions])
+    transactions = [item for item in recorded if isinstance(item, Transaction)]
+    decisions = iter(scoring_use_case.execute_batch(transactions)) if transactions else iter(())
+
+    results = []
+    for index, item in enumerate(recorded):
+        if not isinstance(item, Transaction):
+            results.append(ScoringBatchItem(index=index, error=str(item)))
+            continue
+        action, details = next(decisions)
+        results.append(ScoringBatchItem(
+            index=index,
+            transaction_id=item.id,
+            action=action,
+            ml_score=details['ml_score'],
+            final_score=details['final_score'],
+            rule_hits=details['rule_hits']
+        ))
+    return ScoringBatchResponse(results=results)
@@ -1,12 +1,14 @@
-import os
-from dotenv import load_dotenv
+import threading
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
-from ...infrastructure.database.models.base_db_model import Base
 from ...infrastructure.database.repositories.sqlalchemy_analyst_repository import SqlAlchemyAnalystRepository
 from ...infrastructure.database.repositories.sqlalchemy_role_repository import SqlAlchemyRoleRepository
 from ...infrastructure.security.bcrypt_password_hasher import BcryptPasswordHasher
@@ -18,61 +20,328 @@ from ...infrastructure.database.repositories.sqlalchemy_behavior_repository impo
 from ...infrastructure.database.repositories.sqlalchemy_rule_repository import SqlAlchemyRuleRepository
 from ...infrastructure.database.repositories.sqlalchemy_alert_repository import SqlAlchemyAlertRepository
 from ...infrastructure.database.repositories.sqlalchemy_case_repository import SqlAlchemyCaseRepository
-from ...infrastructure.strategies.simple_eval_evaluator import SimpleEvalEvaluator
+from ...infrastructure.database.repositories.sqlalchemy_alert_outbox_repository import SqlAlchemyAlertOutboxRepository
+from ...infrastructure.database.repositories.sqlalchemy_shadow_rule_hit_repository import SqlAlchemyShadowRuleHitRepository
+from ...infrastructure.database.repositories.async_sqlalchemy_alert_repository import AsyncSqlAlchemyAlertRepository
+from ...infrastructure.database.repositories.async_sqlalchemy_case_repository import AsyncSqlAlchemyCaseRepository
+from ...infrastructure.database.repositories.async_sqlalchemy_behavior_repository import AsyncSqlAlchemyBehaviorRepository
+from ...infrastructure.database.repositories.async_sqlalchemy_analyst_repository import AsyncSqlAlchemyAnalystRepository
+from ...infrastructure.strategies.vectorized_eval_evaluator import VectorizedEvalEvaluator
 from ...infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from ...infrastructure.cache.cached_customer_repository import CachedCustomerRepository
+from ...infrastructure.cache.cached_merchant_repository import CachedMerchantRepository
+from ...infrastructure.database.scoring_unit_of_work import SqlAlchemyScoringUnitOfWork
+from ...infrastructure.database.pooling import engine_options
+from ...infrastructure.database.process_pool_backtest_runner import ProcessPoolBacktestRunner
+from ...infrastructure.database.async_scoring_unit_of_work import AsyncSqlAlchemyScoringUnitOfWork
 from ...infrastructure.ml.xgb_scorer import XgbScorerStub
+from ...infrastructure.ml.xgb_tree_scorer import XgbTreeScorer
+from ...infrastructure.metrics.file_metrics_store import FileMetricsStore
 
 from ...application.services.decision_service import DecisionService
+from ...application.services.feature_builder import SCORING_FEATURE_SCHEMA
+from ...application.services.rule_set_cache import RuleSetCache
+from ...application.services.rule_evaluation_stats import RuleEvaluationStats
+from ...application.services.velocity_engine import VelocityEngine
+from ...application.services.alert_outbox_worker import AlertOutboxWorker
+from ...application.services.shadow_rule_runner import ShadowRuleRunner
+from ...application.services.champion_challenger_scorer import ChampionChallengerScorer
+from ...application.services.latency_budget import LatencyBudgetConfig, LatencyGuard
+from ...application.services.metrics import MetricsRegistry
+from ...application.services.scoring_metrics import ScoringMetrics
+from ...application.services.analyst_assignment import AnalystAssignmentService
+from ...application.services.reference_data_cache import ReferenceDataCache
+from ...application.services.warm_up import WorkerWarmUp
+from ...application.use_cases.alert_outbox_use_case import ProcessAlertOutboxUseCase
 from ...application.use_cases.scoring_use_case import ScoringUseCase
-from ...application.use_cases.case_use_cases import CaseUseCases
-from ...application.use_cases.alert_use_cases import AlertUseCases
+from ...application.use_cases.scoring_ingestion_use_case import ScoringIngestionUseCase
+from ...application.use_cases.case_use_cases import CaseUseCases, AsyncCaseUseCases
+from ...application.use_cases.alert_use_cases import AlertUseCases, AsyncAlertUseCases
 from ...application.use_cases.crud_rule_use_case import CrudRuleUseCase
-from ...application.use_cases.behavior_use_case import BehaviorUseCases
+from ...application.use_cases.backtest_use_case import BacktestUseCase
+from ...application.use_cases.behavior_use_case import BehaviorUseCases, AsyncBehaviorUseCases
 from ...application.use_cases.transaction_use_case import TransactionUseCases
 from ...application.use_cases.crud_merchant_use_case import CrudMerchantUseCase
 from ...application.use_cases.crud_customer_use_case import CrudCustomerUseCase
 from ...application.interfaces.i_analyst_repository import IAnalystRepository
+from ...application.interfaces.i_async_analyst_repository import IAsyncAnalystRepository
+from ...application.interfaces.i_async_alert_repository import IAsyncAlertRepository
+from ...application.interfaces.i_async_case_repository import IAsyncCaseRepository
+from ...application.interfaces.i_async_behavior_repository import IAsyncBehaviorRepository
 from ...application.interfaces.i_case_repository import ICaseRepository
 from ...application.interfaces.i_model_scorer import IModelScorer
 from ...application.interfaces.i_rule_repository import IRuleRepository
 from ...application.interfaces.i_behavior_repository import IBehaviorRepository
 from ...application.interfaces.i_alert_repository import IAlertRepository
+from ...application.interfaces.i_alert_outbox_repository import IAlertOutboxRepository
 from ...application.interfaces.i_transaction_repository import ITransactionRepository
 from ...application.interfaces.i_password_hasher import IPasswordHasher
 from ...application.interfaces.i_token_provider import ITokenProvider
 from ...application.interfaces.i_rule_evaluator import IRuleEvaluator
 from ...application.interfaces.i_unit_of_work import IUnitOfWork
+from ...application.interfaces.i_scoring_unit_of_work import IScoringUnitOfWork
+from ...application.interfaces.i_async_scoring_unit_of_work import IAsyncScoringUnitOfWork
 from ...application.use_cases.auth_use_case import AuthUseCase
 from ...application.use_cases.crud_analyst_use_case import CrudAnalystUseCase
 from ...application.use_cases.crud_role_use_case import CrudRoleUseCase
 from ...core.entities.analyst import Analyst
 from .schemas.token_schemas import TokenData, TokenPayload
-
-load_dotenv()
+from .settings import get_settings
 
 # --- Database Setup ---
-DB_USER = os.getenv("POSTGRES_USER", "fcore_user")
-DB_PASSWORD = os.getenv("POSTGRES_PASSWORD", "fcore_password")
-DB_HOST = os.getenv("POSTGRES_HOST", "localhost")
-DB_PORT = os.getenv("POSTGRES_PORT", "5432")
-DB_NAME = os.getenv("POSTGRES_DB", "fcore_db")
-
-# Cadena de conexión para PostgreSQL
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Settings, engines and the process-wide services below are created on first use
+# (lru_cache factories), so importing this module reads no .env file, opens no
+# connection and starts no thread. Tables are created by init_db.py.
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    settings = get_settings()
+    return create_engine(settings.database_url, **engine_options(**settings.pool))
+
+@lru_cache(maxsize=None)
+def get_session_factory() -> sessionmaker:
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+# Async engine (asyncpg) for the async endpoints: requests wait on the event loop
+# instead of holding a threadpool thread. Scripts and sync endpoints keep the sync engine.
+@lru_cache(maxsize=None)
+def get_async_engine() -> AsyncEngine:
+    settings = get_settings()
+    return create_async_engine(settings.async_database_url, **engine_options(**settings.pool, is_async=True))
+
+@lru_cache(maxsize=None)
+def get_async_session_factory() -> async_sessionmaker:
+    return async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+
+_LAZY_ATTRIBUTES = {
+    "engine": get_engine,
+    "SessionLocal": get_session_factory,
+    "async_engine": get_async_engine,
+    "AsyncSessionLocal": get_async_session_factory,
+}
+
+def __getattr__(name: str):
+    # Keeps 'from ...dependencies import SessionLocal, engine' working for scripts.
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_db():
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
         db.commit()
     finally:
         db.close()
 
+async def get_async_db():
+    async with get_async_session_factory()() as db:
+        yield db
+        await db.commit()
+
+# --- Process-wide services ---
+# One instance per worker process, shared by every request it handles.
+@lru_cache(maxsize=None)
+def get_rule_set_cache() -> RuleSetCache:
+    return RuleSetCache(
+        max_age_seconds=get_settings().rule_set_max_age_seconds,
+        known_names=SCORING_FEATURE_SCHEMA.names
+    )
+
+# Compiled per-transaction evaluation, plus array evaluation of whole batches (execute_batch)
+@lru_cache(maxsize=None)
+def get_rule_evaluator() -> IRuleEvaluator:
+    return VectorizedEvalEvaluator()
+
+@lru_cache(maxsize=None)
+def get_rule_evaluation_stats() -> RuleEvaluationStats:
+    return RuleEvaluationStats(reorder_every=get_settings().rule_reorder_every)
+
+@lru_cache(maxsize=None)
+def get_customer_cache() -> ReferenceDataCache:
+    return ReferenceDataCache("customers", **get_settings().reference_cache)
+
+@lru_cache(maxsize=None)
+def get_merchant_cache() -> ReferenceDataCache:
+    return ReferenceDataCache("merchants", **get_settings().reference_cache)
+
+# Metrics served on /metrics in the Prometheus text format. The scoring metrics are
+# registered with the registry even when disabled, so /metrics always has the same shape.
+@lru_cache(maxsize=None)
+def _build_metrics() -> Tuple[MetricsRegistry, ScoringMetrics]:
+    registry = MetricsRegistry()
+    return registry, ScoringMetrics(registry, rule_sample_every=get_settings().metrics_rule_sample_every)
+
+def get_metrics_registry() -> MetricsRegistry:
+    return _build_metrics()[0]
+
+def get_scoring_metrics() -> Optional[ScoringMetrics]:
+    return _build_metrics()[1] if get_settings().metrics_enabled else None
+
+@lru_cache(maxsize=None)
+def get_metrics_store() -> Optional[FileMetricsStore]:
+    settings = get_settings()
+    if not settings.metrics_multiproc_dir:
+        return None
+    return FileMetricsStore(
+        settings.metrics_multiproc_dir, get_metrics_registry(),
+        interval_seconds=settings.metrics_multiproc_interval_seconds
+    )
+
+@lru_cache(maxsize=None)
+def get_latency_guard() -> Optional[LatencyGuard]:
+    settings = get_settings()
+    if settings.scoring_budget_ms <= 0:
+        return None
+    return LatencyGuard(
+        LatencyBudgetConfig(
+            total_ms=settings.scoring_budget_ms,
+            features_ms=settings.scoring_features_deadline_ms,
+            rules_ms=settings.scoring_rules_deadline_ms,
+            model_ms=settings.scoring_model_deadline_ms,
+            alert_ms=settings.scoring_alert_deadline_ms,
+            features_cooldown_seconds=settings.scoring_features_cooldown_seconds
+        ),
+        model_workers=settings.scoring_model_workers
+    )
+
+@lru_cache(maxsize=None)
+def get_behavior_profile_cache() -> Optional[ReferenceDataCache]:
+    # Only read by the latency guard's cached-profile fallback
+    settings = get_settings()
+    if settings.scoring_budget_ms <= 0:
+        return None
+    return ReferenceDataCache(
+        "behavior_profiles",
+        max_entries=settings.behavior_profile_cache_max_entries,
+        ttl_seconds=settings.behavior_profile_cache_ttl_seconds
+    )
+
+@lru_cache(maxsize=None)
+def get_analyst_assignment() -> AnalystAssignmentService:
+    return AnalystAssignmentService(ttl_seconds=get_settings().analyst_roster_ttl_seconds)
+
+def build_alert_outbox_use_case() -> ProcessAlertOutboxUseCase:
+    return ProcessAlertOutboxUseCase(
+        uow=SqlAlchemyUnitOfWork(session_factory=get_session_factory()),
+        max_attempts=get_settings().alert_outbox_max_attempts,
+        analyst_assignment=get_analyst_assignment()
+    )
+
+@lru_cache(maxsize=None)
+def get_alert_outbox_worker() -> Optional[AlertOutboxWorker]:
+    settings = get_settings()
+    if not settings.alert_outbox_enabled:
+        return None
+    return AlertOutboxWorker(
+        use_case_factory=build_alert_outbox_use_case,
+        batch_size=settings.alert_outbox_batch_size,
+        poll_interval_seconds=settings.alert_outbox_poll_seconds
+    )
+
+def write_shadow_rule_hits(hits) -> None:
+    db = get_session_factory()()
+    try:
+        SqlAlchemyShadowRuleHitRepository(db).add_many(hits)
+    finally:
+        db.close()
+
+@lru_cache(maxsize=None)
+def get_shadow_rule_runner() -> Optional[ShadowRuleRunner]:
+    settings = get_settings()
+    if settings.shadow_rule_workers <= 0:
+        return None
+    return ShadowRuleRunner(
+        evaluator=get_rule_evaluator(),
+        write_hits=write_shadow_rule_hits,
+        workers=settings.shadow_rule_workers,
+        queue_size=settings.shadow_rule_queue_size,
+        flush_size=settings.shadow_rule_flush_size,
+        flush_interval_seconds=settings.shadow_rule_flush_seconds
+    )
+
+@lru_cache(maxsize=None)
+def get_velocity_engine() -> Optional[VelocityEngine]:
+    settings = get_settings()
+    if not settings.velocity_engine_enabled:
+        return None
+    return VelocityEngine(max_memory_bytes=settings.velocity_max_memory_bytes)
+
+def bootstrap_velocity_engine():
+    """Loads the last 24h of transactions into the velocity engine (cold start)."""
+    velocity_engine = get_velocity_engine()
+    if velocity_engine is None:
+        return
+    db = get_session_factory()()
+    try:
+        since = datetime.now(timezone.utc) - timedelta(hours=24)
+        velocity_engine.bootstrap(SqlAlchemyTransactionRepository(db).get_activity_since(since))
+    finally:
+        db.close()
+
+def _load_model(path: str) -> IModelScorer:
+    settings = get_settings()
+    return XgbTreeScorer.from_file(
+        path,
+        feature_names=settings.ml_model_features,
+        schema=SCORING_FEATURE_SCHEMA,
+        schema_version=settings.ml_model_schema_version
+    )
+
+@lru_cache(maxsize=None)
+def get_model_scorer() -> IModelScorer:
+    settings = get_settings()
+    champion = _load_model(settings.ml_model_path) if settings.ml_model_path else XgbScorerStub()
+    if not settings.ml_challenger_models:
+        return champion
+    return ChampionChallengerScorer(
+        champion,
+        {name: _load_model(path) for name, path in settings.ml_challenger_models.items()},
+        budget_seconds=settings.ml_challenger_budget_ms / 1000,
+        workers=settings.ml_challenger_workers,
+        max_pending=settings.ml_challenger_max_pending
+    )
+
+# --- Worker warm-up ---
+# Run at startup, before the worker accepts connections; /health/ready reports the outcome.
+def warm_up_rule_set() -> str:
+    db = get_session_factory()()
+    try:
+        snapshot = get_rule_set_cache().refresh(SqlAlchemyRuleRepository(db))
+    finally:
+        db.close()
+    compiled = get_rule_evaluator().prepare(snapshot.rules)
+    return f"v{snapshot.version}: {len(snapshot.rules)} rules, {compiled} compiled"
+
+def warm_up_model() -> str:
+    # Loads the model file; the first prediction pays for any remaining lazy initialization
+    scorer = get_model_scorer()
+    scorer.score({})
+    if isinstance(scorer, ChampionChallengerScorer):
+        return f"{type(scorer.champion).__name__} + {len(get_settings().ml_challenger_models)} challengers"
+    return type(scorer).__name__
+
+def warm_up_db_pool() -> int:
+    connections = [get_engine().connect() for _ in range(get_settings().pool_warm_connections)]
+    for connection in connections:
+        connection.close()
+    return len(connections)
+
+async def warm_up_async_db_pool() -> int:
+    connections = [await get_async_engine().connect() for _ in range(get_settings().pool_warm_connections)]
+    for connection in connections:
+        await connection.close()
+    return len(connections)
+
+@lru_cache(maxsize=None)
+def get_worker_warm_up() -> WorkerWarmUp:
+    warm_up = WorkerWarmUp()
+    warm_up.add_step("db_pool", warm_up_db_pool)
+    warm_up.add_step("async_db_pool", warm_up_async_db_pool)
+    warm_up.add_step("rule_set", warm_up_rule_set)
+    warm_up.add_step("model", warm_up_model)
+    warm_up.add_step("velocity_engine", bootstrap_velocity_engine)
+    return warm_up
+
 # --- Security & Auth Dependencies ---
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -99,7 +368,7 @@ def get_transaction_repo(db: Session = Depends(get_db)):
     return SqlAlchemyTransactionRepository(db)
 
 def get_behavior_repo(db: Session = Depends(get_db)):
-    return SqlAlchemyBehaviorRepository(db)
+    return SqlAlchemyBehaviorRepository(db, use_rollups=get_settings().behavior_rollups_enabled)
 
 def get_rule_repo(db: Session = Depends(get_db)):
     return SqlAlchemyRuleRepository(db)
@@ -110,25 +379,57 @@ def get_alert_repo(db: Session = Depends(get_db)):
 def get_case_repo(db: Session = Depends(get_db)):
     return SqlAlchemyCaseRepository(db)
 
+def get_async_analyst_repo(db: AsyncSession = Depends(get_async_db)):
+    return AsyncSqlAlchemyAnalystRepository(db)
+
+def get_async_behavior_repo(db: AsyncSession = Depends(get_async_db)):
+    return AsyncSqlAlchemyBehaviorRepository(db)
+
+def get_async_alert_repo(db: AsyncSession = Depends(get_async_db)):
+    return AsyncSqlAlchemyAlertRepository(db)
+
+def get_async_case_repo(db: AsyncSession = Depends(get_async_db)):
+    return AsyncSqlAlchemyCaseRepository(db)
+
+def get_alert_outbox_repo(db: Session = Depends(get_db)) -> Optional[IAlertOutboxRepository]:
+    return SqlAlchemyAlertOutboxRepository(db) if get_settings().alert_outbox_enabled else None
+
+def get_alert_outbox_stats_repo(db: Session = Depends(get_db)) -> IAlertOutboxRepository:
+    return SqlAlchemyAlertOutboxRepository(db)
+
 def get_uow():
-    return SqlAlchemyUnitOfWork(session_factory=SessionLocal)
+    return SqlAlchemyUnitOfWork(session_factory=get_session_factory())
+
+def get_scoring_uow() -> IScoringUnitOfWork:
+    return SqlAlchemyScoringUnitOfWork(
+        session_factory=get_session_factory(),
+        use_rollups=get_settings().behavior_rollups_enabled,
+        customer_cache=get_customer_cache(),
+        merchant_cache=get_merchant_cache()
+    )
 
-# --- Service Dependencies ---
-def get_model_scorer() -> IModelScorer:
-    return XgbScorerStub()
+def get_async_scoring_uow() -> IAsyncScoringUnitOfWork:
+    return AsyncSqlAlchemyScoringUnitOfWork(
+        async_session_factory=get_async_session_factory(),
+        use_rollups=get_settings().behavior_rollups_enabled,
+        customer_cache=get_customer_cache(),
+        merchant_cache=get_merchant_cache()
+    )
 
+# --- Service Dependencies ---
 def get_decision_service() -> DecisionService:
     return DecisionService()
 
-def get_rule_evaluator() -> IRuleEvaluator:
-    return SimpleEvalEvaluator()
+def get_db_engines() -> Dict[str, Engine]:
+    return {"sync": get_engine(), "async": get_async_engine().sync_engine}
 
 # --- Use Case Dependencies ---
 def get_analyst_crud_use_case(
     uow: IUnitOfWork = Depends(get_uow),
-    hasher: BcryptPasswordHasher = Depends(get_password_hasher)
+    hasher: BcryptPasswordHasher = Depends(get_password_hasher),
+    assignment: AnalystAssignmentService = Depends(get_analyst_assignment)
 ):
-    return CrudAnalystUseCase(uow=uow, password_service=hasher)
+    return CrudAnalystUseCase(uow=uow, password_service=hasher, analyst_assignment=assignment)
 
 def get_role_crud_use_case(repo: SqlAlchemyRoleRepository = Depends(get_role_repo)):
     return CrudRoleUseCase(role_repository=repo)
@@ -140,37 +441,76 @@ def get_auth_use_case(
 ):
     return AuthUseCase(analyst_repo=repo, password_hasher=hasher, token_service=token_service)
 
-def get_customer_crud_use_case(repo: SqlAlchemyCustomerRepository = Depends(get_customer_repo)):
-    return CrudCustomerUseCase(customer_repository=repo)
+def get_customer_crud_use_case(
+    repo: SqlAlchemyCustomerRepository = Depends(get_customer_repo),
+    cache: ReferenceDataCache = Depends(get_customer_cache)
+):
+    return CrudCustomerUseCase(customer_repository=repo, cache=cache)
 
-def get_merchant_crud_use_case(repo: SqlAlchemyMerchantRepository = Depends(get_merchant_repo)):
-    return CrudMerchantUseCase(merchant_repository=repo)
+def get_merchant_crud_use_case(
+    repo: SqlAlchemyMerchantRepository = Depends(get_merchant_repo),
+    cache: ReferenceDataCache = Depends(get_merchant_cache)
+):
+    return CrudMerchantUseCase(merchant_repository=repo, cache=cache)
 
 def get_transaction_use_cases(
     transaction_repo: SqlAlchemyTransactionRepository = Depends(get_transaction_repo),
     customer_repo: SqlAlchemyCustomerRepository = Depends(get_customer_repo),
-    merchant_repo: SqlAlchemyMerchantRepository = Depends(get_merchant_repo)
+    merchant_repo: SqlAlchemyMerchantRepository = Depends(get_merchant_repo),
+    velocity: Optional[VelocityEngine] = Depends(get_velocity_engine),
+    customer_cache: ReferenceDataCache = Depends(get_customer_cache),
+    merchant_cache: ReferenceDataCache = Depends(get_merchant_cache)
 ):
     return TransactionUseCases(
         transaction_repository=transaction_repo,
-        customer_repository=customer_repo,
-        merchant_repository=merchant_repo
+        customer_repository=CachedCustomerRepository(customer_repo, customer_cache),
+        merchant_repository=CachedMerchantRepository(merchant_repo, merchant_cache),
+        velocity_engine=velocity
     )
     
 def get_behavior_use_cases(repo: SqlAlchemyBehaviorRepository = Depends(get_behavior_repo)):
     return BehaviorUseCases(behavior_repository=repo)
 
-def get_rule_crud_use_case(repo: SqlAlchemyRuleRepository = Depends(get_rule_repo)):
-    return CrudRuleUseCase(rule_repository=repo)
+def get_async_behavior_use_cases(repo: IAsyncBehaviorRepository = Depends(get_async_behavior_repo)):
+    return AsyncBehaviorUseCases(behavior_repository=repo)
+
+def get_rule_crud_use_case(
+    repo: SqlAlchemyRuleRepository = Depends(get_rule_repo),
+    cache: RuleSetCache = Depends(get_rule_set_cache)
+):
+    return CrudRuleUseCase(rule_repository=repo, rule_set_cache=cache, known_names=SCORING_FEATURE_SCHEMA.names)
+
+@lru_cache(maxsize=None)
+def get_backtest_slot() -> threading.Lock:
+    # Held by the running backtest of this worker, so requests never stack process pools
+    return threading.Lock()
+
+def get_backtest_use_case(repo: SqlAlchemyRuleRepository = Depends(get_rule_repo)):
+    settings = get_settings()
+    runner = ProcessPoolBacktestRunner(settings.database_url, workers=settings.backtest_workers,
+                                       batch_rows=settings.backtest_batch_rows)
+    return BacktestUseCase(rule_repository=repo, runner=runner, known_names=SCORING_FEATURE_SCHEMA.names,
+                           max_range=timedelta(days=settings.backtest_max_days), slot=get_backtest_slot())
 
 def get_alert_use_cases(repo: SqlAlchemyAlertRepository = Depends(get_alert_repo)):
     return AlertUseCases(alert_repository=repo)
 
 def get_case_use_cases(
     case_repo: SqlAlchemyCaseRepository = Depends(get_case_repo),
-    alert_repo: IAlertRepository = Depends(get_alert_repo) # Inject alert repo
+    alert_repo: IAlertRepository = Depends(get_alert_repo), # Inject alert repo
+    assignment: AnalystAssignmentService = Depends(get_analyst_assignment)
+):
+    return CaseUseCases(case_repository=case_repo, alert_repository=alert_repo, analyst_assignment=assignment)
+
+def get_async_alert_use_cases(repo: IAsyncAlertRepository = Depends(get_async_alert_repo)):
+    return AsyncAlertUseCases(alert_repository=repo)
+
+def get_async_case_use_cases(
+    case_repo: IAsyncCaseRepository = Depends(get_async_case_repo),
+    alert_repo: IAsyncAlertRepository = Depends(get_async_alert_repo),
+    assignment: AnalystAssignmentService = Depends(get_analyst_assignment)
 ):
-    return CaseUseCases(case_repository=case_repo, alert_repository=alert_repo)
+    return AsyncCaseUseCases(case_repository=case_repo, alert_repository=alert_repo, analyst_assignment=assignment)
 
 def get_scoring_use_case(
     transaction_repo: ITransactionRepository = Depends(get_transaction_repo),
@@ -181,7 +521,14 @@ def get_scoring_use_case(
     case_repo: ICaseRepository = Depends(get_case_repo),
     analyst_repo: IAnalystRepository = Depends(get_analyst_repo),
     scorer: IModelScorer = Depends(get_model_scorer),
-    decision_service: DecisionService = Depends(get_decision_service)
+    decision_service: DecisionService = Depends(get_decision_service),
+    rule_set_cache: RuleSetCache = Depends(get_rule_set_cache),
+    velocity: Optional[VelocityEngine] = Depends(get_velocity_engine),
+    alert_outbox_repo: Optional[IAlertOutboxRepository] = Depends(get_alert_outbox_repo),
+    assignment: AnalystAssignmentService = Depends(get_analyst_assignment),
+    rule_stats: RuleEvaluationStats = Depends(get_rule_evaluation_stats),
+    shadow_runner: Optional[ShadowRuleRunner] = Depends(get_shadow_rule_runner),
+    metrics: Optional[ScoringMetrics] = Depends(get_scoring_metrics)
 ):
     return ScoringUseCase(
         transaction_repo=transaction_repo,
@@ -192,7 +539,46 @@ def get_scoring_use_case(
         case_repo=case_repo,
         analyst_repo=analyst_repo,
         scorer=scorer,
-        decision_service=decision_service
+        decision_service=decision_service,
+        rule_set_cache=rule_set_cache,
+        velocity_engine=velocity,
+        alert_outbox_repo=alert_outbox_repo,
+        analyst_assignment=assignment,
+        rule_stats=rule_stats,
+        rule_audit=get_settings().rule_audit_mode,
+        shadow_runner=shadow_runner,
+        metrics=metrics
+    )
+
+def get_scoring_ingestion_use_case(
+    uow: IAsyncScoringUnitOfWork = Depends(get_async_scoring_uow),
+    evaluator: IRuleEvaluator = Depends(get_rule_evaluator),
+    scorer: IModelScorer = Depends(get_model_scorer),
+    decision_service: DecisionService = Depends(get_decision_service),
+    rule_set_cache: RuleSetCache = Depends(get_rule_set_cache),
+    velocity: Optional[VelocityEngine] = Depends(get_velocity_engine),
+    assignment: AnalystAssignmentService = Depends(get_analyst_assignment),
+    rule_stats: RuleEvaluationStats = Depends(get_rule_evaluation_stats),
+    shadow_runner: Optional[ShadowRuleRunner] = Depends(get_shadow_rule_runner),
+    guard: Optional[LatencyGuard] = Depends(get_latency_guard),
+    behavior_cache: Optional[ReferenceDataCache] = Depends(get_behavior_profile_cache),
+    metrics: Optional[ScoringMetrics] = Depends(get_scoring_metrics)
+):
+    return ScoringIngestionUseCase(
+        uow=uow,
+        scorer=scorer,
+        decision_service=decision_service,
+        rule_evaluator=evaluator,
+        rule_set_cache=rule_set_cache,
+        velocity_engine=velocity,
+        analyst_assignment=assignment,
+        use_alert_outbox=get_settings().alert_outbox_enabled,
+        rule_stats=rule_stats,
+        rule_audit=get_settings().rule_audit_mode,
+        shadow_runner=shadow_runner,
+        latency_guard=guard,
+        behavior_cache=behavior_cache,
+        metrics=metrics
     )
 
 # --- Obtaining current user logic ---
@@ -216,9 +602,9 @@ async def get_current_analyst(
 
 async def get_current_active_analyst_entity(
     payload: TokenPayload = Depends(get_current_analyst),
-    analyst_repo: IAnalystRepository = Depends(get_analyst_repo)
+    analyst_repo: IAsyncAnalystRepository = Depends(get_async_analyst_repo)
 ) -> Analyst:
-    analyst = analyst_repo.find_by_code(code=payload.sub)
+    analyst = await analyst_repo.find_by_code(code=payload.sub)
     if analyst is None or not analyst.is_active:
         raise HTTPException(status_code=401, detail="User not found or inactive")
     return analyst
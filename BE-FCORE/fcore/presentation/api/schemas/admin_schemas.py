@@ -0,0 +1,137 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+class VelocityEngineStatsResponse(BaseModel):
+    enabled: bool
+    ready: bool = False
+    customers: int = 0
+    buckets: int = 0
+    memory_bytes: int = 0
+    max_memory_bytes: int = 0
+    evictions: int = 0
+
+class AlertOutboxStatsResponse(BaseModel):
+    enabled: bool
+    worker_running: bool = False
+    pending: int
+    dead: int
+    oldest_pending_created_at: Optional[datetime] = None
+    lag_seconds: float
+    processed_total: int = 0
+    failed_total: int = 0
+
+class ReferenceCacheStatsResponse(BaseModel):
+    name: str
+    size: int
+    max_entries: int
+    hits: int
+    negative_hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float
+
+class PoolWaitBucket(BaseModel):
+    le: str
+    count: int
+
+class DbPoolStatsResponse(BaseModel):
+    name: str
+    pool_class: str
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    max_overflow: int
+    timeout_seconds: float
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_sum: float = 0.0
+    wait_seconds_max: float = 0.0
+    wait_histogram: List[PoolWaitBucket] = []
+
+class RuleEvaluationStatsResponse(BaseModel):
+    rule_id: str
+    evaluations: int
+    hits: int
+    hit_rate: float
+    mean_cost_us: float
+
+class ShadowRuleStatsEntry(BaseModel):
+    rule_id: str
+    rule_name: str
+    evaluations: int
+    hits: int
+    hit_rate: float
+
+class ShadowRuleStatsResponse(BaseModel):
+    enabled: bool
+    running: bool = False
+    workers: int = 0
+    queue_depth: int = 0
+    queue_size: int = 0
+    submitted_total: int = 0
+    dropped_total: int = 0
+    written_hits: int = 0
+    failed_flushes: int = 0
+    rules: List[ShadowRuleStatsEntry] = []
+
+class ChallengerModelStats(BaseModel):
+    name: str
+    scored: int
+    dropped: int
+    timed_out: int
+    failed: int
+    same_action_rate: float
+    mean_abs_diff: float
+    max_abs_diff: float
+    mean_latency_ms: float
+    max_latency_ms: float
+
+class ModelChallengersResponse(BaseModel):
+    enabled: bool
+    champion: Optional[str] = None
+    budget_ms: float = 0.0
+    pending: int = 0
+    max_pending: int = 0
+    challengers: List[ChallengerModelStats] = []
+
+class LatencyBudgetStatsResponse(BaseModel):
+    enabled: bool
+    budget_ms: float = 0.0
+    stage_deadlines_ms: Dict[str, float] = {}
+    requests: int = 0
+    over_budget: int = 0
+    stage_overruns: Dict[str, int] = {}
+    degraded: Dict[str, int] = {}
+    skipping_feature_fetch: bool = False
+
+class BacktestRequest(BaseModel):
+    start: datetime
+    end: datetime
+    # Candidate expression; when omitted the live rule set (enabled, not shadow) is replayed
+    dsl_expression: Optional[str] = None
+
+class BacktestDay(BaseModel):
+    day: str
+    rows: int
+    hits: int
+    hit_rate: Optional[float] = None
+
+class RuleBacktestResponse(BaseModel):
+    rule_id: str
+    rule_name: str
+    dsl_expression: str
+    hits: int
+    hit_rate: Optional[float] = None
+    fraud_hits: int
+    precision: Optional[float] = None
+    recall: Optional[float] = None
+    by_day: List[BacktestDay] = []
+
+class BacktestResponse(BaseModel):
+    start: datetime
+    end: datetime
+    rows: int
+    fraud_rows: int
+    rules: List[RuleBacktestResponse]
@@ -0,0 +1,11 @@
+from typing import Dict, Optional
+from pydantic import BaseModel
+
+class WarmUpStepResponse(BaseModel):
+    ok: bool
+    seconds: float
+    detail: Optional[str] = None
+
+class ReadinessResponse(BaseModel):
+    ready: bool
+    steps: Dict[str, WarmUpStepResponse]
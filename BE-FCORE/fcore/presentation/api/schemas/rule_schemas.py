@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 from ....core.entities.rule import RuleSeverity
@@ -10,21 +10,33 @@ class RuleBase(BaseModel):
     severity: RuleSeverity
 
 class RuleCreate(RuleBase):
-    pass
+    shadow: bool = False
 
 class RuleUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=5, max_length=150)
     dsl_expression: Optional[str] = Field(None, min_length=10, max_length=1024)
     severity: Optional[RuleSeverity] = None
     enabled: Optional[bool] = None
+    shadow: Optional[bool] = None
 
 class RuleResponse(RuleBase):
     id: UUID
     enabled: bool
+    shadow: bool = False
     created_at: datetime
     created_by: str
     updated_at: Optional[datetime] | None = None
     updated_by: str | None = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class RuleSetVersionResponse(BaseModel):
+    version: int
+    rule_count: int
+    loaded_at: Optional[datetime] = None
+    age_seconds: Optional[float] = None
+    max_age_seconds: float
+    referenced_features: List[str] = []
+    indexed_rules: int = 0
+    shadow_rule_count: int = 0
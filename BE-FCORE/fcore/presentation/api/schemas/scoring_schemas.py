@@ -1,11 +1,31 @@
-from pydantic import BaseModel
-from typing import List, Dict, Any
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Optional
 from uuid import UUID
 from ....core.entities.alert import AlertAction
+from .transaction_schemas import TransactionCreate
+
+MAX_BATCH_SIZE = 1000
 
 class ScoringResponse(BaseModel):
     transaction_id: UUID
     action: AlertAction
-    ml_score: float
+    # None when the model missed its deadline and the decision was made on rules alone
+    ml_score: Optional[float] = None
     final_score: float
-    rule_hits: List[Dict[str, Any]]
\ No newline at end of file
+    rule_hits: List[Dict[str, Any]]
+    degraded: List[str] = []
+
+class ScoringBatchRequest(BaseModel):
+    transactions: List[TransactionCreate] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+class ScoringBatchItem(BaseModel):
+    index: int
+    transaction_id: Optional[UUID] = None
+    action: Optional[AlertAction] = None
+    ml_score: Optional[float] = None
+    final_score: Optional[float] = None
+    rule_hits: List[Dict[str, Any]] = []
+    error: Optional[str] = None
+
+class ScoringBatchResponse(BaseModel):
+    results: List[ScoringBatchItem]
@@ -0,0 +1,177 @@
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+def _flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() == "true"
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Environment configuration of the API worker, read once on first use (see
+    get_settings) rather than when a module is imported.
+    """
+    # --- Database ---
+    database_url: str
+    async_database_url: str
+    # Connection pool (per engine, per worker process). DB_PGBOUNCER=true for PgBouncer in transaction mode.
+    pool: Dict[str, Any]
+    # Connections opened by the worker warm-up
+    pool_warm_connections: int
+
+    # --- Rules ---
+    rule_set_max_age_seconds: float
+    # Rule cost/hit counters that order each severity tier; RULE_AUDIT_MODE evaluates every rule
+    # instead of stopping at the first critical hit, so alerts carry the full hit list.
+    rule_reorder_every: int
+    rule_audit_mode: bool
+    # Shadow rules: evaluated on live traffic by background threads after the decision,
+    # hits logged to 'shadow_rule_hits' in batches. SHADOW_RULE_WORKERS=0 disables them.
+    shadow_rule_workers: int
+    shadow_rule_queue_size: int
+    shadow_rule_flush_size: int
+    shadow_rule_flush_seconds: float
+    # Backtests run by POST /admin/backtest: worker processes (one shard of customers each, capped at the
+    # CPU count) and transactions per evaluated batch. One backtest at a time per API worker, over at most
+    # BACKTEST_MAX_DAYS days; longer ones belong in backtest_rules.py.
+    backtest_workers: int
+    backtest_batch_rows: int
+    backtest_max_days: int
+
+    # --- Caches ---
+    # Customers and merchants for the scoring path (read-through, invalidated by the CRUD use cases)
+    reference_cache: Dict[str, Any]
+    analyst_roster_ttl_seconds: float
+    # Long behavior windows from the 'transactions_hourly' continuous aggregate (created by init_db.py)
+    behavior_rollups_enabled: bool
+    # In-memory velocity counters. Only correct when this process sees all the traffic
+    # of the customers it scores (single worker or customer-sharded routing), so it is opt-in.
+    velocity_engine_enabled: bool
+    velocity_max_memory_bytes: int
+
+    # --- Alerts ---
+    # Alerts and cases are created by a background worker from the 'alert_outbox' table
+    # instead of on the scoring path.
+    alert_outbox_enabled: bool
+    alert_outbox_max_attempts: int
+    alert_outbox_batch_size: int
+    alert_outbox_poll_seconds: float
+
+    # --- Metrics ---
+    # METRICS_ENABLED=false keeps the registry (and /metrics) but stops the scoring path from recording.
+    metrics_enabled: bool
+    # Rule timings are recorded on one transaction in METRICS_RULE_SAMPLE_EVERY (one observation per rule each)
+    metrics_rule_sample_every: int
+    # With several workers (uvicorn --workers) set METRICS_MULTIPROC_DIR to an empty directory shared by
+    # them: /metrics then reports the sum of every worker instead of the one that answered the scrape.
+    metrics_multiproc_dir: Optional[str]
+    metrics_multiproc_interval_seconds: float
+
+    # --- Latency budget ---
+    # Budget of /scoring/score-transaction, with a deadline per stage (see LatencyGuard).
+    # SCORING_BUDGET_MS=0 disables it: every stage then runs to completion.
+    scoring_budget_ms: float
+    scoring_features_deadline_ms: float
+    scoring_rules_deadline_ms: float
+    scoring_model_deadline_ms: float
+    scoring_alert_deadline_ms: float
+    scoring_features_cooldown_seconds: float
+    scoring_model_workers: int
+    # Last profile scored per customer: the fallback while the stored ones are slow to read
+    behavior_profile_cache_max_entries: int
+    behavior_profile_cache_ttl_seconds: float
+
+    # --- Model ---
+    # XGBoost JSON model (save_model or JSON dump) served with NumPy; the heuristic stub without ML_MODEL_PATH.
+    # ML_MODEL_FEATURES (comma-separated) is required for dumps and overrides a saved model's feature names.
+    ml_model_path: Optional[str]
+    ml_model_features: Optional[List[str]]
+    # Feature schema version the model was trained against; loading fails if it differs from SCORING_FEATURE_SCHEMA.
+    ml_model_schema_version: Optional[str]
+    # Challenger models scored next to the champion for comparison only: "name=path,name=path".
+    # Same JSON formats, ML_MODEL_FEATURES and schema version as ML_MODEL_PATH.
+    ml_challenger_models: Dict[str, str]
+    ml_challenger_budget_ms: float
+    ml_challenger_workers: int
+    ml_challenger_max_pending: int
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        user = os.getenv("POSTGRES_USER", "fcore_user")
+        password = os.getenv("POSTGRES_PASSWORD", "fcore_password")
+        host = os.getenv("POSTGRES_HOST", "localhost")
+        port = os.getenv("POSTGRES_PORT", "5432")
+        name = os.getenv("POSTGRES_DB", "fcore_db")
+        pool = dict(
+            pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE_SECONDS", "-1")),
+            pre_ping=_flag("DB_POOL_PRE_PING", "false"),
+            statement_timeout_ms=int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0")) or None,
+            pgbouncer=_flag("DB_PGBOUNCER", "false")
+        )
+        return cls(
+            # Cadena de conexión para PostgreSQL
+            database_url=f"postgresql://{user}:{password}@{host}:{port}/{name}",
+            # Async engine (asyncpg) for the async endpoints
+            async_database_url=f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{name}",
+            pool=pool,
+            pool_warm_connections=min(int(os.getenv("DB_POOL_WARM_CONNECTIONS", "2")), pool["pool_size"]),
+            rule_set_max_age_seconds=float(os.getenv("RULE_SET_MAX_AGE_SECONDS", "30")),
+            rule_reorder_every=int(os.getenv("RULE_REORDER_EVERY", "10000")),
+            rule_audit_mode=_flag("RULE_AUDIT_MODE", "false"),
+            shadow_rule_workers=int(os.getenv("SHADOW_RULE_WORKERS", "1")),
+            shadow_rule_queue_size=int(os.getenv("SHADOW_RULE_QUEUE_SIZE", "10000")),
+            shadow_rule_flush_size=int(os.getenv("SHADOW_RULE_FLUSH_SIZE", "500")),
+            shadow_rule_flush_seconds=float(os.getenv("SHADOW_RULE_FLUSH_SECONDS", "5")),
+            backtest_workers=max(min(int(os.getenv("BACKTEST_WORKERS", "2")), os.cpu_count() or 1), 1),
+            backtest_batch_rows=int(os.getenv("BACKTEST_BATCH_ROWS", "10000")),
+            backtest_max_days=int(os.getenv("BACKTEST_MAX_DAYS", "31")),
+            reference_cache=dict(
+                max_entries=int(os.getenv("REFERENCE_CACHE_MAX_ENTRIES", "100000")),
+                ttl_seconds=float(os.getenv("REFERENCE_CACHE_TTL_SECONDS", "300")),
+                negative_ttl_seconds=float(os.getenv("REFERENCE_CACHE_NEGATIVE_TTL_SECONDS", "30"))
+            ),
+            analyst_roster_ttl_seconds=float(os.getenv("ANALYST_ROSTER_TTL_SECONDS", "60")),
+            behavior_rollups_enabled=_flag("BEHAVIOR_ROLLUPS_ENABLED", "false"),
+            velocity_engine_enabled=_flag("VELOCITY_ENGINE_ENABLED", "false"),
+            velocity_max_memory_bytes=int(os.getenv("VELOCITY_MAX_MEMORY_BYTES", str(64 * 1024 * 1024))),
+            alert_outbox_enabled=_flag("ALERT_OUTBOX_ENABLED", "false"),
+            alert_outbox_max_attempts=int(os.getenv("ALERT_OUTBOX_MAX_ATTEMPTS", "10")),
+            alert_outbox_batch_size=int(os.getenv("ALERT_OUTBOX_BATCH_SIZE", "100")),
+            alert_outbox_poll_seconds=float(os.getenv("ALERT_OUTBOX_POLL_SECONDS", "1")),
+            metrics_enabled=_flag("METRICS_ENABLED", "true"),
+            metrics_rule_sample_every=int(os.getenv("METRICS_RULE_SAMPLE_EVERY", "10")),
+            metrics_multiproc_dir=os.getenv("METRICS_MULTIPROC_DIR") or None,
+            metrics_multiproc_interval_seconds=float(os.getenv("METRICS_MULTIPROC_INTERVAL_SECONDS", "5")),
+            scoring_budget_ms=float(os.getenv("SCORING_BUDGET_MS", "0")),
+            scoring_features_deadline_ms=float(os.getenv("SCORING_FEATURES_DEADLINE_MS", "40")),
+            scoring_rules_deadline_ms=float(os.getenv("SCORING_RULES_DEADLINE_MS", "20")),
+            scoring_model_deadline_ms=float(os.getenv("SCORING_MODEL_DEADLINE_MS", "30")),
+            scoring_alert_deadline_ms=float(os.getenv("SCORING_ALERT_DEADLINE_MS", "40")),
+            scoring_features_cooldown_seconds=float(os.getenv("SCORING_FEATURES_COOLDOWN_SECONDS", "5")),
+            scoring_model_workers=int(os.getenv("SCORING_MODEL_WORKERS", "4")),
+            behavior_profile_cache_max_entries=int(os.getenv("BEHAVIOR_PROFILE_CACHE_MAX_ENTRIES", "100000")),
+            behavior_profile_cache_ttl_seconds=float(os.getenv("BEHAVIOR_PROFILE_CACHE_TTL_SECONDS", "86400")),
+            ml_model_path=os.getenv("ML_MODEL_PATH"),
+            ml_model_features=[name for name in os.getenv("ML_MODEL_FEATURES", "").split(",") if name] or None,
+            ml_model_schema_version=os.getenv("ML_MODEL_SCHEMA_VERSION"),
+            ml_challenger_models={
+                name.strip(): path.strip()
+                for name, path in (entry.split("=", 1) for entry in os.getenv("ML_CHALLENGER_MODELS", "").split(",")
+                                   if "=" in entry)
+            },
+            ml_challenger_budget_ms=float(os.getenv("ML_CHALLENGER_BUDGET_MS", "50")),
+            ml_challenger_workers=int(os.getenv("ML_CHALLENGER_WORKERS", "2")),
+            ml_challenger_max_pending=int(os.getenv("ML_CHALLENGER_MAX_PENDING", "1000"))
+        )
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    # .env is loaded here, on first use, so importing the app never changes os.environ
+    load_dotenv()
+    return Settings.from_env()
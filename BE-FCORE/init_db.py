@@ -14,6 +14,8 @@ from fcore.infrastructure.database.models.behavior_profile_model import Behavior
 from fcore.infrastructure.database.models.rule_model import RuleModel
 from fcore.infrastructure.database.models.alert_model import AlertModel
 from fcore.infrastructure.database.models.case_model import CaseModel
+from fcore.infrastructure.database.models.alert_outbox_model import AlertOutboxModel
+from fcore.infrastructure.database.models.shadow_rule_hit_model import ShadowRuleHitModel
 
 load_dotenv()
 
@@ -27,6 +29,37 @@ DB_NAME = os.getenv("POSTGRES_DB", "fcore_db")
 # Cadena de conexión para PostgreSQL
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+# Agregado continuo horario por cliente y pais: el repositorio de comportamiento
+# lee de aqui las ventanas largas (24h / 30 dias) en lugar de las filas crudas.
+# materialized_only = false: los buckets aun no materializados se calculan al vuelo.
+CREATE_HOURLY_AGGREGATE = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS transactions_hourly
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT customer_id,
+       country,
+       time_bucket(INTERVAL '1 hour', occurred_at) AS bucket,
+       count(*) AS tx_count,
+       sum(amount) AS amount_sum
+FROM transactions
+GROUP BY customer_id, country, bucket
+WITH NO DATA;
+"""
+
+HOURLY_AGGREGATE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS ix_transactions_hourly_customer_bucket "
+    "ON transactions_hourly (customer_id, bucket DESC);"
+)
+
+# Refresca los ultimos 31 dias cada 15 minutos, dejando fuera la hora en curso
+# (que el repositorio lee de la tabla cruda).
+HOURLY_AGGREGATE_POLICY = """
+SELECT add_continuous_aggregate_policy('transactions_hourly',
+    start_offset => INTERVAL '31 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '15 minutes',
+    if_not_exists => TRUE);
+"""
+
 def wait_for_db(engine):
     """Espera a que la base de datos esté lista (útil para docker-compose)."""
     retries = 5
@@ -57,6 +90,11 @@ def init_db():
     print("Creando tablas estandar...")
     Base.metadata.create_all(bind=engine)
 
+    # create_all no altera tablas existentes: columna de reglas en modo sombra.
+    with engine.connect() as conn:
+        conn.execute(text("ALTER TABLE rules ADD COLUMN IF NOT EXISTS shadow BOOLEAN NOT NULL DEFAULT FALSE;"))
+        conn.commit()
+
     # 3. Convertir 'transactions' en Hypertable
     # Esto es crucial para el rendimiento de series temporales
     with engine.connect() as conn:
@@ -76,6 +114,19 @@ def init_db():
             print(f"Nota sobre Hypertable: {e}")
             # Ignoramos si ya es hypertable
 
+    # 4. Agregados continuos para las ventanas largas de comportamiento.
+    # CREATE MATERIALIZED VIEW ... WITH (timescaledb.continuous) no puede ejecutarse en una transaccion.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        print("Creando agregado continuo 'transactions_hourly'...")
+        try:
+            conn.execute(text(CREATE_HOURLY_AGGREGATE))
+            conn.execute(text(HOURLY_AGGREGATE_INDEX))
+            conn.execute(text(HOURLY_AGGREGATE_POLICY))
+            conn.execute(text("CALL refresh_continuous_aggregate('transactions_hourly', NULL, NULL);"))
+            print("Agregado continuo listo (refresco cada 15 minutos).")
+        except Exception as e:
+            print(f"Nota sobre agregado continuo: {e}")
+
     print("Inicializacion completada.")
 
 if __name__ == "__main__":
@@ -0,0 +1,105 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from fcore.infrastructure.database.models.base_db_model import Base
+from fcore.infrastructure.database.models.alert_model import AlertModel
+from fcore.infrastructure.database.models.case_model import CaseModel
+from fcore.infrastructure.database.models.alert_outbox_model import AlertOutboxModel
+from fcore.infrastructure.database.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_merchant_repository import SqlAlchemyMerchantRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_transaction_repository import SqlAlchemyTransactionRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_alert_outbox_repository import SqlAlchemyAlertOutboxRepository
+from fcore.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from fcore.application.use_cases.scoring_use_case import ScoringUseCase
+from fcore.application.use_cases.alert_outbox_use_case import ProcessAlertOutboxUseCase
+from fcore.core.entities.alert import AlertAction
+from fcore.core.entities.alert_outbox_event import OutboxStatus
+from fcore.core.entities.analyst import Analyst
+from fcore.core.entities.customer import Customer
+from fcore.core.entities.merchant import Merchant
+from fcore.core.entities.role import Role
+from fcore.core.entities.transaction import Transaction
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def declined_transaction(session_factory):
+    """Scores one transaction as DECLINE with the outbox enabled and commits, like get_db would."""
+    session = session_factory()
+    customer = SqlAlchemyCustomerRepository(session).create(Customer(full_name="Ana Perez", document_number="1712345678"))
+    merchant = SqlAlchemyMerchantRepository(session).create(Merchant(name="Tienda Uno", category="retail"))
+    tx = SqlAlchemyTransactionRepository(session).create(Transaction(
+        customer_id=customer.id, merchant_id=merchant.id, amount=Decimal("900.00"), country="EC"
+    ))
+
+    alert_repo, case_repo, analyst_repo = Mock(), Mock(), Mock()
+    decision_service = Mock()
+    decision_service.decide.return_value = (AlertAction.DECLINE, 0.95)
+    scoring = ScoringUseCase(
+        Mock(), Mock(get_by_customer_id=Mock(return_value=None),
+                     calculate_features_from_history=Mock(return_value={
+                         "tx_count_10m": 1, "tx_count_30m": 1, "tx_count_24h": 1,
+                         "avg_amount_24h": 900.0, "usual_country": "EC"})),
+        Mock(get_all=Mock(return_value=[])), alert_repo, case_repo, analyst_repo,
+        Mock(score=Mock(return_value=0.9)), decision_service, Mock(),
+        alert_outbox_repo=SqlAlchemyAlertOutboxRepository(session)
+    )
+    action, _ = scoring.execute(tx)
+    session.commit()
+    session.close()
+
+    assert action == AlertAction.DECLINE
+    alert_repo.create.assert_not_called()
+    analyst_repo.get_all.assert_not_called()
+    return tx
+
+def add_analyst(session_factory):
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        role = uow.role_repository.create(Role(id=uuid4(), name="ANALYST", description="Analyst", is_active=True))
+        uow.analyst_repository.create(Analyst(name="Maria", lastname="Lopez", password_hash="x",
+                                              code="C1000002", role=role, created_at=datetime.utcnow(), created_by="C1000001"))
+        uow.commit()
+
+def test_worker_creates_alert_and_case_once(session_factory, declined_transaction):
+    add_analyst(session_factory)
+    use_case = ProcessAlertOutboxUseCase(SqlAlchemyUnitOfWork(session_factory))
+
+    assert use_case.process_batch() == (1, 0)
+    assert use_case.process_batch() == (0, 0)
+
+    session = session_factory()
+    alert = session.query(AlertModel).one()
+    assert alert.transaction_id == declined_transaction.id
+    assert session.query(CaseModel).filter_by(alert_id=alert.id).count() == 1
+    assert session.query(AlertOutboxModel).one().status == OutboxStatus.DONE
+    session.close()
+
+def test_failed_events_are_retried_then_given_up(session_factory, declined_transaction):
+    uow = SqlAlchemyUnitOfWork(session_factory)
+    use_case = ProcessAlertOutboxUseCase(uow, max_attempts=2, base_backoff_seconds=0)
+    original_materialize = use_case._materialize
+    use_case._materialize = Mock(side_effect=RuntimeError("database unavailable"))
+
+    assert use_case.process_batch() == (0, 1)
+    assert use_case.process_batch() == (0, 1)
+    assert use_case.process_batch() == (0, 0)
+
+    session = session_factory()
+    event = session.query(AlertOutboxModel).one()
+    assert (event.status, event.attempts) == (OutboxStatus.DEAD, 2)
+    assert "database unavailable" in event.last_error
+    assert SqlAlchemyAlertOutboxRepository(session).get_stats()["dead"] == 1
+    session.close()
+
+    # A dead event is not picked up again, even once the failure is gone.
+    use_case._materialize = original_materialize
+    assert use_case.process_batch() == (0, 0)
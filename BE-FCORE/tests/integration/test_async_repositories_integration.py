@@ -0,0 +1,149 @@
+import asyncio
+import time
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from fcore.infrastructure.database.models.base_db_model import Base
+from fcore.infrastructure.database.models.transaction_model import TransactionModel
+from fcore.infrastructure.database.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_merchant_repository import SqlAlchemyMerchantRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_transaction_repository import SqlAlchemyTransactionRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_alert_repository import SqlAlchemyAlertRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_role_repository import SqlAlchemyRoleRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_analyst_repository import SqlAlchemyAnalystRepository
+from fcore.infrastructure.database.repositories.async_sqlalchemy_alert_repository import AsyncSqlAlchemyAlertRepository
+from fcore.infrastructure.database.repositories.async_sqlalchemy_case_repository import AsyncSqlAlchemyCaseRepository
+from fcore.infrastructure.database.async_scoring_unit_of_work import AsyncSqlAlchemyScoringUnitOfWork
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+from fcore.application.services.decision_service import DecisionService
+from fcore.application.services.latency_budget import LatencyBudgetConfig, LatencyGuard
+from fcore.application.services.rule_set_cache import RuleSetCache
+from fcore.application.use_cases.case_use_cases import AsyncCaseUseCases
+from fcore.application.use_cases.scoring_ingestion_use_case import ScoringIngestionUseCase
+from fcore.core.entities.alert import Alert, AlertAction
+from fcore.core.entities.analyst import Analyst
+from fcore.core.entities.case import CaseDecision
+from fcore.core.entities.customer import Customer
+from fcore.core.entities.merchant import Merchant
+from fcore.core.entities.role import Role
+from fcore.core.entities.transaction import Transaction, TransactionChannel
+from fcore.core.errors.case_errors import CaseAlreadyExistsError
+
+@pytest.fixture
+def database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'fcore.db'}"
+    Base.metadata.create_all(create_engine(url))
+    return url
+
+@pytest.fixture
+def seeded(database):
+    session = sessionmaker(bind=create_engine(database))()
+    customer = SqlAlchemyCustomerRepository(session).create(Customer(full_name="Ana Perez", document_number="1712345678"))
+    merchant = SqlAlchemyMerchantRepository(session).create(Merchant(name="Tienda Uno", category="retail"))
+    role = SqlAlchemyRoleRepository(session).create(Role(name="analyst", description="Fraud analyst"))
+    analyst = SqlAlchemyAnalystRepository(session).create(Analyst(
+        name="Maria", lastname="Lopez", code="C1000001", password_hash="x", role=role,
+        created_at=datetime.utcnow(), created_by="C1000000"
+    ))
+    tx = SqlAlchemyTransactionRepository(session).create(Transaction(
+        customer_id=customer.id, merchant_id=merchant.id, amount=Decimal("900.00"), country="EC"
+    ))
+    alert = SqlAlchemyAlertRepository(session).create(Alert(
+        transaction_id=tx.id, transaction_occurred_at=tx.occurred_at, action=AlertAction.REVIEW,
+        ml_score=0.7, final_score=0.7, rule_hits={}, created_at=datetime.utcnow(), created_by=analyst.id
+    ))
+    session.commit()
+    session.close()
+    return customer, merchant, analyst, alert
+
+def async_session_factory(database):
+    engine = create_async_engine(database.replace("sqlite://", "sqlite+aiosqlite://"))
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+def test_scoring_runs_on_the_async_engine(database, seeded):
+    customer, merchant, _, _ = seeded
+    scorer = Mock()
+    scorer.score.return_value = 0.1
+    use_case = ScoringIngestionUseCase(
+        uow=AsyncSqlAlchemyScoringUnitOfWork(async_session_factory(database)),
+        scorer=scorer,
+        decision_service=DecisionService(),
+        rule_evaluator=CompiledEvalEvaluator(),
+        rule_set_cache=RuleSetCache(max_age_seconds=60)
+    )
+    data = {"customer_id": customer.id, "merchant_id": merchant.id, "amount": Decimal("25.00"),
+            "channel": TransactionChannel.POS, "country": "EC"}
+
+    async def score_twice():
+        await use_case.execute_async(data)
+        return await use_case.execute_async(data)
+
+    _, action, _ = asyncio.run(score_twice())
+
+    assert action == AlertAction.APPROVE
+    assert use_case.last_statement_count == 6
+    session = sessionmaker(bind=create_engine(database))()
+    assert session.query(TransactionModel).count() == 3
+    session.close()
+
+def test_model_deadline_does_not_block_the_event_loop(database, seeded):
+    customer, merchant, _, _ = seeded
+    guard = LatencyGuard(LatencyBudgetConfig(total_ms=5000, features_ms=5000, model_ms=300))
+    scorer = Mock()
+    scorer.score.side_effect = lambda features: time.sleep(0.2) or 0.1
+    use_case = ScoringIngestionUseCase(
+        uow=AsyncSqlAlchemyScoringUnitOfWork(async_session_factory(database)),
+        scorer=scorer,
+        decision_service=DecisionService(),
+        rule_evaluator=CompiledEvalEvaluator(),
+        rule_set_cache=RuleSetCache(max_age_seconds=60),
+        latency_guard=guard
+    )
+    data = {"customer_id": customer.id, "merchant_id": merchant.id, "amount": Decimal("25.00"),
+            "channel": TransactionChannel.POS, "country": "EC"}
+
+    async def score_while_ticking():
+        ticks = 0
+        scoring = asyncio.ensure_future(use_case.execute_async(data))
+        while not scoring.done():
+            await asyncio.sleep(0.01)
+            ticks += 1
+        return ticks, await scoring
+
+    ticks, (_, _, details) = asyncio.run(score_while_ticking())
+
+    # The loop kept running while the model thread worked, and the score still arrived in time
+    assert ticks >= 10
+    assert details["ml_score"] == 0.1 and details["degraded"] == []
+    guard.close()
+
+def test_case_lifecycle_through_async_repositories(database, seeded):
+    _, _, analyst, alert = seeded
+    factory = async_session_factory(database)
+
+    async def lifecycle():
+        async with factory() as session:
+            use_cases = AsyncCaseUseCases(AsyncSqlAlchemyCaseRepository(session), AsyncSqlAlchemyAlertRepository(session))
+            case = await use_cases.open_case_from_alert(alert.id, analyst.id)
+            await use_cases.add_note_to_case(case.id, "Customer confirmed the purchase", analyst.name)
+            await session.commit()
+            with pytest.raises(CaseAlreadyExistsError):
+                await use_cases.open_case_from_alert(alert.id, analyst.id)
+
+        async with factory() as session:
+            use_cases = AsyncCaseUseCases(AsyncSqlAlchemyCaseRepository(session), AsyncSqlAlchemyAlertRepository(session))
+            resolved = await use_cases.resolve_case(case.id, CaseDecision.FALSE_POSITIVE)
+            await session.commit()
+            return resolved, await use_cases.get_all_cases(10, 0)
+
+    resolved, cases = asyncio.run(lifecycle())
+
+    assert resolved.decision == CaseDecision.FALSE_POSITIVE
+    assert "Customer confirmed the purchase" in resolved.notes
+    assert resolved.alert.transaction.customer.full_name == "Ana Perez"
+    assert [c.id for c in cases] == [resolved.id]
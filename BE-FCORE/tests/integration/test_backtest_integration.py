@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from fcore.application.services.backtest import PointInTimeProfiles
+from fcore.core.entities.rule import Rule
+from fcore.core.entities.transaction import Transaction
+from fcore.infrastructure.database.models.base_db_model import Base
+from fcore.infrastructure.database.models.customer_model import CustomerModel
+from fcore.infrastructure.database.models.merchant_model import MerchantModel
+from fcore.infrastructure.database.process_pool_backtest_runner import ProcessPoolBacktestRunner
+from fcore.infrastructure.database.repositories.sqlalchemy_behavior_repository import SqlAlchemyBehaviorRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_transaction_repository import SqlAlchemyTransactionRepository
+
+START = datetime(2026, 9, 1)
+END = datetime(2026, 9, 4)
+
+def make_rule(name, expression):
+    return Rule(name=name, dsl_expression=expression, created_at=datetime.utcnow(), created_by="C1000001")
+
+@pytest.fixture
+def database(tmp_path):
+    # A file database: the runner's workers open their own connections
+    url = f"sqlite:///{tmp_path / 'backtest.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    merchant_id, blacklisted_id = uuid4(), uuid4()
+    session.add(MerchantModel(id=merchant_id, name="Tienda Uno", category="retail"))
+    session.add(MerchantModel(id=blacklisted_id, name="Casino Web", category="gaming", is_blacklisted=True))
+    customers = [uuid4() for _ in range(6)]
+    for number, customer_id in enumerate(customers):
+        session.add(CustomerModel(id=customer_id, full_name=f"Cliente {number}", document_number=f"17000000{number}"))
+    session.flush()
+
+    transactions = []
+    for number, customer_id in enumerate(customers):
+        # Warm-up history before START, then a burst and a large foreign payment inside the range
+        transactions.append(Transaction(customer_id=customer_id, merchant_id=merchant_id, amount=Decimal("40.00"),
+                                        country="EC", occurred_at=START - timedelta(days=2, minutes=number)))
+        for minute in range(3):
+            transactions.append(Transaction(customer_id=customer_id, merchant_id=merchant_id, amount=Decimal("25.00"),
+                                            country="EC", occurred_at=START + timedelta(hours=number, minutes=minute)))
+        transactions.append(Transaction(customer_id=customer_id, merchant_id=blacklisted_id if number % 2 else merchant_id,
+                                        amount=Decimal("2500.00"), country="US", label_fraud=number < 3,
+                                        occurred_at=START + timedelta(days=1, hours=number)))
+    SqlAlchemyTransactionRepository(session).create_many(transactions)
+    session.close()
+    return url, customers
+
+RULES = [
+    make_rule("Burst of payments", "tx_count_10m >= 2"),
+    make_rule("Large foreign payment", "amount > 1000 and is_new_country"),
+    make_rule("Blacklisted merchant", "is_blacklisted_merchant"),
+]
+
+def test_backtest_counts_hits_per_rule_and_day(database):
+    url, customers = database
+
+    report = ProcessPoolBacktestRunner(url, workers=1, batch_rows=4).run(RULES, START, END).to_dict()
+
+    assert (report["rows"], report["fraud_rows"]) == (24, 3)
+    burst, foreign, blacklisted = report["rules"]
+    # Third payment of each burst sees the two before it within 10 minutes
+    assert (burst["hits"], burst["fraud_hits"]) == (6, 0)
+    assert burst["by_day"] == [
+        {"day": "2026-09-01", "rows": 18, "hits": 6, "hit_rate": pytest.approx(1 / 3, abs=1e-6)},
+        {"day": "2026-09-02", "rows": 6, "hits": 0, "hit_rate": 0.0},
+    ]
+    # usual_country comes from the warm-up and in-range history: EC, so US is new
+    assert (foreign["hits"], foreign["fraud_hits"], foreign["precision"], foreign["recall"]) == (6, 3, 0.5, 1.0)
+    assert (blacklisted["hits"], blacklisted["fraud_hits"]) == (3, 1)
+
+def test_sharded_workers_produce_the_same_report(database):
+    url, _ = database
+
+    single = ProcessPoolBacktestRunner(url, workers=1).run(RULES, START, END).to_dict()
+    sharded = ProcessPoolBacktestRunner(url, workers=2).run(RULES, START, END).to_dict()
+
+    assert sharded == single
+
+def test_point_in_time_profile_matches_history_query(database):
+    url, customers = database
+    session = sessionmaker(bind=create_engine(url))()
+    profiles = PointInTimeProfiles()
+    for tx in SqlAlchemyTransactionRepository(session).stream_range(START - timedelta(days=30), END):
+        profiles.add(tx)
+
+    # The history query reads up to now; all rows are older than 24h, so only the country mode remains
+    profile = profiles.profile_before(Transaction(customer_id=customers[0], merchant_id=uuid4(), amount=Decimal("1.00"),
+                                                  occurred_at=datetime.utcnow()))
+    history = SqlAlchemyBehaviorRepository(session).calculate_features_from_history(customers[0])
+
+    assert (profile.tx_count_24h, profile.usual_country) == (history["tx_count_24h"], history["usual_country"])
@@ -0,0 +1,99 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from fcore.infrastructure.database.models.base_db_model import Base
+from fcore.infrastructure.database.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_merchant_repository import SqlAlchemyMerchantRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_transaction_repository import SqlAlchemyTransactionRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_behavior_repository import SqlAlchemyBehaviorRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_rule_repository import SqlAlchemyRuleRepository
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+from fcore.application.services.decision_service import DecisionService
+from fcore.application.use_cases.transaction_use_case import TransactionUseCases
+from fcore.application.use_cases.scoring_use_case import ScoringUseCase
+from fcore.core.entities.customer import Customer
+from fcore.core.entities.merchant import Merchant
+from fcore.core.entities.rule import Rule, RuleSeverity
+from fcore.core.entities.transaction import Transaction, TransactionChannel
+from fcore.core.entities.alert import AlertAction
+from fcore.core.errors.customer_errors import CustomerNotFoundError
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def seeded(session):
+    customer = SqlAlchemyCustomerRepository(session).create(Customer(full_name="Ana Perez", document_number="1712345678"))
+    merchant = SqlAlchemyMerchantRepository(session).create(Merchant(name="Tienda Uno", category="retail"))
+    SqlAlchemyRuleRepository(session).create(Rule(
+        name="Burst of transactions", dsl_expression="tx_count_10m >= 2", severity=RuleSeverity.CRITICAL,
+        created_at=datetime.utcnow(), created_by="C1000001"
+    ))
+    return customer, merchant
+
+def build_use_cases(session):
+    tx_use_cases = TransactionUseCases(
+        transaction_repository=SqlAlchemyTransactionRepository(session),
+        customer_repository=SqlAlchemyCustomerRepository(session),
+        merchant_repository=SqlAlchemyMerchantRepository(session)
+    )
+    scorer = Mock()
+    scorer.score.return_value = 0.1
+    scorer.score_batch.side_effect = lambda features_list: [0.1] * len(features_list)
+    scoring = ScoringUseCase(
+        transaction_repo=SqlAlchemyTransactionRepository(session),
+        behavior_repo=SqlAlchemyBehaviorRepository(session),
+        rule_repo=SqlAlchemyRuleRepository(session),
+        alert_repo=Mock(),
+        case_repo=Mock(),
+        analyst_repo=Mock(get_all=Mock(return_value=[])),
+        scorer=scorer,
+        decision_service=DecisionService(),
+        rule_evaluator=CompiledEvalEvaluator()
+    )
+    return tx_use_cases, scoring
+
+def test_batch_keeps_order_and_reports_invalid_items(session, seeded):
+    customer, merchant = seeded
+    tx_use_cases, scoring = build_use_cases(session)
+
+    item = {"customer_id": customer.id, "merchant_id": merchant.id, "amount": Decimal("25.00"),
+            "channel": TransactionChannel.POS, "country": "EC"}
+    recorded = tx_use_cases.record_transactions([item, {**item, "customer_id": uuid4()}, item, item])
+
+    assert isinstance(recorded[1], CustomerNotFoundError)
+    transactions = [r for r in recorded if isinstance(r, Transaction)]
+    decisions = scoring.execute_batch(transactions)
+
+    # The third item of the burst sees the two earlier ones, exactly like sequential scoring would.
+    assert [action for action, _ in decisions] == [AlertAction.APPROVE, AlertAction.APPROVE, AlertAction.DECLINE]
+
+    profile = SqlAlchemyBehaviorRepository(session).get_by_customer_id(customer.id)
+    assert profile.tx_count_24h == 3
+    assert profile.usual_country == "EC"
+
+def test_grouped_features_match_single_customer_query(session, seeded):
+    customer, merchant = seeded
+    tx_repo = SqlAlchemyTransactionRepository(session)
+    tx_repo.create_many([
+        Transaction(customer_id=customer.id, merchant_id=merchant.id, amount=Decimal(amount), country=country)
+        for amount, country in [("10.00", "EC"), ("30.00", "CO"), ("50.00", "EC")]
+    ])
+
+    behavior_repo = SqlAlchemyBehaviorRepository(session)
+    grouped = behavior_repo.calculate_features_for_customers([customer.id])[customer.id]
+    single = behavior_repo.calculate_features_from_history(customer.id)
+
+    for key in ("tx_count_10m", "tx_count_30m", "tx_count_24h", "usual_country"):
+        assert grouped[key] == single[key]
+    assert grouped["avg_amount_24h"] == pytest.approx(single["avg_amount_24h"])
@@ -0,0 +1,96 @@
+import pytest
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from fcore.infrastructure.database.models.base_db_model import Base
+from fcore.infrastructure.database.models.customer_model import CustomerModel
+from fcore.infrastructure.database.models.merchant_model import MerchantModel
+from fcore.infrastructure.database.models.transaction_rollup_model import rollup_metadata, transactions_hourly
+from fcore.infrastructure.database.repositories.sqlalchemy_behavior_repository import SqlAlchemyBehaviorRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_transaction_repository import SqlAlchemyTransactionRepository
+from fcore.core.entities.transaction import Transaction
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    rollup_metadata.create_all(engine)
+    return engine
+
+def test_features_are_computed_in_one_statement(engine):
+    session = sessionmaker(bind=engine)()
+    customer_id, merchant_id = uuid4(), uuid4()
+    session.add(CustomerModel(id=customer_id, full_name="Luis Mora", document_number="0912345678"))
+    session.add(MerchantModel(id=merchant_id, name="Farmacia Sur", category="health"))
+    session.flush()
+
+    now = datetime.utcnow()
+    SqlAlchemyTransactionRepository(session).create_many([
+        Transaction(customer_id=customer_id, merchant_id=merchant_id, amount=Decimal(amount),
+                    country=country, occurred_at=now - age)
+        for amount, country, age in [
+            ("100.00", "EC", timedelta(minutes=1)),
+            ("300.00", "EC", timedelta(minutes=20)),
+            ("50.00", "CO", timedelta(hours=5)),
+            ("80.00", "CO", timedelta(days=3)),
+            ("90.00", "CO", timedelta(days=4)),
+        ]
+    ])
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    features = SqlAlchemyBehaviorRepository(session).calculate_features_from_history(customer_id)
+
+    assert len(statements) == 1
+    assert features == {
+        "tx_count_10m": 1,
+        "tx_count_30m": 2,
+        "tx_count_24h": 3,
+        "avg_amount_24h": pytest.approx(150.0),
+        "usual_country": "CO"
+    }
+
+def test_rollup_features_match_raw_history(engine):
+    session = sessionmaker(bind=engine)()
+    customer_id, merchant_id = uuid4(), uuid4()
+    session.add(CustomerModel(id=customer_id, full_name="Luis Mora", document_number="0912345678"))
+    session.add(MerchantModel(id=merchant_id, name="Farmacia Sur", category="health"))
+    session.flush()
+
+    now = datetime.now(timezone.utc)
+    transactions = [
+        Transaction(customer_id=customer_id, merchant_id=merchant_id, amount=Decimal(amount),
+                    country=country, occurred_at=now - age)
+        for amount, country, age in [
+            ("100.00", "EC", timedelta(minutes=1)),
+            ("300.00", "EC", timedelta(minutes=45)),
+            ("50.00", "CO", timedelta(hours=5)),
+            ("70.00", "CO", timedelta(hours=23, minutes=50)),
+            ("60.00", "CO", timedelta(hours=24, minutes=10)),
+            ("80.00", "CO", timedelta(days=3)),
+            ("90.00", "PE", timedelta(days=40)),
+        ]
+    ]
+    SqlAlchemyTransactionRepository(session).create_many(transactions)
+
+    # What the continuous aggregate would have materialized
+    buckets = defaultdict(lambda: [0, Decimal("0")])
+    for tx in transactions:
+        key = (tx.customer_id, tx.country, tx.occurred_at.replace(minute=0, second=0, microsecond=0))
+        buckets[key][0] += 1
+        buckets[key][1] += tx.amount
+    session.execute(insert(transactions_hourly), [
+        {"customer_id": cid, "country": country, "bucket": bucket, "tx_count": count, "amount_sum": amount}
+        for (cid, country, bucket), (count, amount) in buckets.items()
+    ])
+
+    raw = SqlAlchemyBehaviorRepository(session).calculate_features_from_history(customer_id)
+    rollup = SqlAlchemyBehaviorRepository(session, use_rollups=True).calculate_features_from_history(customer_id)
+
+    assert rollup == {**raw, "avg_amount_24h": pytest.approx(raw["avg_amount_24h"])}
+    assert rollup["tx_count_24h"] == 4
+    assert rollup["usual_country"] == "CO"
@@ -0,0 +1,135 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from fcore.infrastructure.database.models.base_db_model import Base
+from fcore.infrastructure.database.models.transaction_model import TransactionModel
+from fcore.infrastructure.database.models.behavior_profile_model import BehaviorProfileModel
+from fcore.infrastructure.database.repositories.sqlalchemy_customer_repository import SqlAlchemyCustomerRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_merchant_repository import SqlAlchemyMerchantRepository
+from fcore.infrastructure.database.repositories.sqlalchemy_rule_repository import SqlAlchemyRuleRepository
+from fcore.infrastructure.database.scoring_unit_of_work import SqlAlchemyScoringUnitOfWork
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+from fcore.application.services.decision_service import DecisionService
+from fcore.application.services.rule_set_cache import RuleSetCache
+from fcore.application.services.reference_data_cache import ReferenceDataCache
+from fcore.application.services.velocity_engine import VelocityEngine
+from fcore.application.use_cases.scoring_ingestion_use_case import ScoringIngestionUseCase
+from fcore.core.entities.alert import AlertAction
+from fcore.core.entities.customer import Customer
+from fcore.core.entities.merchant import Merchant
+from fcore.core.entities.rule import Rule, RuleSeverity
+from fcore.core.entities.transaction import TransactionChannel
+from fcore.core.errors.merchant_errors import MerchantNotFoundError
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return engine
+
+@pytest.fixture
+def seeded(engine):
+    session = sessionmaker(bind=engine)()
+    customer = SqlAlchemyCustomerRepository(session).create(Customer(full_name="Ana Perez", document_number="1712345678"))
+    merchant = SqlAlchemyMerchantRepository(session).create(Merchant(name="Tienda Uno", category="retail"))
+    SqlAlchemyRuleRepository(session).create(Rule(
+        name="Large amount", dsl_expression="amount > 5000", severity=RuleSeverity.HIGH,
+        created_at=datetime.utcnow(), created_by="C1000001"
+    ))
+    session.close()
+    return customer, merchant
+
+def build_use_case(engine, velocity_engine=None, scorer=None, **uow_options):
+    if scorer is None:
+        scorer = Mock()
+        scorer.score.return_value = 0.1
+    return ScoringIngestionUseCase(
+        uow=SqlAlchemyScoringUnitOfWork(sessionmaker(autocommit=False, autoflush=False, bind=engine), **uow_options),
+        scorer=scorer,
+        decision_service=DecisionService(),
+        rule_evaluator=CompiledEvalEvaluator(),
+        rule_set_cache=RuleSetCache(max_age_seconds=60),
+        velocity_engine=velocity_engine
+    )
+
+def test_scoring_uses_one_commit_and_a_handful_of_statements(engine, seeded):
+    customer, merchant = seeded
+    use_case = build_use_case(engine)
+    data = {"customer_id": customer.id, "merchant_id": merchant.id, "amount": Decimal("25.00"),
+            "channel": TransactionChannel.POS, "country": "EC"}
+    use_case.execute(data)  # first call loads the rule set and creates the profile
+
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(conn))
+    transaction, action, _ = use_case.execute(data)
+
+    assert action == AlertAction.APPROVE
+    assert len(commits) == 1
+    # customer, merchant, INSERT ... RETURNING, profile, features, profile UPDATE
+    assert use_case.last_statement_count == 6
+
+    session = sessionmaker(bind=engine)()
+    assert session.query(TransactionModel).count() == 2
+    assert session.get(BehaviorProfileModel, customer.id).tx_count_24h == 2
+    session.close()
+
+def test_warm_reference_cache_skips_customer_and_merchant_reads(engine, seeded):
+    customer, merchant = seeded
+    use_case = build_use_case(
+        engine,
+        customer_cache=ReferenceDataCache("customers"),
+        merchant_cache=ReferenceDataCache("merchants")
+    )
+    data = {"customer_id": customer.id, "merchant_id": merchant.id, "amount": Decimal("25.00"),
+            "channel": TransactionChannel.POS, "country": "EC"}
+    use_case.execute(data)
+
+    _, action, _ = use_case.execute(data)
+
+    assert action == AlertAction.APPROVE
+    # INSERT ... RETURNING, profile, features, profile UPDATE
+    assert use_case.last_statement_count == 4
+
+def test_nothing_is_written_when_validation_fails(engine, seeded):
+    customer, _ = seeded
+    use_case = build_use_case(engine)
+
+    with pytest.raises(MerchantNotFoundError):
+        use_case.execute({"customer_id": customer.id, "merchant_id": customer.id, "amount": Decimal("25.00"),
+                          "channel": TransactionChannel.POS, "country": "EC"})
+
+    session = sessionmaker(bind=engine)()
+    assert session.query(TransactionModel).count() == 0
+    session.close()
+
+def test_velocity_counters_only_see_committed_transactions(engine, seeded):
+    customer, merchant = seeded
+    velocity = VelocityEngine()
+    velocity.bootstrap([])
+    scorer = Mock()
+    scorer.score.side_effect = RuntimeError("model unavailable")
+    use_case = build_use_case(engine, velocity_engine=velocity, scorer=scorer)
+    data = {"customer_id": customer.id, "merchant_id": merchant.id, "amount": Decimal("25.00"),
+            "channel": TransactionChannel.POS, "country": "EC"}
+
+    with pytest.raises(RuntimeError):
+        use_case.execute(data)
+
+    assert velocity.snapshot(customer.id)["tx_count_10m"] == 0
+    session = sessionmaker(bind=engine)()
+    assert session.query(TransactionModel).count() == 0
+    session.close()
+
+    scorer.score.side_effect = None
+    scorer.score.return_value = 0.1
+    use_case.execute(data)
+    use_case.execute(data)
+
+    # The second transaction is scored with the first one in its counters and itself left out
+    features = scorer.score.call_args[0][0]
+    assert features["tx_count_10m"] == 1
+    assert velocity.snapshot(customer.id)["tx_count_10m"] == 2
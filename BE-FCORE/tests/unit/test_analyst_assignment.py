@@ -0,0 +1,103 @@
+import threading
+from collections import Counter
+from unittest.mock import Mock
+from uuid import uuid4
+
+from fcore.application.services.analyst_assignment import AnalystAssignmentService
+from fcore.application.use_cases.case_use_cases import CaseUseCases
+from fcore.core.entities.case import CaseDecision
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def make_repo(*open_cases):
+    analysts = [(uuid4(), f"Analyst {i}", count) for i, count in enumerate(open_cases)]
+    return Mock(get_active_workload=Mock(return_value=analysts)), analysts
+
+def test_assigns_to_least_loaded_and_balances():
+    repo, analysts = make_repo(5, 0, 2)
+    service = AnalystAssignmentService()
+
+    picked = [analyst_id for analyst_id, _ in service.assign_many(repo, 8)]
+
+    # The idle analyst catches up first, then the load is spread evenly.
+    assert Counter(picked) == {analysts[1][0]: 5, analysts[2][0]: 3}
+    assert set(service.workload().values()) == {5}
+    repo.get_active_workload.assert_called_once()
+
+def test_release_frees_a_slot():
+    repo, analysts = make_repo(1, 1)
+    service = AnalystAssignmentService()
+    service.assign_many(repo, 2)
+
+    service.release(analysts[0][0])
+
+    assert service.assign(repo)[0] == analysts[0][0]
+
+def test_case_opened_by_hand_is_counted_until_resolved():
+    repo, analysts = make_repo(0, 1)
+    (first, _, _), (second, _, _) = analysts
+    service = AnalystAssignmentService()
+    assert service.assign(repo)[0] == first
+    case_repo = Mock(find_by_alert_id=Mock(return_value=None))
+    case_repo.create.side_effect = lambda case: case
+    use_cases = CaseUseCases(case_repo, Mock(), analyst_assignment=service)
+
+    case = use_cases.open_case_from_alert(uuid4(), second)
+    assert service.workload() == {first: 1, second: 2}
+    case_repo.find_by_id.return_value = case
+    case_repo.update.side_effect = lambda case: case
+    use_cases.resolve_case(case.id, CaseDecision.FALSE_POSITIVE)
+
+    # Back to the count before the case was opened, not one below it
+    assert service.workload() == {first: 1, second: 1}
+    assert {analyst_id for analyst_id, _ in service.assign_many(repo, 2)} == {first, second}
+
+def test_roster_is_reloaded_after_ttl_or_invalidation():
+    clock = FakeClock()
+    repo, _ = make_repo(0)
+    service = AnalystAssignmentService(ttl_seconds=60, clock=clock)
+
+    service.assign(repo)
+    clock.now = 30
+    service.assign(repo)
+    assert repo.get_active_workload.call_count == 1
+
+    clock.now = 61
+    service.assign(repo)
+    service.invalidate()
+    service.assign(repo)
+    assert repo.get_active_workload.call_count == 3
+
+def test_no_active_analysts():
+    repo, _ = make_repo()
+    assert AnalystAssignmentService().assign(repo) is None
+
+def test_concurrent_reloads_never_wait_on_each_others_query():
+    # On the async path both assignments run on the event loop thread, so one
+    # waiting for the other's roster query to finish would never wake up.
+    repo, analysts = make_repo(0, 0)
+    second_query_started = threading.Event()
+    waits = []
+
+    def get_active_workload():
+        if repo.get_active_workload.call_count == 1:
+            waits.append(second_query_started.wait(timeout=2))
+        else:
+            second_query_started.set()
+        return analysts
+
+    repo.get_active_workload.side_effect = get_active_workload
+    service = AnalystAssignmentService()
+    first = threading.Thread(target=service.assign, args=(repo,))
+    first.start()
+    assert service.assign(repo) is not None
+    first.join()
+
+    assert waits == [True], "second reload blocked behind the first query"
+    assert repo.get_active_workload.call_count == 2
+    assert sum(service.workload().values()) == 2
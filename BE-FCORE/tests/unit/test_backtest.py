@@ -0,0 +1,116 @@
+import threading
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from fcore.application.services.backtest import BacktestReport, PointInTimeProfiles
+from fcore.application.use_cases.backtest_use_case import BacktestUseCase
+from fcore.core.entities.rule import Rule
+from fcore.core.entities.transaction import Transaction
+from fcore.core.errors.backtest_errors import BacktestAlreadyRunningError, BacktestValidationError
+from fcore.core.errors.rule_errors import RuleValidationError
+
+NOW = datetime(2026, 10, 1, 12, 0)
+
+def make_tx(customer_id, amount, country, age):
+    return Transaction(customer_id=customer_id, merchant_id=uuid4(), amount=Decimal(amount),
+                       country=country, occurred_at=NOW - age)
+
+def make_rule(expression):
+    return Rule(name="Backtest rule", dsl_expression=expression, created_at=datetime.utcnow(), created_by="C1000001")
+
+def test_profile_before_uses_trailing_windows_only():
+    customer_id = uuid4()
+    profiles = PointInTimeProfiles()
+    for amount, country, age in [("90.00", "CO", timedelta(days=40)), ("80.00", "CO", timedelta(days=3)),
+                                 ("70.00", "CO", timedelta(days=2)), ("50.00", "EC", timedelta(hours=5)),
+                                 ("300.00", "EC", timedelta(minutes=20)), ("100.00", "EC", timedelta(minutes=1))]:
+        profiles.add(make_tx(customer_id, amount, country, age))
+
+    profile = profiles.profile_before(make_tx(customer_id, "10.00", "PE", timedelta(0)))
+
+    assert (profile.tx_count_10m, profile.tx_count_30m, profile.tx_count_24h) == (1, 2, 3)
+    assert profile.avg_amount_24h == pytest.approx(150.0)
+    assert profile.usual_country == "EC"  # the 40-day-old CO row is out of the 30-day window
+
+def test_profile_of_unknown_customer_is_empty():
+    profile = PointInTimeProfiles().profile_before(make_tx(uuid4(), "10.00", "EC", timedelta(0)))
+
+    assert (profile.tx_count_24h, profile.avg_amount_24h, profile.usual_country) == (0, 0.0, None)
+
+def test_reports_merge_and_derive_rates():
+    rules = [make_rule("amount > 1000")]
+    first, second = BacktestReport.for_rules(NOW, NOW, rules), BacktestReport.for_rules(NOW, NOW, rules)
+    first.rows, first.fraud_rows, first.rows_by_day = 6, 2, {"2026-10-01": 6}
+    first.rules[0].hits, first.rules[0].fraud_hits, first.rules[0].hits_by_day = 2, 1, {"2026-10-01": 2}
+    second.rows, second.fraud_rows, second.rows_by_day = 4, 2, {"2026-10-01": 2, "2026-10-02": 2}
+    second.rules[0].hits, second.rules[0].fraud_hits, second.rules[0].hits_by_day = 2, 2, {"2026-10-02": 2}
+
+    rule = first.merge(second).to_dict()["rules"][0]
+
+    assert (rule["hits"], rule["hit_rate"], rule["precision"], rule["recall"]) == (4, 0.4, 0.75, 0.75)
+    assert rule["by_day"] == [
+        {"day": "2026-10-01", "rows": 8, "hits": 2, "hit_rate": 0.25},
+        {"day": "2026-10-02", "rows": 2, "hits": 2, "hit_rate": 1.0},
+    ]
+
+def test_candidate_expression_is_validated_before_running():
+    runner = Mock()
+    use_case = BacktestUseCase(rule_repository=Mock(), runner=runner, known_names=("amount", "country"))
+
+    with pytest.raises(RuleValidationError):
+        use_case.execute(NOW - timedelta(days=1), NOW, "amount > velocity_score")
+    with pytest.raises(BacktestValidationError):
+        use_case.execute(NOW, NOW, "amount > 1000")
+    runner.run.assert_not_called()
+
+    use_case.execute(NOW - timedelta(days=1), NOW, "amount > 1000")
+    rules, start, end = runner.run.call_args.args
+    assert [rule.dsl_expression for rule in rules] == ["amount > 1000"]
+
+def test_enabled_rule_set_is_replayed_without_expression():
+    enabled, disabled = make_rule("amount > 1000"), make_rule("country == 'EC'")
+    disabled.enabled = False
+    runner = Mock()
+    use_case = BacktestUseCase(rule_repository=Mock(get_all=Mock(return_value=[enabled, disabled])), runner=runner)
+
+    use_case.execute(NOW - timedelta(days=1), NOW)
+
+    assert runner.run.call_args.args[0] == [enabled]
+
+def test_shadow_rules_are_left_out_of_the_live_rule_set():
+    live, shadow = make_rule("amount > 1000"), make_rule("country == 'EC'")
+    shadow.shadow = True
+    runner = Mock()
+    use_case = BacktestUseCase(rule_repository=Mock(get_all=Mock(return_value=[live, shadow])), runner=runner)
+
+    use_case.execute(NOW - timedelta(days=1), NOW)
+
+    assert runner.run.call_args.args[0] == [live]
+
+    use_case = BacktestUseCase(rule_repository=Mock(get_all=Mock(return_value=[shadow])), runner=runner)
+    with pytest.raises(BacktestValidationError):
+        use_case.execute(NOW - timedelta(days=1), NOW)
+
+def test_one_backtest_at_a_time_over_a_bounded_range():
+    slot = threading.Lock()
+    runner = Mock()
+    use_case = BacktestUseCase(rule_repository=Mock(), runner=runner, max_range=timedelta(days=31), slot=slot)
+
+    with pytest.raises(BacktestValidationError):
+        use_case.execute(NOW - timedelta(days=32), NOW, "amount > 1000")
+    # Another request of the same worker is running
+    slot.acquire()
+    with pytest.raises(BacktestAlreadyRunningError):
+        use_case.execute(NOW - timedelta(days=31), NOW, "amount > 1000")
+    runner.run.assert_not_called()
+    slot.release()
+
+    runner.run.side_effect = RuntimeError("worker process died")
+    with pytest.raises(RuntimeError):
+        use_case.execute(NOW - timedelta(days=31), NOW, "amount > 1000")
+    # A failed backtest frees the slot
+    assert not slot.locked()
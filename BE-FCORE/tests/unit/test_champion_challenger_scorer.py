@@ -0,0 +1,70 @@
+import threading
+import time
+
+from fcore.application.interfaces.i_model_scorer import IModelScorer
+from fcore.application.services.champion_challenger_scorer import ChampionChallengerScorer
+
+class FixedScorer(IModelScorer):
+    def __init__(self, score, delay=0.0, release=None):
+        self._score = score
+        self._delay = delay
+        self._release = release
+
+    def score(self, features):
+        return self.score_batch([features])[0]
+
+    def score_batch(self, features_list):
+        if self._release is not None:
+            self._release.wait(5)
+        time.sleep(self._delay)
+        if self._score is None:
+            raise RuntimeError("model not loaded")
+        return [self._score for _ in features_list]
+
+def challenger(scorer, name):
+    return next(entry for entry in scorer.stats()["challengers"] if entry["name"] == name)
+
+def test_champion_drives_the_score_and_challengers_are_compared():
+    scorer = ChampionChallengerScorer(FixedScorer(0.95), {"close": FixedScorer(0.93), "lenient": FixedScorer(0.10)})
+
+    assert scorer.score({"amount": 10}) == 0.95
+    assert scorer.score_batch([{"amount": 10}, {"amount": 20}]) == [0.95, 0.95]
+    scorer.close()
+
+    close = challenger(scorer, "close")
+    assert (close["scored"], close["same_action_rate"], close["mean_abs_diff"]) == (3, 1.0, 0.02)
+    lenient = challenger(scorer, "lenient")
+    assert (lenient["scored"], lenient["same_action_rate"]) == (3, 0.0)
+
+def test_slow_challenger_adds_no_latency_and_times_out():
+    scorer = ChampionChallengerScorer(FixedScorer(0.5), {"slow": FixedScorer(0.5, delay=0.2)}, budget_seconds=0.01)
+
+    started = time.monotonic()
+    scorer.score({})
+    assert time.monotonic() - started < 0.1
+    scorer.close()
+
+    assert (challenger(scorer, "slow")["timed_out"], challenger(scorer, "slow")["scored"]) == (1, 0)
+
+def test_jobs_beyond_max_pending_or_past_their_budget_are_dropped():
+    release = threading.Event()
+    scorer = ChampionChallengerScorer(FixedScorer(0.5), {"blocked": FixedScorer(0.5, release=release)},
+                                      budget_seconds=0.01, workers=1, max_pending=2)
+    for _ in range(5):
+        scorer.score({})
+    time.sleep(0.05)
+    release.set()
+    scorer.close()
+
+    stats = challenger(scorer, "blocked")
+    # 3 rejected at submit, the queued one expired while the first was blocked, the first ran late
+    assert (stats["dropped"], stats["timed_out"], stats["scored"]) == (4, 1, 0)
+    assert scorer.stats()["pending"] == 0
+
+def test_failing_challenger_is_counted_and_ignored():
+    scorer = ChampionChallengerScorer(FixedScorer(0.2), {"broken": FixedScorer(None)})
+
+    assert scorer.score({}) == 0.2
+    scorer.close()
+
+    assert challenger(scorer, "broken")["failed"] == 1
@@ -0,0 +1,55 @@
+import pytest
+from datetime import datetime
+
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+from fcore.infrastructure.strategies.simple_eval_evaluator import SimpleEvalEvaluator
+from fcore.core.entities.rule import Rule
+
+EXPRESSIONS = [
+    "amount > 1000",
+    "country == 'EC' and amount >= 500",
+    "channel == 'ECOM' or tx_count_10m > 3",
+    "not is_whitelisted_merchant and amount > avg_amount_24h * 3",
+    "amount_ratio_vs_avg > 2.5 if usual_country else amount > 2000",
+    "int(amount) % 2 == 0 and currency != 'EUR'",
+    "amount / tx_count_24h > 100",          # ZeroDivisionError -> not triggered
+    "unknown_field > 10",                   # NameNotDefined -> not triggered
+    "country in ('EC', 'CO')",              # Tuples are not in the simpleeval whitelist
+    "country.lower() == 'ec'",              # Attribute access is delegated to simpleeval
+    "amount ** 2 > 1000000",
+    "country * 10 == 'ECECECECECECECECECEC'",
+]
+
+CONTEXTS = [
+    {"amount": 1500.0, "currency": "USD", "country": "EC", "channel": "ECOM", "tx_count_10m": 1,
+     "tx_count_24h": 0, "avg_amount_24h": 100.0, "amount_ratio_vs_avg": 15.0,
+     "usual_country": "EC", "is_whitelisted_merchant": False},
+    {"amount": 20.0, "currency": "EUR", "country": "CO", "channel": "POS", "tx_count_10m": 5,
+     "tx_count_24h": 4, "avg_amount_24h": 0.0, "amount_ratio_vs_avg": 1.0,
+     "usual_country": None, "is_whitelisted_merchant": True},
+]
+
+def make_rule(expression):
+    return Rule(name="Parity rule", dsl_expression=expression, created_at=datetime.utcnow(), created_by="C1000001")
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_compiled_results_match_simpleeval(expression):
+    compiled = CompiledEvalEvaluator()
+    reference = SimpleEvalEvaluator()
+    rule = make_rule(expression)
+
+    for context in CONTEXTS:
+        assert compiled.evaluate(rule, context) == reference.evaluate(rule, context)
+
+def test_edited_expression_is_recompiled():
+    evaluator = CompiledEvalEvaluator()
+    rule = make_rule("amount > 1000")
+    assert evaluator.evaluate(rule, CONTEXTS[0]) is True
+
+    rule.dsl_expression = "amount > 5000"
+    assert evaluator.evaluate(rule, CONTEXTS[0]) is False
+
+def test_builtins_are_not_reachable():
+    evaluator = CompiledEvalEvaluator()
+    rule = make_rule("__import__('os') is None")
+    assert evaluator.evaluate(rule, CONTEXTS[0]) is False
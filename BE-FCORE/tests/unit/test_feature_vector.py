@@ -0,0 +1,101 @@
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from fcore.application.services.feature_builder import SCORING_FEATURE_SCHEMA, build_scoring_features
+from fcore.application.services.rule_engine import RuleEngine
+from fcore.core.entities.behavior_profile import BehaviorProfile
+from fcore.core.entities.feature_vector import FeatureField, FeatureSchema, FeatureType, FeatureVector, LazyFeatureContext
+from fcore.core.entities.merchant import Merchant
+from fcore.core.entities.rule import Rule
+from fcore.core.entities.transaction import Transaction, TransactionChannel
+from fcore.infrastructure.ml.tree_ensemble import load_xgboost_json
+from fcore.infrastructure.ml.xgb_tree_scorer import XgbTreeScorer
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+from tests.unit.test_xgb_tree_scorer import EXPECTED, HAND_MODEL, ROWS
+
+def make_features(amount="2000", country="US", usual_country="EC", avg="400"):
+    tx = Transaction(customer_id=uuid4(), merchant_id=uuid4(), amount=Decimal(amount), country=country,
+                     channel=TransactionChannel.POS, ip_address="10.0.0.1")
+    tx.merchant = Mock(spec=Merchant, is_blacklisted=True, is_whitelisted=False)
+    beh = BehaviorProfile(customer_id=tx.customer_id, avg_amount_24h=Decimal(avg), tx_count_10m=4,
+                          tx_count_30m=6, tx_count_24h=9, usual_country=usual_country)
+    return build_scoring_features(tx, beh)
+
+def test_vector_follows_schema_order_and_types():
+    features = make_features()
+
+    assert list(features) == list(SCORING_FEATURE_SCHEMA.names)
+    assert features.values[SCORING_FEATURE_SCHEMA.position("amount")] == 2000.0
+    assert features["channel"] == "POS"
+    assert features["amount_ratio_vs_avg"] == 5.0
+    assert features["is_new_country"] is True and features["is_foreign_transaction"] is True
+    assert features["is_blacklisted_merchant"] is True
+    for f in SCORING_FEATURE_SCHEMA.fields:
+        if f.type is FeatureType.FLOAT:
+            assert type(features[f.name]) is float
+    assert features.get("unknown") is None
+
+def test_rules_see_the_same_vector():
+    rule = Rule(name="Blacklisted big ticket", dsl_expression="is_blacklisted_merchant and amount > 1500 and channel == 'POS'",
+                created_at=datetime.utcnow(), created_by="C1000001")
+    engine = RuleEngine(rules=[rule], evaluator=CompiledEvalEvaluator())
+
+    assert [hit["rule_name"] for hit in engine.evaluate(make_features())] == ["Blacklisted big ticket"]
+    assert engine.evaluate(make_features(amount="100")) == []
+
+def test_schema_bound_scorer_matches_name_lookup():
+    schema = FeatureSchema(version="test", fields=(
+        FeatureField("country", FeatureType.STR),
+        FeatureField("is_new_country", FeatureType.BOOL),
+        FeatureField("amount", FeatureType.FLOAT),
+        FeatureField("tx_count_10m", FeatureType.INT),
+    ))
+    vectors = [schema.vector(row.get(name) for name in schema.names) for row in ROWS]
+    scorer = XgbTreeScorer(load_xgboost_json(HAND_MODEL), schema=schema, schema_version="test")
+
+    assert scorer.score_batch(vectors) == pytest.approx(EXPECTED, rel=1e-6)
+
+def test_schema_version_and_types_are_checked():
+    ensemble = load_xgboost_json(HAND_MODEL)
+    with pytest.raises(ValueError):
+        XgbTreeScorer(ensemble, schema=SCORING_FEATURE_SCHEMA, schema_version="0")
+
+    textual = FeatureSchema(version="1", fields=(
+        FeatureField("amount", FeatureType.STR),
+        FeatureField("tx_count_10m", FeatureType.INT),
+        FeatureField("is_new_country", FeatureType.BOOL),
+    ))
+    with pytest.raises(ValueError):
+        XgbTreeScorer(ensemble, schema=textual)
+
+    scorer = XgbTreeScorer(ensemble, schema=SCORING_FEATURE_SCHEMA, schema_version=SCORING_FEATURE_SCHEMA.version)
+    other = FeatureSchema(version="2", fields=SCORING_FEATURE_SCHEMA.fields)
+    with pytest.raises(ValueError):
+        scorer.score(other.vector(make_features().values))
+
+def test_features_are_computed_on_first_read_and_memoized():
+    calls = []
+    getters = {
+        "amount": lambda ctx, tx: calls.append("amount") or float(tx.amount),
+        "double": lambda ctx, tx: calls.append("double") or ctx["amount"] * 2,
+    }
+    schema = FeatureSchema(version="lazy", fields=(
+        FeatureField("amount", FeatureType.FLOAT), FeatureField("double", FeatureType.FLOAT)))
+    features = FeatureVector(schema, LazyFeatureContext(getters, Mock(amount=Decimal("10.5"))))
+
+    assert calls == []
+    assert features["double"] == 21.0 and features["amount"] == 10.5
+    assert features.to_dict() == {"amount": 10.5, "double": 21.0}
+    assert calls == ["double", "amount"]
+
+def test_rules_only_compute_what_they_read():
+    rule = Rule(name="Large amount only", dsl_expression="amount > 1500", created_at=datetime.utcnow(), created_by="C1000001")
+    features = make_features()
+
+    RuleEngine(rules=[rule], evaluator=CompiledEvalEvaluator()).evaluate(features)
+
+    assert set(features.as_dict()) == {"amount"}
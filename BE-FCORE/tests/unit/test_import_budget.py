@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+# Generous enough for a slow CI runner; a regression to import-time I/O or
+# eager heavy imports shows up as a failure here long before it hits autoscaling.
+IMPORT_BUDGET_SECONDS = 5.0
+
+CHECK = """
+import os, sys, threading, time
+started = time.perf_counter()
+import fcore.main
+elapsed = time.perf_counter() - started
+drivers = ",".join(name for name in ("psycopg2", "asyncpg") if name in sys.modules)
+print(f"{elapsed}|{drivers}|{threading.active_count()}|{'FCORE_DOTENV_PROBE' in os.environ}")
+"""
+
+def test_app_imports_without_touching_the_database(tmp_path):
+    # Nothing listens on port 1: any connection attempt during import would fail it.
+    # The .env in the working directory would be picked up by a load_dotenv() at import.
+    (tmp_path / ".env").write_text("FCORE_DOTENV_PROBE=1\n")
+    project = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = {**os.environ, "POSTGRES_HOST": "127.0.0.1", "POSTGRES_PORT": "1", "PYTHONPATH": project}
+    result = subprocess.run([sys.executable, "-c", CHECK], capture_output=True, text=True, env=env, cwd=tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    elapsed, drivers, threads, dotenv_loaded = result.stdout.strip().splitlines()[-1].split("|")
+    assert float(elapsed) < IMPORT_BUDGET_SECONDS
+    assert drivers == ""
+    # No background thread started and no .env read: both wait for startup or first use
+    assert threads == "1"
+    assert dotenv_loaded == "False"
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from fcore.application.services.decision_service import DecisionService
+from fcore.application.services.latency_budget import LatencyBudgetConfig, LatencyGuard
+from fcore.application.services.reference_data_cache import ReferenceDataCache
+from fcore.application.use_cases import scoring_use_case
+from fcore.application.use_cases.scoring_use_case import ScoringUseCase
+from fcore.core.entities.alert import AlertAction
+from fcore.core.entities.behavior_profile import BehaviorProfile
+from fcore.core.entities.transaction import Transaction
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+
+def slow(value, seconds):
+    def call(*args, **kwargs):
+        time.sleep(seconds)
+        return value
+    return call
+
+def make_tx(customer_id):
+    return Transaction(customer_id=customer_id, merchant_id=uuid4(), amount=Decimal("100.00"),
+                       country="EC", occurred_at=datetime.utcnow())
+
+@pytest.fixture
+def behavior_repo():
+    repo = Mock()
+    repo.get_by_customer_id.side_effect = lambda customer_id: BehaviorProfile(customer_id=customer_id, usual_country="EC")
+    repo.calculate_features_from_history.return_value = {
+        "tx_count_10m": 1, "tx_count_30m": 1, "tx_count_24h": 1, "avg_amount_24h": 100.0, "usual_country": "EC"}
+    return repo
+
+def make_use_case(behavior_repo, scorer, guard):
+    rule_repo = Mock()
+    rule_repo.get_all.return_value = []
+    return ScoringUseCase(
+        Mock(), behavior_repo, rule_repo, Mock(), Mock(), Mock(), scorer, DecisionService(), CompiledEvalEvaluator(),
+        latency_guard=guard, behavior_cache=ReferenceDataCache("behavior_profiles")
+    )
+
+def test_slow_model_is_abandoned_and_the_decision_made_on_rules():
+    guard = LatencyGuard(LatencyBudgetConfig(total_ms=1000, model_ms=20))
+    scorer = Mock()
+    scorer.score.side_effect = slow(0.99, 0.5)
+    behavior_repo = Mock()
+    behavior_repo.get_by_customer_id.return_value = None
+    behavior_repo.calculate_features_from_history.return_value = {
+        "tx_count_10m": 1, "tx_count_30m": 1, "tx_count_24h": 1, "avg_amount_24h": 100.0, "usual_country": "EC"}
+
+    started = time.monotonic()
+    action, details = make_use_case(behavior_repo, scorer, guard).execute(make_tx(uuid4()))
+
+    assert time.monotonic() - started < 0.3
+    assert (action, details["ml_score"], details["degraded"]) == (AlertAction.APPROVE, None, ["rules_only"])
+    assert guard.stats()["degraded"]["rules_only"] == 1
+    assert guard.stats()["stage_overruns"]["model"] == 1
+    guard.close()
+
+def test_slow_feature_fetch_switches_to_the_cached_profile(behavior_repo):
+    guard = LatencyGuard(LatencyBudgetConfig(total_ms=1000, features_ms=10, features_cooldown_seconds=60))
+    scorer = Mock()
+    scorer.score.return_value = 0.1
+    use_case = make_use_case(behavior_repo, scorer, guard)
+    customer_id = uuid4()
+    use_case.execute(make_tx(customer_id))
+
+    behavior_repo.get_by_customer_id.side_effect = slow(BehaviorProfile(customer_id=customer_id), 0.05)
+    _, details = use_case.execute(make_tx(customer_id))
+    assert details["degraded"] == []
+    assert guard.stats()["skipping_feature_fetch"]
+
+    behavior_repo.reset_mock()
+    _, details = use_case.execute(make_tx(customer_id))
+
+    assert details["degraded"] == ["cached_profile"]
+    behavior_repo.get_by_customer_id.assert_not_called()
+    behavior_repo.calculate_features_from_history.assert_not_called()
+    # The profile is folded in memory and still saved
+    assert behavior_repo.save.call_args[0][0].tx_count_24h == 2
+    guard.close()
+
+def test_request_over_the_whole_budget_skips_the_model(behavior_repo):
+    guard = LatencyGuard(LatencyBudgetConfig(total_ms=5, features_ms=1000))
+    behavior_repo.get_by_customer_id.side_effect = slow(None, 0.02)
+    scorer = Mock()
+
+    _, details = make_use_case(behavior_repo, scorer, guard).execute(make_tx(uuid4()))
+
+    scorer.score.assert_not_called()
+    assert details["degraded"] == ["rules_only"]
+    assert guard.stats()["over_budget"] == 1
+    guard.close()
+
+def test_feature_building_is_charged_to_the_features_stage(behavior_repo, monkeypatch):
+    build = scoring_use_case.build_scoring_features
+    monkeypatch.setattr(scoring_use_case, "build_scoring_features", lambda tx, beh: slow(build(tx, beh), 0.03)())
+    guard = LatencyGuard(LatencyBudgetConfig(total_ms=1000, features_ms=1000))
+    scorer = Mock()
+    scorer.score.return_value = 0.1
+
+    _, details = make_use_case(behavior_repo, scorer, guard).execute(make_tx(uuid4()))
+
+    stages = details["latency"]["stages_ms"]
+    assert stages["features"] >= 30
+    assert stages["rules"] < 30
+    guard.close()
+
+def test_model_is_scored_inline_on_an_event_loop_thread():
+    guard = LatencyGuard(LatencyBudgetConfig(total_ms=1000, model_ms=20))
+    threads = []
+
+    def score():
+        threads.append(threading.current_thread())
+        return 0.3
+
+    async def run_on_loop():
+        return guard.run_model(guard.start(), score)
+
+    # Without a wait that yields to the loop, blocking on the pool would stall it
+    assert asyncio.run(run_on_loop()) == 0.3
+    assert threads == [threading.current_thread()]
+    assert guard.run_model(guard.start(), score) == 0.3
+    assert threads[1] is not threading.current_thread()
+    guard.close()
+
+def test_rules_only_decision_reviews_high_severity_hits():
+    decision = DecisionService()
+
+    assert decision.decide(None, []) == (AlertAction.APPROVE, 0.0)
+    assert decision.decide(None, [{"severity": "high"}]) == (AlertAction.REVIEW, 0.25)
+    assert decision.decide(None, [{"severity": "critical"}]) == (AlertAction.DECLINE, 1.0)
+    assert decision.decide(0.1, [{"severity": "high"}])[0] == AlertAction.APPROVE
@@ -0,0 +1,95 @@
+import json
+from unittest.mock import Mock
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from fcore.application.services.decision_service import DecisionService
+from fcore.application.services.metrics import MetricsRegistry
+from fcore.application.services.scoring_metrics import ScoringMetrics
+from fcore.application.use_cases.scoring_use_case import ScoringUseCase
+from fcore.core.entities.alert import AlertAction
+from fcore.infrastructure.metrics.file_metrics_store import FileMetricsStore
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+from tests.unit.test_latency_budget import make_tx, behavior_repo  # noqa: F401
+from tests.unit.test_shadow_rule_runner import make_rule
+
+def test_histogram_and_counter_render_in_prometheus_text_format():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("fcore_test_seconds", "Test latency.", ["stage"], buckets=(0.01, 0.1))
+    counter = registry.counter("fcore_test_total", "Test events.", ["name"])
+    histogram.labels("load").observe(0.005)
+    histogram.labels("load").observe(0.05)
+    histogram.labels("load").observe(0.01)
+    counter.labels('say "hi"').inc()
+
+    assert registry.render().splitlines() == [
+        "# HELP fcore_test_seconds Test latency.",
+        "# TYPE fcore_test_seconds histogram",
+        'fcore_test_seconds_bucket{stage="load",le="0.01"} 2',
+        'fcore_test_seconds_bucket{stage="load",le="0.1"} 3',
+        'fcore_test_seconds_bucket{stage="load",le="+Inf"} 3',
+        'fcore_test_seconds_sum{stage="load"} 0.065',
+        'fcore_test_seconds_count{stage="load"} 3',
+        "# HELP fcore_test_total Test events.",
+        "# TYPE fcore_test_total counter",
+        'fcore_test_total{name="say \\"hi\\""} 1',
+    ]
+
+def worker_registry():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("fcore_test_seconds", "Test latency.", ["stage"], buckets=(0.01, 0.1))
+    counter = registry.counter("fcore_test_total", "Test events.", ["name"])
+    return registry, histogram, counter
+
+def test_multiprocess_store_sums_every_workers_series(tmp_path):
+    # Another worker process, published under its own pid
+    other, histogram, counter = worker_registry()
+    histogram.labels("load").observe(0.05)
+    histogram.labels("save").observe(0.5)
+    counter.labels("a").inc(2)
+    (tmp_path / "999999.json").write_text(json.dumps(other.dump()))
+
+    registry, histogram, counter = worker_registry()
+    histogram.labels("load").observe(0.005)
+    counter.labels("a").inc()
+    text = FileMetricsStore(str(tmp_path), registry).render()
+
+    assert 'fcore_test_seconds_bucket{stage="load",le="0.01"} 1' in text
+    assert 'fcore_test_seconds_count{stage="load"} 2' in text
+    assert 'fcore_test_seconds_count{stage="save"} 1' in text
+    assert 'fcore_test_total{name="a"} 3' in text
+    # The answering worker published its own values too, and rendering left them untouched
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    assert 'fcore_test_total{name="a"} 1' in registry.render()
+
+def test_scoring_records_stages_rules_and_decisions(behavior_repo):  # noqa: F811
+    registry = MetricsRegistry()
+    rule_repo = Mock()
+    rule_repo.get_all.return_value = [make_rule("Any amount", "amount > 0", shadow=False)]
+    scorer = Mock()
+    scorer.score.return_value = 0.5
+    use_case = ScoringUseCase(
+        Mock(), behavior_repo, rule_repo, Mock(), Mock(), Mock(), scorer, DecisionService(), CompiledEvalEvaluator(),
+        metrics=ScoringMetrics(registry)
+    )
+
+    action, _ = use_case.execute(make_tx(uuid4()))
+
+    text = registry.render()
+    assert action == AlertAction.APPROVE
+    for stage in ("profile_load", "rule_fetch", "feature_computation", "rule_evaluation", "model_scoring",
+                  "decision", "behavior_save"):
+        assert f'fcore_scoring_stage_seconds_count{{stage="{stage}"}} 1' in text
+    assert 'fcore_rule_evaluation_seconds_count{rule="Any amount"} 1' in text
+    assert 'fcore_rule_hits_total{rule="Any amount",severity="medium"} 1' in text
+    assert 'fcore_scoring_decisions_total{action="APPROVE"} 1' in text
+
+def test_metrics_endpoint_serves_the_registry():
+    from fcore.main import app
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE fcore_scoring_stage_seconds histogram" in response.text
@@ -0,0 +1,31 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from fcore.infrastructure.database.pooling import InstrumentedQueuePool, engine_options, pool_stats
+
+def test_checkouts_and_timeouts_are_recorded(tmp_path):
+    options = engine_options(pool_size=1, max_overflow=0, pool_timeout=0.05)
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", **options)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        busy = pool_stats("sync", engine.pool)
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    stats = pool_stats("sync", engine.pool)
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert busy["checked_out"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["wait_seconds_max"] >= 0.05
+    assert stats["wait_histogram"][-1] == {"le": "+Inf", "count": 2}
+
+def test_pgbouncer_mode_skips_startup_parameters():
+    direct = engine_options(statement_timeout_ms=500)
+    pooled = engine_options(statement_timeout_ms=500, pgbouncer=True, is_async=True)
+
+    assert direct["connect_args"] == {"options": "-c statement_timeout=500"}
+    assert "server_settings" not in pooled["connect_args"]
+    assert pooled["connect_args"]["statement_cache_size"] == 0
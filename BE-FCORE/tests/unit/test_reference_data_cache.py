@@ -0,0 +1,62 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+from fcore.application.services.reference_data_cache import ReferenceDataCache
+from fcore.infrastructure.cache.cached_merchant_repository import CachedMerchantRepository
+from fcore.core.entities.merchant import Merchant
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ReferenceDataCache("customers", ttl_seconds=10, clock=clock)
+    cache.put("a", "value")
+
+    assert cache.get("a") == (True, "value")
+    clock.now = 11
+    assert cache.get("a") == (False, None)
+    assert cache.stats()["size"] == 0
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ReferenceDataCache("customers", max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.stats()["evictions"] == 1
+
+def test_unknown_keys_are_only_remembered_with_negative_ttl():
+    clock = FakeClock()
+    without = ReferenceDataCache("merchants", negative_ttl_seconds=0, clock=clock)
+    without.put("x", None)
+    assert without.get("x") == (False, None)
+
+    cache = ReferenceDataCache("merchants", ttl_seconds=300, negative_ttl_seconds=5, clock=clock)
+    cache.put("x", None)
+    assert cache.get("x") == (True, None)
+    clock.now = 6
+    assert cache.get("x") == (False, None)
+
+def test_cached_repository_reads_through_and_invalidates_on_write():
+    merchant = Merchant(name="Tienda Uno", category="retail", id=uuid4())
+    missing = uuid4()
+    inner = Mock()
+    inner.find_by_ids.return_value = {merchant.id: merchant}
+    inner.update.return_value = merchant
+    repo = CachedMerchantRepository(inner, ReferenceDataCache("merchants", negative_ttl_seconds=30))
+
+    assert repo.find_by_ids([merchant.id, missing]) == {merchant.id: merchant}
+    assert repo.find_by_ids([merchant.id, missing]) == {merchant.id: merchant}
+    assert inner.find_by_ids.call_count == 1
+
+    repo.update(merchant)
+    repo.find_by_ids([merchant.id, missing])
+    inner.find_by_ids.assert_called_with({merchant.id})
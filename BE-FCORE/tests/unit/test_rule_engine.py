@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from fcore.application.services.rule_engine import RuleEngine
+from fcore.application.services.rule_evaluation_stats import RuleEvaluationStats
+from fcore.core.entities.feature_vector import FeatureField, FeatureSchema, FeatureType
+from fcore.core.entities.rule import Rule, RuleSeverity
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+
+SCHEMA = FeatureSchema(version="test", fields=(FeatureField("amount", FeatureType.FLOAT),))
+
+class CountingEvaluator(CompiledEvalEvaluator):
+    def __init__(self):
+        super().__init__()
+        self.evaluated = []
+
+    def evaluate(self, rule, context):
+        self.evaluated.append(rule.name)
+        return super().evaluate(rule, context)
+
+def make_rule(name, expression, severity):
+    return Rule(name=name, dsl_expression=expression, severity=severity,
+                created_at=datetime.utcnow(), created_by="C1000001")
+
+RULES = [
+    make_rule("Medium amount", "amount > 100.0", RuleSeverity.MEDIUM),
+    make_rule("Critical never", "amount < 0.0001", RuleSeverity.CRITICAL),
+    make_rule("Critical huge", "amount > 5000.0", RuleSeverity.CRITICAL),
+    make_rule("High amount", "amount > 1000.0", RuleSeverity.HIGH),
+]
+
+def test_critical_hit_stops_evaluation_unless_audit():
+    evaluator = CountingEvaluator()
+    hits = RuleEngine(RULES, evaluator).evaluate(SCHEMA.vector([9000.0]))
+
+    assert [hit["rule_name"] for hit in hits] == ["Critical huge"]
+    assert evaluator.evaluated == ["Critical never", "Critical huge"]
+
+    audit = RuleEngine(RULES, CountingEvaluator(), audit=True).evaluate(SCHEMA.vector([9000.0]))
+    assert [hit["rule_name"] for hit in audit] == ["Critical huge", "High amount", "Medium amount"]
+
+def test_tiers_are_reordered_by_cost_and_hit_rate():
+    stats = RuleEvaluationStats(reorder_every=20)
+    evaluator = CountingEvaluator()
+    engine = RuleEngine(RULES, evaluator, stats=stats)
+    for _ in range(20):
+        engine.evaluate(SCHEMA.vector([9000.0]))
+
+    evaluator.evaluated.clear()
+    engine.evaluate(SCHEMA.vector([9000.0]))
+
+    # "Critical huge" always hits, so it now runs first and the other critical rule is skipped
+    assert evaluator.evaluated == ["Critical huge"]
+    assert {entry["rule_id"] for entry in stats.describe()} == {str(RULES[1].id), str(RULES[2].id)}
@@ -0,0 +1,75 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from fcore.application.services.feature_builder import SCORING_FEATURE_SCHEMA
+from fcore.application.services.rule_engine import RuleEngine
+from fcore.application.services.rule_index import RuleIndex, extract_predicate
+from fcore.core.entities.feature_vector import FeatureVector
+from fcore.core.entities.rule import Rule, RuleSeverity
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+
+@pytest.mark.parametrize("expression, predicate", [
+    ("country == 'EC' and amount > 1000", ("eq", "country", "EC")),
+    ("amount > 1000 and 'ECOM' == channel", ("eq", "channel", "ECOM")),
+    ("currency == 'EUR' or amount > 10", None),
+    ("500 <= amount and is_foreign_transaction", (">=", "amount", 500)),
+    ("tx_count_10m > 3", (">", "tx_count_10m", 3)),
+    ("100 < amount < 500", None),
+    ("amount_ratio_vs_avg > 4 and not is_whitelisted_merchant", None),
+])
+def test_predicate_extraction(expression, predicate):
+    assert extract_predicate(expression) == predicate
+
+TEMPLATES = [
+    "country == '{c}' and amount > {n}",
+    "channel == '{ch}' and tx_count_10m >= {k}",
+    "currency == '{cur}' and amount_ratio_vs_avg > {r}",
+    "amount <= {n} and is_foreign_transaction",
+    "{n} < amount",
+    "tx_count_24h > {k} or amount > avg_amount_24h * {r}",
+]
+
+def random_rules(rng, count):
+    return [Rule(name=f"Random rule {i}", severity=rng.choice(list(RuleSeverity)),
+                 dsl_expression=rng.choice(TEMPLATES).format(
+                     c=rng.choice("EC CO PE".split()), ch=rng.choice(["POS", "ECOM"]), cur=rng.choice(["EUR", "PEN"]),
+                     n=rng.randint(1, 3000), k=rng.randint(0, 12), r=rng.randint(2, 6)),
+                 created_at=datetime.utcnow(), created_by="C1000001")
+            for i in range(count)]
+
+def random_context(rng):
+    return FeatureVector(SCORING_FEATURE_SCHEMA, {
+        "amount": rng.choice([rng.uniform(1, 3000), 1500.0]), "country": rng.choice(["EC", "CO", "US", None]),
+        "channel": rng.choice(["POS", "ECOM"]), "currency": rng.choice(["USD", "EUR", "PEN"]),
+        "tx_count_10m": rng.randint(0, 12), "tx_count_24h": rng.randint(0, 40),
+        "avg_amount_24h": rng.uniform(0, 800), "amount_ratio_vs_avg": rng.uniform(0, 8),
+        "is_foreign_transaction": rng.random() < 0.3,
+    })
+
+def test_indexed_dispatch_finds_the_same_hits_as_a_linear_scan():
+    rng = random.Random(11)
+    rules = random_rules(rng, 150)
+    rules.append(Rule(name="Exact threshold", dsl_expression="amount >= 1500", created_at=datetime.utcnow(),
+                      created_by="C1000001"))
+    evaluator = CompiledEvalEvaluator()
+    linear = RuleEngine(rules, evaluator, audit=True)
+    indexed = RuleEngine(rules, evaluator, audit=True, index=RuleIndex(rules))
+
+    for _ in range(300):
+        features = random_context(rng)
+        assert indexed.evaluate(features) == linear.evaluate(features)
+
+def test_only_candidates_are_evaluated():
+    rules = random_rules(random.Random(3), 50)
+    index = RuleIndex(rules)
+    context = {"country": "US", "channel": "POS", "currency": "GBP", "amount": 1.0,
+               "tx_count_10m": 0, "tx_count_24h": 0}
+
+    candidates = [rules[p] for p in index.candidates(context)]
+
+    assert index.indexed_count == sum(" or " not in rule.dsl_expression for rule in rules)
+    assert candidates and len(candidates) < len(rules) / 2
+    assert not any("country ==" in rule.dsl_expression or "currency ==" in rule.dsl_expression
+                   or "ECOM" in rule.dsl_expression or "< amount" in rule.dsl_expression for rule in candidates)
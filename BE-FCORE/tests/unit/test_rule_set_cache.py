@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+
+from fcore.application.services.rule_references import referenced_names
+from fcore.application.services.rule_set_cache import RuleSetCache
+from fcore.application.use_cases.crud_rule_use_case import CrudRuleUseCase
+from fcore.core.entities.rule import Rule, RuleSeverity
+from fcore.core.errors.rule_errors import RuleValidationError
+
+def make_rule(name, expression="amount > 1000", severity=RuleSeverity.MEDIUM):
+    return Rule(name=name, dsl_expression=expression, severity=severity,
+                created_at=datetime.utcnow(), created_by="C1000001")
+
+@pytest.fixture
+def rule_repo():
+    repo = Mock()
+    repo.get_all.return_value = [
+        make_rule("Low amount rule", severity=RuleSeverity.LOW),
+        make_rule("Critical velocity", "tx_count_10m > 10", RuleSeverity.CRITICAL),
+        make_rule("Broken expression", "amount > > 10"),
+    ]
+    return repo
+
+def test_snapshot_is_sorted_by_severity_and_reused(rule_repo):
+    cache = RuleSetCache(max_age_seconds=60)
+
+    first = cache.get(rule_repo)
+    second = cache.get(rule_repo)
+
+    assert first is second
+    assert first.version == 1
+    assert [r.name for r in first.rules] == ["Critical velocity", "Low amount rule"]
+    rule_repo.get_all.assert_called_once_with(only_enabled=True)
+
+def test_stale_snapshot_is_reloaded(rule_repo):
+    cache = RuleSetCache(max_age_seconds=0)
+
+    cache.get(rule_repo)
+    snapshot = cache.get(rule_repo)
+
+    assert snapshot.version == 2
+    assert rule_repo.get_all.call_count == 2
+
+def test_crud_changes_swap_the_snapshot(rule_repo):
+    cache = RuleSetCache(max_age_seconds=60)
+    cache.get(rule_repo)
+
+    rule_repo.find_by_name.return_value = None
+    rule_repo.create.side_effect = lambda rule: rule
+    use_case = CrudRuleUseCase(rule_repo, rule_set_cache=cache)
+    use_case.create("New velocity rule", "tx_count_30m > 20", RuleSeverity.HIGH, "C1000001")
+
+    assert cache.active_version == 2
+    assert use_case.get_active_rule_set()["version"] == 2
+
+def test_referenced_names_skip_functions_and_comprehension_variables():
+    assert referenced_names("int(amount) > avg_amount_24h * 3 and country in [c for c in ['EC']]") == {
+        "amount", "avg_amount_24h", "country"}
+
+def test_rules_with_unknown_names_are_rejected_on_save_and_skipped_on_load(rule_repo):
+    known = ("amount", "tx_count_10m", "tx_count_30m")
+    rule_repo.find_by_name.return_value = None
+    use_case = CrudRuleUseCase(rule_repo, known_names=known)
+
+    with pytest.raises(RuleValidationError):
+        use_case.create("Typo in feature", "ammount > 1000", RuleSeverity.HIGH, "C1000001")
+    with pytest.raises(RuleValidationError):
+        use_case.create("Broken syntax", "amount > > 1000", RuleSeverity.HIGH, "C1000001")
+    rule_repo.create.assert_not_called()
+
+    rule_repo.get_all.return_value.append(make_rule("Legacy rule", "ammount > 1000"))
+    snapshot = RuleSetCache(known_names=known).get(rule_repo)
+
+    assert [r.name for r in snapshot.rules] == ["Critical velocity", "Low amount rule"]
+    assert snapshot.referenced_names == {"amount", "tx_count_10m"}
+
+def test_concurrent_reloads_never_wait_on_each_others_query(rule_repo):
+    # On the async path both reloads run on the event loop thread, so a reload
+    # waiting for the other one's query to finish would never wake up.
+    cache = RuleSetCache(max_age_seconds=60)
+    second_query_started = threading.Event()
+    waits = []
+    rules = rule_repo.get_all.return_value
+
+    def get_all(only_enabled):
+        if rule_repo.get_all.call_count == 1:
+            waits.append(second_query_started.wait(timeout=2))
+        else:
+            second_query_started.set()
+        return rules
+
+    rule_repo.get_all.side_effect = get_all
+    first = threading.Thread(target=cache.refresh, args=(rule_repo,))
+    first.start()
+    cache.refresh(rule_repo)
+    first.join()
+
+    assert waits == [True], "second reload blocked behind the first query"
+    assert rule_repo.get_all.call_count == 2
+    assert [r.name for r in cache.get(rule_repo).rules] == ["Critical velocity", "Low amount rule"]
+
+def test_stale_snapshot_is_served_while_another_reader_reloads(rule_repo):
+    cache = RuleSetCache(max_age_seconds=0)
+    stale = cache.get(rule_repo)
+    release = threading.Event()
+    rule_repo.get_all.side_effect = lambda only_enabled: release.wait(timeout=2) and []
+
+    reloader = threading.Thread(target=cache.get, args=(rule_repo,))
+    reloader.start()
+    while rule_repo.get_all.call_count < 2:
+        pass
+    assert cache.get(rule_repo) is stale
+    release.set()
+    reloader.join()
+
+    assert rule_repo.get_all.call_count == 2
+    assert cache.active_version == 2
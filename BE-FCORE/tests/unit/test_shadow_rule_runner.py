@@ -0,0 +1,84 @@
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+
+from fcore.application.services.backtest import PointInTimeProfiles
+from fcore.application.services.feature_builder import build_scoring_features
+from fcore.application.services.rule_engine import RuleEngine
+from fcore.application.services.rule_set_cache import RuleSetCache
+from fcore.application.services.shadow_rule_runner import ShadowRuleRunner
+from fcore.core.entities.rule import Rule
+from fcore.core.entities.transaction import Transaction
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+
+def make_rule(name, expression, shadow=True):
+    return Rule(name=name, dsl_expression=expression, shadow=shadow,
+                created_at=datetime.utcnow(), created_by="C1000001")
+
+def make_features(amount):
+    tx = Transaction(customer_id=uuid4(), merchant_id=uuid4(), amount=Decimal(amount), country="EC",
+                     occurred_at=datetime(2026, 10, 1, 12, 0))
+    return tx, build_scoring_features(tx, PointInTimeProfiles().profile_before(tx))
+
+SHADOW_RULES = [make_rule("Shadow big amount", "amount > 1000"), make_rule("Shadow any amount", "amount > 0")]
+
+def test_hits_are_counted_and_written_in_batches():
+    written = []
+    runner = ShadowRuleRunner(CompiledEvalEvaluator(), write_hits=written.append, flush_size=3)
+    for amount in ("5000.00", "10.00", "20.00"):
+        tx, features = make_features(amount)
+        assert runner.submit(SHADOW_RULES, features, tx)
+
+    assert runner.drain() == 3
+    runner.flush()
+
+    # 4 hits: the first flush happens at 3, the last one by the explicit flush
+    assert [len(batch) for batch in written] == [3, 1]
+    assert {hit.rule_id for hit in written[1]} == {SHADOW_RULES[1].id}
+    stats = runner.stats()
+    assert stats["written_hits"] == 4
+    assert [(r["rule_name"], r["evaluations"], r["hits"]) for r in stats["rules"]] == [
+        ("Shadow any amount", 3, 3), ("Shadow big amount", 3, 1)]
+
+def test_submit_drops_when_the_queue_is_full():
+    runner = ShadowRuleRunner(CompiledEvalEvaluator(), queue_size=1)
+    tx, features = make_features("10.00")
+
+    assert runner.submit(SHADOW_RULES, features, tx)
+    assert not runner.submit(SHADOW_RULES, features, tx)
+    assert (runner.stats()["submitted_total"], runner.stats()["dropped_total"]) == (1, 1)
+
+def test_failed_write_keeps_the_counters():
+    runner = ShadowRuleRunner(CompiledEvalEvaluator(), write_hits=Mock(side_effect=RuntimeError("db down")))
+    tx, features = make_features("10.00")
+    runner.submit(SHADOW_RULES, features, tx)
+    runner.drain()
+    runner.flush()
+
+    assert runner.stats()["failed_flushes"] == 1
+    assert sum(r["hits"] for r in runner.stats()["rules"]) == 1
+
+def test_worker_threads_evaluate_and_flush_on_stop():
+    written = []
+    runner = ShadowRuleRunner(CompiledEvalEvaluator(), write_hits=written.extend, workers=2)
+    runner.start()
+    for _ in range(10):
+        tx, features = make_features("5000.00")
+        runner.submit(SHADOW_RULES, features, tx)
+    runner.stop()
+
+    assert not runner.is_running
+    assert len(written) == 20
+
+def test_shadow_rules_stay_out_of_the_decision():
+    live = make_rule("Live big amount", "amount > 1000", shadow=False)
+    repo = Mock()
+    repo.get_all.return_value = [live, *SHADOW_RULES]
+
+    snapshot = RuleSetCache(max_age_seconds=60).get(repo)
+    assert [r.name for r in snapshot.rules] == ["Live big amount"]
+    assert [r.name for r in snapshot.shadow_rules] == ["Shadow any amount", "Shadow big amount"]
+
+    _, features = make_features("10.00")
+    assert RuleEngine([live, *SHADOW_RULES], CompiledEvalEvaluator()).evaluate(features) == []
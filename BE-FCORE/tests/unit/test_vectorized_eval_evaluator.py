@@ -0,0 +1,106 @@
+import random
+
+import numpy as np
+import pytest
+
+from fcore.application.services.rule_engine import RuleEngine
+from fcore.core.entities.rule import RuleSeverity
+from fcore.infrastructure.strategies.compiled_eval_evaluator import CompiledEvalEvaluator
+from fcore.infrastructure.strategies.vectorized_eval_evaluator import VectorizedEvalEvaluator
+from tests.unit.test_compiled_eval_evaluator import EXPRESSIONS, CONTEXTS, make_rule
+
+BATCH_EXPRESSIONS = EXPRESSIONS + [
+    "tx_count_24h > 0 and amount / tx_count_24h > 100",   # short-circuit guards the division
+    "amount / tx_count_24h > 100 or channel == 'POS'",    # failing first operand fails the rule
+    "channel == 'POS' or amount / tx_count_24h > 100",
+    "0 < tx_count_10m <= 3",
+    "tx_count_10m > 10 > unknown_field",                  # chain stops before the unknown name
+    "usual_country == country",
+    "usual_country != None and usual_country != country",
+    "usual_country",
+    "not usual_country",
+    "usual_country > 'A'",                                # None ordering raises on some rows
+    "amount % tx_count_24h == 0",
+    "amount // 7 >= 3 and -amount < -10",
+    "is_whitelisted_merchant + 1 == 2",
+    "country == 10 or amount == 'EC'",
+    "(amount > 1000) == is_whitelisted_merchant",
+    "amount > 100 if tx_count_10m else unknown_field",
+    "1000 * 1.5 < amount",
+    "amount + 1 / 0 > 1",
+    "amount and country",
+    "str(tx_count_10m) == '5'",
+    "randint(5) > 10",
+]
+
+def random_context(rng: random.Random) -> dict:
+    return {
+        "amount": rng.choice([0.0, 20.0, 999.99, 1000.0, 1500.0, rng.uniform(0, 5000)]),
+        "currency": rng.choice(["USD", "EUR"]),
+        "country": rng.choice(["EC", "CO", "US"]),
+        "channel": rng.choice(["ECOM", "POS", "ATM"]),
+        "tx_count_10m": rng.randint(0, 6),
+        "tx_count_24h": rng.randint(0, 4),
+        "avg_amount_24h": rng.choice([0.0, 100.0, 450.5]),
+        "amount_ratio_vs_avg": rng.uniform(0, 5),
+        "usual_country": rng.choice(["EC", "CO", None]),
+        "is_whitelisted_merchant": rng.random() < 0.3,
+    }
+
+@pytest.mark.parametrize("expression", BATCH_EXPRESSIONS)
+def test_batch_matches_per_row_evaluation(expression):
+    rng = random.Random(7)
+    contexts = CONTEXTS + [random_context(rng) for _ in range(200)]
+    rule = make_rule(expression)
+    reference = CompiledEvalEvaluator()
+
+    matrix = VectorizedEvalEvaluator().evaluate_batch([rule], contexts)
+
+    assert matrix.shape == (len(contexts), 1)
+    assert matrix[:, 0].tolist() == [reference.evaluate(rule, context) for context in contexts]
+
+def test_common_expressions_are_vectorized():
+    evaluator = VectorizedEvalEvaluator()
+    for expression in ["country == 'EC' and amount >= 500", "tx_count_24h > 0 and amount / tx_count_24h > 100",
+                       "amount_ratio_vs_avg > 2.5 if usual_country else amount > 2000"]:
+        assert evaluator._get_plan(make_rule(expression)).plan is not None
+
+    for expression in ["int(amount) % 2 == 0", "country.lower() == 'ec'", "amount ** 2 > 1"]:
+        assert evaluator._get_plan(make_rule(expression)).plan is None
+
+def test_hit_matrix_is_rows_by_rules():
+    rules = [make_rule("amount > 1000"), make_rule("country == 'CO'"), make_rule("__import__('os') is None")]
+
+    matrix = VectorizedEvalEvaluator().evaluate_batch(rules, CONTEXTS)
+
+    assert matrix.dtype == np.bool_
+    assert matrix.tolist() == [[True, False, False], [False, True, False]]
+
+def test_edited_expression_gets_a_new_plan():
+    evaluator = VectorizedEvalEvaluator()
+    rule = make_rule("amount > 1000")
+    assert evaluator.evaluate_batch([rule], CONTEXTS)[:, 0].tolist() == [True, False]
+
+    rule.dsl_expression = "amount < 1000"
+    assert evaluator.evaluate_batch([rule], CONTEXTS)[:, 0].tolist() == [False, True]
+
+def test_rule_engine_batch_matches_per_transaction_hits(monkeypatch):
+    monkeypatch.setattr(RuleEngine, "BATCH_MIN_ROWS", 1)
+
+    class Features:
+        def __init__(self, context):
+            self._context = context
+
+        def as_dict(self):
+            return self._context
+
+    rng = random.Random(11)
+    rules = [make_rule(expression) for expression in BATCH_EXPRESSIONS]
+    for index, rule in enumerate(rules):
+        rule.severity = [RuleSeverity.CRITICAL, RuleSeverity.HIGH, RuleSeverity.MEDIUM, RuleSeverity.LOW][index % 4]
+    features_list = [Features(random_context(rng)) for _ in range(100)]
+
+    for audit in (False, True):
+        expected = [RuleEngine(rules, CompiledEvalEvaluator(), audit=audit).evaluate(f) for f in features_list]
+        batched = RuleEngine(rules, VectorizedEvalEvaluator(), audit=audit).evaluate_batch(features_list)
+        assert batched == expected
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+
+from fcore.application.services.velocity_engine import VelocityEngine
+from fcore.application.use_cases.scoring_use_case import ScoringUseCase
+from fcore.core.entities.alert import AlertAction
+from fcore.core.entities.behavior_profile import BehaviorProfile
+from fcore.core.entities.transaction import Transaction
+
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+class FakeClock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now.timestamp()
+
+def test_windows_follow_the_clock():
+    clock = FakeClock(NOW)
+    engine = VelocityEngine(clock=clock)
+    customer_id = uuid4()
+    engine.bootstrap([
+        (customer_id, NOW - timedelta(hours=30), Decimal("999")),
+        (customer_id, NOW - timedelta(hours=2), Decimal("30")),
+        (customer_id, NOW - timedelta(minutes=20), Decimal("20")),
+    ])
+    engine.record(customer_id, NOW, Decimal("10"))
+
+    assert engine.snapshot(customer_id) == {
+        "tx_count_10m": 1, "tx_count_30m": 2, "tx_count_24h": 3, "avg_amount_24h": 20.0
+    }
+
+    clock.now = NOW + timedelta(minutes=15)
+    assert engine.snapshot(customer_id)["tx_count_10m"] == 0
+    assert engine.snapshot(customer_id)["tx_count_30m"] == 1
+
+    clock.now = NOW + timedelta(hours=25)
+    assert engine.snapshot(customer_id)["tx_count_24h"] == 0
+
+def test_unknown_customers_are_zero_but_nothing_is_answered_before_bootstrap():
+    engine = VelocityEngine(clock=FakeClock(NOW))
+    assert engine.snapshot(uuid4()) is None
+
+    engine.bootstrap([])
+    assert engine.snapshot(uuid4())["tx_count_24h"] == 0
+
+def test_memory_cap_evicts_least_recently_used_customers():
+    engine = VelocityEngine(max_memory_bytes=1, clock=FakeClock(NOW))
+    engine.bootstrap([])
+    first, second = uuid4(), uuid4()
+
+    engine.record(first, NOW, Decimal("10"))
+    engine.record(second, NOW, Decimal("10"))
+
+    # An evicted customer may still be active: the engine must not claim zero activity.
+    assert engine.snapshot(first) is None
+    assert engine.stats()["evictions"] >= 1
+    assert engine.memory_bytes() >= 0
+
+def test_scoring_uses_live_counters_instead_of_history():
+    engine = VelocityEngine(clock=FakeClock(NOW))
+    customer_id = uuid4()
+    engine.bootstrap([(customer_id, NOW - timedelta(minutes=5), Decimal("100"))])
+    tx = Transaction(customer_id=customer_id, merchant_id=uuid4(), amount=Decimal("300"),
+                     country="EC", occurred_at=NOW)
+    engine.record(tx.customer_id, tx.occurred_at, tx.amount)
+
+    behavior_repo = Mock()
+    behavior_repo.get_by_customer_id.return_value = BehaviorProfile(customer_id=customer_id, usual_country="EC")
+    scorer = Mock()
+    scorer.score.return_value = 0.1
+    decision_service = Mock()
+    decision_service.decide.return_value = (AlertAction.APPROVE, 0.1)
+    use_case = ScoringUseCase(
+        Mock(), behavior_repo, Mock(get_all=Mock(return_value=[])), Mock(), Mock(), Mock(),
+        scorer, decision_service, Mock(), velocity_engine=engine
+    )
+
+    use_case.execute(tx)
+
+    features = scorer.score.call_args[0][0]
+    assert (features["tx_count_10m"], features["avg_amount_24h"]) == (1, 100.0)
+    behavior_repo.calculate_features_from_history.assert_not_called()
+    saved = behavior_repo.save.call_args[0][0]
+    assert (saved.tx_count_24h, saved.avg_amount_24h) == (2, 200.0)
@@ -0,0 +1,49 @@
+import asyncio
+
+from fcore.application.services.warm_up import WorkerWarmUp
+
+def test_worker_is_ready_only_after_every_step_succeeds():
+    calls = []
+    attempts = {"pool": 0}
+
+    def open_pool():
+        attempts["pool"] += 1
+        if attempts["pool"] == 1:
+            raise ConnectionError("database is starting up")
+        return 2
+
+    async def load_model():
+        calls.append("model")
+
+    warm_up = WorkerWarmUp()
+    warm_up.add_step("rule_set", lambda: calls.append("rules"))
+    warm_up.add_step("db_pool", open_pool)
+    warm_up.add_step("model", load_model)
+
+    assert asyncio.run(warm_up.run()) is False
+    assert warm_up.status()["steps"]["db_pool"]["detail"] == "database is starting up"
+    assert "model" not in warm_up.status()["steps"]
+
+    assert asyncio.run(warm_up.run()) is True
+    # Steps that already succeeded are not repeated
+    assert calls == ["rules", "model"]
+    assert warm_up.status()["steps"]["db_pool"]["ok"] is True
+    assert warm_up.status()["steps"]["db_pool"]["detail"] == "2"
+
+def test_app_starts_and_stops_with_the_database_steps_stubbed(monkeypatch):
+    import fcore.main
+    from fastapi.testclient import TestClient
+    from fcore.presentation.api.dependencies import get_worker_warm_up
+
+    # Every startup and shutdown hook runs; only the steps that need a database are replaced
+    warm_up = WorkerWarmUp()
+    for name in ("db_pool", "async_db_pool", "rule_set", "model", "velocity_engine"):
+        warm_up.add_step(name, lambda: None)
+    monkeypatch.setattr(fcore.main, "get_worker_warm_up", lambda: warm_up)
+    monkeypatch.setitem(fcore.main.app.dependency_overrides, get_worker_warm_up, lambda: warm_up)
+
+    with TestClient(fcore.main.app) as client:
+        response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
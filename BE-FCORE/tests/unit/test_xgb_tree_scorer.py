@@ -0,0 +1,117 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from fcore.infrastructure.ml.tree_ensemble import load_xgboost_json
+from fcore.infrastructure.ml.xgb_tree_scorer import XgbTreeScorer
+
+FEATURES = ["amount", "tx_count_10m", "is_new_country"]
+
+def saved_model(trees, base_score="5E-1", objective="binary:logistic"):
+    """Minimal document in the layout of Booster.save_model('model.json')."""
+    return {
+        "learner": {
+            "feature_names": FEATURES,
+            "learner_model_param": {"base_score": base_score, "num_class": "0", "num_feature": str(len(FEATURES))},
+            "objective": {"name": objective},
+            "gradient_booster": {"name": "gbtree", "model": {"trees": trees}}
+        }
+    }
+
+def tree(left, right, split_indices, split_conditions, default_left):
+    return {"left_children": left, "right_children": right, "split_indices": split_indices,
+            "split_conditions": split_conditions, "default_left": default_left, "split_type": [0] * len(left)}
+
+# amount < 1500 ? (tx_count_10m < 3.5 ? -0.6 : 0.4) : 0.8, missing amount goes left
+# is_new_country < 0.5 ? -0.2 : 0.5, missing goes right
+HAND_MODEL = saved_model([
+    tree([1, 3, -1, -1, -1], [2, 4, -1, -1, -1], [0, 1, 0, 0, 0], [1500.0, 3.5, 0.8, -0.6, 0.4], [1, 0, 0, 0, 0]),
+    tree([1, -1, -1], [2, -1, -1], [2, 0, 0], [0.5, -0.2, 0.5], [0, 0, 0]),
+])
+
+HAND_DUMP = [
+    {"nodeid": 0, "depth": 0, "split": "amount", "split_condition": 1500.0, "yes": 1, "no": 2, "missing": 1, "children": [
+        {"nodeid": 1, "depth": 1, "split": "tx_count_10m", "split_condition": 3.5, "yes": 3, "no": 4, "missing": 4, "children": [
+            {"nodeid": 3, "leaf": -0.6}, {"nodeid": 4, "leaf": 0.4}]},
+        {"nodeid": 2, "leaf": 0.8}]},
+    {"nodeid": 0, "depth": 0, "split": "is_new_country", "split_condition": 0.5, "yes": 1, "no": 2, "missing": 2, "children": [
+        {"nodeid": 1, "leaf": -0.2}, {"nodeid": 2, "leaf": 0.5}]},
+]
+
+ROWS = [
+    {"amount": 100.0, "tx_count_10m": 1, "is_new_country": False},
+    {"amount": 2000.0, "tx_count_10m": 5, "is_new_country": True},
+    {"amount": None, "tx_count_10m": 4},
+    {"amount": 1500.0, "tx_count_10m": 0, "is_new_country": False},
+]
+# sigmoid of the hand-computed margins -0.8, 1.3, 0.9 and 0.6
+EXPECTED = [0.3100255188723876, 0.7858349830425586, 0.7109495026250039, 0.6456563062257954]
+
+def test_saved_model_matches_reference_predictions():
+    scorer = XgbTreeScorer(load_xgboost_json(HAND_MODEL))
+
+    assert scorer.score_batch(ROWS) == pytest.approx(EXPECTED, rel=1e-6)
+    assert [scorer.score(row) for row in ROWS] == pytest.approx(EXPECTED, rel=1e-6)
+
+def test_tree_dump_matches_saved_model():
+    scorer = XgbTreeScorer(load_xgboost_json(HAND_DUMP, feature_names=FEATURES))
+
+    assert scorer.score_batch(ROWS) == pytest.approx(EXPECTED, rel=1e-6)
+
+def test_base_score_is_applied_as_a_margin():
+    scorer = XgbTreeScorer(load_xgboost_json(saved_model(HAND_MODEL["learner"]["gradient_booster"]["model"]["trees"],
+                                                         base_score="[2E-1]")))
+    margin = -0.8 + math.log(0.2 / 0.8)
+
+    assert scorer.score(ROWS[0]) == pytest.approx(1 / (1 + math.exp(-margin)), rel=1e-6)
+
+def test_unsupported_objectives_are_rejected():
+    with pytest.raises(ValueError):
+        load_xgboost_json(saved_model([], objective="multi:softprob"))
+
+def random_tree(rng, depth):
+    left, right, splits, conditions, defaults = [], [], [], [], []
+
+    def grow(level):
+        node = len(left)
+        for values in (left, right, splits, conditions, defaults):
+            values.append(None)
+        if level == depth or (level > 1 and rng.random() < 0.2):
+            left[node], right[node], splits[node] = -1, -1, 0
+            conditions[node], defaults[node] = rng.uniform(-1, 1), 0
+            return node
+        splits[node], conditions[node] = rng.randrange(len(FEATURES)), rng.uniform(0, 10)
+        defaults[node] = rng.randrange(2)
+        left[node] = grow(level + 1)
+        right[node] = grow(level + 1)
+        return node
+
+    grow(0)
+    return tree(left, right, splits, conditions, defaults)
+
+def reference_margin(trees, row):
+    """Node-by-node walk of the JSON document, independent of the flattened arrays."""
+    margin = 0.0
+    for t in trees:
+        node = 0
+        while t["left_children"][node] >= 0:
+            value = row[t["split_indices"][node]]
+            if math.isnan(value):
+                go_left = bool(t["default_left"][node])
+            else:
+                go_left = np.float32(value) < np.float32(t["split_conditions"][node])
+            node = t["left_children"][node] if go_left else t["right_children"][node]
+        margin += float(np.float32(t["split_conditions"][node]))
+    return margin
+
+def test_vectorized_traversal_matches_node_walk():
+    rng = random.Random(7)
+    trees = [random_tree(rng, depth=6) for _ in range(50)]
+    ensemble = load_xgboost_json(saved_model(trees))
+    rows = np.array([[rng.uniform(0, 10) if rng.random() > 0.1 else np.nan for _ in FEATURES] for _ in range(200)])
+
+    expected = [reference_margin(trees, row) for row in rows]
+
+    assert ensemble.predict_margin(rows) == pytest.approx(expected, abs=1e-5)